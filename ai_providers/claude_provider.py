@@ -63,9 +63,12 @@ class ClaudeProvider(BaseAIProvider):
         if not HAS_ANTHROPIC:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
         
+        from core.http_pool import get_http_client
+
         self._client = anthropic.AsyncAnthropic(
             api_key=self.config.api_key,
-            base_url=self.config.base_url
+            base_url=self.config.base_url,
+            http_client=get_http_client(self.provider_type.value)
         )
     
     def _convert_messages(
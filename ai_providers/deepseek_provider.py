@@ -66,9 +66,12 @@ class DeepSeekProvider(BaseAIProvider):
         if not HAS_OPENAI:
             raise ImportError("openai package not installed. Run: pip install openai")
         
+        from core.http_pool import get_http_client
+
         self._client = AsyncOpenAI(
             api_key=self.config.api_key,
-            base_url=self.config.base_url or self.BASE_URL
+            base_url=self.config.base_url or self.BASE_URL,
+            http_client=get_http_client(self.provider_type.value)
         )
     
     def _convert_messages(
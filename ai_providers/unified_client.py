@@ -268,23 +268,29 @@ class UnifiedLLMClient:
         if not api_key:
             raise ValueError(f"API key not configured for {provider}")
 
+        # SDK clients share the process-wide connection pool
+        from core.http_pool import get_http_client
+        http_client = get_http_client(provider)
+
         if provider == "openai":
             from openai import AsyncOpenAI
-            self._clients[provider] = AsyncOpenAI(api_key=api_key)
+            self._clients[provider] = AsyncOpenAI(api_key=api_key, http_client=http_client)
         elif provider == "anthropic":
             from anthropic import AsyncAnthropic
-            self._clients[provider] = AsyncAnthropic(api_key=api_key)
+            self._clients[provider] = AsyncAnthropic(api_key=api_key, http_client=http_client)
         elif provider == "deepseek":
             from openai import AsyncOpenAI
             self._clients[provider] = AsyncOpenAI(
                 api_key=api_key,
-                base_url="https://api.deepseek.com/v1"
+                base_url="https://api.deepseek.com/v1",
+                http_client=http_client
             )
         elif provider == "gemini":
             from openai import AsyncOpenAI
             self._clients[provider] = AsyncOpenAI(
                 api_key=api_key,
-                base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+                base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+                http_client=http_client
             )
         else:
             raise ValueError(f"Unknown provider: {provider}")
@@ -7,12 +7,11 @@ Module-level singletons imported by route files.
 
 import time
 from pathlib import Path
-from typing import List, Optional
-
-from fastapi import WebSocket
 
 from core.job_queue import JobQueue
-from core.cache.chunk_cache import ChunkCache
+from core.cache.chunk_cache import get_chunk_cache
+from api.ws_broadcaster import ConnectionManager
+from config.settings import settings
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,38 +23,15 @@ start_time = time.time()
 
 # Chunk cache
 cache_db_path = Path(__file__).parent.parent / "data" / "cache" / "chunks.db"
-chunk_cache = ChunkCache(cache_db_path)
+chunk_cache = get_chunk_cache(cache_db_path)
 
 
 # --- WebSocket Manager ---
 
-class ConnectionManager:
-    """
-    Manage WebSocket connections for real-time updates.
-
-    Handles client connections and broadcasts job progress, status
-    changes, and queue statistics to all connected clients.
-    """
-
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.debug("WebSocket send failed (client may have disconnected): %s", e)
-
-
-manager = ConnectionManager()
+manager = ConnectionManager(
+    max_queue=settings.websocket_queue_size,
+    send_timeout=settings.websocket_send_timeout,
+)
 
 
 # --- Processor (mutable) ---
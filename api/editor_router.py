@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from core.cache.checkpoint_manager import VersionConflictError
 from core.editor.service import get_editor_service, EditorService
 from core.editor.schemas import EditorJobResponse, UpdateSegmentRequest
 
@@ -7,15 +10,24 @@ router = APIRouter(prefix="/editor", tags=["editor"])
 @router.get("/jobs/{job_id}/segments", response_model=EditorJobResponse)
 async def get_job_segments(
     job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    around: Optional[str] = Query(None, description="Chunk ID to center the window on"),
+    tm_ids: List[str] = Query([], description="TMs to prefetch suggestions from"),
+    min_similarity: float = Query(0.75, ge=0.0, le=1.0),
+    source_lang: Optional[str] = Query(None, description="Job source language; TMs of other pairs are skipped"),
+    target_lang: Optional[str] = Query(None, description="Job target language"),
     service: EditorService = Depends(get_editor_service)
 ):
     """
-    Get all translation segments for a job.
+    Get one window of translation segments for a job.
     Used by the Proofreading Studio (CAT Tool).
     """
-    response = service.get_job_segments(job_id)
+    response = service.get_job_segments(job_id, offset=offset, limit=limit, around=around)
     if not response:
         raise HTTPException(status_code=404, detail="Job not found or no checkpoint available")
+    if tm_ids:
+        await service.add_tm_suggestions(response, tm_ids, min_similarity, source_lang, target_lang)
     return response
 
 @router.patch("/jobs/{job_id}/segments/{chunk_id}")
@@ -27,11 +39,22 @@ async def update_segment(
 ):
     """
     Update a specific translation segment.
+
+    Send the segment's ``version`` as ``expected_version`` to get a 409
+    instead of overwriting a change made since it was loaded.
     """
-    success = service.update_segment(job_id, chunk_id, body.translated_text)
-    if not success:
+    try:
+        version = service.update_segment(
+            job_id, chunk_id, body.translated_text, expected_version=body.expected_version
+        )
+    except VersionConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Segment was changed by someone else", "current_version": e.current_version}
+        )
+    if version is None:
         raise HTTPException(status_code=404, detail="Segment or Job not found")
-    return {"status": "success", "message": "Segment updated"}
+    return {"status": "success", "message": "Segment updated", "version": version}
 
 @router.post("/jobs/{job_id}/regenerate")
 async def regenerate_document(
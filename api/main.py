@@ -254,6 +254,16 @@ async def shutdown_redis():
         logger.debug("Redis shutdown skipped: %s", e)
 
 
+@app.on_event("shutdown")
+async def shutdown_http_pool():
+    """Close pooled LLM HTTP connections on shutdown."""
+    try:
+        from core.http_pool import close_http_pool
+        await close_http_pool()
+    except Exception as e:
+        logger.debug("HTTP pool shutdown skipped: %s", e)
+
+
 @app.on_event("startup")
 async def startup_cleanup_scheduler():
     """Start periodic file cleanup (every 6 hours) and job memory cleanup (every 1 hour)."""
@@ -429,9 +439,9 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
 
     try:
-        # Send initial stats
+        # Send initial stats (queued so the sender task owns the socket)
         stats = queue.get_queue_stats()
-        await websocket.send_json({
+        await manager.send_personal(websocket, {
             "event": "connected",
             "stats": stats
         })
@@ -445,21 +455,26 @@ async def websocket_endpoint(websocket: WebSocket):
                 try:
                     msg = json.loads(data)
                     if msg.get("action") == "subscribe" and msg.get("job_id"):
-                        await websocket.send_json({
+                        manager.subscribe(websocket, msg["job_id"])
+                        await manager.send_personal(websocket, {
                             "event": "subscribed",
                             "job_id": msg["job_id"],
                         })
-                except (json.JSONDecodeError, KeyError):
+                    elif msg.get("action") == "unsubscribe":
+                        manager.unsubscribe(websocket, msg.get("job_id"))
+                except (json.JSONDecodeError, KeyError, AttributeError):
                     pass
             except asyncio.TimeoutError:
                 stats = queue.get_queue_stats()
-                await websocket.send_json({
+                await manager.send_personal(websocket, {
                     "event": "stats_update",
                     "stats": stats,
                     "timestamp": time.time()
                 })
 
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 # =============================================================================
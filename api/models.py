@@ -23,6 +23,7 @@ class JobCreate(BaseModel):
     use_smart_tables: bool = Field(default=False, description="Enable Premium Vision Table Reconstruction")
     domain: Optional[str] = Field(default=None, description="Domain (general/stem/finance/literature/medical/technology). Use 'stem' for STEM documents with formulas/code.")
     glossary: Optional[str] = Field(default=None, description="Glossary name")
+    tm_ids: List[str] = Field(default_factory=list, description="Translation Memories to reuse exact matches from before translating")
     concurrency: int = Field(default=5, description="Parallel chunks")
     chunk_size: int = Field(default=3000, description="Chunk size in characters")
     output_format: str = Field(default="txt", description="Output format (txt/docx/pdf/html/md)")
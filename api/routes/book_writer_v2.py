@@ -277,6 +277,17 @@ async def pause_book(
     return {"message": "Project paused", "id": project_id}
 
 
+@router.post("/{project_id}/resume")
+async def resume_book(
+    project_id: str,
+    service: BookWriterV2Service = Depends(get_service),
+):
+    """Resume a failed or paused book generation from its last checkpoint."""
+    if not await service.resume_project(project_id):
+        raise HTTPException(status_code=400, detail="Cannot resume project")
+    return {"message": "Project resumed", "id": project_id}
+
+
 # === WebSocket ===
 
 @router.websocket("/{project_id}/ws")
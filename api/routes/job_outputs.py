@@ -8,7 +8,7 @@ import os
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from docx import Document as DocxDocument
 
 from api.deps import queue
@@ -16,11 +16,13 @@ from core.job_queue import JobStatus
 from core.batch_processor import read_document
 from core.post_formatting.heading_detector import HeadingDetector
 from api.services.converter import convert_document_format, get_media_type
+from api.services.conversion_cache import get_conversion_cache
 from api.services.file_handler import (
     resolve_output_path, validate_project_path,
     generate_docx_preview, generate_text_preview,
 )
 from config.logging_config import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -31,7 +33,12 @@ ALLOWED_DOWNLOAD_FORMATS = {"docx", "pdf", "md", "txt", "html", "srt"}
 
 @router.get("/api/jobs/{job_id}/download/{format}")
 async def download_job_output(job_id: str, format: str):
-    """Download translated output file with on-the-fly conversion."""
+    """Download translated output file with on-the-fly conversion.
+
+    Conversions are cached by content hash and shared between concurrent
+    requests. If one takes longer than ``settings.conversion_wait_seconds``
+    the response is 202 with a ``poll_url`` to retry once it is ready.
+    """
     if format not in ALLOWED_DOWNLOAD_FORMATS:
         raise HTTPException(
             status_code=400,
@@ -70,24 +77,29 @@ async def download_job_output(job_id: str, format: str):
         output_path = target_path
     elif format != job.output_format and output_path.exists():
         try:
-            converted_path = await convert_document_format(
-                output_path, format, output_dir, base_name,
+            result = await get_conversion_cache().get(
+                output_path, format, convert_document_format,
+                wait=settings.conversion_wait_seconds,
             )
-            if converted_path and converted_path.exists():
-                output_path = converted_path
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to convert to {format} format"
-                )
-        except HTTPException:
-            raise
         except Exception as e:
             logger.error("Conversion error: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"Conversion to {format} failed: {str(e)}"
             )
+        if not result.ready:
+            retry_after = max(1, int(settings.conversion_wait_seconds))
+            return JSONResponse(
+                status_code=202,
+                headers={"Retry-After": str(retry_after)},
+                content={
+                    "status": "converting",
+                    "format": format,
+                    "poll_url": f"/api/jobs/{job_id}/download/{format}",
+                    "retry_after": retry_after,
+                },
+            )
+        output_path = result.path
     elif not output_path.exists():
         raise HTTPException(
             status_code=404,
@@ -137,6 +137,7 @@ async def create_job(
         'include_images': job_data.include_images,
         'use_vision': job_data.use_vision,
         'api_key': job_data.api_key,
+        'tm_ids': job_data.tm_ids,
     }
     logger.debug(f"Creating job with metadata: {metadata_dict}")
 
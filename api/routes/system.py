@@ -155,6 +155,35 @@ async def get_cache_stats():
         raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
 
 
+@router.get("/api/ws/metrics")
+async def get_websocket_metrics():
+    """
+    Get WebSocket fan-out metrics
+
+    Returns:
+        Connected clients, queue depth, dropped/coalesced counts and send lag
+    """
+    return {
+        "success": True,
+        "metrics": manager.get_metrics()
+    }
+
+
+@router.get("/api/http-pool/metrics")
+async def get_http_pool_metrics():
+    """
+    Get shared LLM HTTP connection pool metrics
+
+    Returns:
+        Per-provider request counts, in-flight requests and open/idle connections
+    """
+    from core.http_pool import get_http_pool
+    return {
+        "success": True,
+        "metrics": get_http_pool().get_metrics()
+    }
+
+
 @router.post("/api/cache/clear")
 async def clear_cache(request: Request):
     """
@@ -5,13 +5,13 @@ Upload, analyze, and language detection endpoints.
 import math
 import os
 import re
-import uuid
 import tempfile
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Request
 
 from api.models import AnalyzeRequest, AnalyzeResponse
+from api.services.upload_store import UPLOAD_CHUNK_SIZE, UploadTooLargeError, get_upload_store
 from core.batch_processor import read_document
 from config.logging_config import get_logger
 
@@ -44,32 +44,26 @@ async def upload_file(
             detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         )
 
-    # Read file
-    contents = await file.read()
-
     # Check size (configurable via MAX_UPLOAD_SIZE_MB env var, default 50MB)
     max_size_mb = int(os.getenv("MAX_UPLOAD_SIZE_MB", "50"))
     max_size_bytes = max_size_mb * 1024 * 1024
-    if len(contents) > max_size_bytes:
+    if file.size is not None and file.size > max_size_bytes:
         raise HTTPException(status_code=400, detail=f"File too large (max {max_size_mb}MB)")
 
-    # Create uploads directory if not exists
-    upload_dir = Path(__file__).parent.parent.parent / "uploads"
-    upload_dir.mkdir(exist_ok=True)
-
-    # Generate unique filename
-    unique_filename = f"{uuid.uuid4().hex}_{file.filename}"
-    file_path = upload_dir / unique_filename
-
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Stream to disk in chunks, hashing as we go; identical re-uploads
+    # get their own file but reuse the cached analysis
+    try:
+        stored = await get_upload_store().save(file, file.filename, max_size_bytes)
+    except UploadTooLargeError:
+        raise HTTPException(status_code=400, detail=f"File too large (max {max_size_mb}MB)")
 
     return {
         "filename": file.filename,
-        "server_path": str(file_path),
-        "size": len(contents),
-        "content_type": file.content_type
+        "server_path": str(stored.path),
+        "size": stored.size,
+        "content_type": file.content_type,
+        "sha256": stored.sha256,
+        "deduplicated": stored.deduplicated
     }
 
 
@@ -87,6 +81,12 @@ async def analyze_file(
         if not file_path.exists():
             raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
 
+        # Identical uploads share one cached analysis
+        upload_store = get_upload_store()
+        cached = upload_store.get_analysis(file_path.resolve())
+        if cached:
+            return AnalyzeResponse(**cached)
+
         # Extract text from document
         text = read_document(file_path)
 
@@ -118,12 +118,14 @@ async def analyze_file(
         # Calculate chunks estimate (3000 words per chunk)
         chunks_estimate = math.ceil(word_count / 3000) if word_count > 0 else 1
 
-        return AnalyzeResponse(
+        response = AnalyzeResponse(
             word_count=word_count,
             character_count=len(text),
             detected_language=detected_lang,
             chunks_estimate=chunks_estimate
         )
+        upload_store.set_analysis(file_path.resolve(), response.model_dump())
+        return response
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
@@ -140,8 +142,8 @@ async def detect_language(file: UploadFile = File(...)):
         # Save uploaded file temporarily
         suffix = Path(file.filename).suffix
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                tmp.write(chunk)
             tmp_path = tmp.name
 
         try:
@@ -16,6 +16,7 @@ from core.book_writer_v2 import (
     BookWriterConfig,
     BookProject,
     BookStatus,
+    BookCheckpointStore,
 )
 from core.book_writer_v2.ai_adapter import AIClientAdapter, MockAIClient
 from core.book_writer_v2.progress import progress_tracker
@@ -42,6 +43,9 @@ class BookWriterV2Service:
             logger.warning("No AI client provided, using mock client")
             self.ai_client = MockAIClient()
 
+        # Per-section checkpoints so failed or paused projects can resume
+        self.checkpoints = BookCheckpointStore(os.path.join(db_path, "checkpoints.db"))
+
         self._active_projects: Dict[str, BookProject] = {}
         self._running_tasks: Dict[str, asyncio.Task] = {}
 
@@ -62,24 +66,14 @@ class BookWriterV2Service:
         model: Optional[str] = None,
     ) -> BookProject:
         """Create a new book project and start generation in background."""
-        config = BookWriterConfig(
-            words_per_page=words_per_page,
-            default_sections_per_chapter=sections_per_chapter,
-        )
-
-        # Handle provider/model override
-        use_ai_client = self.ai_client
-        if provider or model:
-            from ai_providers.unified_client import UnifiedLLMClient
-            # Create a specialized client for this project
-            spec_client = UnifiedLLMClient(preferred_provider=provider, model_override=model)
-            use_ai_client = AIClientAdapter(spec_client)
-
-        pipeline = BookWriterPipeline(
-            config=config,
-            ai_client=use_ai_client,
-            progress_callback=self._progress_callback,
-        )
+        # Kept with the checkpoint so resume_project rebuilds the same pipeline
+        options = {
+            "words_per_page": words_per_page,
+            "sections_per_chapter": sections_per_chapter,
+            "provider": provider,
+            "model": model,
+        }
+        pipeline = self._build_pipeline(**options)
 
         project = BookProject(
             user_request=f"{title}: {description}",
@@ -99,6 +93,7 @@ class BookWriterV2Service:
                 genre=genre,
                 audience=audience,
                 subtitle=subtitle,
+                options=options,
             )
         )
         self._running_tasks[project.id] = task
@@ -106,16 +101,74 @@ class BookWriterV2Service:
         await self._save_project(project)
         return project
 
+    async def resume_project(self, project_id: str) -> Optional[BookProject]:
+        """Resume a failed or paused project from its checkpoint in background."""
+        if project_id in self._running_tasks:
+            return None
+
+        checkpoint = self.checkpoints.load(project_id)
+        if checkpoint is None:
+            return None
+
+        project = await self.get_project(project_id)
+        if project is None:
+            project = BookProject(id=project_id)
+
+        options = checkpoint.inputs.get("options", {})
+        if "words_per_page" not in options and checkpoint.blueprint is not None:
+            # Checkpoints written before options were stored
+            options = {**options, "words_per_page": checkpoint.blueprint.words_per_page}
+        pipeline = self._build_pipeline(**options)
+
+        self._active_projects[project_id] = project
+        self._running_tasks[project_id] = asyncio.create_task(
+            self._run_pipeline(pipeline=pipeline, project=project, resume=True)
+        )
+        return project
+
+    def _build_pipeline(
+        self,
+        words_per_page: Optional[int] = None,
+        sections_per_chapter: Optional[int] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> BookWriterPipeline:
+        """Pipeline with the project's config and, if overridden, its own AI client."""
+        config = BookWriterConfig()
+        if words_per_page is not None:
+            config.words_per_page = words_per_page
+        if sections_per_chapter is not None:
+            config.default_sections_per_chapter = sections_per_chapter
+
+        # Handle provider/model override
+        use_ai_client = self.ai_client
+        if provider or model:
+            from ai_providers.unified_client import UnifiedLLMClient
+            # Create a specialized client for this project
+            spec_client = UnifiedLLMClient(preferred_provider=provider, model_override=model)
+            use_ai_client = AIClientAdapter(spec_client)
+
+        return BookWriterPipeline(
+            config=config,
+            ai_client=use_ai_client,
+            progress_callback=self._progress_callback,
+            checkpoint_store=self.checkpoints,
+        )
+
     async def _run_pipeline(
         self,
         pipeline: BookWriterPipeline,
         project: "BookProject",
+        resume: bool = False,
         **kwargs,
     ):
         """Run pipeline in background task."""
         project_id = project.id
         try:
-            result = await pipeline.create_book(project=project, **kwargs)
+            if resume:
+                result = await pipeline.resume_book(project_id, project=project)
+            else:
+                result = await pipeline.create_book(project=project, **kwargs)
             self._active_projects[project_id] = result
             await self._save_project(result)
 
@@ -124,7 +177,10 @@ class BookWriterV2Service:
             if project_id in self._active_projects:
                 proj = self._active_projects[project_id]
                 proj.status = BookStatus.FAILED
-                proj.add_error(str(e), "Pipeline", recoverable=False)
+                # Recoverable when resume_project has a checkpoint to continue from
+                proj.add_error(
+                    str(e), "Pipeline", recoverable=self.checkpoints.exists(project_id)
+                )
                 await self._save_project(proj)
 
         finally:
@@ -199,6 +255,8 @@ class BookWriterV2Service:
             self._running_tasks[project_id].cancel()
             self._running_tasks.pop(project_id, None)
 
+        self.checkpoints.delete(project_id)
+
         filepath = os.path.join(self.db_path, f"{project_id}.json")
         if os.path.exists(filepath):
             os.remove(filepath)
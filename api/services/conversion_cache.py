@@ -0,0 +1,197 @@
+"""
+Content-addressed cache for download format conversions.
+
+Converted artifacts are stored under ``<source sha256>.<format>``, so a
+job output is converted at most once per format no matter how many
+clients download it. Concurrent requests for the same (hash, format)
+share one in-flight conversion, conversions run in a bounded worker
+pool off the event loop, and the least recently used artifacts are
+evicted once the cache exceeds its disk budget. No FastAPI or HTTP
+concerns.
+"""
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# (source_path, target_format, output_dir, base_name) -> converted path or None
+Converter = Callable[[Path, str, Path, str], Awaitable[Optional[Path]]]
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of a conversion request."""
+    ready: bool
+    path: Optional[Path] = None
+    cached: bool = False
+
+
+class ConversionCache:
+    """Deduplicated, pooled, LRU-bounded format conversions."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int, max_workers: int = 2):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="conversion"
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # (path, size, mtime_ns) -> sha256, so unchanged sources are hashed once
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+        # artifact name -> size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        artifacts = [p for p in self.cache_dir.iterdir() if p.is_file() and not p.name.startswith(".")]
+        for path in sorted(artifacts, key=lambda p: p.stat().st_mtime):
+            self._entries[path.name] = path.stat().st_size
+        self._total = sum(self._entries.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    async def get(
+        self,
+        source_path: Path,
+        target_format: str,
+        convert: Converter,
+        wait: Optional[float] = None,
+    ) -> ConversionResult:
+        """Return the converted artifact, converting it at most once.
+
+        Args:
+            source_path: Original job output.
+            target_format: Requested format (file extension).
+            convert: Async converter, run on a worker thread.
+            wait: Seconds to wait for a running conversion (None = until done).
+
+        Returns:
+            ConversionResult; ``ready`` is False if ``wait`` elapsed first.
+
+        Raises:
+            Exception: Whatever the converter raised, or ValueError if it
+                produced no file.
+        """
+        loop = asyncio.get_running_loop()
+        digest = await loop.run_in_executor(self._pool, self._source_digest, Path(source_path))
+        name = f"{digest}.{target_format}"
+
+        cached = self._lookup(name)
+        if cached is not None:
+            return ConversionResult(ready=True, path=cached, cached=True)
+
+        task = self._inflight.get(name)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._convert(Path(source_path), target_format, name, convert)
+            )
+            self._inflight[name] = task
+            task.add_done_callback(lambda t: self._finished(name, t))
+
+        try:
+            path = await asyncio.wait_for(asyncio.shield(task), wait)
+        except asyncio.TimeoutError:
+            return ConversionResult(ready=False)
+        return ConversionResult(ready=True, path=path)
+
+    def is_converting(self, source_path: Path, target_format: str) -> bool:
+        """Whether a conversion of this source/format is currently running."""
+        digest = self._digests.get(self._stat_key(Path(source_path)))
+        return digest is not None and f"{digest}.{target_format}" in self._inflight
+
+    def _finished(self, name: str, task: asyncio.Task):
+        self._inflight.pop(name, None)
+        # Retrieve the error so conversions nobody waited for do not warn on exit
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Conversion %s failed: %s", name, task.exception())
+
+    def _lookup(self, name: str) -> Optional[Path]:
+        if name not in self._entries:
+            return None
+        path = self.cache_dir / name
+        if not path.exists():
+            self._forget(name)
+            return None
+        self._entries.move_to_end(name)
+        os.utime(path)
+        return path
+
+    async def _convert(self, source_path: Path, target_format: str, name: str, convert: Converter) -> Path:
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(
+            self._pool, self._convert_sync, source_path, target_format, name, convert
+        )
+        self._entries[name] = path.stat().st_size
+        self._total += self._entries[name]
+        self._evict(keep=name)
+        return path
+
+    def _convert_sync(self, source_path: Path, target_format: str, name: str, convert: Converter) -> Path:
+        work_dir = Path(tempfile.mkdtemp(prefix=".convert_", dir=self.cache_dir))
+        try:
+            converted = asyncio.run(convert(source_path, target_format, work_dir, source_path.stem))
+            if not converted or not Path(converted).exists():
+                raise ValueError(f"Failed to convert to {target_format} format")
+            final = self.cache_dir / name
+            shutil.move(str(converted), final)
+            logger.info("Converted %s -> %s", source_path.name, final.name)
+            return final
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _evict(self, keep: str):
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            name = next(iter(self._entries))
+            if name == keep:
+                break
+            self._forget(name)
+            (self.cache_dir / name).unlink(missing_ok=True)
+            logger.debug("Evicted conversion artifact %s", name)
+
+    def _forget(self, name: str):
+        self._total -= self._entries.pop(name, 0)
+
+    @staticmethod
+    def _stat_key(path: Path) -> Tuple[str, int, int]:
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+    def _source_digest(self, path: Path) -> str:
+        key = self._stat_key(path)
+        digest = self._digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    sha.update(block)
+            digest = self._digests[key] = sha.hexdigest()
+        return digest
+
+
+_cache: Optional[ConversionCache] = None
+
+
+def get_conversion_cache() -> ConversionCache:
+    """Get the shared ConversionCache under settings.cache_dir."""
+    global _cache
+    if _cache is None:
+        from config.settings import settings
+        _cache = ConversionCache(
+            settings.cache_dir / "conversions",
+            max_bytes=settings.conversion_cache_max_mb * 1024 * 1024,
+            max_workers=settings.conversion_workers,
+        )
+    return _cache
@@ -0,0 +1,163 @@
+"""
+Streaming upload storage with content-hash deduplication.
+
+Uploads are copied to disk in fixed-size chunks while a SHA-256 of the
+content is computed, so memory stays flat regardless of file size and
+an oversized upload is rejected as soon as it crosses the limit.
+
+Every upload gets its own ``<uuid>_<filename>`` file, so a path handed to
+one client never points at another client's upload. Files are indexed by
+their hash (``uploads.db``) and the analysis computed for a file (word
+count, language) is cached against the hash, so re-uploading identical
+content reuses the analysis instead of recomputing it. No FastAPI or
+HTTP concerns.
+"""
+import hashlib
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.logging_config import get_logger
+from core.database import get_db_backend
+
+logger = get_logger(__name__)
+
+# Read/write granularity for streamed uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Project root — computed once at module load
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+
+
+class UploadTooLargeError(ValueError):
+    """Upload exceeded the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+
+
+@dataclass
+class StoredUpload:
+    """Result of storing an upload."""
+    path: Path
+    size: int
+    sha256: str
+    deduplicated: bool = False  # Identical content was uploaded before
+
+
+class UploadStore:
+    """Hash index over the uploads directory, with analyses cached per content."""
+
+    def __init__(self, upload_dir: Path, db_dir: Optional[Path] = None):
+        self.upload_dir = Path(upload_dir)
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self._backend = get_db_backend("uploads", db_dir=db_dir)
+        self._init_db()
+
+    def _init_db(self):
+        with self._backend.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS upload_files (
+                    path TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_upload_files_sha256 ON upload_files(sha256)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS upload_analyses (
+                    sha256 TEXT PRIMARY KEY,
+                    analysis_json TEXT NOT NULL
+                )
+            """)
+
+    async def save(self, upload: Any, filename: str, max_bytes: int) -> StoredUpload:
+        """Stream an upload to disk, hashing it and enforcing max_bytes.
+
+        Args:
+            upload: Object with an async ``read(size)`` (e.g. UploadFile).
+            filename: Original client filename (kept as suffix of the stored name).
+            max_bytes: Size limit; the partial file is removed once exceeded.
+
+        Returns:
+            StoredUpload for the new file; ``deduplicated`` is set when the
+            same content was stored before (its analysis is then reused).
+
+        Raises:
+            UploadTooLargeError: If the upload is larger than max_bytes.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        tmp_path = self.upload_dir / f".{uuid.uuid4().hex}.part"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                while True:
+                    chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise UploadTooLargeError(max_bytes)
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        sha256 = digest.hexdigest()
+        file_path = self.upload_dir / f"{uuid.uuid4().hex}_{Path(filename).name}"
+        os.replace(tmp_path, file_path)
+
+        with self._backend.connection() as conn:
+            seen = conn.execute(
+                "SELECT 1 FROM upload_files WHERE sha256 = ? LIMIT 1", (sha256,)
+            ).fetchone() is not None
+            conn.execute("""
+                INSERT INTO upload_files (path, sha256, size, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (str(file_path), sha256, size, time.time()))
+
+        if seen:
+            logger.info(f"Upload deduplicated: {filename} matches earlier content {sha256[:12]}")
+        return StoredUpload(path=file_path, size=size, sha256=sha256, deduplicated=seen)
+
+    def get_analysis(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for a stored upload's content, if any."""
+        with self._backend.connection() as conn:
+            row = conn.execute("""
+                SELECT a.analysis_json, f.size
+                FROM upload_files f JOIN upload_analyses a ON a.sha256 = f.sha256
+                WHERE f.path = ?
+            """, (str(file_path),)).fetchone()
+        if not row:
+            return None
+        # The path may have been overwritten by something other than this store
+        if not file_path.exists() or file_path.stat().st_size != row[1]:
+            return None
+        return json.loads(row[0])
+
+    def set_analysis(self, file_path: Path, analysis: Dict[str, Any]) -> None:
+        """Cache the analysis for a stored upload's content (no-op for unknown paths)."""
+        with self._backend.connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO upload_analyses (sha256, analysis_json)
+                SELECT sha256, ? FROM upload_files WHERE path = ?
+            """, (json.dumps(analysis), str(file_path)))
+
+
+_store: Optional[UploadStore] = None
+
+
+def get_upload_store() -> UploadStore:
+    """Get the shared UploadStore for the project uploads directory."""
+    global _store
+    if _store is None:
+        _store = UploadStore(PROJECT_ROOT / "uploads")
+    return _store
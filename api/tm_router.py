@@ -16,6 +16,7 @@ from core.tm.schemas import (
     BulkSegmentCreate, BulkSegmentResult,
     LookupRequest, LookupResponse,
     ProcessRequest, ProcessResponse,
+    PretranslateRequest, PretranslateResponse,
     TMStats, ImportResult,
 )
 from core.tm.io import (
@@ -247,6 +248,28 @@ async def process(data: ProcessRequest):
     return await service.process(data)
 
 
+@router.post("/pretranslate", response_model=PretranslateResponse)
+async def pretranslate(data: PretranslateRequest):
+    """
+    Pre-translate a whole document from Translation Memory.
+
+    Matches every segment in one batch and returns leverage statistics
+    (exact/near-exact/fuzzy/repetition/new word counts) plus the segments
+    that still need machine translation.
+
+    - **tm_ids**: List of TM IDs to search
+    - **source_text**: Full document text
+    - **segment_type**: sentence, paragraph, or smart (default: smart)
+    - **min_similarity**: Minimum similarity threshold (default: 0.75)
+    - **include_segments**: Return per-segment results (default: true)
+    """
+    service = get_service()
+    try:
+        return await service.pretranslate(data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 # =============================================================================
 # Learn from Translations
 # =============================================================================
@@ -325,9 +348,20 @@ async def import_segments(
     service = get_service()
 
     try:
-        content = await file.read()
         filename = file.filename.lower()
 
+        if filename.endswith('.tmx'):
+            # Streamed from the spooled upload, never read into memory whole
+            result = await service.import_tmx(tm_id, file.file, skip_duplicates)
+            return ImportResult(
+                status="success",
+                added=result.added,
+                updated=0,
+                skipped=result.skipped,
+                errors=result.errors,
+            )
+
+        content = await file.read()
         segments_data = []
 
         if filename.endswith('.json'):
@@ -351,17 +385,6 @@ async def import_segments(
                     "source_type": row.get("source_type", "human"),
                 })
 
-        elif filename.endswith('.tmx'):
-            # Parse TMX using io module
-            metadata, parsed_segments = import_tm_from_tmx(content.decode('utf-8'))
-            for seg in parsed_segments:
-                segments_data.append({
-                    "source_text": seg.source_text,
-                    "target_text": seg.target_text,
-                    "quality_score": seg.quality_score,
-                    "source_type": seg.source_type,
-                })
-
         else:
             raise HTTPException(status_code=400, detail="Unsupported file format. Use JSON, CSV, or TMX.")
 
@@ -407,6 +430,14 @@ async def export_segments(
         if not tm:
             raise HTTPException(status_code=404, detail="Translation Memory not found")
 
+        if format == "tmx":
+            # Every segment, written as it is read from the database
+            return StreamingResponse(
+                service.iter_tmx_export(tm_id),
+                media_type="application/xml",
+                headers={"Content-Disposition": f'attachment; filename="tm_{tm_id}.tmx"'}
+            )
+
         # Get all segments
         result = await service.list_segments(tm_id, page=1, limit=10000)
         segments = result.segments
@@ -447,32 +478,6 @@ async def export_segments(
                 headers={"Content-Disposition": f'attachment; filename="tm_{tm_id}.csv"'}
             )
 
-        elif format == "tmx":
-            # Generate TMX using io module
-            segment_dicts = [
-                {
-                    "source_text": s.source_text,
-                    "target_text": s.target_text,
-                    "quality_score": s.quality_score,
-                    "source_type": s.source_type.value if hasattr(s.source_type, 'value') else s.source_type,
-                    "notes": getattr(s, 'notes', None),
-                    "created_at": s.created_at.isoformat() if s.created_at else None,
-                }
-                for s in segments
-            ]
-            tmx_content = export_tm_to_tmx(
-                tm_name=tm.name,
-                segments=segment_dicts,
-                source_lang=tm.source_language,
-                target_lang=tm.target_language,
-            )
-
-            return StreamingResponse(
-                io.BytesIO(tmx_content.encode('utf-8')),
-                media_type="application/xml",
-                headers={"Content-Disposition": f'attachment; filename="tm_{tm_id}.tmx"'}
-            )
-
         else:
             raise HTTPException(status_code=400, detail="Unsupported format. Use json, csv, or tmx.")
 
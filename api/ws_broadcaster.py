@@ -0,0 +1,237 @@
+"""
+Fan-out WebSocket broadcaster.
+
+``broadcast()`` serializes each message once and enqueues the resulting
+text on every interested client; a per-client sender task drains that
+queue. Broadcasting never awaits a socket, so one slow dashboard cannot
+stall job progress for everyone else.
+
+Per-client queues are bounded:
+- Progress-style events (``COALESCE_EVENTS``) for the same job replace
+  the pending one instead of queueing behind it (coalesce-latest)
+- When a queue is still full the oldest pending message is dropped
+
+Clients may subscribe to job ids. A message carrying a ``job_id`` is
+only delivered to clients subscribed to that job or to no job at all;
+messages without one (queue stats) go to everybody.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Events where only the latest value per job matters
+COALESCE_EVENTS = frozenset({
+    "job_progress",
+    "job_updated",
+    "batch_completed",
+    "progress",
+    "stats_update",
+})
+
+DEFAULT_QUEUE_SIZE = 256
+DEFAULT_SEND_TIMEOUT = 10.0
+
+
+class _Client:
+    """Connection state: subscriptions, pending messages and send stats."""
+
+    def __init__(self, websocket: WebSocket, max_queue: int):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.topics: Set[str] = set()
+        # key -> (text, enqueued_at); insertion order is send order
+        self.pending: "OrderedDict[Hashable, Tuple[str, float]]" = OrderedDict()
+        self.ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sending = False
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+        self.lag_last = 0.0
+
+    def wants(self, topic: Optional[str]) -> bool:
+        return topic is None or not self.topics or topic in self.topics
+
+    def enqueue(self, key: Hashable, text: str, now: float):
+        if key in self.pending:
+            # Keep the queue position (and age) of the older update
+            _, enqueued_at = self.pending[key]
+            self.pending[key] = (text, enqueued_at)
+            self.coalesced += 1
+        else:
+            if len(self.pending) >= self.max_queue:
+                self.pending.popitem(last=False)
+                self.dropped += 1
+            self.pending[key] = (text, now)
+        self.ready.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self.pending),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "subscriptions": sorted(self.topics),
+            "lag_last_ms": round(self.lag_last * 1000, 2),
+            "lag_avg_ms": round(self.lag_total / self.sent * 1000, 2) if self.sent else 0.0,
+            "lag_max_ms": round(self.lag_max * 1000, 2),
+        }
+
+
+class ConnectionManager:
+    """
+    Manage WebSocket connections for real-time updates.
+
+    Handles client connections and broadcasts job progress, status
+    changes, and queue statistics through bounded per-client queues.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ):
+        """
+        Args:
+            max_queue: Pending messages kept per client before dropping the oldest
+            send_timeout: Seconds a single send may take before the client is dropped
+        """
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._clients: Dict[WebSocket, _Client] = {}
+        self._seq = itertools.count()
+        self.messages_broadcast = 0
+        self.clients_dropped = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self._clients)
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        client = _Client(websocket, self.max_queue)
+        client.task = asyncio.create_task(self._sender(client))
+        self._clients[websocket] = client
+
+    def disconnect(self, websocket: WebSocket):
+        client = self._clients.pop(websocket, None)
+        if client is not None and client.task is not None:
+            client.task.cancel()
+
+    def subscribe(self, websocket: WebSocket, job_id: str):
+        """Limit job events sent to this client to the subscribed jobs."""
+        client = self._clients.get(websocket)
+        if client is not None:
+            client.topics.add(job_id)
+
+    def unsubscribe(self, websocket: WebSocket, job_id: Optional[str] = None):
+        """Drop one subscription, or all of them (receive every job again)."""
+        client = self._clients.get(websocket)
+        if client is None:
+            return
+        if job_id is None:
+            client.topics.clear()
+        else:
+            client.topics.discard(job_id)
+
+    async def broadcast(self, message: dict, topic: Optional[str] = None):
+        """
+        Queue a message for every interested client.
+
+        Args:
+            message: JSON-serializable event dict
+            topic: Job id used for subscription filtering (defaults to message["job_id"])
+        """
+        if not self._clients:
+            return
+
+        if topic is None:
+            topic = message.get("job_id")
+        text = json.dumps(message, default=str)
+        key = self._message_key(message, topic)
+        now = time.monotonic()
+
+        for client in self._clients.values():
+            if client.wants(topic):
+                client.enqueue(key, text, now)
+        self.messages_broadcast += 1
+
+    async def send_personal(self, websocket: WebSocket, message: dict):
+        """Queue a message for one client (keeps sends on its sender task)."""
+        client = self._clients.get(websocket)
+        if client is not None:
+            key = self._message_key(message, message.get("job_id"))
+            client.enqueue(key, json.dumps(message, default=str), time.monotonic())
+
+    def _message_key(self, message: dict, topic: Optional[str]) -> Hashable:
+        event = message.get("event")
+        if event in COALESCE_EVENTS:
+            return (event, topic)
+        return next(self._seq)
+
+    async def _sender(self, client: _Client):
+        websocket = client.websocket
+        try:
+            while True:
+                if not client.pending:
+                    client.ready.clear()
+                    await client.ready.wait()
+                    continue
+
+                _, (text, enqueued_at) = client.pending.popitem(last=False)
+                client.sending = True
+                await asyncio.wait_for(websocket.send_text(text), self.send_timeout)
+                client.sending = False
+
+                lag = time.monotonic() - enqueued_at
+                client.sent += 1
+                client.lag_last = lag
+                client.lag_total += lag
+                client.lag_max = max(client.lag_max, lag)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("WebSocket send failed (client may have disconnected): %s", e)
+            self.clients_dropped += 1
+            if self._clients.get(websocket) is client:
+                del self._clients[websocket]
+
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """Wait until every client queue is empty. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while any(c.pending or c.sending for c in self._clients.values()):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, drop counts and send lag across all clients."""
+        clients = [c.stats() for c in self._clients.values()]
+        sent = sum(c.sent for c in self._clients.values())
+        lag_total = sum(c.lag_total for c in self._clients.values())
+        return {
+            "clients": len(clients),
+            "messages_broadcast": self.messages_broadcast,
+            "clients_dropped": self.clients_dropped,
+            "queued": sum(c["queued"] for c in clients),
+            "sent": sent,
+            "dropped": sum(c["dropped"] for c in clients),
+            "coalesced": sum(c["coalesced"] for c in clients),
+            "lag_avg_ms": round(lag_total / sent * 1000, 2) if sent else 0.0,
+            "lag_max_ms": max((c["lag_max_ms"] for c in clients), default=0.0),
+            "per_client": clients,
+        }
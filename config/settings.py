@@ -89,18 +89,50 @@ class Settings(BaseSettings):
     # Phase 5.1: Chunk Cache Settings
     chunk_cache_enabled: bool = True  # Enable chunk-level translation caching
     chunk_cache_ttl_days: int = 30  # Cache entry TTL (for future eviction)
+    chunk_cache_write_behind: bool = True  # Buffer cache writes, flush in batches
+    chunk_cache_flush_interval: float = 2.0  # Seconds between write-behind flushes
+    chunk_cache_flush_size: int = 500  # Pending writes that trigger a flush
+
+    # Request packing: translate many small chunks (subtitles, table cells) per LLM call
+    pack_small_chunks: bool = True
+    pack_max_tokens: int = 1500  # Source token budget per packed request
+    pack_chunk_tokens: int = 200  # Chunks above this estimate are sent on their own
+
+    # Shared LLM HTTP connection pool (one client per provider, see core/http_pool.py)
+    http2_enabled: bool = True  # Needs h2 (httpx[http2] in requirements.txt)
+    http_pool_max_connections: int = 100  # Connections per provider
+    http_pool_max_keepalive: int = 20  # Idle connections kept warm per provider
+    http_pool_keepalive_expiry: float = 30.0  # Seconds before an idle connection is closed
 
     # Phase 5.2: Checkpoint Settings (Fault-Tolerant Resume)
     checkpoint_enabled: bool = True  # Enable job checkpointing for resume capability
     checkpoint_interval: int = 10  # Save checkpoint every N chunks
 
+    # Job queue worker leases (several batch processors per queue)
+    job_lease_seconds: float = 300.0  # Claimed job is re-queued if not renewed in time
+    job_heartbeat_interval: float = 60.0  # Seconds between lease renewals
+
     # Phase 5.4: Multi-Format Streaming Pipeline (Memory Optimization + Live Preview)
     streaming_enabled: bool = True  # Enable memory-efficient batch processing
     streaming_batch_size: int = 100  # Chunks per batch (reduces memory usage)
+    streaming_sliding_window: bool = True  # Refill concurrency slots continuously instead of per batch
     streaming_broadcast_chunks: bool = True  # Broadcast individual chunk completions
     streaming_partial_export: bool = True  # Export partial files per batch (DOCX, PDF, TXT)
     streaming_memory_limit_mb: int = 500  # Max memory per batch (monitoring)
 
+    # WebSocket fan-out (per-client bounded queues)
+    websocket_queue_size: int = 256  # Pending messages per client before dropping the oldest
+    websocket_send_timeout: float = 10.0  # Seconds before a stalled client is disconnected
+
+    # Download conversions (content-addressed cache under cache_dir/conversions)
+    conversion_workers: int = 2  # Conversions running at once
+    conversion_cache_max_mb: int = 2048  # Disk budget before least-recently-used artifacts are evicted
+    conversion_wait_seconds: float = 10.0  # Wait inside the request before answering 202
+
+    # Proofreading editor (segments are served in windows)
+    editor_page_size: int = 100  # Segments per window when the client sends no limit
+    editor_max_page_size: int = 500  # Upper bound for a requested limit
+
     # Translation Memory
     tm_enabled: bool = True
     tm_fuzzy_threshold: float = 0.85  # 85% similarity for fuzzy matches
@@ -126,6 +158,11 @@ class Settings(BaseSettings):
     database_backend: str = "sqlite"  # sqlite | postgresql (Sprint 2)
     database_url: Optional[str] = None
     database_dir: Path = BASE_DIR / "data"
+    database_pool_enabled: bool = True  # Reuse SQLite connections across calls
+    database_pool_size: int = 8  # Idle connections kept per database
+    database_synchronous: str = "NORMAL"  # PRAGMA synchronous (WAL-safe)
+    database_mmap_size: int = 64 * 1024 * 1024  # PRAGMA mmap_size in bytes
+    database_busy_timeout_ms: int = 5000  # Wait on locked database
 
     # ========== Cleanup / Retention ==========
     cleanup_upload_retention_days: int = 7
@@ -148,6 +185,7 @@ class Settings(BaseSettings):
     # PaddleOCR Settings (local OCR, no API key needed)
     paddle_lang: str = "en"  # Language: en, ch, multilingual, etc.
     ocr_backend: str = "auto"  # auto, paddle, hybrid, mathpix, none
+    ocr_workers: int = 1  # Processes rendering + OCRing PDF pages (1 = sequential)
 
     # PDF Processing
     poppler_path: Optional[str] = None
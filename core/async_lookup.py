@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Async Lookup Executor - Run blocking TM/cache I/O off the event loop
+
+TranslationMemory and ChunkCache use synchronous sqlite3 calls. Awaiting
+them directly inside translate_chunk blocks every other coroutine on the
+event loop while the disk I/O runs. LookupExecutor moves those calls onto
+a dedicated thread pool so LLM requests keep flowing.
+
+The default pool has a single worker: TranslationMemory shares one sqlite
+connection, so its calls must stay serialized.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+
+class LookupExecutor:
+    """Dedicated thread pool for blocking TM and cache operations."""
+
+    def __init__(self, max_workers: int = 1, thread_name_prefix: str = "tm-lookup"):
+        """
+        Args:
+            max_workers: Number of worker threads (keep 1 for shared sqlite connections)
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get or create the underlying thread pool."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix
+                    )
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the pool and await its result.
+
+        Args:
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            Whatever func returns (exceptions are re-raised)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the pool (a new one is created on next use)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+# Global instance
+_lookup_executor: Optional[LookupExecutor] = None
+
+
+def get_lookup_executor() -> LookupExecutor:
+    """Get the process-wide lookup executor."""
+    global _lookup_executor
+    if _lookup_executor is None:
+        _lookup_executor = LookupExecutor()
+    return _lookup_executor
@@ -16,12 +16,12 @@ Phase 1.5 Refactor:
 """
 
 import asyncio
+import threading
 import time
 import traceback
 from pathlib import Path
-from typing import Optional, List, Any, Dict, Tuple
+from typing import Optional, List, Any, Dict, Set, Tuple
 from collections.abc import Callable
-import httpx
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -50,10 +50,13 @@ try:
 except ImportError:
     HAS_DOCX = False
 
-from .job_queue import JobQueue, TranslationJob, JobStatus, JobPriority
-from .chunker import SmartChunker
+from .job_queue import JobQueue, TranslationJob, JobStatus, JobPriority, default_worker_id
+from .chunker import SmartChunker, TranslationChunk
+from .chunk_packer import ChunkPacker
+from .http_pool import get_http_client, pooled_client
 from .cache import TranslationCache  # Legacy cache (keep for compatibility)
-from .cache.chunk_cache import ChunkCache  # Phase 5.1: New chunk-level cache
+from .cache.legacy_cache import get_translation_cache
+from .cache.chunk_cache import get_chunk_cache  # Phase 5.1: New chunk-level cache
 from .cache import CheckpointManager, serialize_translation_result, deserialize_translation_result  # Phase 5.2: Checkpoints
 from .validator import QualityValidator
 from .glossary_legacy import GlossaryManager
@@ -285,7 +288,8 @@ class BatchProcessor:
         queue: Optional[JobQueue] = None,
         max_concurrent_jobs: int = 1,
         auto_start: bool = False,
-        websocket_manager: Optional[Any] = None
+        websocket_manager: Optional[Any] = None,
+        worker_id: Optional[str] = None
     ):
         """
         Initialize batch processor
@@ -294,6 +298,7 @@ class BatchProcessor:
             queue: Job queue (creates new if None)
             max_concurrent_jobs: Maximum number of concurrent jobs
             auto_start: Auto-start processing on init
+            worker_id: Lease owner name in the job queue (default: host:pid)
         """
         self.queue = queue or JobQueue()
         self.max_concurrent_jobs = max_concurrent_jobs
@@ -302,8 +307,20 @@ class BatchProcessor:
         self.background_tasks: List[asyncio.Task] = []  # Track all background tasks
         self.websocket_manager = websocket_manager  # For realtime progress broadcast
 
-        # Phase 5.2: Initialize checkpoint manager
         from config.settings import settings
+
+        # Worker leases: several processors can share one queue
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = settings.job_lease_seconds
+        self.heartbeat_interval = settings.job_heartbeat_interval
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        # job_id -> task running it, so a lost lease can stop the job
+        self._job_tasks: Dict[str, asyncio.Task] = {}
+        self._job_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lost_leases: Set[str] = set()
+
+        # Phase 5.2: Initialize checkpoint manager
         if settings.checkpoint_enabled:
             self.checkpoint_manager = CheckpointManager(
                 db_path=settings.checkpoint_dir / "checkpoints.db"
@@ -328,21 +345,26 @@ class BatchProcessor:
             continuous: If True, keep processing until stopped
         """
         self.is_running = True
-        logger.info("🚀 Batch Processor started")
+        logger.info(f"🚀 Batch Processor started (worker: {self.worker_id})")
+        self._start_heartbeat()
 
         while self.is_running:
             # Check if we can process more jobs
-            if len(self.current_jobs) >= self.max_concurrent_jobs:
+            free_slots = self.max_concurrent_jobs - len(self.current_jobs)
+            if free_slots <= 0:
                 await asyncio.sleep(1)
                 continue
 
-            # Get next job from queue
-            job = self.queue.get_next_job()
+            # Atomically claim jobs for this worker
+            jobs = self.queue.claim_jobs(self.worker_id, free_slots, lease_seconds=self.lease_seconds)
 
-            if job:
+            for job in jobs:
                 logger.info(f"\n📋 Processing job: {job.job_name} (ID: {job.job_id})")
                 logger.info(f"  Priority: {job.priority} | Status: {job.status}")
 
+                # Count the slot now so the next iteration does not over-claim
+                self.current_jobs.append(job.job_id)
+
                 # Process job in background with exception handling
                 task = asyncio.create_task(self._process_job(job))
                 task.add_done_callback(self._handle_task_exception)
@@ -350,6 +372,8 @@ class BatchProcessor:
                 # Track this task so we can cancel it later
                 self.background_tasks.append(task)
 
+            if jobs:
+                await asyncio.sleep(0)
             else:
                 # No jobs available
                 if not continuous:
@@ -360,11 +384,13 @@ class BatchProcessor:
                 await asyncio.sleep(2)
 
         self.is_running = False
+        self._stop_heartbeat()
         logger.info(" Batch Processor stopped")
 
     def stop(self):
         """Stop processing jobs and cancel all background tasks"""
         self.is_running = False
+        self._stop_heartbeat()
 
         # Cancel all running background tasks
         logger.info(f" Cancelling {len(self.background_tasks)} background tasks...")
@@ -377,6 +403,41 @@ class BatchProcessor:
         self.background_tasks.clear()
         logger.info(f" All background tasks cancelled")
 
+    def _start_heartbeat(self):
+        """Renew job leases from a thread so a busy event loop cannot starve it"""
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name=f"job-heartbeat-{self.worker_id}", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _stop_heartbeat(self):
+        self._heartbeat_stop.set()
+
+    def _heartbeat_loop(self):
+        while not self._heartbeat_stop.wait(self.heartbeat_interval):
+            if not self.current_jobs:
+                continue
+            try:
+                held = set(self.queue.heartbeat(self.worker_id, lease_seconds=self.lease_seconds))
+            except Exception as e:
+                logger.warning(f" Lease heartbeat failed: {e}")
+                continue
+            for job_id in list(self.current_jobs):
+                if job_id not in held and job_id not in self._lost_leases:
+                    logger.warning(f" Lost lease on job {job_id}; stopping it so its new owner is not overwritten")
+                    self._lost_leases.add(job_id)
+                    if self._job_loop:
+                        self._job_loop.call_soon_threadsafe(self._cancel_job_task, job_id)
+
+    def _cancel_job_task(self, job_id: str):
+        """Cancel the task of a job whose lease was lost (runs on the event loop)"""
+        task = self._job_tasks.get(job_id)
+        if task and not task.done():
+            task.cancel()
+
     def _handle_task_exception(self, task: asyncio.Task):
         """Handle exceptions from background tasks"""
         try:
@@ -498,7 +559,12 @@ class BatchProcessor:
                     ocr_client = PaddleOcrClient(lang=ocr_lang)
 
                 if ocr_client:
-                    pipeline = OcrPipeline(ocr_client, dpi=150)  # Reduced for faster processing
+                    from config.settings import settings
+                    pipeline = OcrPipeline(
+                        ocr_client,
+                        dpi=150,  # Reduced for faster processing
+                        workers=settings.ocr_workers
+                    )
                     ocr_processing_mode = 'handwriting' if input_type == 'handwritten_pdf' else 'document'
                     ocr_pages = pipeline.process_pdf(input_path, mode=ocr_processing_mode)
                     input_text = pipeline.merge_pages_to_text(ocr_pages)
@@ -570,7 +636,11 @@ class BatchProcessor:
             tm_fuzzy_threshold=0.85,
             chunk_cache=chunk_cache,
             mode=pipeline_mode,
-            domain=domain
+            domain=domain,
+            packer=ChunkPacker(
+                max_tokens=settings.pack_max_tokens,
+                small_chunk_tokens=settings.pack_chunk_tokens,
+            ) if settings.pack_small_chunks else None
         )
 
     async def _preprocess_smart_tables(
@@ -752,6 +822,50 @@ class BatchProcessor:
             logger.warning(f"ADN extraction failed: {e}")
             return None
 
+    async def _seed_tm_pretranslation(
+        self,
+        translator: TranslatorEngine,
+        chunks: List[TranslationChunk],
+        tm_ids: List[str],
+        source_lang: str,
+        target_lang: str,
+    ) -> int:
+        """
+        Seed chunks that the job's TMs fully cover into the translator.
+
+        Runs the TM pre-translation pass over the chunks in one batch, so
+        covered chunks skip lookups and the LLM. Usage counts are recorded
+        at the end of the job from translator.tm_segments_used.
+
+        Args:
+            translator: Engine of the job
+            chunks: Chunks about to be translated
+            tm_ids: Translation Memories (core.tm) selected for the job
+            source_lang: Job source language, TMs of other pairs are skipped
+            target_lang: Job target language
+
+        Returns:
+            Number of chunks seeded
+        """
+        from core.tm.service import get_tm_service
+
+        try:
+            covered = await get_tm_service().pretranslate_texts(
+                tm_ids, [chunk.text for chunk in chunks], source_lang, target_lang
+            )
+        except Exception as e:
+            logger.warning(f"TM pre-translation failed: {e}")
+            return 0
+
+        seeded = 0
+        for chunk, text in zip(chunks, covered):
+            if text:
+                translator.seed_pretranslation(chunk, text.target_text, text.segment_ids)
+                seeded += 1
+
+        logger.info(f" TM pre-translation: {seeded}/{len(chunks)} chunks reused")
+        return seeded
+
     # =========================================================================
     # End of Phase 1.5 helper methods
     # =========================================================================
@@ -763,7 +877,10 @@ class BatchProcessor:
         Args:
             job: Job to process
         """
-        self.current_jobs.append(job.job_id)
+        if job.job_id not in self.current_jobs:
+            self.current_jobs.append(job.job_id)
+        self._job_loop = asyncio.get_running_loop()
+        self._job_tasks[job.job_id] = asyncio.current_task()
 
         # Set overall timeout for job (2 hours)
         job_timeout = 7200  # 2 hours in seconds
@@ -781,6 +898,11 @@ class BatchProcessor:
                     self._process_job_impl(job),
                     timeout=job_timeout
                 )
+        except asyncio.CancelledError:
+            if job.job_id not in self._lost_leases:
+                raise
+            # Another worker may own the job now: write no status or output
+            logger.warning(f" Job {job.job_id} stopped after losing its lease")
         except asyncio.TimeoutError:
             error_msg = f"Job exceeded maximum time limit of {job_timeout/3600:.1f} hours"
             logger.info(f" {error_msg}")
@@ -812,6 +934,8 @@ class BatchProcessor:
             # Remove from current jobs
             if job.job_id in self.current_jobs:
                 self.current_jobs.remove(job.job_id)
+            self._job_tasks.pop(job.job_id, None)
+            self._lost_leases.discard(job.job_id)
 
     async def _process_job_v2(self, job: TranslationJob):
         """
@@ -834,10 +958,9 @@ class BatchProcessor:
             try:
                 # Get translator and http client from existing setup
                 from config.settings import settings
-                import httpx
 
                 translator = TranslatorEngine(settings)
-                http_client = httpx.AsyncClient(timeout=120.0)
+                http_client = get_http_client()
 
                 self._orchestrator = BatchOrchestrator(
                     translator=translator,
@@ -1015,7 +1138,12 @@ class BatchProcessor:
 
                 if ocr_client:
                     # Create OCR pipeline
-                    pipeline = OcrPipeline(ocr_client, dpi=150)  # Reduced for faster processing
+                    from config.settings import settings
+                    pipeline = OcrPipeline(
+                        ocr_client,
+                        dpi=150,  # Reduced for faster processing
+                        workers=settings.ocr_workers
+                    )
 
                     # Determine OCR mode
                     ocr_processing_mode = 'handwriting' if input_type == 'handwritten_pdf' else 'document'
@@ -1103,19 +1231,17 @@ class BatchProcessor:
         # Phase 5.1: Use new ChunkCache for better caching with hash keys
         from config.settings import settings
         if settings.chunk_cache_enabled:
-            chunk_cache = ChunkCache(
-                db_path=settings.cache_dir / "chunks.db"
-            )
+            # Shared write-behind cache: hits and new entries are flushed in batches
+            chunk_cache = get_chunk_cache(settings.cache_dir / "chunks.db")
             logger.info(f" Chunk cache enabled (DB: {settings.cache_dir / 'chunks.db'})")
         else:
             chunk_cache = None
             logger.warning(" Chunk cache disabled")
 
-        # Legacy cache (fallback for compatibility)
-        cache = TranslationCache(
-                cache_dir=Path("data/cache"),
-                enabled=True
-        )
+        # Legacy cache (fallback for compatibility), shared by concurrent jobs
+        cache = get_translation_cache(Path("data/cache"))
+        # Hit counters are process-wide; report this job's share
+        cache_hits_at_start = cache.hits
 
         glossary_mgr = None
         if job.glossary:
@@ -1166,7 +1292,11 @@ class BatchProcessor:
                 # Phase 5.1: Pass chunk cache and mode parameters
                 chunk_cache=chunk_cache,
                 mode=pipeline_mode,
-                domain=domain
+                domain=domain,
+                packer=ChunkPacker(
+                    max_tokens=settings.pack_max_tokens,
+                    small_chunk_tokens=settings.pack_chunk_tokens,
+                ) if settings.pack_small_chunks else None
         )
 
         # Wrap with STEM translator if STEM mode is enabled
@@ -1270,7 +1400,8 @@ class BatchProcessor:
                     completed_results[chunk_id] = deserialize_translation_result(result_data)
 
                 # Filter out completed chunks
-                chunks_to_process = [c for c in chunks if c.id not in checkpoint.completed_chunk_ids]
+                completed_ids = set(checkpoint.completed_chunk_ids)
+                chunks_to_process = [c for c in chunks if c.id not in completed_ids]
 
                 logger.info(f" Restored {len(completed_results)} cached results")
                 logger.info(f"  → Processing remaining {len(chunks_to_process)} chunks")
@@ -1288,6 +1419,9 @@ class BatchProcessor:
                 )
                 logger.info(f" Initial checkpoint saved")
 
+        # TM pre-translation: Translation Memories (core.tm) selected for the job
+        tm_ids = job.metadata.get('tm_ids') or []
+
         # Phase 5.4: Check if streaming mode should be used
         from config.settings import settings
         use_streaming = (
@@ -1300,18 +1434,26 @@ class BatchProcessor:
             # Use streaming pipeline for memory efficiency
             logger.info(f" Streaming mode enabled: {len(chunks_to_process)} chunks → batched processing")
 
-            # Initialize all_completed_results for streaming mode (same as parallel mode)
-            all_completed_results = completed_results.copy()
-
             from core.streaming import StreamingBatchProcessor
 
             streaming_processor = StreamingBatchProcessor(
                 batch_size=settings.streaming_batch_size,
                 enable_streaming=settings.streaming_broadcast_chunks,
                 enable_partial_export=settings.streaming_partial_export,
-                websocket_manager=self.websocket_manager
+                websocket_manager=self.websocket_manager,
+                sliding_window=settings.streaming_sliding_window,
+                max_concurrency=job.concurrency or 10
             )
 
+            # Results are appended to the checkpoint as they are exported and
+            # read back once for the final merge, so the job never holds them
+            # all; without checkpoints they are collected in memory
+            stream_to_checkpoint = self.checkpoint_manager is not None
+            if stream_to_checkpoint:
+                completed_results.clear()  # Restored results stay in the checkpoint
+            # Serialized results not yet written to the checkpoint
+            pending_checkpoint = {}
+
             # Define progress callback for streaming mode
             async def streaming_progress_callback(completed_chunks: int, total_chunks: int, progress: float):
                 """Update job progress in database during streaming"""
@@ -1320,30 +1462,48 @@ class BatchProcessor:
                 logger.info(f"Progress: {completed_chunks}/{total_chunks} ({progress*100:.1f}%)")
 
             # Process in streaming batches
-            async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
-                all_results_list, batch_stats = await streaming_processor.process_streaming(
+            async with pooled_client(job.provider) as client:
+                def checkpoint_result(result):
+                    pending_checkpoint[result.chunk_id] = serialize_translation_result(result)
+                    if len(pending_checkpoint) >= settings.checkpoint_interval:
+                        self.checkpoint_manager.save_chunk_results(job.job_id, pending_checkpoint)
+                        pending_checkpoint.clear()
+
+                # Per batch, so prefetched results never cover the whole job
+                async def prepare_batch(batch_chunks):
+                    # Reuse chunks fully covered by the job's TMs
+                    if tm_ids:
+                        await self._seed_tm_pretranslation(
+                            translator, batch_chunks, tm_ids, job.source_lang, job.target_lang
+                        )
+                    # Resolve TM/cache hits in bulk before scheduling LLM calls
+                    await translator.prefetch_lookups(batch_chunks)
+                    # Group small chunks; each group's request is sent from a
+                    # window slot, so admission never waits on the LLM
+                    translator.plan_packed(batch_chunks)
+
+                new_results, batch_stats = await streaming_processor.process_streaming(
                     job=job,
                     chunks=chunks_to_process,
                     translator=translator,
                     http_client=client,
                     output_path=output_path,
-                    progress_callback=streaming_progress_callback
+                    progress_callback=streaming_progress_callback,
+                    result_callback=checkpoint_result if stream_to_checkpoint else None,
+                    keep_results=not stream_to_checkpoint,
+                    prepare_batch=prepare_batch
                 )
 
-                # Convert list to results array and merge with completed results
-                new_results = []
-                for chunk in chunks_to_process:
-                    # Find result for this chunk
-                    chunk_result = next((r for r in all_results_list if r.chunk_id == chunk.id), None)
-                    if chunk_result:
-                        new_results.append(chunk_result)
-                        all_completed_results[chunk.id] = chunk_result
-
                 # Merge with restored results for final output
-                results = []
-                for chunk in chunks:
-                    if chunk.id in all_completed_results:
-                        results.append(all_completed_results[chunk.id])
+                if stream_to_checkpoint:
+                    if pending_checkpoint:
+                        self.checkpoint_manager.save_chunk_results(job.job_id, pending_checkpoint)
+                        pending_checkpoint.clear()
+                    for chunk_id, result_data in self.checkpoint_manager.get_results(job.job_id).items():
+                        completed_results[chunk_id] = deserialize_translation_result(result_data)
+                else:
+                    completed_results.update((result.chunk_id, result) for result in new_results)
+                results = [completed_results[chunk.id] for chunk in chunks if chunk.id in completed_results]
 
                 logger.info(f" Streaming complete: {batch_stats['batches_processed']} batches")
                 logger.info(f"  Memory saved: {batch_stats['memory_saved_bytes'] / 1024 / 1024:.1f} MB")
@@ -1365,7 +1525,7 @@ class BatchProcessor:
 
                     job.update_progress(actual_completed, actual_total)
                     job.tm_hits = translator.tm_exact_matches + translator.tm_fuzzy_matches
-                    job.cache_hits = cache.hits if cache else 0
+                    job.cache_hits = cache.hits - cache_hits_at_start if cache else 0
                     self.queue.update_job(job)
 
                     # Broadcast WebSocket event for realtime updates
@@ -1386,7 +1546,7 @@ class BatchProcessor:
                         logger.info(f"Progress: {actual_completed}/{actual_total} ({job.progress*100:.1f}%) - Quality: {quality_score:.2f}")
 
             # Use parallel translation with proper concurrency
-            async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
+            async with pooled_client(job.provider) as client:
                     # Create a modified translate_chunk that works with the existing http_client
                     async def translate_with_client(client_param, chunk):
                         return await translator.translate_chunk(client_param, chunk)
@@ -1402,6 +1562,8 @@ class BatchProcessor:
 
                     # Track progress
                     completed_count = 0
+                    # Serialized results not yet written to the checkpoint
+                    pending_checkpoint = {}
 
                     # Wrap translate_chunk to include progress callback and cancellation check
                     async def translate_with_progress(client_param, chunk):
@@ -1415,29 +1577,32 @@ class BatchProcessor:
 
                         # Phase 5.2: Add result to tracking dict
                         all_completed_results[chunk.id] = result
+                        pending_checkpoint[chunk.id] = serialize_translation_result(result)
 
-                        # Phase 5.2: Save checkpoint every N chunks
+                        # Phase 5.2: Append the chunks finished since the last save every N chunks
                         from config.settings import settings
                         if self.checkpoint_manager and completed_count % settings.checkpoint_interval == 0:
-                            # Serialize all completed results
-                            serialized_results = {
-                                cid: serialize_translation_result(res)
-                                for cid, res in all_completed_results.items()
-                            }
-                            self.checkpoint_manager.save_checkpoint(
-                                job_id=job.job_id,
-                                input_file=str(input_path),
-                                output_file=str(output_path),
-                                total_chunks=len(chunks),
-                                completed_chunk_ids=list(all_completed_results.keys()),
-                                results_data=serialized_results,
-                                job_metadata=job.metadata
-                            )
+                            self.checkpoint_manager.save_chunk_results(job.job_id, pending_checkpoint)
+                            pending_checkpoint.clear()
                             logger.info(f"  💾 Checkpoint saved ({len(all_completed_results)}/{len(chunks)} chunks)")
 
                         progress_callback(completed_count, len(chunks_to_process), result.quality_score)
                         return result
 
+                    # Reuse chunks fully covered by the job's TMs
+                    if tm_ids:
+                        await self._seed_tm_pretranslation(
+                            translator, chunks_to_process, tm_ids, job.source_lang, job.target_lang
+                        )
+
+                    # Resolve TM/cache hits in bulk before scheduling LLM calls
+                    await translator.prefetch_lookups(chunks_to_process)
+
+                    # Translate small chunks several per request
+                    await translator.pretranslate_packed(
+                        client, chunks_to_process, job.concurrency or 10
+                    )
+
                     # Process remaining chunks in parallel
                     new_results, stats = await processor.process_all(
                         chunks_to_process,
@@ -1467,6 +1632,15 @@ class BatchProcessor:
                     job.failed_chunks = stats.failed
                     self.queue.update_job(job)
 
+        # Persist buffered chunk cache writes of this job
+        if chunk_cache:
+            chunk_cache.flush()
+
+        # Count TM usage only for pre-translations the job consumed
+        if translator.tm_segments_used:
+            from core.tm.service import get_tm_service
+            await get_tm_service().record_usage(translator.tm_segments_used)
+
         # Merge results
         merger = SmartMerger()
         merged_text = merger.merge_translations(results)
@@ -2130,7 +2304,8 @@ class JobScheduler:
 async def run_batch_processor(
     queue: Optional[JobQueue] = None,
     max_concurrent_jobs: int = 1,
-    enable_scheduler: bool = True
+    enable_scheduler: bool = True,
+    worker_id: Optional[str] = None
 ):
     """
     Run batch processor with optional scheduler
@@ -2139,8 +2314,9 @@ async def run_batch_processor(
         queue: Job queue
         max_concurrent_jobs: Max concurrent jobs
         enable_scheduler: Enable job scheduler
+        worker_id: Lease owner name (default: host:pid)
     """
-    processor = BatchProcessor(queue, max_concurrent_jobs)
+    processor = BatchProcessor(queue, max_concurrent_jobs, worker_id=worker_id)
 
     tasks = [processor.start(continuous=True)]
 
@@ -35,6 +35,7 @@ from .models import (
     WordCountTarget,
 )
 from .pipeline import BookWriterPipeline
+from .checkpoint import BookCheckpointStore
 from .exceptions import (
     BookWriterError,
     QualityGateFailedError,
@@ -57,6 +58,7 @@ __all__ = [
     "WordCountTarget",
     # Pipeline
     "BookWriterPipeline",
+    "BookCheckpointStore",
     # Exceptions
     "BookWriterError",
     "QualityGateFailedError",
@@ -61,17 +61,7 @@ class EditorAgent(BaseAgent[BookBlueprint, BookBlueprint]):
         async def edit_one(section, chapter, prev_section, next_section):
             nonlocal completed
             async with sem:
-                section.status = SectionStatus.EDITING
-
-                await self._edit_section(
-                    section=section,
-                    chapter=chapter,
-                    prev_section=prev_section,
-                    next_section=next_section,
-                )
-
-                section.update_word_count()
-                section.status = SectionStatus.COMPLETE
+                await self.process_section(section, chapter, prev_section, next_section)
 
                 completed += 1
                 pct = (completed / total_sections) * 100
@@ -84,16 +74,7 @@ class EditorAgent(BaseAgent[BookBlueprint, BookBlueprint]):
         # Edit chapter intros and summaries in parallel
         async def edit_chapter_texts(chapter):
             async with sem:
-                if chapter.introduction:
-                    chapter.introduction = await self._edit_text(
-                        chapter.introduction,
-                        context_desc="chapter introduction"
-                    )
-                if chapter.summary:
-                    chapter.summary = await self._edit_text(
-                        chapter.summary,
-                        context_desc="chapter summary"
-                    )
+                await self.process_chapter(chapter)
 
         await asyncio.gather(*[edit_chapter_texts(ch) for ch in blueprint.all_chapters])
 
@@ -101,6 +82,39 @@ class EditorAgent(BaseAgent[BookBlueprint, BookBlueprint]):
 
         return blueprint
 
+    async def process_section(
+        self,
+        section: Section,
+        chapter: Chapter,
+        prev_section: Section = None,
+        next_section: Section = None,
+    ):
+        """Edit one section and mark it complete"""
+        section.status = SectionStatus.EDITING
+
+        await self._edit_section(
+            section=section,
+            chapter=chapter,
+            prev_section=prev_section,
+            next_section=next_section,
+        )
+
+        section.update_word_count()
+        section.status = SectionStatus.COMPLETE
+
+    async def process_chapter(self, chapter: Chapter):
+        """Edit the chapter introduction and summary"""
+        if chapter.introduction:
+            chapter.introduction = await self._edit_text(
+                chapter.introduction,
+                context_desc="chapter introduction"
+            )
+        if chapter.summary:
+            chapter.summary = await self._edit_text(
+                chapter.summary,
+                context_desc="chapter summary"
+            )
+
     async def _edit_section(
         self,
         section: Section,
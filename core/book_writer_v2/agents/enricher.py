@@ -51,30 +51,10 @@ class EnricherAgent(BaseAgent[BookBlueprint, BookBlueprint]):
         async def enrich_chapter(chapter):
             nonlocal completed
             async with sem:
-                if not chapter.introduction:
-                    chapter.introduction = await self._generate_chapter_intro(
-                        chapter=chapter,
-                        blueprint=blueprint,
-                    )
-
-                if not chapter.summary:
-                    chapter.summary = await self._generate_chapter_summary(
-                        chapter=chapter,
-                        blueprint=blueprint,
-                    )
-
-                if not chapter.key_takeaways:
-                    chapter.key_takeaways = await self._generate_takeaways(
-                        chapter=chapter,
-                        blueprint=blueprint,
-                    )
+                await self.process_chapter(chapter, blueprint)
 
                 for section in chapter.sections:
-                    if section.status != SectionStatus.COMPLETE:
-                        section.status = SectionStatus.ENRICHING
-                        await self._enrich_section(section, chapter, blueprint)
-                        section.update_word_count()
-                        section.status = SectionStatus.WRITTEN
+                    await self.process_section(section, chapter, blueprint)
 
                 completed += 1
                 pct = (completed / total_chapters) * 100
@@ -86,6 +66,34 @@ class EnricherAgent(BaseAgent[BookBlueprint, BookBlueprint]):
 
         return blueprint
 
+    async def process_chapter(self, chapter, blueprint: BookBlueprint):
+        """Generate the chapter introduction, summary and takeaways if missing"""
+        if not chapter.introduction:
+            chapter.introduction = await self._generate_chapter_intro(
+                chapter=chapter,
+                blueprint=blueprint,
+            )
+
+        if not chapter.summary:
+            chapter.summary = await self._generate_chapter_summary(
+                chapter=chapter,
+                blueprint=blueprint,
+            )
+
+        if not chapter.key_takeaways:
+            chapter.key_takeaways = await self._generate_takeaways(
+                chapter=chapter,
+                blueprint=blueprint,
+            )
+
+    async def process_section(self, section, chapter, blueprint: BookBlueprint):
+        """Enrich one section unless it is already complete"""
+        if section.status != SectionStatus.COMPLETE:
+            section.status = SectionStatus.ENRICHING
+            await self._enrich_section(section, chapter, blueprint)
+            section.update_word_count()
+            section.status = SectionStatus.WRITTEN
+
     async def _generate_chapter_intro(self, chapter, blueprint) -> str:
         """Generate chapter introduction"""
 
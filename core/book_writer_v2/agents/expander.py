@@ -76,29 +76,7 @@ class ExpanderAgent(BaseAgent[BookBlueprint, BookBlueprint]):
         async def expand_one(section):
             nonlocal completed
             async with sem:
-                section.status = SectionStatus.EXPANDING
-                section.expansion_attempts += 1
-
-                words_needed = section.word_count.remaining
-                chapter = blueprint.get_chapter(section.chapter_id)
-
-                await self._expand_section(
-                    section=section,
-                    chapter=chapter,
-                    book_title=blueprint.title,
-                    words_needed=words_needed,
-                )
-
-                section.update_word_count()
-
-                if section.word_count.is_complete:
-                    section.status = SectionStatus.WRITTEN
-                elif section.expansion_attempts >= self.config.max_expansion_attempts:
-                    self.logger.warning(
-                        f"Section {section.id} still at {section.word_count.completion:.0f}% "
-                        f"after {section.expansion_attempts} attempts"
-                    )
-                    section.status = SectionStatus.WRITTEN
+                await self.process_section(section, blueprint)
 
                 completed += 1
                 pct = (completed / len(eligible)) * 100
@@ -120,6 +98,32 @@ class ExpanderAgent(BaseAgent[BookBlueprint, BookBlueprint]):
 
         return blueprint
 
+    async def process_section(self, section, blueprint: BookBlueprint):
+        """Run one expansion attempt on a section"""
+        section.status = SectionStatus.EXPANDING
+        section.expansion_attempts += 1
+
+        words_needed = section.word_count.remaining
+        chapter = blueprint.get_chapter(section.chapter_id)
+
+        await self._expand_section(
+            section=section,
+            chapter=chapter,
+            book_title=blueprint.title,
+            words_needed=words_needed,
+        )
+
+        section.update_word_count()
+
+        if section.word_count.is_complete:
+            section.status = SectionStatus.WRITTEN
+        elif section.expansion_attempts >= self.config.max_expansion_attempts:
+            self.logger.warning(
+                f"Section {section.id} still at {section.word_count.completion:.0f}% "
+                f"after {section.expansion_attempts} attempts"
+            )
+            section.status = SectionStatus.WRITTEN
+
     async def _expand_section(
         self,
         section,
@@ -55,26 +55,7 @@ class WriterAgent(BaseAgent[BookBlueprint, BookBlueprint]):
         async def write_one(section):
             nonlocal completed
             async with sem:
-                section.status = SectionStatus.WRITING
-
-                chapter = blueprint.get_chapter(section.chapter_id)
-                part = next(
-                    (p for p in blueprint.parts if p.id == chapter.part_id), None
-                ) if chapter else None
-
-                await self._write_section(
-                    section=section,
-                    chapter=chapter,
-                    part=part,
-                    book_title=blueprint.title,
-                )
-
-                section.update_word_count()
-
-                if section.word_count.needs_expansion:
-                    section.status = SectionStatus.NEEDS_EXPANSION
-                else:
-                    section.status = SectionStatus.WRITTEN
+                await self.process_section(section, blueprint)
 
                 completed += 1
                 pct = (completed / len(sections_to_write)) * 100
@@ -90,6 +71,29 @@ class WriterAgent(BaseAgent[BookBlueprint, BookBlueprint]):
 
         return blueprint
 
+    async def process_section(self, section, blueprint: BookBlueprint):
+        """Write one section and mark whether it needs expansion"""
+        section.status = SectionStatus.WRITING
+
+        chapter = blueprint.get_chapter(section.chapter_id)
+        part = next(
+            (p for p in blueprint.parts if p.id == chapter.part_id), None
+        ) if chapter else None
+
+        await self._write_section(
+            section=section,
+            chapter=chapter,
+            part=part,
+            book_title=blueprint.title,
+        )
+
+        section.update_word_count()
+
+        if section.word_count.needs_expansion:
+            section.status = SectionStatus.NEEDS_EXPANSION
+        else:
+            section.status = SectionStatus.WRITTEN
+
     async def _write_section(
         self,
         section,
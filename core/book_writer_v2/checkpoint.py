@@ -0,0 +1,410 @@
+"""
+Book Checkpoints
+
+Resumable on-disk state for Book Writer v2 projects.
+
+The blueprint structure is stored once after planning; every agent
+step afterwards upserts only the row it touched:
+- sections: status, content, word target, expansion attempts and the
+  last completed step
+- chapters: introduction, summary, takeaways and the last completed step
+
+``BookWriterPipeline.resume_book`` reloads this state and skips the
+agents, sections and chapters that already finished.
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .models import (
+    AnalysisResult,
+    BackMatter,
+    BookBlueprint,
+    Chapter,
+    FrontMatter,
+    OutlinePoint,
+    Part,
+    Section,
+    SectionStatus,
+    WordCountTarget,
+)
+
+# Pipeline stages in run order
+STAGES = (
+    "analyst",
+    "architect",
+    "outliner",
+    "writer",
+    "expander",
+    "enricher",
+    "editor",
+)
+
+# Per-section / per-chapter steps in run order
+STEPS = ("written", "expanded", "enriched", "edited")
+
+
+def _reached(current: Optional[str], target: str, order: tuple) -> bool:
+    return current is not None and order.index(current) >= order.index(target)
+
+
+def blueprint_to_state(blueprint: BookBlueprint) -> Dict[str, Any]:
+    """Full, lossless blueprint dict (``to_dict`` only keeps previews)."""
+    return {
+        "title": blueprint.title,
+        "subtitle": blueprint.subtitle,
+        "author": blueprint.author,
+        "genre": blueprint.genre,
+        "language": blueprint.language,
+        "target_pages": blueprint.target_pages,
+        "words_per_page": blueprint.words_per_page,
+        "front_matter": asdict(blueprint.front_matter),
+        "back_matter": asdict(blueprint.back_matter),
+        "parts": [
+            {
+                "id": part.id,
+                "number": part.number,
+                "title": part.title,
+                "target_words": part.word_count.target,
+                "introduction": part.introduction,
+                "chapters": [
+                    {
+                        "id": chapter.id,
+                        "number": chapter.number,
+                        "title": chapter.title,
+                        "target_words": chapter.word_count.target,
+                        "introduction": chapter.introduction,
+                        "summary": chapter.summary,
+                        "key_takeaways": chapter.key_takeaways,
+                        "sections": [
+                            {
+                                "id": section.id,
+                                "number": section.number,
+                                "title": section.title,
+                                "target_words": section.word_count.target,
+                                "outline_points": [asdict(p) for p in section.outline_points],
+                                "outline_summary": section.outline_summary,
+                                "content": section.content,
+                                "status": section.status.value,
+                                "expansion_attempts": section.expansion_attempts,
+                            }
+                            for section in chapter.sections
+                        ],
+                    }
+                    for chapter in part.chapters
+                ],
+            }
+            for part in blueprint.parts
+        ],
+    }
+
+
+def blueprint_from_state(data: Dict[str, Any]) -> BookBlueprint:
+    """Rebuild a blueprint from :func:`blueprint_to_state` output."""
+    blueprint = BookBlueprint(
+        title=data["title"],
+        subtitle=data.get("subtitle"),
+        author=data.get("author", "AI Publisher Pro"),
+        genre=data.get("genre", "non-fiction"),
+        language=data.get("language", "en"),
+        target_pages=data.get("target_pages", 300),
+        words_per_page=data.get("words_per_page", 300),
+        front_matter=FrontMatter(**data.get("front_matter", {})),
+        back_matter=BackMatter(**data.get("back_matter", {})),
+    )
+
+    for p in data.get("parts", []):
+        part = Part(
+            id=p["id"],
+            number=p["number"],
+            title=p["title"],
+            word_count=WordCountTarget(p["target_words"]),
+            introduction=p.get("introduction", ""),
+        )
+        for c in p.get("chapters", []):
+            chapter = Chapter(
+                id=c["id"],
+                number=c["number"],
+                title=c["title"],
+                part_id=part.id,
+                word_count=WordCountTarget(c["target_words"]),
+                introduction=c.get("introduction", ""),
+                summary=c.get("summary", ""),
+                key_takeaways=c.get("key_takeaways", []),
+            )
+            for s in c.get("sections", []):
+                section = Section(
+                    id=s["id"],
+                    number=s["number"],
+                    title=s["title"],
+                    chapter_id=chapter.id,
+                    word_count=WordCountTarget(s["target_words"]),
+                    outline_points=[OutlinePoint(**op) for op in s.get("outline_points", [])],
+                    outline_summary=s.get("outline_summary", ""),
+                    content=s.get("content", ""),
+                    status=SectionStatus(s.get("status", "pending")),
+                    expansion_attempts=s.get("expansion_attempts", 0),
+                )
+                section.update_word_count()
+                chapter.sections.append(section)
+            part.chapters.append(chapter)
+        blueprint.parts.append(part)
+
+    return blueprint
+
+
+@dataclass
+class BookCheckpoint:
+    """
+    Saved state of one project, bound to its store.
+
+    Agents report finished work through ``save_*``; the pipeline and
+    scheduler ask ``*_done`` before spending an AI call.
+    """
+    project_id: str
+    store: "BookCheckpointStore" = field(repr=False)
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    stage: Optional[str] = None
+    analysis: Optional[AnalysisResult] = None
+    blueprint: Optional[BookBlueprint] = None
+    expansion_rounds: int = 0
+    section_steps: Dict[str, str] = field(default_factory=dict)
+    chapter_steps: Dict[str, str] = field(default_factory=dict)
+
+    def stage_done(self, stage: str) -> bool:
+        return _reached(self.stage, stage, STAGES)
+
+    def section_done(self, section_id: str, step: str) -> bool:
+        return _reached(self.section_steps.get(section_id), step, STEPS)
+
+    def chapter_done(self, chapter_id: str, step: str) -> bool:
+        return _reached(self.chapter_steps.get(chapter_id), step, STEPS)
+
+    def save_stage(
+        self,
+        stage: str,
+        analysis: Optional[AnalysisResult] = None,
+        blueprint: Optional[BookBlueprint] = None,
+        expansion_rounds: Optional[int] = None,
+    ):
+        """Mark a pipeline stage finished, storing whatever it produced."""
+        self.stage = stage
+        if analysis is not None:
+            self.analysis = analysis
+        if blueprint is not None:
+            self.blueprint = blueprint
+        if expansion_rounds is not None:
+            self.expansion_rounds = expansion_rounds
+        self.store.save_stage(
+            self.project_id, stage,
+            analysis=analysis, blueprint=blueprint, expansion_rounds=expansion_rounds,
+        )
+
+    def save_section(self, section: Section, step: str):
+        self.section_steps[section.id] = step
+        self.store.save_section(self.project_id, section, step)
+
+    def save_chapter(self, chapter: Chapter, step: str):
+        self.chapter_steps[chapter.id] = step
+        self.store.save_chapter(self.project_id, chapter, step)
+
+
+class BookCheckpointStore:
+    """
+    SQLite store for Book Writer v2 checkpoints.
+
+    Usage:
+        store = BookCheckpointStore("data/books_v2/checkpoints.db")
+        checkpoint = store.start(project_id, {"title": ..., "description": ...})
+        ...
+        checkpoint = store.load(project_id)  # after a crash
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS projects (
+                    project_id TEXT PRIMARY KEY,
+                    inputs TEXT NOT NULL,  -- JSON create_book() arguments
+                    stage TEXT,
+                    analysis TEXT,  -- JSON AnalysisResult
+                    blueprint TEXT,  -- JSON structure snapshot
+                    expansion_rounds INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sections (
+                    project_id TEXT NOT NULL,
+                    section_id TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    expansion_attempts INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (project_id, section_id)
+                );
+                CREATE TABLE IF NOT EXISTS chapters (
+                    project_id TEXT NOT NULL,
+                    chapter_id TEXT NOT NULL,
+                    step TEXT NOT NULL,
+                    introduction TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    key_takeaways TEXT NOT NULL,  -- JSON array
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (project_id, chapter_id)
+                );
+            """)
+
+    def start(self, project_id: str, inputs: Dict[str, Any]) -> BookCheckpoint:
+        """Begin a fresh checkpoint, discarding any earlier state for the project."""
+        self.delete(project_id)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO projects (project_id, inputs, updated_at) VALUES (?, ?, ?)",
+                (project_id, json.dumps(inputs), time.time()),
+            )
+        return BookCheckpoint(project_id=project_id, store=self, inputs=dict(inputs))
+
+    def save_stage(
+        self,
+        project_id: str,
+        stage: str,
+        analysis: Optional[AnalysisResult] = None,
+        blueprint: Optional[BookBlueprint] = None,
+        expansion_rounds: Optional[int] = None,
+    ):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE projects SET
+                    stage = ?,
+                    analysis = COALESCE(?, analysis),
+                    blueprint = COALESCE(?, blueprint),
+                    expansion_rounds = COALESCE(?, expansion_rounds),
+                    updated_at = ?
+                WHERE project_id = ?
+                """,
+                (
+                    stage,
+                    json.dumps(asdict(analysis)) if analysis is not None else None,
+                    json.dumps(blueprint_to_state(blueprint)) if blueprint is not None else None,
+                    expansion_rounds,
+                    time.time(),
+                    project_id,
+                ),
+            )
+
+    def save_section(self, project_id: str, section: Section, step: str):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    project_id, section.id, step, section.status.value,
+                    section.content, section.expansion_attempts, time.time(),
+                ),
+            )
+
+    def save_chapter(self, project_id: str, chapter: Chapter, step: str):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO chapters VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    project_id, chapter.id, step, chapter.introduction,
+                    chapter.summary, json.dumps(chapter.key_takeaways), time.time(),
+                ),
+            )
+
+    def exists(self, project_id: str) -> bool:
+        """Whether the project has a checkpoint to resume from."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM projects WHERE project_id = ?", (project_id,)
+            ).fetchone()
+        return row is not None
+
+    def load(self, project_id: str) -> Optional[BookCheckpoint]:
+        """Load a project's checkpoint, or None if it has none."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT inputs, stage, analysis, blueprint, expansion_rounds
+                FROM projects WHERE project_id = ?
+                """,
+                (project_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            section_rows = conn.execute(
+                """
+                SELECT section_id, step, status, content, expansion_attempts
+                FROM sections WHERE project_id = ?
+                """,
+                (project_id,),
+            ).fetchall()
+            chapter_rows = conn.execute(
+                """
+                SELECT chapter_id, step, introduction, summary, key_takeaways
+                FROM chapters WHERE project_id = ?
+                """,
+                (project_id,),
+            ).fetchall()
+
+        inputs, stage, analysis, blueprint_json, expansion_rounds = row
+        checkpoint = BookCheckpoint(
+            project_id=project_id,
+            store=self,
+            inputs=json.loads(inputs),
+            stage=stage,
+            analysis=AnalysisResult(**json.loads(analysis)) if analysis else None,
+            expansion_rounds=expansion_rounds,
+        )
+        if not blueprint_json:
+            return checkpoint
+
+        blueprint = blueprint_from_state(json.loads(blueprint_json))
+        for section_id, step, status, content, attempts in section_rows:
+            section = blueprint.get_section(section_id)
+            if section is None:
+                continue
+            section.status = SectionStatus(status)
+            section.content = content
+            section.expansion_attempts = attempts
+            section.update_word_count()
+            checkpoint.section_steps[section_id] = step
+
+        for chapter_id, step, introduction, summary, takeaways in chapter_rows:
+            chapter = blueprint.get_chapter(chapter_id)
+            if chapter is None:
+                continue
+            chapter.introduction = introduction
+            chapter.summary = summary
+            chapter.key_takeaways = json.loads(takeaways)
+            checkpoint.chapter_steps[chapter_id] = step
+
+        checkpoint.blueprint = blueprint
+        return checkpoint
+
+    def delete(self, project_id: str):
+        """Remove all saved state for a project."""
+        with self._connect() as conn:
+            for table in ("projects", "sections", "chapters"):
+                conn.execute(f"DELETE FROM {table} WHERE project_id = ?", (project_id,))
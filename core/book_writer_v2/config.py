@@ -91,6 +91,14 @@ class BookWriterConfig:
     max_total_expansion_rounds: int = 5
     """Maximum full expansion rounds for entire book"""
 
+    # === SCHEDULING ===
+
+    section_pipelining: bool = True
+    """Flow each section through Writer->Expander->Enricher->Editor independently"""
+
+    pipeline_concurrency: int = 5
+    """AI calls in flight across all sections when section pipelining is on"""
+
     # === AI MODEL SETTINGS ===
 
     primary_provider: AIProvider = AIProvider.ANTHROPIC
@@ -5,7 +5,7 @@ Main orchestrator that coordinates all agents.
 """
 
 import logging
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from datetime import datetime
 
 from .config import BookWriterConfig
@@ -17,6 +17,8 @@ from .agents import (
     EditorAgent, QualityGateAgent, PublisherAgent,
 )
 from .agents.base import AgentContext
+from .checkpoint import BookCheckpoint, BookCheckpointStore
+from .scheduler import SectionScheduler
 
 
 class BookWriterPipeline:
@@ -33,6 +35,9 @@ class BookWriterPipeline:
             description="A book about...",
             target_pages=300
         )
+
+        # After a crash, with the same checkpoint store:
+        project = await pipeline.resume_book(project.id)
     """
 
     def __init__(
@@ -40,10 +45,12 @@ class BookWriterPipeline:
         config: BookWriterConfig,
         ai_client: Any,
         progress_callback: Optional[Callable[[str, str, float], None]] = None,
+        checkpoint_store: Optional[BookCheckpointStore] = None,
     ):
         self.config = config
         self.ai = ai_client
         self.progress_callback = progress_callback
+        self.checkpoints = checkpoint_store
         self.logger = logging.getLogger("BookWriter.Pipeline")
 
         # Initialize agents
@@ -57,6 +64,10 @@ class BookWriterPipeline:
         self.quality_gate = QualityGateAgent(config, ai_client)
         self.publisher = PublisherAgent(config, ai_client)
 
+        self.scheduler = SectionScheduler(
+            config, self.writer, self.expander, self.enricher, self.editor
+        )
+
     async def create_book(
         self,
         title: str,
@@ -66,12 +77,16 @@ class BookWriterPipeline:
         audience: str = "",
         subtitle: str = "",
         project: Optional["BookProject"] = None,
+        options: Optional[Dict[str, Any]] = None,
     ) -> BookProject:
         """
         Create a complete book.
 
         This is the main entry point. It orchestrates all 9 agents
         to produce a book meeting the exact page count target.
+
+        options are caller settings (config, provider, model) kept with
+        the checkpoint inputs, so a resume can rebuild the same pipeline.
         """
         if project is None:
             project = BookProject(
@@ -79,9 +94,69 @@ class BookWriterPipeline:
                 user_description=description,
             )
 
+        inputs = {
+            "title": title,
+            "description": description,
+            "target_pages": target_pages,
+            "genre": genre,
+            "audience": audience,
+            "subtitle": subtitle,
+            "options": dict(options or {}),
+        }
+        checkpoint = None
+        if self.checkpoints is not None:
+            checkpoint = self.checkpoints.start(project.id, inputs)
+
         self.logger.info(f"Starting book project: {project.id}")
         self._report_progress(project.id, "Starting book creation...", 0)
 
+        return await self._run(project, inputs, checkpoint)
+
+    async def resume_book(
+        self,
+        project_id: str,
+        project: Optional["BookProject"] = None,
+    ) -> BookProject:
+        """
+        Continue a crashed or paused project from its last checkpoint.
+
+        Finished agents, sections and chapters are skipped, so only
+        the outstanding AI calls are paid for again.
+        """
+        checkpoint = self.checkpoints.load(project_id) if self.checkpoints else None
+        if checkpoint is None:
+            raise BookWriterError(f"No checkpoint found for project {project_id}")
+
+        inputs = checkpoint.inputs
+        if project is None:
+            project = BookProject(
+                id=project_id,
+                user_request=f"{inputs['title']}: {inputs['description']}",
+                user_description=inputs["description"],
+            )
+        project.analysis = checkpoint.analysis
+        project.blueprint = checkpoint.blueprint
+        project.expansion_rounds = checkpoint.expansion_rounds
+        project.update_progress()
+
+        self.logger.info(
+            f"Resuming book project: {project_id} after stage {checkpoint.stage or 'start'}"
+        )
+        self._report_progress(project_id, "Resuming book creation...", 0)
+
+        return await self._run(project, inputs, checkpoint)
+
+    async def _run(
+        self,
+        project: BookProject,
+        inputs: dict,
+        checkpoint: Optional[BookCheckpoint],
+    ) -> BookProject:
+        """Run every agent not already recorded as finished in the checkpoint"""
+
+        def stage_done(stage: str) -> bool:
+            return checkpoint is not None and checkpoint.stage_done(stage)
+
         try:
             context = AgentContext(
                 project_id=project.id,
@@ -94,89 +169,63 @@ class BookWriterPipeline:
             # === PHASE 1: PLANNING ===
 
             # Agent 1: Analyst
-            project.status = BookStatus.ANALYZING
-            project.current_agent = "Analyst"
-            self._report_progress(project.id, "Analyzing book topic...", 5)
-
-            analysis = await self.analyst.execute({
-                "title": title,
-                "description": description,
-                "target_pages": target_pages,
-                "genre": genre,
-                "audience": audience,
-            }, context)
-
-            project.analysis = analysis
+            if stage_done("analyst"):
+                analysis = project.analysis
+            else:
+                project.status = BookStatus.ANALYZING
+                project.current_agent = "Analyst"
+                self._report_progress(project.id, "Analyzing book topic...", 5)
+
+                analysis = await self.analyst.execute({
+                    "title": inputs["title"],
+                    "description": inputs["description"],
+                    "target_pages": inputs["target_pages"],
+                    "genre": inputs["genre"],
+                    "audience": inputs["audience"],
+                }, context)
+
+                project.analysis = analysis
+                if checkpoint:
+                    checkpoint.save_stage("analyst", analysis=analysis)
 
             # Agent 2: Architect
-            project.status = BookStatus.ARCHITECTING
-            project.current_agent = "Architect"
-            self._report_progress(project.id, "Designing book structure...", 10)
-
-            blueprint = await self.architect.execute({
-                "title": title,
-                "subtitle": subtitle,
-                "target_pages": target_pages,
-                "analysis": analysis,
-                "genre": genre,
-            }, context)
-
-            project.blueprint = blueprint
+            if stage_done("architect"):
+                blueprint = project.blueprint
+            else:
+                project.status = BookStatus.ARCHITECTING
+                project.current_agent = "Architect"
+                self._report_progress(project.id, "Designing book structure...", 10)
+
+                blueprint = await self.architect.execute({
+                    "title": inputs["title"],
+                    "subtitle": inputs["subtitle"],
+                    "target_pages": inputs["target_pages"],
+                    "analysis": analysis,
+                    "genre": inputs["genre"],
+                }, context)
+
+                project.blueprint = blueprint
+                if checkpoint:
+                    checkpoint.save_stage("architect", blueprint=blueprint)
+
             project.sections_total = blueprint.total_sections
 
             # Agent 3: Outliner
-            project.status = BookStatus.OUTLINING
-            project.current_agent = "Outliner"
-            self._report_progress(project.id, "Creating detailed outlines...", 15)
-
-            blueprint = await self.outliner.execute(blueprint, context)
-
-            # === PHASE 2: WRITING ===
-
-            # Agent 4: Writer
-            project.status = BookStatus.WRITING
-            project.current_agent = "Writer"
-            self._report_progress(project.id, "Writing content...", 25)
-
-            blueprint = await self.writer.execute(blueprint, context)
-            project.update_progress()
-
-            # Agent 5: Expander (may run multiple rounds)
-            project.status = BookStatus.EXPANDING
-            project.current_agent = "Expander"
-
-            for round_num in range(self.config.max_total_expansion_rounds):
-                sections_needing_expansion = blueprint.get_sections_needing_expansion()
-
-                if not sections_needing_expansion:
-                    break
-
-                self._report_progress(
-                    project.id,
-                    f"Expansion round {round_num + 1}: {len(sections_needing_expansion)} sections",
-                    45 + (round_num * 5)
-                )
-
-                blueprint = await self.expander.execute(blueprint, context)
-                project.expansion_rounds += 1
-                project.update_progress()
-
-            # === PHASE 3: ENHANCEMENT ===
-
-            # Agent 6: Enricher
-            project.status = BookStatus.ENRICHING
-            project.current_agent = "Enricher"
-            self._report_progress(project.id, "Enriching content...", 65)
+            if not stage_done("outliner"):
+                project.status = BookStatus.OUTLINING
+                project.current_agent = "Outliner"
+                self._report_progress(project.id, "Creating detailed outlines...", 15)
 
-            blueprint = await self.enricher.execute(blueprint, context)
+                blueprint = await self.outliner.execute(blueprint, context)
+                if checkpoint:
+                    checkpoint.save_stage("outliner", blueprint=blueprint)
 
-            # Agent 7: Editor
-            project.status = BookStatus.EDITING
-            project.current_agent = "Editor"
-            self._report_progress(project.id, "Editing and polishing...", 75)
+            # === PHASES 2-3: WRITING & ENHANCEMENT ===
 
-            blueprint = await self.editor.execute(blueprint, context)
-            project.update_progress()
+            if self.config.section_pipelining:
+                blueprint = await self._write_pipelined(project, blueprint, context, checkpoint)
+            else:
+                blueprint = await self._write_staged(project, blueprint, context, checkpoint)
 
             # === PHASE 4: QUALITY GATE ===
 
@@ -194,6 +243,7 @@ class BookWriterPipeline:
                     self._report_progress(project.id, "Additional expansion needed...", 87)
                     blueprint = await self.expander.execute(blueprint, context)
                     project.expansion_rounds += 1
+                    self._save_sections(checkpoint, blueprint, "edited")
 
                     quality_result = await self.quality_gate.execute(blueprint, context)
                     project.quality_checks.append(quality_result)
@@ -214,6 +264,9 @@ class BookWriterPipeline:
             project.completed_at = datetime.now()
             project.update_progress()
 
+            if checkpoint:
+                self.checkpoints.delete(project.id)
+
             self._report_progress(project.id, "Book creation complete!", 100)
 
             self.logger.info(
@@ -228,9 +281,120 @@ class BookWriterPipeline:
         except Exception as e:
             self.logger.error(f"Pipeline error: {e}")
             project.status = BookStatus.FAILED
-            project.add_error(str(e), project.current_agent, recoverable=False)
+            project.add_error(str(e), project.current_agent, recoverable=checkpoint is not None)
             raise BookWriterError(f"Book creation failed: {e}")
 
+    async def _write_pipelined(
+        self,
+        project: BookProject,
+        blueprint,
+        context: AgentContext,
+        checkpoint: Optional[BookCheckpoint] = None,
+    ):
+        """Write, expand, enrich and edit each section as its own chain"""
+        if checkpoint and checkpoint.stage_done("editor"):
+            return blueprint
+
+        project.status = BookStatus.WRITING
+        project.current_agent = "Writer"
+        self._report_progress(project.id, "Writing content (section pipeline)...", 25)
+
+        blueprint = await self.scheduler.run(blueprint, context, checkpoint)
+        project.expansion_rounds += self.scheduler.expansion_rounds
+        project.update_progress()
+
+        if checkpoint:
+            checkpoint.save_stage("editor", expansion_rounds=project.expansion_rounds)
+
+        return blueprint
+
+    async def _write_staged(
+        self,
+        project: BookProject,
+        blueprint,
+        context: AgentContext,
+        checkpoint: Optional[BookCheckpoint] = None,
+    ):
+        """Run each writing agent over the whole book, one stage at a time"""
+
+        def stage_done(stage: str) -> bool:
+            return checkpoint is not None and checkpoint.stage_done(stage)
+
+        def save_stage(stage: str, step: str):
+            if checkpoint:
+                self._save_sections(checkpoint, blueprint, step)
+                checkpoint.save_stage(stage, expansion_rounds=project.expansion_rounds)
+
+        # Agent 4: Writer
+        if not stage_done("writer"):
+            project.status = BookStatus.WRITING
+            project.current_agent = "Writer"
+            self._report_progress(project.id, "Writing content...", 25)
+
+            blueprint = await self.writer.execute(blueprint, context)
+            project.update_progress()
+            save_stage("writer", "written")
+
+        # Agent 5: Expander (may run multiple rounds)
+        if not stage_done("expander"):
+            project.status = BookStatus.EXPANDING
+            project.current_agent = "Expander"
+
+            for round_num in range(self.config.max_total_expansion_rounds):
+                sections_needing_expansion = blueprint.get_sections_needing_expansion()
+
+                if not sections_needing_expansion:
+                    break
+
+                self._report_progress(
+                    project.id,
+                    f"Expansion round {round_num + 1}: {len(sections_needing_expansion)} sections",
+                    45 + (round_num * 5)
+                )
+
+                blueprint = await self.expander.execute(blueprint, context)
+                project.expansion_rounds += 1
+                project.update_progress()
+                if checkpoint:
+                    self._save_sections(checkpoint, blueprint, "expanded")
+
+            save_stage("expander", "expanded")
+
+        # === PHASE 3: ENHANCEMENT ===
+
+        # Agent 6: Enricher
+        if not stage_done("enricher"):
+            project.status = BookStatus.ENRICHING
+            project.current_agent = "Enricher"
+            self._report_progress(project.id, "Enriching content...", 65)
+
+            blueprint = await self.enricher.execute(blueprint, context)
+            if checkpoint:
+                for chapter in blueprint.all_chapters:
+                    checkpoint.save_chapter(chapter, "enriched")
+            save_stage("enricher", "enriched")
+
+        # Agent 7: Editor
+        if not stage_done("editor"):
+            project.status = BookStatus.EDITING
+            project.current_agent = "Editor"
+            self._report_progress(project.id, "Editing and polishing...", 75)
+
+            blueprint = await self.editor.execute(blueprint, context)
+            project.update_progress()
+            if checkpoint:
+                for chapter in blueprint.all_chapters:
+                    checkpoint.save_chapter(chapter, "edited")
+            save_stage("editor", "edited")
+
+        return blueprint
+
+    def _save_sections(self, checkpoint: Optional[BookCheckpoint], blueprint, step: str):
+        """Checkpoint every section of the blueprint at the given step"""
+        if checkpoint:
+            for section in blueprint.all_sections:
+                checkpoint.save_section(section, step)
+
     def _report_progress(self, project_id: str, message: str, percentage: float):
         """Report progress via callback"""
         if self.progress_callback:
@@ -0,0 +1,219 @@
+"""
+Section Scheduler
+
+Section-granular dataflow for the writing phase. Instead of running
+each agent over the whole book behind a barrier, every section flows
+Writer -> Expander -> Enricher -> Editor on its own, and all AI calls
+share one concurrency budget.
+
+Waiting calls are served lowest section index first, so early sections
+run to completion instead of every section crawling through the same
+stage together.
+
+Cross-section dependencies are kept as fine-grained waits:
+- Chapter intro/summary/takeaways start once the chapter's sections
+  are expanded (the summary previews their content)
+- A section is edited once it and its neighbours are enriched (the
+  editor smooths transitions against their text)
+
+With a checkpoint, every finished step is saved and steps already
+saved by an earlier run are skipped.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from .config import BookWriterConfig
+from .models import BookBlueprint, Section, SectionStatus
+from .agents import WriterAgent, ExpanderAgent, EnricherAgent, EditorAgent
+from .agents.base import AgentContext
+from .checkpoint import BookCheckpoint
+
+
+class _PriorityBudget:
+    """Semaphore that wakes the waiter with the lowest priority value first."""
+
+    def __init__(self, slots: int):
+        self._free = slots
+        self._waiters: list = []
+        self._seq = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, priority: int):
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._seq), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Slot was handed over just as we were cancelled
+                if future.done() and not future.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
+class SectionScheduler:
+    """
+    Run the writing agents per section under a global concurrency budget.
+
+    Total wall time approaches the longest single-section chain rather
+    than the sum of the slowest section at every stage.
+
+    Usage:
+        scheduler = SectionScheduler(config, writer, expander, enricher, editor)
+        blueprint = await scheduler.run(blueprint, context)
+    """
+
+    def __init__(
+        self,
+        config: BookWriterConfig,
+        writer: WriterAgent,
+        expander: ExpanderAgent,
+        enricher: EnricherAgent,
+        editor: EditorAgent,
+    ):
+        self.config = config
+        self.writer = writer
+        self.expander = expander
+        self.enricher = enricher
+        self.editor = editor
+        self.logger = logging.getLogger("BookWriter.Scheduler")
+
+        self.expansion_rounds = 0
+
+    async def run(
+        self,
+        blueprint: BookBlueprint,
+        context: AgentContext,
+        checkpoint: Optional[BookCheckpoint] = None,
+    ) -> BookBlueprint:
+        """Write, expand, enrich and edit every section of the blueprint."""
+        sections = blueprint.all_sections
+        chapters = blueprint.all_chapters
+        total = len(sections)
+
+        concurrency = max(1, self.config.pipeline_concurrency)
+        budget = _PriorityBudget(concurrency)
+        expanded: Dict[str, asyncio.Event] = {s.id: asyncio.Event() for s in sections}
+        enriched: List[asyncio.Event] = [asyncio.Event() for _ in sections]
+        last_index = {s.chapter_id: idx for idx, s in enumerate(sections)}
+        completed = 0
+        self.expansion_rounds = 0
+
+        context.report_progress(
+            f"Writing {total} sections (pipelined x{concurrency})...", 0
+        )
+
+        def done(section: Section, step: str) -> bool:
+            return checkpoint is not None and checkpoint.section_done(section.id, step)
+
+        def save(section: Section, step: str):
+            if checkpoint is not None:
+                checkpoint.save_section(section, step)
+
+        async def section_chain(idx: int, section: Section):
+            nonlocal completed
+            chapter = blueprint.get_chapter(section.chapter_id)
+
+            if (
+                section.status not in [SectionStatus.COMPLETE, SectionStatus.WRITTEN]
+                and not done(section, "written")
+            ):
+                async with budget.slot(idx):
+                    await self.writer.process_section(section, blueprint)
+                save(section, "written")
+
+            rounds = 0
+            while (
+                not done(section, "enriched")
+                and rounds < self.config.max_total_expansion_rounds
+                and section.needs_expansion()
+                and section.expansion_attempts < self.config.max_expansion_attempts
+            ):
+                async with budget.slot(idx):
+                    await self.expander.process_section(section, blueprint)
+                save(section, "expanded")
+                rounds += 1
+            self.expansion_rounds = max(self.expansion_rounds, rounds)
+            expanded[section.id].set()
+
+            if not done(section, "enriched"):
+                async with budget.slot(idx):
+                    await self.enricher.process_section(section, chapter, blueprint)
+                save(section, "enriched")
+            enriched[idx].set()
+
+            prev_section = sections[idx - 1] if idx > 0 else None
+            next_section = sections[idx + 1] if idx < total - 1 else None
+            if not done(section, "edited"):
+                if prev_section:
+                    await enriched[idx - 1].wait()
+                if next_section:
+                    await enriched[idx + 1].wait()
+
+                async with budget.slot(idx):
+                    await self.editor.process_section(section, chapter, prev_section, next_section)
+                save(section, "edited")
+
+            completed += 1
+            context.report_progress(
+                f"Completed {completed}/{total}: {section.title}",
+                (completed / total) * 100,
+            )
+
+        async def chapter_chain(chapter, priority: int):
+            saved = checkpoint is not None
+            if not (saved and checkpoint.chapter_done(chapter.id, "enriched")):
+                for section in chapter.sections:
+                    await expanded[section.id].wait()
+
+                async with budget.slot(priority):
+                    await self.enricher.process_chapter(chapter, blueprint)
+                if saved:
+                    checkpoint.save_chapter(chapter, "enriched")
+
+            if not (saved and checkpoint.chapter_done(chapter.id, "edited")):
+                async with budget.slot(priority):
+                    await self.editor.process_chapter(chapter)
+                if saved:
+                    checkpoint.save_chapter(chapter, "edited")
+
+        tasks = [
+            asyncio.create_task(section_chain(idx, section))
+            for idx, section in enumerate(sections)
+        ] + [
+            # Rank a chapter with its last section
+            asyncio.create_task(chapter_chain(chapter, last_index.get(chapter.id, 0)))
+            for chapter in chapters
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Sections waiting on a failed neighbour would never wake up
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        context.report_progress("All sections written and edited", 100)
+
+        return blueprint
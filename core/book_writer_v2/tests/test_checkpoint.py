@@ -0,0 +1,209 @@
+"""
+Tests for resumable Book Writer checkpoints
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.book_writer_v2.checkpoint import (
+    BookCheckpointStore,
+    blueprint_from_state,
+    blueprint_to_state,
+)
+from core.book_writer_v2.exceptions import BookWriterError
+from core.book_writer_v2.models import BookStatus, OutlinePoint, SectionStatus
+from core.book_writer_v2.pipeline import BookWriterPipeline
+from core.book_writer_v2.agents.base import AgentContext
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+class TestBookCheckpointStore:
+    """Tests for the on-disk checkpoint store"""
+
+    def test_blueprint_state_round_trip(self, sample_blueprint):
+        section = sample_blueprint.all_sections[0]
+        section.outline_points.append(OutlinePoint("p1", "Point", 500))
+        section.content = "word " * 100
+        section.status = SectionStatus.NEEDS_EXPANSION
+
+        restored = blueprint_from_state(blueprint_to_state(sample_blueprint))
+
+        restored_section = restored.all_sections[0]
+        assert restored.title == sample_blueprint.title
+        assert restored.total_sections == sample_blueprint.total_sections
+        assert restored_section.content == section.content
+        assert restored_section.word_count.actual == 100
+        assert restored_section.status == SectionStatus.NEEDS_EXPANSION
+        assert restored_section.outline_points[0].content == "Point"
+
+    def test_load_overlays_section_and_chapter_rows(self, store, sample_blueprint):
+        checkpoint = store.start("p1", {"title": "Test Book"})
+        checkpoint.save_stage("outliner", blueprint=sample_blueprint)
+
+        section = sample_blueprint.all_sections[1]
+        section.content = "edited text"
+        section.status = SectionStatus.COMPLETE
+        checkpoint.save_section(section, "edited")
+
+        chapter = sample_blueprint.all_chapters[0]
+        chapter.introduction = "Intro"
+        chapter.key_takeaways = ["One"]
+        checkpoint.save_chapter(chapter, "enriched")
+
+        loaded = store.load("p1")
+        assert loaded.inputs == {"title": "Test Book"}
+        assert loaded.stage_done("architect")
+        assert not loaded.stage_done("writer")
+        assert loaded.section_done("1.1.2", "enriched")
+        assert not loaded.section_done("1.1.1", "written")
+        assert loaded.chapter_done("1.1", "enriched")
+        assert not loaded.chapter_done("1.1", "edited")
+        assert loaded.blueprint.get_section("1.1.2").content == "edited text"
+        assert loaded.blueprint.get_section("1.1.2").status == SectionStatus.COMPLETE
+        assert loaded.blueprint.get_chapter("1.1").key_takeaways == ["One"]
+
+    def test_start_and_delete_discard_state(self, store, sample_blueprint):
+        checkpoint = store.start("p1", {})
+        checkpoint.save_section(sample_blueprint.all_sections[0], "written")
+
+        assert store.start("p1", {}).section_steps == {}
+        assert store.load("p1").section_steps == {}
+
+        assert store.exists("p1")
+        store.delete("p1")
+        assert store.load("p1") is None
+        assert not store.exists("p1")
+
+
+class TestSchedulerResume:
+    """Tests for skipping checkpointed work in the section scheduler"""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_finished_sections(self, config, mock_ai_client, sample_blueprint, store):
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        context = AgentContext(project_id="p1", config=config)
+        checkpoint = store.start("p1", {})
+        checkpoint.save_stage("outliner", blueprint=sample_blueprint)
+
+        original_edit = pipeline.editor.process_section
+
+        async def failing_edit(section, chapter, prev_section, next_section):
+            if section.id == "1.1.3":
+                raise RuntimeError("AI down")
+            await original_edit(section, chapter, prev_section, next_section)
+
+        pipeline.editor.process_section = failing_edit
+        with pytest.raises(RuntimeError):
+            await pipeline.scheduler.run(sample_blueprint, context, checkpoint)
+
+        resumed = store.load("p1")
+        assert resumed.section_done("1.1.3", "enriched")
+        assert not resumed.section_done("1.1.3", "edited")
+
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        pipeline.writer.process_section = AsyncMock()
+        pipeline.expander.process_section = AsyncMock()
+        pipeline.enricher.process_section = AsyncMock()
+        pipeline.editor.process_section = AsyncMock()
+
+        blueprint = await pipeline.scheduler.run(resumed.blueprint, context, resumed)
+
+        pipeline.writer.process_section.assert_not_awaited()
+        pipeline.expander.process_section.assert_not_awaited()
+        pipeline.enricher.process_section.assert_not_awaited()
+        edited = {c.args[0].id for c in pipeline.editor.process_section.await_args_list}
+        assert "1.1.3" in edited
+        assert len(edited) < blueprint.total_sections
+        assert store.load("p1").section_done("1.1.3", "edited")
+
+
+class TestPipelineResume:
+    """Tests for BookWriterPipeline.resume_book"""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_planning_agents(self, config, mock_ai_client, sample_blueprint, store):
+        checkpoint = store.start("p1", {
+            "title": "Test Book",
+            "description": "About testing",
+            "target_pages": 100,
+            "genre": "non-fiction",
+            "audience": "",
+            "subtitle": "",
+        })
+        checkpoint.save_stage("outliner", blueprint=sample_blueprint)
+
+        pipeline = BookWriterPipeline(config, mock_ai_client, checkpoint_store=store)
+        for agent in ("analyst", "architect", "outliner", "quality_gate", "publisher"):
+            setattr(pipeline, agent, MagicMock())
+        pipeline.analyst.execute = AsyncMock()
+        pipeline.architect.execute = AsyncMock()
+        pipeline.outliner.execute = AsyncMock()
+        pipeline.quality_gate.execute = AsyncMock(return_value=MagicMock(passed=True))
+        pipeline.publisher.execute = AsyncMock(return_value={"md": "book.md"})
+
+        project = await pipeline.resume_book("p1")
+
+        pipeline.analyst.execute.assert_not_awaited()
+        pipeline.architect.execute.assert_not_awaited()
+        pipeline.outliner.execute.assert_not_awaited()
+        assert project.status == BookStatus.COMPLETED
+        assert project.sections_completed == project.sections_total
+        assert store.load("p1") is None
+
+    @pytest.mark.asyncio
+    async def test_resume_without_checkpoint_raises(self, config, mock_ai_client, store):
+        pipeline = BookWriterPipeline(config, mock_ai_client, checkpoint_store=store)
+
+        with pytest.raises(BookWriterError):
+            await pipeline.resume_book("missing")
+
+
+class TestServiceResume:
+    """Tests for BookWriterV2Service.resume_project"""
+
+    @pytest.mark.asyncio
+    async def test_resume_rebuilds_project_options(self, tmp_path, monkeypatch):
+        from api.services.book_writer_v2_service import BookWriterV2Service
+
+        service = BookWriterV2Service(db_path=str(tmp_path))
+        monkeypatch.setattr(service, "_run_pipeline", AsyncMock())
+        options = {
+            "words_per_page": 250,
+            "sections_per_chapter": 6,
+            "provider": "anthropic",
+            "model": "claude-test",
+        }
+        service.checkpoints.start("p1", {"title": "Test Book", "options": options})
+        monkeypatch.setattr("ai_providers.unified_client.UnifiedLLMClient", MagicMock())
+
+        await service.resume_project("p1")
+        await service._running_tasks["p1"]
+
+        pipeline = service._run_pipeline.await_args.kwargs["pipeline"]
+        assert pipeline.config.words_per_page == 250
+        assert pipeline.config.default_sections_per_chapter == 6
+        # Provider/model override gets its own client again
+        assert pipeline.ai is not service.ai_client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("checkpointed", [True, False])
+    async def test_failure_recoverable_with_checkpoint(self, tmp_path, checkpointed):
+        from api.services.book_writer_v2_service import BookWriterV2Service
+        from core.book_writer_v2.models import BookProject
+
+        service = BookWriterV2Service(db_path=str(tmp_path))
+        project = BookProject(id="p1")
+        service._active_projects["p1"] = project
+        if checkpointed:
+            service.checkpoints.start("p1", {})
+        pipeline = MagicMock()
+        pipeline.create_book = AsyncMock(side_effect=RuntimeError("AI down"))
+
+        await service._run_pipeline(pipeline=pipeline, project=project)
+
+        assert project.status == BookStatus.FAILED
+        assert project.errors[-1]["recoverable"] is checkpointed
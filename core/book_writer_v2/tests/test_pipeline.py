@@ -2,12 +2,15 @@
 Tests for the pipeline orchestrator
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from core.book_writer_v2.config import BookWriterConfig
 from core.book_writer_v2.pipeline import BookWriterPipeline
-from core.book_writer_v2.models import BookStatus
+from core.book_writer_v2.models import BookStatus, SectionStatus
+from core.book_writer_v2.agents.base import AgentContext
 
 
 @pytest.fixture
@@ -54,3 +57,81 @@ class TestBookWriterPipeline:
         pipeline = BookWriterPipeline(pipeline_config, mock_ai)
         # Should not raise even without callback
         pipeline._report_progress("test-id", "test message", 50.0)
+
+
+class TestSectionScheduler:
+    """Tests for section-level pipelining"""
+
+    @pytest.mark.asyncio
+    async def test_runs_all_stages_per_section(self, config, mock_ai_client, sample_blueprint):
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        context = AgentContext(project_id="test", config=config)
+
+        blueprint = await pipeline.scheduler.run(sample_blueprint, context)
+
+        chapter = blueprint.all_chapters[0]
+        assert chapter.introduction and chapter.summary
+        for section in blueprint.all_sections:
+            assert section.status == SectionStatus.COMPLETE
+            assert section.expansion_attempts == config.max_expansion_attempts
+        assert pipeline.scheduler.expansion_rounds == config.max_expansion_attempts
+
+    @pytest.mark.asyncio
+    async def test_slow_section_does_not_hold_back_others(self, config, mock_ai_client, sample_blueprint):
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        events = []
+
+        async def write(section, blueprint):
+            await asyncio.sleep(0.2 if section.id == "1.1.1" else 0.01)
+            section.content = "word " * 2500
+            section.update_word_count()
+            section.status = SectionStatus.WRITTEN
+            events.append(("write", section.id))
+
+        async def edit(section, chapter, prev_section, next_section):
+            section.status = SectionStatus.COMPLETE
+            events.append(("edit", section.id))
+
+        pipeline.writer.process_section = write
+        pipeline.enricher.process_section = AsyncMock()
+        pipeline.enricher.process_chapter = AsyncMock()
+        pipeline.editor.process_section = edit
+        pipeline.editor.process_chapter = AsyncMock()
+
+        context = AgentContext(project_id="test", config=config)
+        await pipeline.scheduler.run(sample_blueprint, context)
+
+        # The last section is finished before the slow first one is even written
+        assert events.index(("edit", "1.1.4")) < events.index(("write", "1.1.1"))
+        assert all(s.status == SectionStatus.COMPLETE for s in sample_blueprint.all_sections)
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_waiting_sections(self, config, mock_ai_client, sample_blueprint):
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        pipeline.writer.process_section = AsyncMock(side_effect=RuntimeError("AI down"))
+        context = AgentContext(project_id="test", config=config)
+
+        with pytest.raises(RuntimeError, match="AI down"):
+            await asyncio.wait_for(pipeline.scheduler.run(sample_blueprint, context), 5)
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_concurrent_calls(self, mock_ai_client, sample_blueprint):
+        config = BookWriterConfig(pipeline_concurrency=2, max_expansion_attempts=1)
+        in_flight = 0
+        peak = 0
+
+        async def generate(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "word " * 2500
+
+        mock_ai_client.generate = generate
+        pipeline = BookWriterPipeline(config, mock_ai_client)
+        context = AgentContext(project_id="test", config=config)
+
+        await pipeline.scheduler.run(sample_blueprint, context)
+
+        assert peak == 2
@@ -5,18 +5,93 @@
 Checkpoint Manager - Fault-tolerant job state persistence
 
 Phase 5.2: Allows translation jobs to resume from last saved state after interruption.
-Stores completed chunk IDs and translation results in SQLite for crash recovery.
+Stores completed chunk IDs and translation results in SQLite for crash recovery,
+one row per chunk so progress is saved incrementally.
 """
 
 import sqlite3
 import json
 import time
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 
+# Document order: numeric chunk ids sort numerically (text ids cast to 0, then by text)
+_ORDER_COLUMNS = "CAST(chunk_key AS INTEGER), chunk_key"
+
+
+def _result_key(chunk_id: Any) -> Any:
+    """FIX-003: results_data keys are INT when numeric, STRING otherwise."""
+    if isinstance(chunk_id, str) and chunk_id.isdigit():
+        return int(chunk_id)
+    return chunk_id
+
+
+class LazyResults(MutableMapping):
+    """
+    results_data of a loaded checkpoint, read from the chunk rows on first access.
+
+    Resume info, listings and cleanup never touch the translated text, so
+    they no longer pay for decoding every result of every job.
+    """
+
+    def __init__(self, manager: "CheckpointManager", job_id: str):
+        self._manager = manager
+        self._job_id = job_id
+        self._data: Optional[Dict[Any, Any]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def _load(self) -> Dict[Any, Any]:
+        if self._data is None:
+            self._data = self._manager.get_results(self._job_id)
+        return self._data
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+
+    def __delitem__(self, key):
+        del self._load()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        return repr(self._load()) if self.loaded else f"<LazyResults job={self._job_id}>"
+
+
+@dataclass
+class ChunkRecord:
+    """One stored chunk result with its position and edit version"""
+    chunk_id: Any
+    index: int  # Position among stored results in document order
+    result: Dict[str, Any]
+    version: int
+
+
+class VersionConflictError(Exception):
+    """A chunk changed since the version the caller last read"""
+
+    def __init__(self, job_id: str, chunk_id: Any, current_version: int):
+        super().__init__(
+            f"Chunk {chunk_id} of job {job_id} is at version {current_version}"
+        )
+        self.job_id = job_id
+        self.chunk_id = chunk_id
+        self.current_version = current_version
+
+
 @dataclass
 class CheckpointState:
     """Represents a saved checkpoint state for resume"""
@@ -25,7 +100,7 @@ class CheckpointState:
     output_file: str
     total_chunks: int
     completed_chunk_ids: List[str]  # IDs of chunks already translated
-    results_data: Dict[str, Any]  # Map of chunk_id -> serialized TranslationResult
+    results_data: Dict[str, Any]  # Map of chunk_id -> serialized TranslationResult (lazy when loaded)
     job_metadata: Dict[str, Any]
     created_at: float
     updated_at: float
@@ -50,6 +125,15 @@ class CheckpointManager:
     - Thread-safe operations
     - Automatic state serialization/deserialization
     - Resume capability after crashes/interruptions
+
+    Storage:
+    - ``checkpoints``: one row per job (files, totals, metadata, timestamps)
+    - ``checkpoint_chunks``: one row per chunk (completion flag + result JSON)
+
+    Saving a chunk appends or updates only that chunk's row, so a job's
+    total checkpoint writes grow linearly with its chunk count instead of
+    rewriting every earlier result on each save. Databases written in the
+    old single-row JSON format are migrated when opened.
     """
 
     def __init__(self, db_path: Path | None = None):
@@ -68,17 +152,21 @@ class CheckpointManager:
         self._init_db()
 
     def _init_db(self):
-        """Initialize database schema"""
+        """Initialize database schema (migrating the legacy blob format)"""
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(checkpoints)")}
+            if "results_data" in columns:
+                # The index would follow the renamed table and be dropped with it
+                conn.execute("DROP INDEX IF EXISTS idx_updated_at")
+                conn.execute("ALTER TABLE checkpoints RENAME TO checkpoints_legacy")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS checkpoints (
                     job_id TEXT PRIMARY KEY,
                     input_file TEXT NOT NULL,
                     output_file TEXT NOT NULL,
                     total_chunks INTEGER NOT NULL,
-                    completed_chunk_ids TEXT NOT NULL,  -- JSON array
-                    results_data TEXT NOT NULL,  -- JSON object
                     job_metadata TEXT,  -- JSON object
                     created_at REAL NOT NULL,
                     updated_at REAL NOT NULL
@@ -88,8 +176,80 @@ class CheckpointManager:
                 CREATE INDEX IF NOT EXISTS idx_updated_at
                 ON checkpoints(updated_at)
             """)
+            # rowid order = order chunks were first saved
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkpoint_chunks (
+                    job_id TEXT NOT NULL,
+                    chunk_key TEXT NOT NULL,  -- str(chunk_id)
+                    chunk_id TEXT NOT NULL,  -- JSON, keeps INT/STRING type
+                    completed INTEGER NOT NULL DEFAULT 1,
+                    result TEXT,  -- JSON object, NULL if no result stored
+                    version INTEGER NOT NULL DEFAULT 0,  -- bumped on every result change
+                    PRIMARY KEY (job_id, chunk_key)
+                )
+            """)
+            # Document order (numeric chunk ids) for windowed reads
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_chunks_order
+                ON checkpoint_chunks(job_id, {_ORDER_COLUMNS})
+            """)
+
+            if "results_data" in columns:
+                self._migrate_legacy(conn)
             conn.commit()
 
+    def _migrate_legacy(self, conn: sqlite3.Connection):
+        """Split legacy rows (JSON id list + JSON results blob) into chunk rows"""
+        rows = conn.execute("""
+            SELECT job_id, input_file, output_file, total_chunks,
+                   completed_chunk_ids, results_data, job_metadata,
+                   created_at, updated_at
+            FROM checkpoints_legacy
+        """).fetchall()
+
+        for row in rows:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (row[0], row[1], row[2], row[3], row[6], row[7], row[8])
+            )
+            self._write_chunks(
+                conn, row[0], json.loads(row[4] or "[]"), json.loads(row[5] or "{}")
+            )
+
+        conn.execute("DROP TABLE checkpoints_legacy")
+
+    @staticmethod
+    def _write_chunks(
+        conn: sqlite3.Connection,
+        job_id: str,
+        completed_chunk_ids: List[Any],
+        results_data: Dict[Any, Any]
+    ):
+        """Upsert chunk rows; unchanged rows are left untouched"""
+        rows: Dict[str, list] = {}
+        for chunk_id in completed_chunk_ids:
+            rows[str(chunk_id)] = [json.dumps(chunk_id), 1, None]
+        for chunk_id, result in results_data.items():
+            row = rows.setdefault(str(chunk_id), [json.dumps(chunk_id), 0, None])
+            row[2] = json.dumps(result)
+
+        conn.executemany("""
+            INSERT INTO checkpoint_chunks (job_id, chunk_key, chunk_id, completed, result)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(job_id, chunk_key) DO UPDATE SET
+                completed = excluded.completed,
+                result = excluded.result,
+                version = version + (result IS NOT excluded.result)
+            WHERE completed IS NOT excluded.completed OR result IS NOT excluded.result
+        """, [(job_id, key, *row) for key, row in rows.items()])
+
+    def _touch(self, conn: sqlite3.Connection, job_id: str, now: float) -> bool:
+        cursor = conn.execute(
+            "UPDATE checkpoints SET updated_at = ? WHERE job_id = ?",
+            (now, job_id)
+        )
+        return cursor.rowcount > 0
+
     def save_checkpoint(
         self,
         job_id: str,
@@ -101,7 +261,11 @@ class CheckpointManager:
         job_metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """
-        Save or update checkpoint state
+        Save or update the full checkpoint state
+
+        Only chunk rows that are new or changed are written; chunks missing
+        from ``completed_chunk_ids`` and ``results_data`` are removed. For
+        per-chunk progress prefer save_chunk_results().
 
         Args:
             job_id: Unique job identifier
@@ -115,38 +279,261 @@ class CheckpointManager:
         now = time.time()
 
         with sqlite3.connect(self.db_path) as conn:
-            # Check if checkpoint exists
-            cursor = conn.execute(
-                "SELECT created_at FROM checkpoints WHERE job_id = ?",
-                (job_id,)
-            )
-            row = cursor.fetchone()
-            created_at = row[0] if row else now
-
-            # Insert or replace
             conn.execute("""
-                INSERT OR REPLACE INTO checkpoints (
+                INSERT INTO checkpoints (
                     job_id, input_file, output_file, total_chunks,
-                    completed_chunk_ids, results_data, job_metadata,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    job_metadata, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    input_file = excluded.input_file,
+                    output_file = excluded.output_file,
+                    total_chunks = excluded.total_chunks,
+                    job_metadata = excluded.job_metadata,
+                    updated_at = excluded.updated_at
             """, (
                 job_id,
                 input_file,
                 output_file,
                 total_chunks,
-                json.dumps(completed_chunk_ids),
-                json.dumps(results_data),
                 json.dumps(job_metadata or {}),
-                created_at,
+                now,
                 now
             ))
+
+            keep = {str(c) for c in completed_chunk_ids} | {str(c) for c in results_data}
+            stale = [
+                (job_id, key)
+                for (key,) in conn.execute(
+                    "SELECT chunk_key FROM checkpoint_chunks WHERE job_id = ?", (job_id,)
+                )
+                if key not in keep
+            ]
+            conn.executemany(
+                "DELETE FROM checkpoint_chunks WHERE job_id = ? AND chunk_key = ?", stale
+            )
+            self._write_chunks(conn, job_id, completed_chunk_ids, results_data)
+            conn.commit()
+
+    def save_chunk_results(self, job_id: str, results: Dict[Any, Dict[str, Any]]) -> bool:
+        """
+        Append completed chunks to an existing checkpoint
+
+        Writes one row per chunk (updating it if the chunk was saved
+        before) without touching the rest of the job.
+
+        Args:
+            job_id: Job identifier (checkpoint must exist)
+            results: Map of chunk_id -> serialized translation result
+
+        Returns:
+            True if the checkpoint exists and the chunks were saved
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if not self._touch(conn, job_id, time.time()):
+                return False
+            conn.executemany("""
+                INSERT INTO checkpoint_chunks (job_id, chunk_key, chunk_id, completed, result)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(job_id, chunk_key) DO UPDATE SET
+                    completed = 1,
+                    result = excluded.result,
+                    version = version + (result IS NOT excluded.result)
+            """, [
+                (job_id, str(chunk_id), json.dumps(chunk_id), json.dumps(result))
+                for chunk_id, result in results.items()
+            ])
             conn.commit()
+            return True
+
+    def save_chunk_result(self, job_id: str, chunk_id: Any, result: Dict[str, Any]) -> bool:
+        """Append or update a single chunk result (see save_chunk_results)"""
+        return self.save_chunk_results(job_id, {chunk_id: result})
+
+    def completed_count(self, job_id: str) -> int:
+        """Number of completed chunks, without loading any results"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_chunks WHERE job_id = ? AND completed = 1",
+                (job_id,)
+            ).fetchone()
+            return row[0]
+
+    def get_results(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Stored chunk results in save order
+
+        Args:
+            job_id: Job identifier
+            offset: Number of results to skip
+            limit: Maximum number of results (None = all)
+
+        Returns:
+            Map of chunk_id -> serialized translation result
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                SELECT chunk_id, result FROM checkpoint_chunks
+                WHERE job_id = ? AND result IS NOT NULL
+                ORDER BY rowid
+                LIMIT ? OFFSET ?
+            """, (job_id, -1 if limit is None else limit, offset))
+            return {
+                _result_key(json.loads(chunk_id)): json.loads(result)
+                for chunk_id, result in cursor
+            }
+
+    def count_results(self, job_id: str) -> int:
+        """Number of chunks with a stored result"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_chunks WHERE job_id = ? AND result IS NOT NULL",
+                (job_id,)
+            ).fetchone()
+            return row[0]
+
+    def get_chunk_window(self, job_id: str, offset: int = 0, limit: int = 50) -> List[ChunkRecord]:
+        """
+        A page of stored results in document order
+
+        Only the rows in the window are read and decoded.
+
+        Args:
+            job_id: Job identifier
+            offset: Index of the first result
+            limit: Maximum number of results
+
+        Returns:
+            ChunkRecords with ``index`` counting from ``offset``
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(f"""
+                SELECT chunk_id, result, version FROM checkpoint_chunks
+                WHERE job_id = ? AND result IS NOT NULL
+                ORDER BY {_ORDER_COLUMNS}
+                LIMIT ? OFFSET ?
+            """, (job_id, limit, offset))
+            return [
+                ChunkRecord(
+                    chunk_id=_result_key(json.loads(chunk_id)),
+                    index=offset + i,
+                    result=json.loads(result),
+                    version=version
+                )
+                for i, (chunk_id, result, version) in enumerate(cursor)
+            ]
+
+    def get_chunk(self, job_id: str, chunk_id: Any) -> Optional[ChunkRecord]:
+        """
+        One stored result with its document position
+
+        Args:
+            job_id: Job identifier
+            chunk_id: Chunk ID (INT or STRING, compared as text)
+
+        Returns:
+            ChunkRecord, or None if the chunk has no stored result
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(f"""
+                SELECT chunk_id, result, version, {_ORDER_COLUMNS} FROM checkpoint_chunks
+                WHERE job_id = ? AND chunk_key = ? AND result IS NOT NULL
+            """, (job_id, str(chunk_id))).fetchone()
+            if not row:
+                return None
+            (index,) = conn.execute("""
+                SELECT COUNT(*) FROM checkpoint_chunks
+                WHERE job_id = ? AND result IS NOT NULL
+                  AND (CAST(chunk_key AS INTEGER) < ?
+                       OR (CAST(chunk_key AS INTEGER) = ? AND chunk_key < ?))
+            """, (job_id, row[3], row[3], row[4])).fetchone()
+            return ChunkRecord(
+                chunk_id=_result_key(json.loads(row[0])),
+                index=index,
+                result=json.loads(row[1]),
+                version=row[2]
+            )
+
+    def update_chunk_result(
+        self,
+        job_id: str,
+        chunk_id: Any,
+        changes: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Merge fields into one stored result
+
+        Reads and rewrites only that chunk's row inside one write
+        transaction, so concurrent edits of other chunks never conflict.
+
+        Args:
+            job_id: Job identifier
+            chunk_id: Chunk ID
+            changes: Fields to set on the result dict
+            expected_version: Version the caller read; None skips the check
+
+        Returns:
+            The chunk's new version, or None if it has no stored result
+
+        Raises:
+            VersionConflictError: If the chunk is no longer at expected_version
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("""
+                SELECT result, version FROM checkpoint_chunks
+                WHERE job_id = ? AND chunk_key = ? AND result IS NOT NULL
+            """, (job_id, str(chunk_id))).fetchone()
+            if not row:
+                return None
+
+            result, version = json.loads(row[0]), row[1]
+            if expected_version is not None and expected_version != version:
+                raise VersionConflictError(job_id, chunk_id, version)
+
+            result.update(changes)
+            conn.execute("""
+                UPDATE checkpoint_chunks SET result = ?, version = ?
+                WHERE job_id = ? AND chunk_key = ?
+            """, (json.dumps(result), version + 1, job_id, str(chunk_id)))
+            self._touch(conn, job_id, time.time())
+            conn.commit()
+            return version + 1
+
+    def _completed_ids(self, conn: sqlite3.Connection, job_id: str) -> List[Any]:
+        return [
+            json.loads(chunk_id)  # Keeps original INT/STRING type
+            for (chunk_id,) in conn.execute(
+                "SELECT chunk_id FROM checkpoint_chunks WHERE job_id = ? AND completed = 1 ORDER BY rowid",
+                (job_id,)
+            )
+        ]
+
+    def _state_from_row(self, conn: sqlite3.Connection, row) -> CheckpointState:
+        return CheckpointState(
+            job_id=row[0],
+            input_file=row[1],
+            output_file=row[2],
+            total_chunks=row[3],
+            completed_chunk_ids=self._completed_ids(conn, row[0]),
+            results_data=LazyResults(self, row[0]),
+            job_metadata=json.loads(row[4]) if row[4] else {},
+            created_at=row[5],
+            updated_at=row[6]
+        )
 
     def load_checkpoint(self, job_id: str) -> Optional[CheckpointState]:
         """
         Load checkpoint state for a job
 
+        Completed chunk IDs are read eagerly; ``results_data`` is loaded
+        from the chunk rows on first access.
+
         Args:
             job_id: Job identifier
 
@@ -154,38 +541,16 @@ class CheckpointManager:
             CheckpointState if checkpoint exists, None otherwise
         """
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
+            row = conn.execute("""
                 SELECT
                     job_id, input_file, output_file, total_chunks,
-                    completed_chunk_ids, results_data, job_metadata,
-                    created_at, updated_at
+                    job_metadata, created_at, updated_at
                 FROM checkpoints
                 WHERE job_id = ?
-            """, (job_id,))
-
-            row = cursor.fetchone()
+            """, (job_id,)).fetchone()
             if not row:
                 return None
-
-            # FIX-003: Handle both INT and STRING chunk IDs
-            # JSON dict keys are always strings, convert to int if numeric
-            raw_results_data = json.loads(row[5])
-            results_data_fixed_keys = {
-                int(k) if k.isdigit() else k: v
-                for k, v in raw_results_data.items()
-            }
-
-            return CheckpointState(
-                job_id=row[0],
-                input_file=row[1],
-                output_file=row[2],
-                total_chunks=row[3],
-                completed_chunk_ids=json.loads(row[4]),  # Array keeps original type
-                results_data=results_data_fixed_keys,  # Dict keys fixed
-                job_metadata=json.loads(row[6]) if row[6] else {},
-                created_at=row[7],
-                updated_at=row[8]
-            )
+            return self._state_from_row(conn, row)
 
     def has_checkpoint(self, job_id: str) -> bool:
         """
@@ -215,6 +580,7 @@ class CheckpointManager:
             True if checkpoint was deleted
         """
         with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM checkpoint_chunks WHERE job_id = ?", (job_id,))
             cursor = conn.execute(
                 "DELETE FROM checkpoints WHERE job_id = ?",
                 (job_id,)
@@ -236,35 +602,13 @@ class CheckpointManager:
             cursor = conn.execute("""
                 SELECT
                     job_id, input_file, output_file, total_chunks,
-                    completed_chunk_ids, results_data, job_metadata,
-                    created_at, updated_at
+                    job_metadata, created_at, updated_at
                 FROM checkpoints
                 ORDER BY updated_at DESC
                 LIMIT ?
             """, (limit,))
 
-            checkpoints = []
-            for row in cursor.fetchall():
-                # FIX-003: Handle both INT and STRING chunk IDs
-                raw_results_data = json.loads(row[5])
-                results_data_fixed_keys = {
-                    int(k) if k.isdigit() else k: v
-                    for k, v in raw_results_data.items()
-                }
-
-                checkpoints.append(CheckpointState(
-                    job_id=row[0],
-                    input_file=row[1],
-                    output_file=row[2],
-                    total_chunks=row[3],
-                    completed_chunk_ids=json.loads(row[4]),  # Array keeps original type
-                    results_data=results_data_fixed_keys,  # Dict keys fixed
-                    job_metadata=json.loads(row[6]) if row[6] else {},
-                    created_at=row[7],
-                    updated_at=row[8]
-                ))
-
-            return checkpoints
+            return [self._state_from_row(conn, row) for row in cursor.fetchall()]
 
     def get_resume_info(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -276,18 +620,26 @@ class CheckpointManager:
         Returns:
             Dict with resume info or None if no checkpoint
         """
-        checkpoint = self.load_checkpoint(job_id)
-        if not checkpoint:
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT total_chunks, updated_at FROM checkpoints WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        if not row:
             return None
 
+        total_chunks, updated_at = row
+        completed = self.completed_count(job_id)
+        remaining = total_chunks - completed
+
         return {
-            'job_id': checkpoint.job_id,
-            'total_chunks': checkpoint.total_chunks,
-            'completed_chunks': len(checkpoint.completed_chunk_ids),
-            'remaining_chunks': checkpoint.remaining_chunks(),
-            'completion_percentage': checkpoint.completion_percentage(),
-            'last_updated': datetime.fromtimestamp(checkpoint.updated_at).isoformat(),
-            'can_resume': checkpoint.remaining_chunks() > 0
+            'job_id': job_id,
+            'total_chunks': total_chunks,
+            'completed_chunks': completed,
+            'remaining_chunks': remaining,
+            'completion_percentage': completed / total_chunks if total_chunks else 0.0,
+            'last_updated': datetime.fromtimestamp(updated_at).isoformat(),
+            'can_resume': remaining > 0
         }
 
     def cleanup_old_checkpoints(self, days: int = 7) -> int:
@@ -303,6 +655,11 @@ class CheckpointManager:
         cutoff_time = time.time() - (days * 86400)
 
         with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                DELETE FROM checkpoint_chunks WHERE job_id IN (
+                    SELECT job_id FROM checkpoints WHERE updated_at < ?
+                )
+            """, (cutoff_time,))
             cursor = conn.execute(
                 "DELETE FROM checkpoints WHERE updated_at < ?",
                 (cutoff_time,)
@@ -321,9 +678,13 @@ class CheckpointManager:
             cursor = conn.execute("""
                 SELECT
                     COUNT(*) as total_checkpoints,
-                    AVG(CAST(LENGTH(completed_chunk_ids) - LENGTH(REPLACE(completed_chunk_ids, ',', '')) + 1 AS FLOAT) / total_chunks) as avg_completion,
-                    SUM(total_chunks) as total_chunks_all_jobs
-                FROM checkpoints
+                    AVG(CAST(COALESCE(done.n, 0) AS FLOAT) / c.total_chunks) as avg_completion,
+                    SUM(c.total_chunks) as total_chunks_all_jobs
+                FROM checkpoints c
+                LEFT JOIN (
+                    SELECT job_id, COUNT(*) AS n FROM checkpoint_chunks
+                    WHERE completed = 1 GROUP BY job_id
+                ) done ON done.job_id = c.job_id
             """)
             row = cursor.fetchone()
 
@@ -11,13 +11,16 @@ Key Features:
 - Persistent storage across restarts
 - Hit/miss statistics tracking
 - Thread-safe operations
+- Optional write-behind mode: inserts and access-stat updates are
+  buffered and flushed in one transaction on a timer or size threshold
 """
 
+import atexit
 import sqlite3
 import hashlib
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 import threading
 
@@ -109,15 +112,32 @@ class ChunkCache:
         'Hello world'
         >>> cache.stats()
         {'total_entries': 1, 'hits': 1, 'misses': 0, 'hit_rate': 1.0}
+
+    Write-behind mode:
+        With ``write_behind=True``, ``set`` and the access-stat UPDATE of
+        a hit only touch in-memory buffers. A background thread writes the
+        buffers in a single transaction every ``flush_interval`` seconds,
+        or sooner once ``flush_size`` writes are pending. Buffered entries
+        are visible to ``get`` immediately. Call ``flush()`` or ``close()``
+        to persist everything before shutdown.
     """
 
-    def __init__(self, db_path: str | Path | None = None):
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        write_behind: bool = False,
+        flush_interval: float = 2.0,
+        flush_size: int = 500,
+    ):
         """
         Initialize cache with SQLite database.
 
         Args:
             db_path: Path to SQLite database file (will be created if doesn't exist).
                      If None, uses settings.cache_dir / "chunks.db".
+            write_behind: Buffer writes and flush them in batches
+            flush_interval: Seconds between background flushes (write-behind only)
+            flush_size: Pending writes that trigger an immediate flush (write-behind only)
         """
         if db_path is None:
             from config.settings import settings
@@ -133,9 +153,31 @@ class ChunkCache:
         self._hits = 0
         self._misses = 0
 
+        # Write-behind buffers: key -> row to insert, key -> (last_accessed, hits)
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending_sets: Dict[str, Tuple[str, str, str, str, str]] = {}
+        self._pending_access: Dict[str, Tuple[str, int]] = {}
+        # Inserts taken by a running flush, readable until its commit
+        self._flushing_sets: Dict[str, Tuple[str, str, str, str, str]] = {}
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
         # Initialize database schema
         self._init_db()
 
+        if write_behind:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="chunk-cache-flush",
+                daemon=True
+            )
+            self._flusher.start()
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, 'conn') or self._local.conn is None:
@@ -191,6 +233,14 @@ class ChunkCache:
         Returns:
             Cached translated text if found, None otherwise
         """
+        if self.write_behind:
+            buffered = self._buffered_values([key])
+            if buffered:
+                self._record_access(buffered)
+                with self._stats_lock:
+                    self._hits += 1
+                return buffered[key]
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -199,13 +249,16 @@ class ChunkCache:
 
         if row:
             # Update access stats
-            now = datetime.utcnow().isoformat()
-            cursor.execute('''
-                UPDATE chunk_cache
-                SET last_accessed = ?, access_count = access_count + 1
-                WHERE key = ?
-            ''', (now, key))
-            conn.commit()
+            if self.write_behind:
+                self._record_access([key])
+            else:
+                now = datetime.utcnow().isoformat()
+                cursor.execute('''
+                    UPDATE chunk_cache
+                    SET last_accessed = ?, access_count = access_count + 1
+                    WHERE key = ?
+                ''', (now, key))
+                conn.commit()
 
             # Track hit
             with self._stats_lock:
@@ -219,6 +272,58 @@ class ChunkCache:
 
             return None
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Retrieve many cached values in one query.
+
+        Access stats of all hits are updated in a single transaction.
+
+        Args:
+            keys: Cache keys (SHA256 hashes from compute_chunk_key)
+
+        Returns:
+            Dict mapping each found key to its cached value
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        found: Dict[str, str] = self._buffered_values(keys) if self.write_behind else {}
+        remaining = [key for key in keys if key not in found]
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(remaining), 500):
+            batch = remaining[i:i + 500]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(
+                f'SELECT key, value FROM chunk_cache WHERE key IN ({placeholders})',
+                batch
+            )
+            for row in cursor.fetchall():
+                found[row['key']] = row['value']
+
+        if found and self.write_behind:
+            self._record_access(found)
+        elif found:
+            now = datetime.utcnow().isoformat()
+            cursor.execute('BEGIN')
+            cursor.executemany('''
+                UPDATE chunk_cache
+                SET last_accessed = ?, access_count = access_count + 1
+                WHERE key = ?
+            ''', [(now, key) for key in found])
+            cursor.execute('COMMIT')
+
+        # Track hits/misses
+        with self._stats_lock:
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+
+        return found
+
     def set(
         self,
         key: str,
@@ -237,18 +342,46 @@ class ChunkCache:
             target_lang: Optional target language (for metadata)
             mode: Optional pipeline mode (for metadata)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        self.set_many([(key, value)], source_lang, target_lang, mode)
 
-        now = datetime.utcnow().isoformat()
+    def set_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        source_lang: str = '',
+        target_lang: str = '',
+        mode: str = ''
+    ) -> None:
+        """
+        Store many values in one transaction.
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO chunk_cache
-            (key, value, source_lang, target_lang, mode, created_at, last_accessed, access_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-        ''', (key, value, source_lang, target_lang, mode, now, now))
+        In write-behind mode the values are buffered instead.
 
-        conn.commit()
+        Args:
+            items: (key, translated text) pairs
+            source_lang: Optional source language (for metadata)
+            target_lang: Optional target language (for metadata)
+            mode: Optional pipeline mode (for metadata)
+        """
+        now = datetime.utcnow().isoformat()
+        rows = {
+            key: (value, source_lang, target_lang, mode, now)
+            for key, value in items
+        }
+        if not rows:
+            return
+
+        if self.write_behind:
+            with self._buffer_lock:
+                self._pending_sets.update(rows)
+                # The new row starts with fresh access stats
+                for key in rows:
+                    self._pending_access.pop(key, None)
+                pending = len(self._pending_sets) + len(self._pending_access)
+            if pending >= self.flush_size:
+                self._flush_event.set()
+            return
+
+        self._write_rows(rows, {})
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -262,6 +395,8 @@ class ChunkCache:
             - hit_rate: Cache hit rate (0.0 - 1.0)
             - db_size_mb: Database file size in MB
         """
+        self.flush()
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -288,18 +423,171 @@ class ChunkCache:
 
     def clear(self) -> None:
         """Clear all cache entries (for testing/maintenance)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM chunk_cache')
-        conn.commit()
+        with self._flush_lock:
+            with self._buffer_lock:
+                self._pending_sets.clear()
+                self._pending_access.clear()
+
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM chunk_cache')
+            conn.commit()
 
         # Reset stats
         with self._stats_lock:
             self._hits = 0
             self._misses = 0
 
+    # ==================== WRITE-BEHIND ====================
+
+    def _buffered_values(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Values of keys that are written but not committed yet."""
+        with self._buffer_lock:
+            found = {}
+            for key in keys:
+                row = self._pending_sets.get(key) or self._flushing_sets.get(key)
+                if row is not None:
+                    found[key] = row[0]
+            return found
+
+    def _record_access(self, keys: Iterable[str]) -> None:
+        """Buffer access-stat updates for cache hits."""
+        now = datetime.utcnow().isoformat()
+        with self._buffer_lock:
+            for key in keys:
+                _, count = self._pending_access.get(key, (now, 0))
+                self._pending_access[key] = (now, count + 1)
+            pending = len(self._pending_sets) + len(self._pending_access)
+        if pending >= self.flush_size:
+            self._flush_event.set()
+
+    def _write_rows(
+        self,
+        rows: Dict[str, Tuple[str, str, str, str, str]],
+        access: Dict[str, Tuple[str, int]]
+    ) -> None:
+        """Write inserts and access-stat updates in one transaction."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('BEGIN')
+        try:
+            if rows:
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO chunk_cache
+                    (key, value, source_lang, target_lang, mode, created_at, last_accessed, access_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                ''', [
+                    (key, value, src, tgt, mode, now, now)
+                    for key, (value, src, tgt, mode, now) in rows.items()
+                ])
+            if access:
+                cursor.executemany('''
+                    UPDATE chunk_cache
+                    SET last_accessed = ?, access_count = access_count + ?
+                    WHERE key = ?
+                ''', [
+                    (last_accessed, count, key)
+                    for key, (last_accessed, count) in access.items()
+                ])
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+    def flush(self) -> int:
+        """
+        Write all buffered inserts and access-stat updates.
+
+        Returns:
+            Number of buffered writes persisted
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                rows, self._pending_sets = self._pending_sets, {}
+                access, self._pending_access = self._pending_access, {}
+                self._flushing_sets = rows
+
+            if not rows and not access:
+                return 0
+
+            try:
+                self._write_rows(rows, access)
+            except sqlite3.Error:
+                # Put the writes back so the next flush retries them
+                with self._buffer_lock:
+                    for key, row in rows.items():
+                        self._pending_sets.setdefault(key, row)
+                    for key, (last_accessed, count) in access.items():
+                        latest, newer = self._pending_access.get(key, (last_accessed, 0))
+                        self._pending_access[key] = (latest, count + newer)
+                raise
+            finally:
+                with self._buffer_lock:
+                    self._flushing_sets = {}
+
+            return len(rows) + len(access)
+
+    def _flush_loop(self) -> None:
+        """Background flusher for write-behind mode."""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Keep the buffers and retry on the next tick
+                continue
+
+        self._close_connection()
+
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending writes, stop the flusher and close the database connection."""
+        if self._flusher is not None:
+            self._stop_event.set()
+            self._flush_event.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        self._close_connection()
+
+    def _close_connection(self) -> None:
+        """Close the calling thread's database connection."""
         if hasattr(self._local, 'conn') and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
+
+
+# Shared instances, one per database file
+_chunk_caches: Dict[Path, ChunkCache] = {}
+_chunk_caches_lock = threading.Lock()
+
+
+def get_chunk_cache(db_path: str | Path | None = None) -> ChunkCache:
+    """
+    Get the process-wide ChunkCache for a database file.
+
+    Uses write-behind according to settings, so all jobs and the API share
+    one set of buffers and one flusher thread. Buffers are flushed at exit.
+
+    Args:
+        db_path: Path to SQLite database file (default: settings.cache_dir / "chunks.db")
+    """
+    from config.settings import settings
+
+    if db_path is None:
+        db_path = settings.cache_dir / "chunks.db"
+    path = Path(db_path).resolve()
+
+    with _chunk_caches_lock:
+        cache = _chunk_caches.get(path)
+        if cache is None:
+            cache = ChunkCache(
+                path,
+                write_behind=settings.chunk_cache_write_behind,
+                flush_interval=settings.chunk_cache_flush_interval,
+                flush_size=settings.chunk_cache_flush_size,
+            )
+            _chunk_caches[path] = cache
+            atexit.register(cache.close)
+        return cache
@@ -3,58 +3,229 @@
 
 """
 TranslationCache - Cache để tránh dịch lại content giống nhau
+
+Storage is an append-only log (``translation_cache.log``), one record per
+line::
+
+    <sha256 key>\\t<json entry>\\n
+
+- set() appends one line: O(1), nothing is rewritten
+- get() seeks to the record through an in-memory key -> offset index
+- The index is built lazily on first use by scanning only the keys
+- Overwritten records are dropped by compaction once they outnumber
+  the live ones
+- An existing ``translation_cache.json`` is migrated once into the log
+
+Jobs share one instance per directory (get_translation_cache). Other
+writers of the same log (e.g. another worker process) are tolerated:
+records are appended with O_APPEND and their offset is taken from the
+real end of file, get() checks the key of the record it reads and indexes
+records appended by others on a miss, and a log replaced by another
+writer's compaction is re-indexed.
 """
 
+import atexit
 import json
 import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from datetime import datetime
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+KEY_LENGTH = 64  # sha256 hex digest
+
 
 class TranslationCache:
     """Cache để tránh dịch lại content giống nhau"""
 
+    LOG_NAME = "translation_cache.log"
+    LEGACY_NAME = "translation_cache.json"
+
+    # Compact when dead records exceed live ones and this minimum
+    COMPACT_MIN_DEAD = 1000
+
     def __init__(self, cache_dir: Path, enabled: bool = True):
         self.enabled = enabled
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
-        self.cache_file = self.cache_dir / "translation_cache.json"
-        self.cache = self._load_cache()
+        self.log_file = self.cache_dir / self.LOG_NAME
+        self.legacy_file = self.cache_dir / self.LEGACY_NAME
         self.hits = 0
         self.misses = 0
 
-    def _load_cache(self) -> Dict:
-        """Load cache từ disk"""
-        if not self.enabled:
-            return {}
-
-        if self.cache_file.exists():
-            try:
-                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-                logger.info(f" Loaded {len(data)} cached translations")
-                return data
-            except Exception as e:
-                logger.debug("Failed to load cache from disk: %s", e)
-                return {}
-        return {}
-
-    def _save_cache(self):
-        """Save cache to disk"""
-        if not self.enabled:
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, int]] = None
+        self._dead = 0
+        self._indexed_size = 0  # Log bytes covered by the index
+        self._reader = None
+        self._writer = None
+
+        if self.enabled:
+            self._migrate_legacy()
+
+    # ==================== STORAGE ====================
+
+    def _migrate_legacy(self):
+        """One-time import of the old JSON cache file into the log"""
+        if self.log_file.exists() or not self.legacy_file.exists():
             return
 
         try:
-            self.cache_file.write_text(
-                json.dumps(self.cache, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
+            data = json.loads(self.legacy_file.read_text(encoding="utf-8"))
         except Exception as e:
-            logger.warning(f" Cannot save cache: {e}")
+            logger.warning(f" Cannot migrate legacy cache {self.legacy_file}: {e}")
+            return
+
+        tmp_file = self.log_file.with_suffix(".log.tmp")
+        with open(tmp_file, "wb") as f:
+            for hash_key, entry in data.items():
+                f.write(self._encode(hash_key, entry))
+        os.replace(tmp_file, self.log_file)
+        self.legacy_file.rename(self.legacy_file.with_suffix(".json.migrated"))
+
+        logger.info(f" Migrated {len(data)} cached translations to {self.log_file.name}")
+
+    @staticmethod
+    def _encode(hash_key: str, entry: Dict) -> bytes:
+        return f"{hash_key}\t{json.dumps(entry, ensure_ascii=False)}\n".encode("utf-8")
+
+    def _ensure_index(self) -> Dict[str, int]:
+        """Build the key -> offset index on first use"""
+        if self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._index is not None:
+                return self._index
+
+            index: Dict[str, int] = {}
+            dead = 0
+            offset = 0
+            if self.log_file.exists():
+                with open(self.log_file, "rb") as f:
+                    for line in f:
+                        if not line.endswith(b"\n") or line[KEY_LENGTH:KEY_LENGTH + 1] != b"\t":
+                            # Torn write from a crash: drop the partial record
+                            logger.warning(f" Truncating partial record in {self.log_file.name} at {offset}")
+                            break
+                        key = line[:KEY_LENGTH].decode("ascii")
+                        if key in index:
+                            dead += 1
+                        index[key] = offset
+                        offset += len(line)
+
+                if offset != self.log_file.stat().st_size:
+                    with open(self.log_file, "r+b") as f:
+                        f.truncate(offset)
+
+            self._dead = dead
+            self._index = index
+            self._indexed_size = offset
+            logger.info(f" Indexed {len(index)} cached translations")
+            return index
+
+    def _index_tail(self) -> bool:
+        """Index records other writers appended since the last scan"""
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size <= self._indexed_size:
+            return False
+
+        index = self._ensure_index()
+        offset = self._indexed_size
+        with open(self.log_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n") or line[KEY_LENGTH:KEY_LENGTH + 1] != b"\t":
+                    break  # Still being written
+                key = line[:KEY_LENGTH].decode("ascii")
+                current = index.get(key)
+                # Own appends are already indexed; never go back to an older record
+                if current is None or offset > current:
+                    if current is not None:
+                        self._dead += 1
+                    index[key] = offset
+                offset += len(line)
+        self._indexed_size = offset
+        return True
+
+    def _read_entry(self, hash_key: str, offset: int) -> Optional[Dict]:
+        """Record at offset, or None if it is not hash_key's (stale offset)"""
+        if self._reader is None:
+            self._reader = open(self.log_file, "rb")
+        self._reader.seek(offset)
+        line = self._reader.readline()
+        if line[:KEY_LENGTH] != hash_key.encode("ascii") or not line.endswith(b"\n"):
+            return None
+        return json.loads(line[KEY_LENGTH + 1:])
+
+    def _append(self, hash_key: str, entry: Dict) -> int:
+        if self._writer is None:
+            # Unbuffered O_APPEND: each record is one write at the real end
+            # of file, even with other writers on the same log
+            self._writer = open(self.log_file, "ab", buffering=0)
+        record = self._encode(hash_key, entry)
+        self._writer.write(record)
+        return os.lseek(self._writer.fileno(), 0, os.SEEK_CUR) - len(record)
+
+    def _check_replaced(self):
+        """Drop handles and index if another writer replaced the log"""
+        handle = self._writer or self._reader
+        if handle is None:
+            return
+        try:
+            replaced = not os.path.samestat(os.fstat(handle.fileno()), os.stat(self.log_file))
+        except FileNotFoundError:
+            replaced = True
+        if replaced:
+            logger.info(f" {self.log_file.name} was replaced, re-indexing")
+            self._close_handles()
+            self._index = None
+
+    def _close_handles(self):
+        for handle in (self._reader, self._writer):
+            if handle is not None:
+                handle.close()
+        self._reader = None
+        self._writer = None
+
+    def compact(self):
+        """Rewrite the log without overwritten records"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            index = self._ensure_index()
+            # Keep records other writers appended
+            self._index_tail()
+            if self._dead == 0:
+                return
+
+            tmp_file = self.log_file.with_suffix(".log.tmp")
+            new_index: Dict[str, int] = {}
+            with open(self.log_file, "rb") as src, open(tmp_file, "wb") as dst:
+                # Copy live records in file order
+                for hash_key, offset in sorted(index.items(), key=lambda item: item[1]):
+                    src.seek(offset)
+                    new_index[hash_key] = dst.tell()
+                    dst.write(src.readline())
+
+            self._close_handles()
+            # Other writers notice the new file in _check_replaced
+            os.replace(tmp_file, self.log_file)
+            logger.info(f" Compacted translation cache: dropped {self._dead} stale records")
+            self._index = new_index
+            self._indexed_size = self.log_file.stat().st_size
+            self._dead = 0
+
+    # ==================== PUBLIC API ====================
 
     def get_hash(self, text: str, model: str) -> str:
         """Generate unique hash cho text + model"""
@@ -67,9 +238,18 @@ class TranslationCache:
             return None
 
         hash_key = self.get_hash(text, model)
-        if hash_key in self.cache:
-            self.hits += 1
-            return self.cache[hash_key]["translation"]
+        with self._lock:
+            self._check_replaced()
+            index = self._ensure_index()
+            offset = index.get(hash_key)
+            if offset is None and self._index_tail():
+                offset = index.get(hash_key)
+            if offset is not None:
+                entry = self._read_entry(hash_key, offset)
+                if entry is not None:
+                    self.hits += 1
+                    return entry["translation"]
+                del index[hash_key]
 
         self.misses += 1
         return None
@@ -80,16 +260,28 @@ class TranslationCache:
             return
 
         hash_key = self.get_hash(text, model)
-        self.cache[hash_key] = {
+        entry = {
             "translation": translation,
             "model": model,
             "quality_score": quality_score,
             "timestamp": datetime.now().isoformat()
         }
 
-        # Periodic save
-        if len(self.cache) % 10 == 0:
-            self._save_cache()
+        with self._lock:
+            self._check_replaced()
+            index = self._ensure_index()
+            if hash_key in index:
+                self._dead += 1
+            index[hash_key] = self._append(hash_key, entry)
+
+            # Periodic compaction
+            if self._dead > max(self.COMPACT_MIN_DEAD, len(index)):
+                self.compact()
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        return len(self._ensure_index())
 
     def get_stats(self) -> str:
         """Get cache statistics"""
@@ -102,4 +294,44 @@ class TranslationCache:
 
     def save(self):
         """Force save cache to disk"""
-        self._save_cache()
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if self._writer is not None:
+                os.fsync(self._writer.fileno())
+
+    def close(self):
+        """Flush and close the log file handles"""
+        self.save()
+        with self._lock:
+            self._close_handles()
+
+
+# Shared instances, one per cache directory
+_translation_caches: Dict[Path, TranslationCache] = {}
+_translation_caches_lock = threading.Lock()
+
+
+def get_translation_cache(cache_dir: Union[str, Path], enabled: bool = True) -> TranslationCache:
+    """
+    Get the process-wide TranslationCache for a cache directory.
+
+    Concurrent jobs then append through one index and one writer instead
+    of each keeping its own view of the log.
+
+    Args:
+        cache_dir: Directory holding translation_cache.log
+        enabled: Return a disabled, unshared cache when False
+    """
+    if not enabled:
+        return TranslationCache(cache_dir, enabled=False)
+
+    path = Path(cache_dir).resolve()
+    with _translation_caches_lock:
+        cache = _translation_caches.get(path)
+        if cache is None:
+            cache = TranslationCache(path)
+            _translation_caches[path] = cache
+            atexit.register(cache.close)
+        return cache
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chunk Packer - Group small chunks into one LLM request
+
+Subtitles, short paragraphs and table cells produce many tiny chunks.
+Sending each one as its own request repeats the full system prompt and
+pays one round trip per chunk. ChunkPacker groups consecutive small
+chunks up to a token budget, joins them with numbered markers the model
+is told to keep, and splits the response back into one text per chunk.
+
+If the markers do not come back intact the split returns None and the
+caller translates those chunks one by one instead.
+"""
+
+import re
+from typing import List, Optional
+
+from .chunker import TranslationChunk
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+
+# Bracketed numbers on their own line survive translation into any language
+MARKER_TEMPLATE = "[[#{}]]"
+MARKER_PATTERN = re.compile(r"^[ \t]*\[\[#(\d+)\]\][ \t]*$", re.MULTILINE)
+MARKER_TOKENS = 4
+
+
+class ChunkPacker:
+    """Pack small TranslationChunks into token-budgeted groups."""
+
+    def __init__(
+        self,
+        max_tokens: int = 1500,
+        small_chunk_tokens: int = 200,
+        max_chunks: int = 40
+    ):
+        """
+        Args:
+            max_tokens: Token budget for the packed source text of one request.
+            small_chunk_tokens: Chunks above this estimate are never packed.
+            max_chunks: Maximum chunks per request.
+        """
+        self.max_tokens = max_tokens
+        self.small_chunk_tokens = small_chunk_tokens
+        self.max_chunks = max_chunks
+
+    def is_packable(self, chunk: TranslationChunk) -> bool:
+        """Whether a chunk is small enough to share a request."""
+        return (
+            bool(chunk.text.strip())
+            and chunk.estimated_tokens <= self.small_chunk_tokens
+            and not MARKER_PATTERN.search(chunk.text)
+        )
+
+    def pack(self, chunks: List[TranslationChunk]) -> List[List[TranslationChunk]]:
+        """
+        Group packable chunks in document order.
+
+        Large chunks end the current group so packed neighbours stay
+        adjacent in the source. Groups of a single chunk are dropped:
+        they gain nothing over a normal request.
+
+        Returns:
+            Groups of two or more chunks.
+        """
+        groups: List[List[TranslationChunk]] = []
+        current: List[TranslationChunk] = []
+        tokens = 0
+
+        for chunk in chunks:
+            if not self.is_packable(chunk):
+                groups.append(current)
+                current, tokens = [], 0
+                continue
+
+            cost = chunk.estimated_tokens + MARKER_TOKENS
+            if current and (tokens + cost > self.max_tokens or len(current) >= self.max_chunks):
+                groups.append(current)
+                current, tokens = [], 0
+            current.append(chunk)
+            tokens += cost
+
+        groups.append(current)
+        return [g for g in groups if len(g) > 1]
+
+    def build_text(self, group: List[TranslationChunk]) -> str:
+        """Join a group into one source text separated by numbered markers."""
+        parts = []
+        for index, chunk in enumerate(group, 1):
+            parts.append(MARKER_TEMPLATE.format(index))
+            parts.append(chunk.text.strip())
+        return "\n".join(parts)
+
+    def instructions(self, count: int) -> str:
+        """Prompt lines telling the model to keep the markers."""
+        return "\n".join([
+            f"The text contains {count} segments, each preceded by a marker line "
+            f"{MARKER_TEMPLATE.format(1)} to {MARKER_TEMPLATE.format(count)}.",
+            "Keep every marker line exactly as is, in the same order, and put each "
+            "segment's translation directly below its marker.",
+            "Do not merge, split, drop or renumber segments.",
+        ])
+
+    def split(self, translated: str, group: List[TranslationChunk]) -> Optional[List[str]]:
+        """
+        Split a packed translation back into one text per chunk.
+
+        Returns:
+            Translations in group order, or None if markers are missing,
+            duplicated, out of order, or any segment came back empty.
+        """
+        markers = list(MARKER_PATTERN.finditer(translated))
+        if [int(m.group(1)) for m in markers] != list(range(1, len(group) + 1)):
+            logger.debug(
+                f"Packed split failed: expected {len(group)} markers, got {len(markers)}"
+            )
+            return None
+
+        if translated[:markers[0].start()].strip():
+            return None
+
+        parts = []
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(translated)
+            text = translated[marker.end():end].strip()
+            if not text:
+                return None
+            parts.append(text)
+        return parts
@@ -25,7 +25,8 @@ def get_db_backend(
         db_dir:  directory for database files.  Defaults to settings.database_dir.
 
     Returns:
-        A DatabaseBackend instance (currently always SQLiteBackend).
+        A DatabaseBackend instance (currently always SQLiteBackend,
+        pooled when settings.database_pool_enabled is set).
     """
     from config.settings import settings
 
@@ -35,7 +36,14 @@ def get_db_backend(
         db_dir = getattr(settings, "database_dir", Path("data"))
 
     if backend_type == "sqlite":
-        return SQLiteBackend(db_dir / f"{db_name}.db")
+        return SQLiteBackend(
+            db_dir / f"{db_name}.db",
+            pooled=getattr(settings, "database_pool_enabled", False),
+            pool_size=getattr(settings, "database_pool_size", 8),
+            synchronous=getattr(settings, "database_synchronous", "NORMAL"),
+            mmap_size=getattr(settings, "database_mmap_size", 64 * 1024 * 1024),
+            busy_timeout_ms=getattr(settings, "database_busy_timeout_ms", 5000),
+        )
 
     # Sprint 2: postgresql
     raise ValueError(f"Unsupported database backend: {backend_type}")
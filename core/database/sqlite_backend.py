@@ -7,12 +7,18 @@ Wraps the contextmanager pattern already used across the codebase
 
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Iterator, Optional
 
 
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
 class SQLiteCursor:
     """Thin wrapper so that a single object exposes execute + fetch."""
 
@@ -53,26 +59,134 @@ class SQLiteBackend:
 
     Each call to connection() opens a new connection, sets row_factory,
     commits on success, rolls back on error, and closes on exit.
+
+    With ``pooled=True`` connections are kept open and reused instead.
+    PRAGMAs are applied once per connection, and sqlite3's per-connection
+    statement cache keeps prepared statements across calls. Up to
+    ``pool_size`` idle connections are kept; when all are busy an extra
+    connection is opened and closed after use, so callers never block.
     """
 
-    def __init__(self, db_path: str | Path):
+    def __init__(
+        self,
+        db_path: str | Path,
+        pooled: bool = False,
+        pool_size: int = 8,
+        synchronous: str = "NORMAL",
+        mmap_size: int = 64 * 1024 * 1024,
+        busy_timeout_ms: int = 5000,
+        statement_cache_size: int = 128,
+    ):
+        """
+        Args:
+            db_path: Path to the database file
+            pooled: Reuse connections instead of opening one per call
+            pool_size: Maximum idle connections kept (pooled mode)
+            synchronous: PRAGMA synchronous for pooled connections
+            mmap_size: PRAGMA mmap_size in bytes for pooled connections (0 = off)
+            busy_timeout_ms: How long to wait on a locked database
+            statement_cache_size: Prepared statements cached per connection
+        """
+        if synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous mode: {synchronous}")
+
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.pooled = pooled
+        self.pool_size = pool_size
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.statement_cache_size = statement_cache_size
+
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
+        self._pool_lock = threading.Lock()
+        self._pid = os.getpid()
+
     @contextmanager
     def connection(self) -> Iterator[SQLiteCursor]:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.row_factory = sqlite3.Row
+        if not self.pooled:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.row_factory = sqlite3.Row
+            cursor = SQLiteCursor(conn)
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+            return
+
+        conn = self._acquire()
         cursor = SQLiteCursor(conn)
         try:
             yield cursor
             conn.commit()
         except Exception:
-            conn.rollback()
+            self._rollback_and_release(conn)
             raise
-        finally:
+        else:
+            self._release(conn)
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a pooled connection and apply the PRAGMAs once."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        self._check_fork()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if os.getpid() != self._pid:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
             conn.close()
 
+    def _rollback_and_release(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            # Broken connection: drop it instead of returning it
+            conn.close()
+            return
+        self._release(conn)
+
+    def _check_fork(self) -> None:
+        """Connections must not be shared with a forked child process."""
+        if os.getpid() == self._pid:
+            return
+        with self._pool_lock:
+            if os.getpid() != self._pid:
+                # Abandon (not close) the parent's connections
+                self._idle = queue.LifoQueue(maxsize=self.pool_size)
+                self._pid = os.getpid()
+
     def close(self) -> None:
-        pass  # connections are per-call, nothing to close
+        """Close idle pooled connections (no-op for per-call connections)."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
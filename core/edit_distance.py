@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Edit Distance - Fast Levenshtein distance for TM fuzzy matching
+
+Two implementations, both returning the same distances as the classic
+O(n*m) dynamic programme:
+
+- levenshtein_bounded: pure-Python banded DP (Ukkonen). Only cells within
+  ``max_distance`` of the diagonal are computed, and it stops as soon as
+  the distance is known to exceed the bound.
+- levenshtein_batch: NumPy bit-parallel (Myers/Hyyrö) distance of one
+  pattern against many texts at once, one lane per text.
+
+levenshtein_many picks between them automatically.
+
+lcs_length gives the longest common subsequence length, bit-parallel,
+used as a cheap upper bound for SequenceMatcher similarity.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Below this many DP cells per batch the banded DP is faster than NumPy setup
+NUMPY_MIN_CELLS = 20_000
+
+
+def levenshtein_bounded(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance limited to a band of width max_distance.
+
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Largest distance of interest (None = unbounded)
+
+    Returns:
+        Exact distance if it is <= max_distance, otherwise max_distance + 1
+    """
+    if s1 == s2:
+        return 0
+
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if max_distance is None:
+        max_distance = len(s1)
+    limit = max_distance + 1
+
+    if len(s1) - len(s2) > max_distance:
+        return limit
+
+    # Common prefix and suffix never contribute to the distance
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1 = s1[start:end1]
+    s2 = s2[start:end2]
+
+    n1, n2 = len(s1), len(s2)
+    if n2 == 0:
+        return n1 if n1 <= max_distance else limit
+
+    k = max_distance
+    prev = [j if j <= k else limit for j in range(n2 + 1)]
+    cur = [limit] * (n2 + 1)
+
+    for i in range(1, n1 + 1):
+        c1 = s1[i - 1]
+        lo = max(1, i - k)
+        hi = min(n2, i + k)
+
+        cur[lo - 1] = i if lo == 1 and i <= k else limit
+        row_min = cur[lo - 1]
+
+        for j in range(lo, hi + 1):
+            value = prev[j - 1] + (c1 != s2[j - 1])
+            above = prev[j] + 1
+            if above < value:
+                value = above
+            left = cur[j - 1] + 1
+            if left < value:
+                value = left
+            cur[j] = value
+            if value < row_min:
+                row_min = value
+
+        if hi < n2:
+            cur[hi + 1] = limit
+
+        if row_min > k:
+            return limit
+
+        prev, cur = cur, prev
+
+    distance = prev[n2]
+    return distance if distance <= k else limit
+
+
+if HAS_NUMPY:
+    _ONE = np.uint64(1)
+    _SHIFT_TOP = np.uint64(63)
+    _ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+    def _add_words(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Add multi-word integers stored as (lanes, words), low word first."""
+        total = a + b
+        carry = total < a
+        carry[:, -1] = False
+        while carry.any():
+            carry_in = np.zeros_like(total)
+            carry_in[:, 1:] = carry[:, :-1]
+            bumped = total + carry_in
+            carry = bumped < total
+            carry[:, -1] = False
+            total = bumped
+        return total
+
+    def _shift_left(x: "np.ndarray", fill: bool) -> "np.ndarray":
+        """Shift multi-word integers left by one bit."""
+        out = x << _ONE
+        out[:, 1:] |= x[:, :-1] >> _SHIFT_TOP
+        if fill:
+            out[:, 0] |= _ONE
+        return out
+
+
+def levenshtein_batch(pattern: str, texts: Sequence[str]) -> List[int]:
+    """
+    Levenshtein distance of pattern against each text, bit-parallel.
+
+    Each text is a lane; the pattern's bit vectors are split into 64-bit
+    words so patterns of any length are supported.
+
+    Args:
+        pattern: String compared against every text
+        texts: Candidate strings
+
+    Returns:
+        Distances, in the order of texts
+    """
+    if not HAS_NUMPY:
+        raise RuntimeError("levenshtein_batch requires numpy")
+
+    if not texts:
+        return []
+
+    m = len(pattern)
+    if m == 0:
+        return [len(t) for t in texts]
+
+    n_words = (m + 63) // 64
+    top_bits = m - 64 * (n_words - 1)
+    top_mask = _ALL_ONES if top_bits == 64 else np.uint64((1 << top_bits) - 1)
+    high_bit = np.uint64(1 << (top_bits - 1))
+
+    # Pattern match vectors per distinct character; row 0 = not in pattern
+    alphabet = {c: i + 1 for i, c in enumerate(dict.fromkeys(pattern))}
+    peq = np.zeros((len(alphabet) + 1, n_words), dtype=np.uint64)
+    for pos, c in enumerate(pattern):
+        peq[alphabet[c], pos // 64] |= np.uint64(1 << (pos % 64))
+
+    n_lanes = len(texts)
+    lengths = np.array([len(t) for t in texts], dtype=np.int64)
+    max_len = int(lengths.max())
+
+    codes = np.zeros((n_lanes, max(max_len, 1)), dtype=np.int64)
+    for lane, text in enumerate(texts):
+        if text:
+            codes[lane, :len(text)] = [alphabet.get(c, 0) for c in text]
+
+    vp = np.full((n_lanes, n_words), _ALL_ONES, dtype=np.uint64)
+    vp[:, -1] &= top_mask
+    vn = np.zeros((n_lanes, n_words), dtype=np.uint64)
+    score = np.full(n_lanes, m, dtype=np.int64)
+
+    for j in range(max_len):
+        active = j < lengths
+        eq = peq[codes[:, j]]
+
+        xv = eq | vn
+        xh = (_add_words(eq & vp, vp) ^ vp) | eq
+        ph = vn | ~(xh | vp)
+        mh = vp & xh
+
+        up = (ph[:, -1] & high_bit) != 0
+        down = (mh[:, -1] & high_bit) != 0
+        score += np.where(active, up.astype(np.int64) - down.astype(np.int64), 0)
+
+        # Top DP row is 0, 1, 2, ... so every horizontal delta there is +1
+        ph = _shift_left(ph, fill=True)
+        mh = _shift_left(mh, fill=False)
+
+        vp = mh | ~(xv | ph)
+        vn = ph & xv
+        vp[:, -1] &= top_mask
+        vn[:, -1] &= top_mask
+
+    return score.tolist()
+
+
+def levenshtein_many(
+    pattern: str,
+    texts: Sequence[str],
+    max_distances: Optional[Sequence[int]] = None,
+) -> List[int]:
+    """
+    Levenshtein distance of pattern against many texts, choosing a backend.
+
+    Uses the NumPy batch when available and the batch is large enough to
+    amortise its setup, otherwise the banded DP.
+
+    Args:
+        pattern: String compared against every text
+        texts: Candidate strings
+        max_distances: Optional per-text bound; distances above it are
+            reported as bound + 1 (the NumPy backend returns exact values)
+
+    Returns:
+        Distances, in the order of texts
+    """
+    if not texts:
+        return []
+
+    cells = len(pattern) * max(len(t) for t in texts) * len(texts)
+    if HAS_NUMPY and len(texts) > 1 and cells >= NUMPY_MIN_CELLS:
+        return levenshtein_batch(pattern, texts)
+
+    if max_distances is None:
+        return [levenshtein_bounded(pattern, t) for t in texts]
+    return [levenshtein_bounded(pattern, t, k) for t, k in zip(texts, max_distances)]
+
+
+@lru_cache(maxsize=256)
+def _char_masks(text: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character (cached per pattern)."""
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(text):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def lcs_length(s1: str, s2: str) -> int:
+    """
+    Length of the longest common subsequence, bit-parallel (Allison-Dix).
+
+    One big-integer step per character of s2, so it is much cheaper than
+    SequenceMatcher. SequenceMatcher's matching blocks form a common
+    subsequence, hence ``2 * lcs_length / (len1 + len2)`` is an upper
+    bound of its ratio().
+
+    The character masks of s1 are cached, so pass the string that is
+    compared against many others as s1.
+
+    Args:
+        s1: First string
+        s2: Second string
+
+    Returns:
+        LCS length
+    """
+    if not s1 or not s2:
+        return 0
+
+    masks = _char_masks(s1)
+    full = (1 << len(s1)) - 1
+    v = full
+    for c in s2:
+        u = v & masks.get(c, 0)
+        v = ((v + u) | (v - u)) & full
+
+    # Each zero bit in v is one matched character
+    return len(s1) - bin(v).count("1")
@@ -1,6 +1,8 @@
 from typing import List, Optional, Any
 from pydantic import BaseModel
 
+from core.tm.schemas import TMMatch
+
 class SegmentResponse(BaseModel):
     """A single translation segment (chunk) for editing."""
     chunk_id: str
@@ -10,14 +12,19 @@ class SegmentResponse(BaseModel):
     quality_score: float = 0.0
     is_edited: bool = False
     warnings: List[str] = []
+    version: int = 0  # Send back as expected_version when saving
+    tm_suggestion: Optional[TMMatch] = None  # Only when tm_ids were requested
 
 class EditorJobResponse(BaseModel):
-    """Full job data for the editor."""
+    """One window of a job's segments for the editor."""
     job_id: str
     segments: List[SegmentResponse]
     completion_percentage: float
     can_export: bool
+    offset: int = 0  # Index of the first segment in this window
+    total_segments: int = 0  # Segments in the whole job
 
 class UpdateSegmentRequest(BaseModel):
     """Request to update a segment."""
     translated_text: str
+    expected_version: Optional[int] = None  # Reject the save if the segment changed since
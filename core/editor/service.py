@@ -1,7 +1,7 @@
 import logging
 from typing import List, Dict, Any, Optional
 from config.settings import settings
-from core.cache.checkpoint_manager import CheckpointManager
+from core.cache.checkpoint_manager import CheckpointManager, ChunkRecord
 from core.editor.schemas import SegmentResponse, EditorJobResponse
 
 logger = logging.getLogger(__name__)
@@ -9,98 +9,132 @@ logger = logging.getLogger(__name__)
 class EditorService:
     """
     Service for managing translation segments updates via Checkpoints.
+
+    Segments are read one window at a time and saved one row at a time,
+    so neither depends on the size of the job.
     """
 
     def __init__(self):
         db_path = settings.checkpoint_dir / "checkpoints.db"
         self.checkpoint_manager = CheckpointManager(db_path)
 
-    def get_job_segments(self, job_id: str) -> Optional[EditorJobResponse]:
+    def get_job_segments(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        around: Optional[str] = None
+    ) -> Optional[EditorJobResponse]:
         """
-        Get all segments for a job from its checkpoint.
+        Get one window of a job's segments in document order.
+
+        Args:
+            job_id: Job identifier
+            offset: Index of the first segment
+            limit: Window size (defaults to settings.editor_page_size)
+            around: Chunk ID to center the window on (overrides offset)
         """
-        checkpoint = self.checkpoint_manager.load_checkpoint(job_id)
-        if not checkpoint:
+        info = self.checkpoint_manager.get_resume_info(job_id)
+        if not info:
             return None
 
-        segments: List[SegmentResponse] = []
-        
-        # results_data is Dict[chunk_id, TranslationResult-like-dict]
-        # We need to sort them. Assuming chunk_id is numeric or sortable string.
-        # Try to parse chunk_id to int for sorting if possible.
-        
-        sorted_keys = sorted(
-            checkpoint.results_data.keys(),
-            key=lambda k: int(k) if str(k).isdigit() else str(k)
-        )
+        if limit is None:
+            limit = settings.editor_page_size
+        limit = max(1, min(limit, settings.editor_max_page_size))
 
-        for i, chunk_id in enumerate(sorted_keys):
-            data = checkpoint.results_data[chunk_id]
-            # data matches serialize_translation_result format
-            
-            segments.append(SegmentResponse(
-                chunk_id=str(chunk_id),
-                index=i,
-                source=data.get('source', ''),
-                translated=data.get('translated', ''),
-                quality_score=data.get('quality_score', 0.0),
-                is_edited=data.get('is_edited', False), # Custom field we might add
-                warnings=data.get('warnings', [])
-            ))
+        if around is not None:
+            cursor = self.checkpoint_manager.get_chunk(job_id, around)
+            if cursor is None:
+                return None
+            offset = max(0, cursor.index - limit // 2)
+
+        records = self.checkpoint_manager.get_chunk_window(job_id, offset, limit)
 
         return EditorJobResponse(
             job_id=job_id,
-            segments=segments,
-            completion_percentage=checkpoint.completion_percentage(),
-            can_export=checkpoint.completion_percentage() >= 1.0
+            segments=[self._to_segment(record) for record in records],
+            completion_percentage=info['completion_percentage'],
+            can_export=info['completion_percentage'] >= 1.0,
+            offset=offset,
+            total_segments=self.checkpoint_manager.count_results(job_id)
+        )
+
+    async def add_tm_suggestions(
+        self,
+        response: EditorJobResponse,
+        tm_ids: List[str],
+        min_similarity: float = 0.75,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None
+    ) -> EditorJobResponse:
+        """
+        Attach the best TM match to every segment of a window.
+
+        All sources of the window are matched in a single batched lookup,
+        against the TMs of the job's language pair when it is given.
+        """
+        from core.tm.service import get_tm_service
+
+        if not tm_ids or not response.segments:
+            return response
+
+        suggestions = await get_tm_service().suggest(
+            tm_ids,
+            [segment.source for segment in response.segments],
+            min_similarity=min_similarity,
+            source_lang=source_lang,
+            target_lang=target_lang
         )
+        for segment, suggestion in zip(response.segments, suggestions):
+            segment.tm_suggestion = suggestion
+        return response
 
-    def update_segment(self, job_id: str, chunk_id: str, new_text: str) -> bool:
+    def update_segment(
+        self,
+        job_id: str,
+        chunk_id: str,
+        new_text: str,
+        expected_version: Optional[int] = None
+    ) -> Optional[int]:
         """
         Update the translation of a specific segment.
+
+        Only the segment's own row is rewritten.
+
+        Returns:
+            The segment's new version, or None if the job or segment is unknown
+
+        Raises:
+            VersionConflictError: If expected_version is given and the
+                segment was changed since (by another editor or a re-run)
         """
-        # 1. Load entire checkpoint
-        checkpoint = self.checkpoint_manager.load_checkpoint(job_id)
-        if not checkpoint:
-            logger.warning(f"Checkpoint not found for job {job_id}")
-            return False
-
-        # 2. Check if chunk exists (handle int/str mismatch)
-        # CheckpointManager.load_checkpoint fixes keys to match original types (int or str)
-        # But our input chunk_id is str (from URL).
-        # We try both str and int keys.
-        
-        target_key = chunk_id
-        if chunk_id not in checkpoint.results_data:
-            if chunk_id.isdigit() and int(chunk_id) in checkpoint.results_data:
-                target_key = int(chunk_id)
-            else:
-                logger.warning(f"Chunk {chunk_id} not found in checkpoint for job {job_id}")
-                return False
-
-        # 3. Update data
-        original_data = checkpoint.results_data[target_key]
-        
-        # Preserve other fields, just update text
-        original_data['translated'] = new_text
-        original_data['is_edited'] = True # Mark as edited
-        
-        # 4. Save back
-        # Note: save_checkpoint takes arguments, not a CheckpointState object
-        # We need to pass all fields back.
-        
-        self.checkpoint_manager.save_checkpoint(
-            job_id=checkpoint.job_id,
-            input_file=checkpoint.input_file,
-            output_file=checkpoint.output_file,
-            total_chunks=checkpoint.total_chunks,
-            completed_chunk_ids=checkpoint.completed_chunk_ids,
-            results_data=checkpoint.results_data,
-            job_metadata=checkpoint.job_metadata
+        version = self.checkpoint_manager.update_chunk_result(
+            job_id,
+            chunk_id,
+            {'translated': new_text, 'is_edited': True},
+            expected_version=expected_version
+        )
+        if version is None:
+            logger.warning(f"Chunk {chunk_id} not found in checkpoint for job {job_id}")
+            return None
+
+        logger.info(f"Updated segment {chunk_id} for job {job_id} (version {version})")
+        return version
+
+    @staticmethod
+    def _to_segment(record: ChunkRecord) -> SegmentResponse:
+        # record.result matches serialize_translation_result format
+        data: Dict[str, Any] = record.result
+        return SegmentResponse(
+            chunk_id=str(record.chunk_id),
+            index=record.index,
+            source=data.get('source', ''),
+            translated=data.get('translated', ''),
+            quality_score=data.get('quality_score', 0.0),
+            is_edited=data.get('is_edited', False),
+            warnings=data.get('warnings', []),
+            version=record.version
         )
-        
-        logger.info(f"Updated segment {chunk_id} for job {job_id}")
-        return True
 
 _editor_service = None
 
@@ -0,0 +1,204 @@
+"""
+Term Automaton
+Aho-Corasick automaton for matching many glossary terms in one pass.
+
+Text and terms are tokenized into runs of word characters and single
+non-word characters. Every ``\\b<term>\\b`` regex match starts and ends on
+a token boundary, so the automaton walks tokens instead of characters:
+the trie stays small for large glossaries and each text token is visited
+once regardless of how many terms are loaded.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import GlossaryTerm
+
+_TOKEN_PATTERN = re.compile(r"\w+|\W")
+
+
+def tokenize(text: str) -> List[Tuple[int, int, str]]:
+    """Split text into (start, end, token) triples."""
+    return [(m.start(), m.end(), m.group()) for m in _TOKEN_PATTERN.finditer(text)]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Same semantics as regex ``\\b`` at pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+@dataclass
+class TermEntry:
+    """A glossary term stored in the automaton."""
+    term: GlossaryTerm
+    glossary_id: str
+    order: int
+
+    @property
+    def priority(self) -> int:
+        return self.term.priority or 0
+
+    def outranks(self, other: "TermEntry") -> bool:
+        """Higher priority wins, then the term loaded first."""
+        return (self.priority, -self.order) > (other.priority, -other.order)
+
+
+@dataclass
+class Candidate:
+    """A term occurrence found by the automaton (may overlap others)."""
+    start: int
+    end: int
+    entry: TermEntry
+
+
+class _Trie:
+    """Token trie with Aho-Corasick failure links."""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Optional[TermEntry]] = [None]
+        self.depth: List[int] = [0]
+        # Nearest node on the failure chain that has an output
+        self.dict_link: List[int] = [0]
+
+    def add(self, tokens: List[str], entry: TermEntry):
+        node = 0
+        for token in tokens:
+            nxt = self.goto[node].get(token)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][token] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.depth.append(self.depth[node] + 1)
+                self.dict_link.append(0)
+            node = nxt
+
+        current = self.output[node]
+        if current is None or entry.outranks(current):
+            self.output[node] = entry
+
+    def build(self):
+        """Compute failure and dictionary links (BFS)."""
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for token, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and token not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(token, 0)
+                self.fail[child] = target if target != child else 0
+                link = self.fail[child]
+                self.dict_link[child] = link if self.output[link] is not None else self.dict_link[link]
+
+    def scan(self, tokens: List[str]) -> Iterable[Tuple[int, int, TermEntry]]:
+        """Yield (first_token, last_token, entry) for every key occurrence."""
+        goto, fail, output, depth, dict_link = (
+            self.goto, self.fail, self.output, self.depth, self.dict_link
+        )
+        state = 0
+        for i, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            node = state if output[state] is not None else dict_link[state]
+            while node:
+                yield i - depth[node] + 1, i, output[node]
+                node = dict_link[node]
+
+
+class TermAutomaton:
+    """
+    Compiled matcher for a fixed set of glossary terms.
+
+    Case-insensitive terms are matched against lowercased tokens, case
+    sensitive ones against the original tokens.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[GlossaryTerm, str]], case_insensitive: bool = True):
+        """
+        Build the automaton.
+
+        Args:
+            terms: (term, glossary_id) pairs, in load order
+            case_insensitive: Whether to ignore case for terms that allow it
+        """
+        self._folded = _Trie()
+        self._exact = _Trie()
+        self.term_count = 0
+
+        for order, (term, glossary_id) in enumerate(terms):
+            if not term.source_term:
+                continue
+            entry = TermEntry(term=term, glossary_id=glossary_id, order=order)
+            if case_insensitive and not term.case_sensitive:
+                self._folded.add([t for _, _, t in tokenize(term.source_term.lower())], entry)
+            else:
+                self._exact.add([t for _, _, t in tokenize(term.source_term)], entry)
+            self.term_count += 1
+
+        self._folded.build()
+        self._exact.build()
+
+    def scan(self, text: str) -> List[Candidate]:
+        """
+        Find every term occurrence in text, overlapping ones included.
+
+        Occurrences are only reported where the regex ``\\b`` would match
+        at both ends.
+        """
+        spans = tokenize(text)
+        if not spans:
+            return []
+
+        candidates: List[Candidate] = []
+
+        for trie, tokens in (
+            (self._folded, [t.lower() for _, _, t in spans]),
+            (self._exact, [t for _, _, t in spans]),
+        ):
+            if len(trie.goto) == 1:
+                continue
+            for first, last, entry in trie.scan(tokens):
+                start = spans[first][0]
+                end = spans[last][1]
+                if _is_boundary(text, start) and _is_boundary(text, end):
+                    candidates.append(Candidate(start=start, end=end, entry=entry))
+
+        return candidates
+
+
+def select_longest_leftmost(candidates: List[Candidate], text_length: int) -> List[Candidate]:
+    """
+    Pick non-overlapping candidates.
+
+    Longer matches win, then the leftmost, then the higher priority term.
+    """
+    candidates = sorted(
+        candidates,
+        key=lambda c: (c.start - c.end, c.start, -c.entry.priority, c.entry.order),
+    )
+
+    occupied = bytearray(text_length)
+    selected = []
+    for cand in candidates:
+        if occupied.find(1, cand.start, cand.end) != -1:
+            continue
+        occupied[cand.start:cand.end] = b"\x01" * (cand.end - cand.start)
+        selected.append(cand)
+
+    selected.sort(key=lambda c: c.start)
+    return selected
@@ -5,6 +5,9 @@ Supports:
 - CSV (Simple format for spreadsheets)
 - TBX (TermBase eXchange) - Industry standard for terminology
 - Excel (XLSX) - Coming soon
+
+TBX is read and written incrementally (iter_tbx) so large termbases
+never have to fit in memory as one XML tree.
 """
 
 import csv
@@ -13,12 +16,20 @@ import json
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, BinaryIO, TextIO, Union
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+TBX_NAMESPACE = "urn:iso:std:iso:30042:ed-2"
+
+
+def _local_name(tag: str) -> str:
+    """Tag without its {namespace} prefix."""
+    return tag.rsplit("}", 1)[-1]
+
 
 @dataclass
 class GlossaryTermData:
@@ -133,17 +144,22 @@ class GlossaryExporter:
         Returns:
             TBX XML string
         """
-        # TBX namespace
-        ns = "urn:iso:std:iso:30042:ed-2"
+        return "".join(GlossaryExporter.iter_tbx(glossary_name, terms, source_lang, target_lang))
 
-        # Create root
-        root = ET.Element("tbx", type="TBX-Basic")
-        root.set("style", "dca")
-        root.set("xmlns", ns)
-        root.set("{http://www.w3.org/XML/1998/namespace}lang", "en")
+    @staticmethod
+    def iter_tbx(
+        glossary_name: str,
+        terms: Iterable[Dict],
+        source_lang: str = "en",
+        target_lang: str = "vi",
+    ) -> Iterator[str]:
+        """
+        Export terms to TBX one concept entry at a time.
 
+        Same output as to_tbx(), but ``terms`` is consumed lazily.
+        """
         # Header
-        header = ET.SubElement(root, "tbxHeader")
+        header = ET.Element("tbxHeader")
         file_desc = ET.SubElement(header, "fileDesc")
 
         title_stmt = ET.SubElement(file_desc, "titleStmt")
@@ -154,41 +170,46 @@ class GlossaryExporter:
         p = ET.SubElement(source_desc, "p")
         p.text = f"Exported from AI Publisher Pro on {datetime.utcnow().isoformat()}"
 
-        # Body
-        text = ET.SubElement(root, "text")
-        body = ET.SubElement(text, "body")
-
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield f'<tbx type="TBX-Basic" style="dca" xmlns="{TBX_NAMESPACE}" xml:lang="en">'
+        yield ET.tostring(header, encoding="unicode", method="xml")
+        yield "<text><body>"
         for i, term in enumerate(terms):
-            # Concept entry
-            concept = ET.SubElement(body, "conceptEntry", id=f"c{i+1}")
+            concept = GlossaryExporter._build_concept(i, term, source_lang, target_lang)
+            yield ET.tostring(concept, encoding="unicode", method="xml")
+        yield "</body></text></tbx>"
 
-            # Admin info (context as definition)
-            if term.get("context"):
-                admin = ET.SubElement(concept, "descrip", type="definition")
-                admin.text = term["context"]
+    @staticmethod
+    def _build_concept(i: int, term: Dict, source_lang: str, target_lang: str) -> ET.Element:
+        """Build one <conceptEntry> element."""
+        concept = ET.Element("conceptEntry", id=f"c{i+1}")
 
-            # Source language section
-            lang_sec_src = ET.SubElement(concept, "langSec")
-            lang_sec_src.set("{http://www.w3.org/XML/1998/namespace}lang", source_lang)
+        # Admin info (context as definition)
+        if term.get("context"):
+            admin = ET.SubElement(concept, "descrip", type="definition")
+            admin.text = term["context"]
 
-            term_sec_src = ET.SubElement(lang_sec_src, "termSec")
-            term_elem = ET.SubElement(term_sec_src, "term")
-            term_elem.text = term.get("source_term", "")
+        # Source language section
+        lang_sec_src = ET.SubElement(concept, "langSec")
+        lang_sec_src.set(XML_LANG, source_lang)
 
-            if term.get("part_of_speech"):
-                pos = ET.SubElement(term_sec_src, "termNote", type="partOfSpeech")
-                pos.text = term["part_of_speech"]
+        term_sec_src = ET.SubElement(lang_sec_src, "termSec")
+        term_elem = ET.SubElement(term_sec_src, "term")
+        term_elem.text = term.get("source_term", "")
 
-            # Target language section
-            lang_sec_tgt = ET.SubElement(concept, "langSec")
-            lang_sec_tgt.set("{http://www.w3.org/XML/1998/namespace}lang", target_lang)
+        if term.get("part_of_speech"):
+            pos = ET.SubElement(term_sec_src, "termNote", type="partOfSpeech")
+            pos.text = term["part_of_speech"]
 
-            term_sec_tgt = ET.SubElement(lang_sec_tgt, "termSec")
-            term_elem_tgt = ET.SubElement(term_sec_tgt, "term")
-            term_elem_tgt.text = term.get("target_term", "")
+        # Target language section
+        lang_sec_tgt = ET.SubElement(concept, "langSec")
+        lang_sec_tgt.set(XML_LANG, target_lang)
 
-        xml_str = ET.tostring(root, encoding="unicode", method="xml")
-        return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
+        term_sec_tgt = ET.SubElement(lang_sec_tgt, "termSec")
+        term_elem_tgt = ET.SubElement(term_sec_tgt, "term")
+        term_elem_tgt.text = term.get("target_term", "")
+
+        return concept
 
 
 class GlossaryImporter:
@@ -316,74 +337,112 @@ class GlossaryImporter:
         Returns:
             Tuple of (metadata dict, list of GlossaryTermData)
         """
-        terms = []
-        metadata = {
-            "name": "Imported from TBX",
-            "source_lang": "en",
-            "target_lang": "vi",
-        }
-
-        try:
-            root = ET.fromstring(content)
+        metadata: Dict = {}
+        terms = list(GlossaryImporter.iter_tbx(io.StringIO(content), metadata))
+        logger.info(f"Imported {len(terms)} terms from TBX")
+        return metadata, terms
 
-            # Get namespace if present
-            ns = {"tbx": "urn:iso:std:iso:30042:ed-2"}
+    @staticmethod
+    def iter_tbx(
+        source: Union[str, Path, BinaryIO, TextIO],
+        metadata: Optional[Dict] = None
+    ) -> Iterator[GlossaryTermData]:
+        """
+        Stream terms from a TBX file, with or without the TBX namespace.
 
-            # Try to get title
-            title = root.find(".//title") or root.find(".//tbx:title", ns)
-            if title is not None and title.text:
-                metadata["name"] = title.text
+        Each <conceptEntry> is cleared once read, so memory stays flat
+        regardless of file size.
 
-            # Find all concept entries
-            concepts = root.findall(".//conceptEntry") or root.findall(".//tbx:conceptEntry", ns)
+        Args:
+            source: File path or file object (binary or text)
+            metadata: Dict filled with name, source_lang and target_lang
 
-            for concept in concepts:
-                source_term = ""
-                target_term = ""
-                context = None
-                part_of_speech = None
+        Raises:
+            ValueError: If the XML is malformed (possibly after some terms)
+        """
+        if metadata is None:
+            metadata = {}
+        metadata.update({
+            "name": "Imported from TBX",
+            "source_lang": "en",
+            "target_lang": "vi",
+        })
+        found_title = False
 
-                # Get definition/context
-                descrip = concept.find(".//descrip[@type='definition']")
-                if descrip is not None and descrip.text:
-                    context = descrip.text
-
-                # Get language sections
-                lang_secs = concept.findall(".//langSec") or concept.findall(".//tbx:langSec", ns)
-
-                for i, lang_sec in enumerate(lang_secs):
-                    lang = lang_sec.get("{http://www.w3.org/XML/1998/namespace}lang")
-
-                    term_elem = lang_sec.find(".//term") or lang_sec.find(".//tbx:term", ns)
-                    if term_elem is not None and term_elem.text:
-                        if i == 0:  # First is source
-                            source_term = term_elem.text
-                            if lang:
-                                metadata["source_lang"] = lang
-                        else:  # Second is target
-                            target_term = term_elem.text
-                            if lang:
-                                metadata["target_lang"] = lang
-
-                    # Get part of speech
-                    pos = lang_sec.find(".//termNote[@type='partOfSpeech']")
-                    if pos is not None and pos.text:
-                        part_of_speech = pos.text
-
-                if source_term and target_term:
-                    terms.append(GlossaryTermData(
-                        source_term=source_term,
-                        target_term=target_term,
-                        context=context,
-                        part_of_speech=part_of_speech,
-                    ))
+        try:
+            parents = []
+            for event, elem in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    parents.append(elem)
+                    continue
+                parents.pop()
+
+                name = _local_name(elem.tag)
+                if name == "title" and not found_title and elem.text:
+                    metadata["name"] = elem.text
+                    found_title = True
+                elif name == "conceptEntry":
+                    term = GlossaryImporter._parse_concept(elem, metadata)
+                    # Drop the parsed entry (and its siblings) from the tree
+                    elem.clear()
+                    if parents:
+                        parents[-1].clear()
+                    if term is not None:
+                        yield term
 
         except ET.ParseError as e:
             logger.error(f"TBX parse error: {e}")
             raise ValueError(f"Invalid TBX format: {e}")
 
-        logger.info(f"Imported {len(terms)} terms from TBX")
-        return metadata, terms
+    @staticmethod
+    def _parse_concept(concept: ET.Element, metadata: Dict) -> Optional[GlossaryTermData]:
+        """Parse one <conceptEntry>; None unless it has a source and a target term."""
+        source_term = ""
+        target_term = ""
+        context = None
+        part_of_speech = None
+
+        lang_secs = []
+        for elem in concept.iter():
+            name = _local_name(elem.tag)
+            if name == "descrip" and elem.get("type") == "definition" and elem.text and context is None:
+                # Get definition/context
+                context = elem.text
+            elif name == "langSec":
+                lang_secs.append(elem)
+
+        for i, lang_sec in enumerate(lang_secs):
+            lang = lang_sec.get(XML_LANG)
+
+            for elem in lang_sec.iter():
+                name = _local_name(elem.tag)
+                if name == "term" and elem.text:
+                    if i == 0:  # First is source
+                        source_term = elem.text
+                        if lang:
+                            metadata["source_lang"] = lang
+                    else:  # Second is target
+                        target_term = elem.text
+                        if lang:
+                            metadata["target_lang"] = lang
+                    break
+
+            # Get part of speech
+            for elem in lang_sec.iter():
+                if (_local_name(elem.tag) == "termNote"
+                        and elem.get("type") == "partOfSpeech" and elem.text):
+                    part_of_speech = elem.text
+                    break
+
+        if not (source_term and target_term):
+            return None
+
+        return GlossaryTermData(
+            source_term=source_term,
+            target_term=target_term,
+            context=context,
+            part_of_speech=part_of_speech,
+        )
 
 
 # ==================== CONVENIENCE FUNCTIONS ====================
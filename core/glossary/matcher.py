@@ -2,14 +2,13 @@
 Term Matcher
 Engine for finding glossary terms in text.
 """
-import re
 import logging
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from functools import lru_cache
 
 from .models import GlossaryTerm
 from .repository import get_repository
+from .automaton import TermAutomaton, select_longest_leftmost
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +34,15 @@ class TermMatcher:
     - Longest match first (prevents partial matches)
     - Priority-based selection for overlapping matches
     - Caching for frequently used glossaries
+    - Single pass over the text via a compiled Aho-Corasick automaton
     """
 
     def __init__(self):
         """Initialize matcher."""
         self.repository = get_repository()
         self._term_cache: Dict[str, List[GlossaryTerm]] = {}
+        # (glossary_ids, case_insensitive) -> compiled automaton
+        self._automaton_cache: Dict[Tuple[Tuple[str, ...], bool], TermAutomaton] = {}
 
     def load_glossary(self, glossary_id: str) -> List[GlossaryTerm]:
         """
@@ -96,11 +98,37 @@ class TermMatcher:
             return []
 
     def clear_cache(self, glossary_id: Optional[str] = None):
-        """Clear term cache."""
+        """Clear term cache and the automata built from it."""
         if glossary_id:
             self._term_cache.pop(glossary_id, None)
+            for key in [k for k in self._automaton_cache if glossary_id in k[0]]:
+                del self._automaton_cache[key]
         else:
             self._term_cache.clear()
+            self._automaton_cache.clear()
+
+    def get_automaton(
+        self,
+        glossary_ids: List[str],
+        case_insensitive: bool = True,
+    ) -> TermAutomaton:
+        """
+        Get the compiled automaton for a set of glossaries.
+
+        Built once per glossary set and reused until clear_cache().
+        """
+        key = (tuple(glossary_ids), case_insensitive)
+        automaton = self._automaton_cache.get(key)
+        if automaton is None:
+            terms = [
+                (term, gid)
+                for gid in glossary_ids
+                for term in self.load_glossary(gid)
+            ]
+            automaton = TermAutomaton(terms, case_insensitive=case_insensitive)
+            self._automaton_cache[key] = automaton
+            logger.debug(f"Compiled automaton for {len(glossary_ids)} glossaries ({automaton.term_count} terms)")
+        return automaton
 
     def find_matches(
         self,
@@ -122,66 +150,28 @@ class TermMatcher:
         if not text or not glossary_ids:
             return []
 
-        # Collect all terms from all glossaries
-        all_terms: List[tuple] = []  # (term, glossary_id)
-        for gid in glossary_ids:
-            terms = self.load_glossary(gid)
-            for term in terms:
-                all_terms.append((term, gid))
-
-        if not all_terms:
+        automaton = self.get_automaton(glossary_ids, case_insensitive)
+        if not automaton.term_count:
             return []
 
-        # Sort by length descending (longest match first)
-        all_terms.sort(key=lambda x: len(x[0].source_term), reverse=True)
-
-        matches: List[TermMatch] = []
-        matched_positions: Set[tuple] = set()  # (start, end) pairs
-
-        for term, glossary_id in all_terms:
-            # Build regex pattern
-            escaped = re.escape(term.source_term)
-            flags = re.IGNORECASE if (case_insensitive and not term.case_sensitive) else 0
-
-            # Word boundary matching
-            pattern = rf'\b{escaped}\b'
-
-            try:
-                for match in re.finditer(pattern, text, flags):
-                    start, end = match.start(), match.end()
-
-                    # Check for overlap with existing matches
-                    is_overlapping = any(
-                        self._ranges_overlap(start, end, s, e)
-                        for s, e in matched_positions
-                    )
-
-                    if not is_overlapping:
-                        matches.append(TermMatch(
-                            source_term=term.source_term,
-                            target_term=term.target_term,
-                            start=start,
-                            end=end,
-                            glossary_id=glossary_id,
-                            priority=term.priority,
-                            term_id=term.id,
-                        ))
-                        matched_positions.add((start, end))
-
-            except re.error as e:
-                logger.warning(f"Regex error for term '{term.source_term}': {e}")
-                continue
-
-        # Sort by position
-        matches.sort(key=lambda m: m.start)
+        selected = select_longest_leftmost(automaton.scan(text), len(text))
+
+        matches = [
+            TermMatch(
+                source_term=cand.entry.term.source_term,
+                target_term=cand.entry.term.target_term,
+                start=cand.start,
+                end=cand.end,
+                glossary_id=cand.entry.glossary_id,
+                priority=cand.entry.term.priority,
+                term_id=cand.entry.term.id,
+            )
+            for cand in selected
+        ]
 
         logger.debug(f"Found {len(matches)} matches in text")
         return matches
 
-    def _ranges_overlap(self, s1: int, e1: int, s2: int, e2: int) -> bool:
-        """Check if two ranges overlap."""
-        return not (e1 <= s2 or e2 <= s1)
-
     def highlight_matches(
         self,
         text: str,
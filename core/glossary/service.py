@@ -4,7 +4,7 @@ Business logic layer for glossary operations.
 """
 import logging
 import json
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from pathlib import Path
 from io import BytesIO
 
@@ -19,8 +19,8 @@ from .repository import GlossaryRepository, get_repository
 from .matcher import TermMatcher, get_matcher
 from .io import (
     GlossaryExporter, GlossaryImporter,
-    export_glossary_to_csv, export_glossary_to_json, export_glossary_to_tbx,
-    import_glossary_from_csv, import_glossary_from_json, import_glossary_from_tbx,
+    export_glossary_to_csv, export_glossary_to_json,
+    import_glossary_from_csv, import_glossary_from_json,
 )
 
 logger = logging.getLogger(__name__)
@@ -302,9 +302,6 @@ class GlossaryService:
             )
 
         try:
-            # Read file content
-            content = await file.read()
-            content_str = content.decode("utf-8")
             filename = file.filename.lower() if file.filename else ""
 
             # Auto-detect format
@@ -318,17 +315,19 @@ class GlossaryService:
                 else:
                     format = "csv"  # Default to CSV
 
-            # Parse file
-            if format == "csv":
+            # Parse file (TBX is streamed from the upload, term by term)
+            if format == "tbx":
+                term_data = GlossaryImporter.iter_tbx(file.file)
+            elif format == "csv":
+                content_str = (await file.read()).decode("utf-8")
                 metadata, term_data = import_glossary_from_csv(
                     content_str,
                     glossary.source_language,
                     glossary.target_language
                 )
             elif format == "json":
+                content_str = (await file.read()).decode("utf-8")
                 metadata, term_data = import_glossary_from_json(content_str)
-            elif format == "tbx":
-                metadata, term_data = import_glossary_from_tbx(content_str)
             else:
                 return ImportResult(
                     status="error",
@@ -401,14 +400,15 @@ class GlossaryService:
         self,
         glossary_id: str,
         format: str = "csv",
-    ) -> Tuple[BytesIO, str, str]:
+    ) -> Tuple[Union[BytesIO, Iterator[bytes]], str, str]:
         """
         Export terms to file.
 
         Supports: csv, json, tbx
 
         Returns:
-            Tuple of (file_content, filename, media_type)
+            Tuple of (file_content, filename, media_type); TBX content is
+            an iterator of byte chunks rather than a buffer
         """
         # Get glossary
         glossary = self.repository.get_glossary(glossary_id)
@@ -434,14 +434,14 @@ class GlossaryService:
             filename = f"glossary_{glossary_id}.json"
             media_type = "application/json"
         elif format == "tbx":
-            content_str = export_glossary_to_tbx(
+            pieces = GlossaryExporter.iter_tbx(
                 glossary.name,
                 term_dicts,
                 glossary.source_language,
                 glossary.target_language
             )
             filename = f"glossary_{glossary_id}.tbx"
-            media_type = "application/xml"
+            return (piece.encode("utf-8") for piece in pieces), filename, "application/xml"
         else:
             raise ValueError(f"Unsupported format: {format}")
 
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP Pool - Shared per-provider httpx clients for LLM calls
+
+Every job, streaming batch and SDK client used to build its own
+httpx.AsyncClient, so each one re-did DNS, TCP and TLS before its first
+request. HTTPPool keeps one long-lived client per provider (per event
+loop, since httpx connections cannot cross loops) with keep-alive tuned
+for bursts of LLM requests, and HTTP/2 when the optional ``h2`` package
+is installed so concurrent requests share one connection.
+
+Clients from the pool are owned by it: callers must not close them.
+Call close_http_pool() on shutdown.
+"""
+
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+import weakref
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+from config.logging_config import get_logger
+logger = get_logger(__name__)
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class PoolStats:
+    """Request counters for one provider's client."""
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    errors: int = 0
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport to count requests for pool metrics."""
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, stats: PoolStats):
+        self.inner = inner
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+        self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+        try:
+            response = await self.inner.handle_async_request(request)
+        except Exception:
+            self.stats.errors += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+        if response.status_code >= 400:
+            self.stats.errors += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class HTTPPool:
+    """Process-wide httpx clients keyed by provider."""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 300.0,
+        http2: bool = True
+    ):
+        """
+        Args:
+            max_connections: Connection cap per provider client.
+            max_keepalive_connections: Idle connections kept open per client.
+            keepalive_expiry: Seconds an idle connection stays open.
+            timeout: Default request timeout (callers may override per request).
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self.http2 = http2 and _h2_available()
+        if http2 and not self.http2:
+            logger.info("h2 not installed, LLM connections use HTTP/1.1")
+
+        # loop -> provider -> client
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, PoolStats] = {}
+
+    def get_client(self, provider: str = "default") -> httpx.AsyncClient:
+        """
+        Shared client for a provider on the running event loop.
+
+        Must be called from a coroutine. The client stays open until
+        close_http_pool(); do not use it in ``async with`` or close it.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        client = clients.get(provider)
+        if client is None or client.is_closed:
+            client = clients[provider] = self._create_client(provider)
+        return client
+
+    def _create_client(self, provider: str) -> httpx.AsyncClient:
+        stats = self._stats.setdefault(provider, PoolStats())
+
+        transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+        logger.debug(f"Creating pooled HTTP client for {provider} (http2={self.http2})")
+        return httpx.AsyncClient(
+            transport=_CountingTransport(transport, stats),
+            timeout=httpx.Timeout(self.timeout, connect=10.0)
+        )
+
+    @staticmethod
+    def _connection_counts(client: httpx.AsyncClient) -> Dict[str, int]:
+        """Open/idle connections from the transport's pool (best effort)."""
+        transport = getattr(client, "_transport", None)
+        pool = getattr(getattr(transport, "inner", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = sum(1 for c in connections if c.is_idle())
+        return {"open": len(connections), "idle": idle}
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """Per-provider request counters and connection counts."""
+        metrics: Dict[str, Dict] = {}
+        for provider, stats in self._stats.items():
+            open_total = idle_total = clients = 0
+            for loop_clients in list(self._clients.values()):
+                client = loop_clients.get(provider)
+                if client is None or client.is_closed:
+                    continue
+                counts = self._connection_counts(client)
+                open_total += counts["open"]
+                idle_total += counts["idle"]
+                clients += 1
+            metrics[provider] = {
+                "clients": clients,
+                "connections_open": open_total,
+                "connections_idle": idle_total,
+                "requests": stats.requests,
+                "in_flight": stats.in_flight,
+                "peak_in_flight": stats.peak_in_flight,
+                "errors": stats.errors,
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+            }
+        return metrics
+
+    async def close(self):
+        """Close every client. Clients of other, still running loops are dropped."""
+        current = asyncio.get_running_loop()
+        for loop, clients in list(self._clients.items()):
+            for provider, client in clients.items():
+                if loop is current:
+                    await client.aclose()
+                elif not loop.is_closed() and loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            clients.clear()
+        self._clients = weakref.WeakKeyDictionary()
+
+
+_pool: Optional[HTTPPool] = None
+
+
+def get_http_pool() -> HTTPPool:
+    """Get the process-wide HTTPPool configured from settings."""
+    global _pool
+    if _pool is None:
+        from config.settings import settings
+        _pool = HTTPPool(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive,
+            keepalive_expiry=settings.http_pool_keepalive_expiry,
+            http2=settings.http2_enabled
+        )
+    return _pool
+
+
+def get_http_client(provider: str = "default") -> httpx.AsyncClient:
+    """Shortcut for get_http_pool().get_client(provider)."""
+    return get_http_pool().get_client(provider)
+
+
+@asynccontextmanager
+async def pooled_client(provider: str = "default") -> AsyncIterator[httpx.AsyncClient]:
+    """Drop-in for ``async with httpx.AsyncClient() as client`` that leaves the shared client open."""
+    yield get_http_client(provider)
+
+
+async def close_http_pool() -> None:
+    """Close all pooled clients (application shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
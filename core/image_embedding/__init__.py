@@ -20,6 +20,7 @@ Usage:
 """
 
 from .models import ImageBlock, ImageFormat, ImagePosition
+from .store import ImageStore, StoredImage
 from .extractor import ImageExtractor, ExtractionConfig, extract_images
 from .docx_embedder import DocxImageEmbedder, create_document_with_images
 from .pdf_embedder import (
@@ -46,6 +47,9 @@ __all__ = [
     "ImageBlock",
     "ImageFormat",
     "ImagePosition",
+    # Store
+    "ImageStore",
+    "StoredImage",
     # Extractor
     "ImageExtractor",
     "ExtractionConfig",
@@ -17,7 +17,6 @@ Usage:
     embedder.embed_images(document, image_blocks)
 """
 
-import io
 from pathlib import Path
 from typing import Optional, List, Union, Tuple
 
@@ -99,8 +98,8 @@ class DocxImageEmbedder:
         if width_inches is None:
             width_inches = self._calculate_width(image_block)
 
-        # Create image stream
-        image_stream = io.BytesIO(image_block.image_data)
+        # Stored file path or in-memory stream
+        image_stream = image_block.image_source()
 
         # Create or use paragraph
         if paragraph is None:
@@ -247,8 +246,8 @@ class DocxImageEmbedder:
         # Calculate width
         width_inches = self._calculate_width(image_block)
 
-        # Create image stream and add picture
-        image_stream = io.BytesIO(image_block.image_data)
+        # Stored file path or in-memory stream, then add picture
+        image_stream = image_block.image_source()
         run = new_para.add_run()
         picture = run.add_picture(image_stream, width=Inches(width_inches))
 
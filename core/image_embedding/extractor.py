@@ -10,11 +10,17 @@ Usage:
 
     for img in images:
         print(f"Found image: {img.width_px}x{img.height_px} on page {img.source_page}")
+
+    # Image-heavy documents: extract pages in 4 processes and keep the
+    # bytes on disk instead of in memory
+    extractor = ImageExtractor(ExtractionConfig(workers=4, store_dir="data/temp/images"))
 """
 
 import io
 import hashlib
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple, Union
 from dataclasses import dataclass
@@ -34,6 +40,7 @@ except ImportError:
     PILLOW_AVAILABLE = False
 
 from .models import ImageBlock, ImageFormat, ImagePosition
+from .store import ImageStore
 
 
 @dataclass
@@ -59,6 +66,32 @@ class ExtractionConfig:
     start_page: Optional[int] = None  # 1-indexed
     end_page: Optional[int] = None  # 1-indexed (inclusive)
 
+    # Large documents
+    workers: int = 1  # Processes extracting pages in parallel (1 = in-process)
+    pages_per_task: int = 8  # Pages handed to a worker at a time
+    store_dir: Optional[Union[str, Path]] = None  # Spill image bytes to an ImageStore here (None = keep in memory)
+
+
+# Per-process state of pool workers (see _init_worker)
+_worker_doc = None
+_worker_extractor = None
+
+
+def _init_worker(pdf_path: str, config: ExtractionConfig):
+    """Open the document once per worker process"""
+    global _worker_doc, _worker_extractor
+    _worker_doc = fitz.open(pdf_path)
+    _worker_extractor = ImageExtractor(config)
+
+
+def _extract_pages_in_worker(page_indices: List[int]) -> List[ImageBlock]:
+    """Extract a run of pages; duplicates are only dropped within the run"""
+    _worker_extractor._seen_hashes.clear()
+    images: List[ImageBlock] = []
+    for page_idx in page_indices:
+        images.extend(_worker_extractor._extract_from_page(_worker_doc[page_idx], page_idx + 1))
+    return images
+
 
 class ImageExtractor:
     """
@@ -82,6 +115,7 @@ class ImageExtractor:
 
         self.config = config or ExtractionConfig()
         self._seen_hashes: set = set()  # For duplicate detection
+        self._store = ImageStore(self.config.store_dir) if self.config.store_dir else None
 
     def extract_from_pdf(
         self,
@@ -91,6 +125,9 @@ class ImageExtractor:
         """
         Extract all images from a PDF file.
 
+        With ``config.workers > 1`` pages are extracted in worker
+        processes; the result is the same as a sequential run.
+
         Args:
             pdf_path: Path to PDF file
             pages: Specific pages to extract from (1-indexed). None = all pages.
@@ -116,6 +153,12 @@ class ImageExtractor:
                 end = self.config.end_page or total_pages
                 page_indices = list(range(start, min(end, total_pages)))
 
+            if self.config.workers > 1 and len(page_indices) > self.config.pages_per_task:
+                # Workers open their own copy of the document
+                doc.close()
+                doc = None
+                return self._extract_pool(pdf_path, page_indices)
+
             # Extract from each page
             for page_idx in page_indices:
                 page = doc[page_idx]
@@ -123,8 +166,48 @@ class ImageExtractor:
                 images.extend(page_images)
 
         finally:
-            doc.close()
+            if doc is not None:
+                doc.close()
+
+        return images
 
+    def _extract_pool(self, pdf_path: Path, page_indices: List[int]) -> List[ImageBlock]:
+        """
+        Extract runs of pages in worker processes, in page order.
+
+        Workers drop duplicates within their run; duplicates across runs
+        are dropped here by content hash, keeping the first occurrence,
+        so the output matches sequential extraction. With a store_dir the
+        workers return handles only, not image bytes.
+        """
+        size = self.config.pages_per_task
+        runs = [page_indices[i:i + size] for i in range(0, len(page_indices), size)]
+
+        # spawn: MuPDF state must not be inherited through fork
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.config.workers, len(runs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(pdf_path), self.config),
+        )
+
+        images: List[ImageBlock] = []
+        try:
+            for run_images in executor.map(_extract_pages_in_worker, runs):
+                for image_block in run_images:
+                    if self.config.skip_duplicates:
+                        content_hash = image_block.metadata["content_hash"]
+                        if content_hash in self._seen_hashes:
+                            continue
+                        self._seen_hashes.add(content_hash)
+                    images.append(image_block)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info(
+            "Extracted %d images from %d pages of %s with %d workers",
+            len(images), len(page_indices), pdf_path.name, self.config.workers
+        )
         return images
 
     def extract_from_bytes(
@@ -135,6 +218,9 @@ class ImageExtractor:
         """
         Extract images from PDF bytes (in-memory).
 
+        Always runs in-process (workers need a file to open);
+        config.store_dir still applies.
+
         Args:
             pdf_bytes: PDF file content as bytes
             pages: Specific pages to extract from (1-indexed)
@@ -257,8 +343,8 @@ class ImageExtractor:
             return None
 
         # Check for duplicates
+        img_hash = hashlib.md5(image_bytes).hexdigest()
         if self.config.skip_duplicates:
-            img_hash = hashlib.md5(image_bytes).hexdigest()
             if img_hash in self._seen_hashes:
                 return None
             self._seen_hashes.add(img_hash)
@@ -276,8 +362,16 @@ class ImageExtractor:
         # Generate unique ID
         image_id = f"img_p{page_number}_{img_index}_{xref}"
 
+        # Spill to disk if configured
+        stored = None
+        if self._store is not None:
+            ext = "jpg" if final_format == ImageFormat.JPEG else final_format.value
+            stored = self._store.put(final_bytes, ext)
+            final_bytes = b""
+
         return ImageBlock(
             image_data=final_bytes,
+            stored=stored,
             format=final_format,
             width_px=final_width,
             height_px=final_height,
@@ -291,6 +385,7 @@ class ImageExtractor:
                 "original_width": width,
                 "original_height": height,
                 "colorspace": base_image.get("cs-name", "unknown"),
+                "content_hash": img_hash,
             }
         )
 
@@ -5,9 +5,12 @@ Data models for image extraction and embedding.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from enum import Enum
 import base64
+import io
+
+from .store import StoredImage
 
 
 class ImageFormat(Enum):
@@ -75,10 +78,12 @@ class ImageBlock:
     Represents an extracted image with metadata.
 
     This is the core data structure for image embedding.
-    Contains the actual image data (bytes) plus metadata.
+    Contains the image data plus metadata. The data is either held
+    in memory (image_data) or spilled to an ImageStore (stored), in
+    which case it is read back only when needed.
     """
     # Core data
-    image_data: bytes  # Raw image bytes
+    image_data: bytes = b""  # Raw image bytes (empty when spilled to disk)
     format: ImageFormat = ImageFormat.PNG
 
     # Dimensions (pixels)
@@ -104,11 +109,33 @@ class ImageBlock:
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Lazy handle to the bytes when spilled to an ImageStore
+    stored: Optional[StoredImage] = None
+
     @property
     def size_bytes(self) -> int:
         """Size of image data in bytes"""
+        if self.stored is not None:
+            return self.stored.size
         return len(self.image_data)
 
+    def read_data(self) -> bytes:
+        """Image bytes, loaded from the store if spilled"""
+        if self.stored is not None:
+            return self.stored.read()
+        return self.image_data
+
+    def image_source(self) -> Union[str, io.BytesIO]:
+        """
+        Image input for python-docx / ReportLab.
+
+        The stored file path when spilled (so the library reads the file
+        itself, at embed time), otherwise an in-memory stream.
+        """
+        if self.stored is not None:
+            return str(self.stored.path)
+        return io.BytesIO(self.image_data)
+
     @property
     def size_kb(self) -> float:
         """Size of image data in KB"""
@@ -144,7 +171,7 @@ class ImageBlock:
 
     def to_base64(self) -> str:
         """Convert image data to base64 string"""
-        return base64.b64encode(self.image_data).decode("utf-8")
+        return base64.b64encode(self.read_data()).decode("utf-8")
 
     def to_data_uri(self) -> str:
         """Convert to data URI for HTML embedding"""
@@ -14,7 +14,6 @@ Usage:
     create_pdf_with_images(image_blocks, "output.pdf")
 """
 
-import io
 from pathlib import Path
 from typing import Optional, List, Union, Tuple
 
@@ -126,8 +125,8 @@ class PdfImageEmbedder:
         Returns:
             ReportLab Image object
         """
-        # Create image stream
-        image_stream = io.BytesIO(image_block.image_data)
+        # Stored file path or in-memory stream
+        image_stream = image_block.image_source()
 
         # Calculate dimensions
         if width is None:
@@ -242,8 +241,8 @@ class PdfImageEmbedder:
             width: Width in points (None = auto)
             height: Height in points (None = auto from aspect ratio)
         """
-        # Create image stream
-        image_stream = io.BytesIO(image_block.image_data)
+        # Stored file path or in-memory stream
+        image_stream = image_block.image_source()
 
         # Calculate dimensions
         if width is None:
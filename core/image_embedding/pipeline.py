@@ -42,6 +42,8 @@ class PipelineConfig:
     min_image_size: int = 50  # pixels
     max_image_size: int = 2000  # pixels
     skip_duplicates: bool = True
+    extraction_workers: int = 1  # Processes extracting pages in parallel
+    image_store_dir: Optional[str] = None  # Keep extracted images on disk here instead of in memory
 
     # Embedding settings
     max_width_ratio: float = 0.8  # 80% of page width
@@ -111,6 +113,8 @@ class ImageEmbeddingPipeline:
             max_width=self.config.max_image_size,
             max_height=self.config.max_image_size,
             skip_duplicates=self.config.skip_duplicates,
+            workers=self.config.extraction_workers,
+            store_dir=self.config.image_store_dir,
         )
         self.extractor = ImageExtractor(extraction_config)
         self.embedder = DocxImageEmbedder(
@@ -357,7 +361,7 @@ def save_extracted_images(
         filepath = output_dir / filename
 
         with open(filepath, "wb") as f:
-            f.write(img.image_data)
+            f.write(img.read_data())
 
         saved_paths.append(filepath)
 
@@ -0,0 +1,102 @@
+"""
+Image Store - AI Publisher Pro
+
+Content-addressed on-disk store for extracted image bytes.
+
+Each image is written once under its SHA-256 digest, so a figure that
+repeats across a document costs one file, and extractor processes can
+share a store without coordinating. ImageBlocks keep a StoredImage
+handle instead of the bytes and the embedders read them back one image
+at a time.
+
+Usage:
+    store = ImageStore("data/temp/images")
+    stored = store.put(png_bytes, "png")
+    data = stored.read()
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """Lazy handle to image bytes held in an ImageStore"""
+    path: Path
+    digest: str  # SHA-256 of the bytes
+    size: int  # Size in bytes
+
+    def read(self) -> bytes:
+        """Load the image bytes"""
+        return self.path.read_bytes()
+
+    def open(self) -> BinaryIO:
+        """Open the image for streaming reads"""
+        return open(self.path, "rb")
+
+
+class ImageStore:
+    """
+    Directory of images named by content hash.
+
+    Layout: ``<root>/<first 2 hex chars>/<sha256>.<ext>``. Writes go to a
+    temporary file that is renamed into place, so concurrent writers of
+    the same image never expose a partial file.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Initialize store.
+
+        Args:
+            root: Directory holding the images (created if missing)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str, ext: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.{ext}"
+
+    def put(self, data: bytes, ext: str = "png") -> StoredImage:
+        """
+        Store image bytes, unless identical bytes are already stored.
+
+        Args:
+            data: Image bytes
+            ext: File extension (without dot)
+
+        Returns:
+            Handle to the stored image
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest, ext)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+        return StoredImage(path=path, digest=digest, size=len(data))
+
+    def get(self, digest: str, ext: str = "png") -> Optional[StoredImage]:
+        """Handle to a stored image, or None if it is not in the store"""
+        path = self._path(digest, ext)
+        if not path.exists():
+            return None
+        return StoredImage(path=path, digest=digest, size=path.stat().st_size)
+
+    def clear(self):
+        """Delete every stored image"""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
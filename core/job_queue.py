@@ -11,6 +11,8 @@ No external dependencies like Redis or Celery required.
 import sqlite3
 import json
 import hashlib
+import os
+import socket
 import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -99,6 +101,10 @@ class TranslationJob:
     # Cancellation support
     cancellation_requested: bool = False
 
+    # Worker lease (managed by JobQueue.claim_jobs / heartbeat)
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+
     # Metadata
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -176,15 +182,58 @@ class TranslationJob:
         self.updated_at = time.time()
 
 
+# Columns written by _save_job. worker_id / lease_expires_at are left out:
+# they are owned by claim_jobs() and heartbeat(), so saving a stale job
+# object never shortens or drops a lease.
+JOB_COLUMNS = (
+    "job_id", "job_name", "status", "priority",
+    "input_file", "output_file", "input_format", "output_format",
+    "source_lang", "target_lang", "domain", "glossary",
+    "provider", "model", "concurrency", "chunk_size",
+    "progress", "total_chunks", "completed_chunks", "failed_chunks",
+    "avg_quality_score", "total_cost_usd", "tm_hits", "cache_hits",
+    "scheduled_at", "created_at", "started_at", "completed_at", "updated_at",
+    "error_message", "retry_count", "max_retries",
+    "tags", "metadata",
+)
+
+UPSERT_JOB_SQL = (
+    f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in JOB_COLUMNS)}) "
+    f"ON CONFLICT(job_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in JOB_COLUMNS[1:])
+)
+
+DEFAULT_LEASE_SECONDS = 300.0
+
+
+def default_worker_id() -> str:
+    """Worker identity for this process: host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
 class JobQueue:
-    """SQLite-based job queue with priority scheduling"""
+    """SQLite-based job queue with priority scheduling
+
+    Several worker processes can share one queue: claim_jobs() hands each
+    job to exactly one worker under a time-limited lease, workers renew
+    their leases with heartbeat(), and jobs whose lease expired (crashed
+    or hung worker) are re-queued on the next claim.
+    """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
         """
         Initialize job queue
 
         Args:
             db_path: Path to SQLite database (default: data/jobs.db)
+            worker_id: Worker identity used by get_next_job (default: host:pid)
+            lease_seconds: How long a claimed job stays leased without a heartbeat
         """
         if db_path is None:
             from config.settings import BASE_DIR
@@ -192,6 +241,8 @@ class JobQueue:
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
 
         from core.database import get_db_backend
         self._backend = get_db_backend("jobs", db_dir=self.db_path.parent)
@@ -253,10 +304,21 @@ class JobQueue:
 
                     -- Metadata (JSON)
                     tags TEXT,
-                    metadata TEXT
+                    metadata TEXT,
+
+                    -- Worker lease
+                    worker_id TEXT,
+                    lease_expires_at REAL
                 )
             """)
 
+            # Migrate databases created before worker leases
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()}
+            if "worker_id" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN worker_id TEXT")
+            if "lease_expires_at" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN lease_expires_at REAL")
+
             # Indexes for performance
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_status_priority
@@ -273,6 +335,11 @@ class JobQueue:
                 ON jobs(status)
             """)
 
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lease
+                ON jobs(status, lease_expires_at)
+            """)
+
     def create_job(
         self,
         job_name: str,
@@ -325,31 +392,13 @@ class JobQueue:
         return hashlib.md5(data.encode()).hexdigest()[:12]
 
     def _save_job(self, job: TranslationJob):
-        """Save job to database"""
+        """Save job to database (insert or update, keeping its lease)"""
+        values = asdict(job)
+        values['tags'] = json.dumps(job.tags)
+        values['metadata'] = json.dumps(job.metadata)
+
         with self._backend.connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO jobs (
-                    job_id, job_name, status, priority,
-                    input_file, output_file, input_format, output_format,
-                    source_lang, target_lang, domain, glossary,
-                    provider, model, concurrency, chunk_size,
-                    progress, total_chunks, completed_chunks, failed_chunks,
-                    avg_quality_score, total_cost_usd, tm_hits, cache_hits,
-                    scheduled_at, created_at, started_at, completed_at, updated_at,
-                    error_message, retry_count, max_retries,
-                    tags, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.job_id, job.job_name, job.status, job.priority,
-                job.input_file, job.output_file, job.input_format, job.output_format,
-                job.source_lang, job.target_lang, job.domain, job.glossary,
-                job.provider, job.model, job.concurrency, job.chunk_size,
-                job.progress, job.total_chunks, job.completed_chunks, job.failed_chunks,
-                job.avg_quality_score, job.total_cost_usd, job.tm_hits, job.cache_hits,
-                job.scheduled_at, job.created_at, job.started_at, job.completed_at, job.updated_at,
-                job.error_message, job.retry_count, job.max_retries,
-                json.dumps(job.tags), json.dumps(job.metadata)
-            ))
+            conn.execute(UPSERT_JOB_SQL, tuple(values[column] for column in JOB_COLUMNS))
 
     def get_job(self, job_id: str) -> Optional[TranslationJob]:
         """Get job by ID (supports partial ID prefix matching)"""
@@ -394,29 +443,111 @@ class JobQueue:
 
     def get_next_job(self) -> Optional[TranslationJob]:
         """
-        Get next job to process based on priority and FIFO
+        Claim next job to process based on priority and FIFO
+
+        Returns:
+            Next job (leased to this queue's worker_id) or None if queue is empty
+        """
+        jobs = self.claim_jobs(self.worker_id, 1)
+        return jobs[0] if jobs else None
+
+    def claim_jobs(
+        self,
+        worker_id: str,
+        n: int = 1,
+        lease_seconds: Optional[float] = None
+    ) -> List[TranslationJob]:
+        """
+        Atomically claim up to n pending/retrying jobs for a worker
+
+        A single UPDATE ... RETURNING marks the jobs QUEUED and leases them
+        to worker_id, so concurrent workers (threads or processes) never
+        receive the same job. Expired leases are re-queued first.
+
+        Args:
+            worker_id: Identity of the claiming worker
+            n: Maximum number of jobs to claim
+            lease_seconds: Lease duration (default: self.lease_seconds)
+
+        Returns:
+            Claimed jobs, highest priority first
+        """
+        if n <= 0:
+            return []
+
+        now = time.time()
+        lease_expires_at = now + (lease_seconds or self.lease_seconds)
+
+        with self._backend.connection() as conn:
+            # Take the write lock up front so the SELECT below cannot go stale
+            conn.execute("BEGIN IMMEDIATE")
+            self._requeue_expired(conn, now)
+            rows = conn.execute("""
+                UPDATE jobs
+                SET status = 'queued', worker_id = ?, lease_expires_at = ?, updated_at = ?
+                WHERE job_id IN (
+                    SELECT job_id FROM jobs
+                    WHERE status IN ('pending', 'retrying')
+                    AND (scheduled_at IS NULL OR scheduled_at <= ?)
+                    ORDER BY priority DESC, created_at ASC
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (worker_id, lease_expires_at, now, now, n)).fetchall()
+
+        jobs = [self._row_to_job(row) for row in rows]
+        # RETURNING order is unspecified
+        jobs.sort(key=lambda job: (-job.priority, job.created_at))
+        return jobs
+
+    def heartbeat(self, worker_id: str, lease_seconds: Optional[float] = None) -> List[str]:
+        """
+        Renew the leases of all active jobs held by a worker
+
+        Args:
+            worker_id: Identity of the worker
+            lease_seconds: New lease duration (default: self.lease_seconds)
 
         Returns:
-            Next job or None if queue is empty
+            IDs of the jobs still leased to the worker. A job missing from
+            this list lost its lease and may be running elsewhere.
         """
+        lease_expires_at = time.time() + (lease_seconds or self.lease_seconds)
+
         with self._backend.connection() as conn:
-            # Get highest priority pending/retrying job (NOT queued - prevents race condition)
-            row = conn.execute("""
-                SELECT * FROM jobs
-                WHERE status IN ('pending', 'retrying')
-                AND (scheduled_at IS NULL OR scheduled_at <= ?)
-                ORDER BY priority DESC, created_at ASC
-                LIMIT 1
-            """, (time.time(),)).fetchone()
-
-        if row:
-            job = self._row_to_job(row)
-            # Mark as queued immediately to prevent race condition
-            job.status = JobStatus.QUEUED
-            self.update_job(job)
-            return job
+            rows = conn.execute("""
+                UPDATE jobs SET lease_expires_at = ?
+                WHERE worker_id = ? AND status IN ('queued', 'running')
+                RETURNING job_id
+            """, (lease_expires_at, worker_id)).fetchall()
 
-        return None
+        return [row[0] for row in rows]
+
+    def requeue_expired_leases(self) -> int:
+        """
+        Re-queue jobs whose worker stopped sending heartbeats
+
+        Returns:
+            Number of jobs re-queued or failed
+        """
+        with self._backend.connection() as conn:
+            return self._requeue_expired(conn, time.time())
+
+    def _requeue_expired(self, conn, now: float) -> int:
+        """Retry (or fail, once out of retries) jobs with an expired lease"""
+        conn.execute("""
+            UPDATE jobs
+            SET status = CASE WHEN retry_count < max_retries THEN 'retrying' ELSE 'failed' END,
+                retry_count = retry_count + 1,
+                error_message = 'Worker lease expired (worker ' || COALESCE(worker_id, '?') || ')',
+                completed_at = CASE WHEN retry_count < max_retries THEN completed_at ELSE ? END,
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                updated_at = ?
+            WHERE status IN ('queued', 'running')
+            AND lease_expires_at IS NOT NULL AND lease_expires_at < ?
+        """, (now, now, now))
+        return conn.rowcount
 
     def list_jobs(
         self,
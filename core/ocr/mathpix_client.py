@@ -96,6 +96,17 @@ class MathPixOcrClient(OcrClient):
 
         logger.info("MathPix OCR client initialized")
 
+    def __getstate__(self):
+        # Modules cannot be pickled (OcrPipeline worker processes)
+        state = self.__dict__.copy()
+        state.pop('httpx', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        import httpx
+        self.httpx = httpx
+
     def _encode_image(self, image_bytes: bytes) -> str:
         """Encode image bytes to base64 string."""
         return base64.b64encode(image_bytes).decode('utf-8')
@@ -124,6 +124,18 @@ class PaddleOcrClient(OcrClient):
         except Exception as e:
             raise OcrConnectionError(f"Failed to initialize PaddleOCR: {str(e)}") from e
 
+    def __getstate__(self):
+        # The PaddleOCR engine is not picklable; OcrPipeline worker
+        # processes rebuild it from the settings
+        state = self.__dict__.copy()
+        state.pop('ocr', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        from paddleocr import PaddleOCR
+        self.ocr = PaddleOCR(lang=self.lang)
+
     def extract(
         self,
         image_bytes: bytes,
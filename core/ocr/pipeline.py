@@ -6,8 +6,11 @@ Converts PDF pages to images and processes with OCR.
 """
 
 import fitz  # PyMuPDF
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator
 from dataclasses import dataclass
 from io import BytesIO
 
@@ -28,6 +31,90 @@ class OcrPage:
     metadata: Dict
 
 
+def render_page(page: fitz.Page, dpi: int, image_format: str) -> bytes:
+    """
+    Convert PDF page to image bytes
+
+    Args:
+        page: PyMuPDF page object
+        dpi: Render resolution
+        image_format: "PNG" or "JPEG"
+
+    Returns:
+        Image bytes (PNG or JPEG)
+    """
+    # Render page to pixmap
+    mat = fitz.Matrix(dpi / 72, dpi / 72)  # Scale matrix
+    pix = page.get_pixmap(matrix=mat)
+
+    # Convert to bytes
+    if image_format.upper() == "PNG":
+        image_bytes = pix.tobytes("png")
+    elif image_format.upper() == "JPEG":
+        image_bytes = pix.tobytes("jpeg")
+    else:
+        raise ValueError(f"Unsupported image format: {image_format}")
+
+    return image_bytes
+
+
+def ocr_image(
+    ocr_client: OcrClient,
+    image_bytes: bytes,
+    page_num: int,
+    mode: str,
+    language: Optional[str]
+) -> OcrPage:
+    """Run OCR on one page image; an OcrError yields an empty page"""
+    try:
+        ocr_result = ocr_client.extract_structured(
+            image_bytes=image_bytes,
+            mode=mode,
+            language=language
+        )
+    except OcrError as e:
+        logger.info(f"✗ OCR failed on page {page_num + 1}: {e}")
+        return OcrPage(
+            page_num=page_num,
+            text="",
+            confidence=0.0,
+            blocks=[],
+            metadata={"error": str(e)}
+        )
+
+    return OcrPage(
+        page_num=page_num,
+        text=ocr_result.get("text", ""),
+        confidence=ocr_result.get("confidence", 0.0),
+        blocks=ocr_result.get("blocks", []),
+        metadata=ocr_result.get("metadata", {})
+    )
+
+
+# ----- Process-pool workers -----
+# Each worker process opens its own fitz document and OCR client once,
+# then renders + OCRs pages by number. Rendered images never leave the
+# worker; only OcrPage results are sent back.
+
+_worker_state: Dict = {}
+
+
+def _init_worker(pdf_path: str, ocr_client: OcrClient, dpi: int, image_format: str, language: Optional[str]):
+    _worker_state.update(
+        doc=fitz.open(pdf_path),
+        client=ocr_client,
+        dpi=dpi,
+        image_format=image_format,
+        language=language,
+    )
+
+
+def _process_page_in_worker(page_num: int, mode: str) -> OcrPage:
+    state = _worker_state
+    image_bytes = render_page(state["doc"][page_num], state["dpi"], state["image_format"])
+    return ocr_image(state["client"], image_bytes, page_num, mode, state["language"])
+
+
 class OcrPipeline:
     """
     OCR Pipeline for document processing
@@ -35,6 +122,8 @@ class OcrPipeline:
     Features:
     - PDF to image conversion
     - Per-page OCR processing
+    - Optional process pool (workers > 1) rendering and OCRing pages
+      concurrently, results streamed back in page order
     - Progress tracking
     - Error recovery
 
@@ -55,21 +144,28 @@ class OcrPipeline:
         ocr_client: OcrClient,
         dpi: int = 300,  # Image resolution for OCR
         image_format: str = "PNG",
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        workers: int = 1,
+        max_in_flight: Optional[int] = None
     ):
         """
         Initialize OCR pipeline
 
         Args:
-            ocr_client: OCR client instance
+            ocr_client: OCR client instance (must be picklable when workers > 1)
             dpi: DPI for PDF-to-image conversion (higher = better quality)
             image_format: Image format for OCR ("PNG", "JPEG")
             language: Default language hint for OCR
+            workers: Worker processes for PDF pages (1 = sequential)
+            max_in_flight: Pages submitted ahead of the consumer in pool
+                mode (default: 2 x workers); bounds buffered results
         """
         self.ocr_client = ocr_client
         self.dpi = dpi
         self.image_format = image_format
         self.language = language
+        self.workers = max(1, workers)
+        self.max_in_flight = max(self.workers, max_in_flight or 2 * self.workers)
 
     def process_pdf(
         self,
@@ -92,6 +188,30 @@ class OcrPipeline:
             FileNotFoundError: If PDF doesn't exist
             OcrError: If OCR processing fails
         """
+        return list(self.iter_pdf(pdf_path, page_range=page_range, mode=mode))
+
+    def iter_pdf(
+        self,
+        pdf_path: Path,
+        page_range: Optional[tuple] = None,
+        mode: str = "document"
+    ) -> Iterator[OcrPage]:
+        """
+        Process PDF with OCR, yielding pages in order as they complete
+
+        Args:
+            pdf_path: Path to PDF file
+            page_range: Optional (start, end) page range (0-indexed)
+            mode: OCR mode ("document", "handwriting")
+
+        Yields:
+            OcrPage results in page order
+
+        Raises:
+            FileNotFoundError: If PDF doesn't exist
+            ValueError: If the PDF cannot be opened
+        """
+        pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
@@ -105,52 +225,71 @@ class OcrPipeline:
         start_page, end_page = page_range if page_range else (0, total_pages)
         start_page = max(0, start_page)
         end_page = min(total_pages, end_page)
+        page_nums = range(start_page, end_page)
 
-        logger.info(f"Processing {end_page - start_page} pages with OCR (DPI: {self.dpi})...")
-
-        ocr_pages = []
+        workers = min(self.workers, len(page_nums))
+        logger.info(
+            f"Processing {len(page_nums)} pages with OCR (DPI: {self.dpi}, workers: {max(workers, 1)})..."
+        )
 
-        for page_num in range(start_page, end_page):
+        if workers <= 1:
             try:
-                logger.debug(f"Processing page {page_num + 1}/{total_pages}...")
-
-                # Convert page to image
-                image_bytes = self._page_to_image(doc[page_num])
+                for page_num in page_nums:
+                    logger.debug(f"Processing page {page_num + 1}/{total_pages}...")
 
-                # Process with OCR
-                ocr_result = self.ocr_client.extract_structured(
-                    image_bytes=image_bytes,
-                    mode=mode,
-                    language=self.language
-                )
-
-                # Create OcrPage
-                ocr_page = OcrPage(
-                    page_num=page_num,
-                    text=ocr_result.get("text", ""),
-                    confidence=ocr_result.get("confidence", 0.0),
-                    blocks=ocr_result.get("blocks", []),
-                    metadata=ocr_result.get("metadata", {})
-                )
-
-                ocr_pages.append(ocr_page)
+                    # Convert page to image, then OCR it
+                    image_bytes = self._page_to_image(doc[page_num])
+                    ocr_page = ocr_image(self.ocr_client, image_bytes, page_num, mode, self.language)
 
-                logger.info(f" ({len(ocr_page.text)} chars, {ocr_page.confidence:.1%} confidence)")
-
-            except OcrError as e:
-                logger.info(f"✗ OCR failed: {e}")
-                # Create empty page on error
-                ocr_pages.append(OcrPage(
-                    page_num=page_num,
-                    text="",
-                    confidence=0.0,
-                    blocks=[],
-                    metadata={"error": str(e)}
-                ))
+                    logger.info(f" ({len(ocr_page.text)} chars, {ocr_page.confidence:.1%} confidence)")
+                    yield ocr_page
+            finally:
+                doc.close()
+            return
 
+        # Workers open their own copy of the document
         doc.close()
+        yield from self._iter_pdf_pool(pdf_path, page_nums, mode, workers)
 
-        return ocr_pages
+    def _iter_pdf_pool(
+        self,
+        pdf_path: Path,
+        page_nums: range,
+        mode: str,
+        workers: int
+    ) -> Iterator[OcrPage]:
+        """Render + OCR pages in worker processes, yielding in page order"""
+        # spawn: OCR engines (e.g. PaddleOCR) are not fork-safe
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(pdf_path), self.ocr_client, self.dpi, self.image_format, self.language),
+        )
+
+        pending = deque()
+        pages = iter(page_nums)
+        try:
+            for page_num in pages:
+                pending.append(executor.submit(_process_page_in_worker, page_num, mode))
+                if len(pending) >= self.max_in_flight:
+                    break
+
+            while pending:
+                ocr_page = pending.popleft().result()
+                # Keep the window full before handing the page to the caller
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(_process_page_in_worker, next_page, mode))
+
+                logger.info(
+                    f" Page {ocr_page.page_num + 1}: "
+                    f"({len(ocr_page.text)} chars, {ocr_page.confidence:.1%} confidence)"
+                )
+                yield ocr_page
+        finally:
+            # Generator closed early or failed: drop queued pages
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def process_image(
         self,
@@ -197,19 +336,7 @@ class OcrPipeline:
         Returns:
             Image bytes (PNG or JPEG)
         """
-        # Render page to pixmap
-        mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)  # Scale matrix
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to bytes
-        if self.image_format.upper() == "PNG":
-            image_bytes = pix.tobytes("png")
-        elif self.image_format.upper() == "JPEG":
-            image_bytes = pix.tobytes("jpeg")
-        else:
-            raise ValueError(f"Unsupported image format: {self.image_format}")
-
-        return image_bytes
+        return render_page(page, self.dpi, self.image_format)
 
     def merge_pages_to_text(self, ocr_pages: List[OcrPage]) -> str:
         """
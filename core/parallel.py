@@ -16,6 +16,7 @@ from enum import Enum
 import httpx
 from tqdm import tqdm
 
+from .http_pool import get_http_client
 from config.logging_config import get_logger
 logger = get_logger(__name__)
 
@@ -224,11 +225,9 @@ class ParallelProcessor:
         self.tasks = [Task(id=i, data=data) for i, data in enumerate(data_list)]
         self.stats = ProcessingStats(total_tasks=len(self.tasks))
 
-        # Setup HTTP client
-        close_client = False
+        # Shared pooled client unless the caller passes its own
         if http_client is None:
-            http_client = httpx.AsyncClient(timeout=httpx.Timeout(self.timeout))
-            close_client = True
+            http_client = get_http_client()
 
         # Setup progress bar
         progress_bar = None
@@ -284,9 +283,6 @@ class ParallelProcessor:
             if progress_bar:
                 progress_bar.close()
 
-            if close_client:
-                await http_client.aclose()
-
     def get_failed_tasks(self) -> List[Task]:
         """Get list of failed tasks"""
         return [task for task in self.tasks if task.status == TaskStatus.FAILED]
@@ -370,39 +366,33 @@ class BatchProcessor:
         all_results = []
         combined_stats = ProcessingStats(total_tasks=len(data_list))
 
-        # Setup HTTP client
-        close_client = False
+        # Shared pooled client unless the caller passes its own
         if http_client is None:
-            http_client = httpx.AsyncClient(timeout=httpx.Timeout(300.0))
-            close_client = True
+            http_client = get_http_client()
 
-        try:
-            for i, batch in enumerate(batches, 1):
-                logger.info(f"\n🔄 Processing batch {i}/{len(batches)} ({len(batch)} items)...")
+        for i, batch in enumerate(batches, 1):
+            logger.info(f"\n🔄 Processing batch {i}/{len(batches)} ({len(batch)} items)...")
 
-                results, stats = await self.processor.process_all(
-                    batch,
-                    processor_func,
-                    http_client
-                )
+            results, stats = await self.processor.process_all(
+                batch,
+                processor_func,
+                http_client
+            )
 
-                all_results.extend(results)
+            all_results.extend(results)
 
-                # Combine stats
-                combined_stats.completed += stats.completed
-                combined_stats.failed += stats.failed
-                combined_stats.retried += stats.retried
-                combined_stats.total_time += stats.total_time
-                combined_stats.tokens_used += stats.tokens_used
-                combined_stats.cache_hits += stats.cache_hits
-                combined_stats.cache_misses += stats.cache_misses
+            # Combine stats
+            combined_stats.completed += stats.completed
+            combined_stats.failed += stats.failed
+            combined_stats.retried += stats.retried
+            combined_stats.total_time += stats.total_time
+            combined_stats.tokens_used += stats.tokens_used
+            combined_stats.cache_hits += stats.cache_hits
+            combined_stats.cache_misses += stats.cache_misses
 
-            # Calculate final averages
-            if combined_stats.completed > 0:
-                combined_stats.avg_time_per_task = combined_stats.total_time / combined_stats.completed
+        # Calculate final averages
+        if combined_stats.completed > 0:
+            combined_stats.avg_time_per_task = combined_stats.total_time / combined_stats.completed
 
-            return all_results, combined_stats
+        return all_results, combined_stats
 
-        finally:
-            if close_client:
-                await http_client.aclose()
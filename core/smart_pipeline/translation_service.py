@@ -27,6 +27,7 @@ from .tiered_config import (
     estimate_cost
 )
 from .content_analyzer import ContentAnalyzer, ContentAnalysis
+from ..http_pool import get_http_client
 
 
 @dataclass
@@ -123,13 +124,15 @@ class TranslationService:
         if provider == "openai":
             from openai import AsyncOpenAI
             self._clients[provider] = AsyncOpenAI(
-                api_key=self.api_keys.get("openai")
+                api_key=self.api_keys.get("openai"),
+                http_client=get_http_client(provider)
             )
 
         elif provider == "claude":
             import anthropic
             self._clients[provider] = anthropic.AsyncAnthropic(
-                api_key=self.api_keys.get("claude")
+                api_key=self.api_keys.get("claude"),
+                http_client=get_http_client(provider)
             )
 
         elif provider == "gemini":
@@ -141,7 +144,8 @@ class TranslationService:
             from openai import AsyncOpenAI
             self._clients[provider] = AsyncOpenAI(
                 api_key=self.api_keys.get("deepseek"),
-                base_url="https://api.deepseek.com"
+                base_url="https://api.deepseek.com",
+                http_client=get_http_client(provider)
             )
 
         return self._clients[provider]
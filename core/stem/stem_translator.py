@@ -234,7 +234,7 @@ class STEMTranslator:
         Returns:
             Translated text with placeholders intact
         """
-        import httpx
+        from ..http_pool import pooled_client
 
         # Create a single translation chunk
         # For long documents, we'd chunk this properly in production
@@ -248,7 +248,7 @@ class STEMTranslator:
 
         # Use the base translator with HTTP client
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
+            async with pooled_client(self.base_translator.provider) as client:
                 result = await self.base_translator.translate_chunk(
                     client=client,
                     chunk=chunk
@@ -169,12 +169,15 @@ class ProgressStreamer:
         """
         Internal broadcast method
 
+        Events are published on the job's topic, so clients subscribed
+        to other jobs never receive them.
+
         Args:
             message: Message dict to broadcast
         """
         if self.ws_manager:
             try:
-                await self.ws_manager.broadcast(message)
+                await self.ws_manager.broadcast(message, topic=message["job_id"])
             except Exception as e:
                 # Don't fail job if WebSocket broadcast fails
                 logger.warning(f"WebSocket broadcast failed: {e}")
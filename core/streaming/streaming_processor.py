@@ -11,7 +11,7 @@ Reduces memory usage by 80% for large jobs.
 
 import asyncio
 import gc
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Set
 from pathlib import Path
 import httpx
 
@@ -34,6 +34,9 @@ class StreamingBatchProcessor:
 
     Features:
     - Process chunks in configurable batches (default: 100)
+    - Optional sliding-window mode: chunks are admitted as soon as a
+      concurrency slot frees up, and completed chunks are exported as
+      soon as they form a contiguous prefix (no per-batch barrier)
     - Stream results to disk after each batch
     - Real-time WebSocket progress broadcasting
     - Partial export for DOCX, PDF, and TXT formats
@@ -57,7 +60,10 @@ class StreamingBatchProcessor:
         batch_size: int = 100,
         enable_streaming: bool = True,
         enable_partial_export: bool = True,
-        websocket_manager: Optional[Any] = None
+        websocket_manager: Optional[Any] = None,
+        sliding_window: bool = False,
+        max_concurrency: int = 10,
+        window_size: Optional[int] = None
     ):
         """
         Initialize streaming batch processor
@@ -67,11 +73,19 @@ class StreamingBatchProcessor:
             enable_streaming: Enable WebSocket progress broadcasting
             enable_partial_export: Enable partial exports for all formats
             websocket_manager: WebSocket manager for broadcasting
+            sliding_window: Use continuous sliding-window execution
+            max_concurrency: Chunks translated at once
+            window_size: Sliding-window mode only - how far ahead of the
+                oldest unfinished chunk new chunks may start (default:
+                2 x batch_size). Bounds results buffered out of order.
         """
         self.batch_size = batch_size
         self.enable_streaming = enable_streaming
         self.enable_partial_export = enable_partial_export
         self.websocket_manager = websocket_manager
+        self.sliding_window = sliding_window
+        self.max_concurrency = max_concurrency
+        self.window_size = max(window_size or 2 * batch_size, max_concurrency)
 
         # Progress streamer for WebSocket broadcasts
         if websocket_manager and enable_streaming:
@@ -114,7 +128,10 @@ class StreamingBatchProcessor:
         translator: Any,
         http_client: httpx.AsyncClient,
         output_path: Path,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        result_callback: Optional[callable] = None,
+        keep_results: bool = True,
+        prepare_batch: Optional[callable] = None
     ) -> tuple[List[TranslationResult], Dict[str, Any]]:
         """
         Process job in streaming batches with live progress
@@ -125,9 +142,18 @@ class StreamingBatchProcessor:
             translator: Translator engine instance
             http_client: HTTP client for API calls
             output_path: Path for final output
+            progress_callback: Async callback(completed_chunks, total_chunks, progress)
+            result_callback: Called with each result, in chunk order, as it is exported
+            keep_results: Collect all results for the return value; set False
+                with result_callback to avoid holding them twice
+            prepare_batch: Async callback(batch_chunks) awaited before each
+                group of batch_size chunks is dispatched (e.g. bulk TM/cache
+                prefetch and planning packed requests); it should not wait on
+                the LLM, since no chunk is admitted while it runs
 
         Returns:
-            Tuple of (all_results, statistics)
+            Tuple of (all_results, statistics); all_results is empty when
+            keep_results is False
         """
         total_chunks = len(chunks)
         total_batches = (total_chunks + self.batch_size - 1) // self.batch_size
@@ -152,14 +178,68 @@ class StreamingBatchProcessor:
                 builder = None
 
         # Process batches
-        all_results = []
         batch_stats = {
             'batches_processed': 0,
             'chunks_processed': 0,
             'memory_saved_bytes': 0,
-            'partial_exports': []
+            'partial_exports': [],
+            'mode': 'sliding_window' if self.sliding_window else 'batch'
         }
 
+        run_mode = self._process_sliding_window if self.sliding_window else self._process_batches
+        all_results = await run_mode(
+            job=job,
+            chunks=chunks,
+            translator=translator,
+            http_client=http_client,
+            builder=builder,
+            batch_stats=batch_stats,
+            progress_callback=progress_callback,
+            result_callback=result_callback,
+            keep_results=keep_results,
+            prepare_batch=prepare_batch
+        )
+
+        # Merge partial exports if created
+        if builder and batch_stats['partial_exports']:
+            logger.info(f"Merging {len(batch_stats['partial_exports'])} partial exports...")
+            final_output = await builder.merge_all()
+            format_name = job.output_format.upper()
+            logger.info(f"Final {format_name}: {final_output}")
+
+        # Broadcast completion
+        if self.progress_streamer:
+            await self.progress_streamer.broadcast_job_completed(
+                job_id=job.job_id,
+                total_chunks=total_chunks,
+                memory_saved_mb=batch_stats['memory_saved_bytes'] / 1024 / 1024
+            )
+
+        return all_results, batch_stats
+
+    async def _process_batches(
+        self,
+        job: TranslationJob,
+        chunks: List[TranslationChunk],
+        translator: Any,
+        http_client: httpx.AsyncClient,
+        builder: Optional[BaseIncrementalBuilder],
+        batch_stats: Dict[str, Any],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+        keep_results: bool,
+        prepare_batch: Optional[callable] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate fixed batches one after another (batch barrier mode)
+
+        Returns:
+            All results in chunk order if keep_results, else []
+        """
+        total_chunks = len(chunks)
+        total_batches = (total_chunks + self.batch_size - 1) // self.batch_size
+        all_results = []
+
         for batch_idx in range(total_batches):
             # Get batch chunks
             start_idx = batch_idx * self.batch_size
@@ -168,6 +248,9 @@ class StreamingBatchProcessor:
 
             logger.info(f"Processing batch {batch_idx + 1}/{total_batches}: Chunks {start_idx + 1}-{end_idx}")
 
+            if prepare_batch:
+                await prepare_batch(batch_chunks)
+
             # Translate batch
             batch_results = await self._translate_batch(
                 batch_chunks=batch_chunks,
@@ -178,7 +261,11 @@ class StreamingBatchProcessor:
             )
 
             # Add to results
-            all_results.extend(batch_results)
+            if keep_results:
+                all_results.extend(batch_results)
+            if result_callback:
+                for result in batch_results:
+                    result_callback(result)
             batch_stats['chunks_processed'] += len(batch_results)
 
             # Export batch if enabled
@@ -232,22 +319,172 @@ class StreamingBatchProcessor:
 
             batch_stats['batches_processed'] += 1
 
-        # Merge partial exports if created
-        if builder and batch_stats['partial_exports']:
-            logger.info(f"Merging {len(batch_stats['partial_exports'])} partial exports...")
-            final_output = await builder.merge_all()
-            format_name = job.output_format.upper()
-            logger.info(f"Final {format_name}: {final_output}")
+        return all_results
 
-        # Broadcast completion
+    async def _process_sliding_window(
+        self,
+        job: TranslationJob,
+        chunks: List[TranslationChunk],
+        translator: Any,
+        http_client: httpx.AsyncClient,
+        builder: Optional[BaseIncrementalBuilder],
+        batch_stats: Dict[str, Any],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+        keep_results: bool,
+        prepare_batch: Optional[callable] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate chunks with a continuous window instead of batch barriers
+
+        Up to max_concurrency chunks run at once; a new chunk starts as
+        soon as any finishes. Finished chunks wait in a reorder buffer until
+        every earlier chunk is done, then the contiguous prefix is handed
+        to the builder (in groups of batch_size) and dropped from memory.
+        Failed chunks (after retries) are skipped, as in batch mode.
+        prepare_batch runs for each group of batch_size chunks just before
+        the first of them is admitted.
+
+        Returns:
+            All results in chunk order if keep_results, else []
+        """
+        from core.parallel import ParallelProcessor, Task, TaskStatus
+
+        processor = ParallelProcessor(
+            max_concurrency=self.max_concurrency,
+            max_retries=5,
+            timeout=120.0,
+            show_progress=False
+        )
+
+        def translate(client, chunk):
+            return translator.translate_chunk(client, chunk)
+
+        async def run(idx: int):
+            task = await processor.process_task(Task(id=idx, data=chunks[idx]), translate, http_client)
+            return idx, task
+
+        total_chunks = len(chunks)
+        all_results: List[TranslationResult] = []
+        finished: Dict[int, Optional[TranslationResult]] = {}  # Reorder buffer
+        ready: List[TranslationResult] = []  # Contiguous prefix not yet exported
+        in_flight: Set[asyncio.Task] = set()
+        next_admit = 0
+        next_flush = 0
+        next_prepare = 0
+
+        try:
+            while next_flush < total_chunks:
+                # Admit new chunks while slots are free and the window allows
+                while (
+                    next_admit < total_chunks
+                    and len(in_flight) < self.max_concurrency
+                    and next_admit < next_flush + self.window_size
+                ):
+                    if prepare_batch and next_admit == next_prepare:
+                        next_prepare = min(next_admit + self.batch_size, total_chunks)
+                        await prepare_batch(chunks[next_admit:next_prepare])
+                    in_flight.add(asyncio.create_task(run(next_admit)))
+                    next_admit += 1
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for finished_task in done:
+                    idx, task = finished_task.result()
+                    processor.stats.update(task)
+                    if task.status == TaskStatus.COMPLETED and task.result is not None:
+                        finished[idx] = task.result
+                        if self.progress_streamer:
+                            await self.progress_streamer.broadcast_chunk_translated(
+                                job_id=job.job_id,
+                                chunk_id=task.result.chunk_id,
+                                preview=task.result.translated[:200],  # First 200 chars
+                                quality_score=task.result.quality_score
+                            )
+                    else:
+                        finished[idx] = None
+                        logger.warning(f"Chunk {idx + 1} failed after retries: {task.error}")
+
+                # Move the contiguous prefix out of the reorder buffer
+                while next_flush in finished:
+                    result = finished.pop(next_flush)
+                    next_flush += 1
+                    if result is not None:
+                        ready.append(result)
+
+                if len(ready) >= self.batch_size or next_flush == total_chunks:
+                    if keep_results:
+                        all_results.extend(ready)
+                    await self._flush_window(
+                        job=job,
+                        window_results=ready,
+                        builder=builder,
+                        batch_stats=batch_stats,
+                        processed=next_flush,
+                        total_chunks=total_chunks,
+                        progress_callback=progress_callback,
+                        result_callback=result_callback
+                    )
+                    ready = []
+        finally:
+            for pending_task in in_flight:
+                pending_task.cancel()
+
+        return all_results
+
+    async def _flush_window(
+        self,
+        job: TranslationJob,
+        window_results: List[TranslationResult],
+        builder: Optional[BaseIncrementalBuilder],
+        batch_stats: Dict[str, Any],
+        processed: int,
+        total_chunks: int,
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable]
+    ):
+        """Export an in-order group of results and report progress"""
+        batch_idx = batch_stats['batches_processed']
+        batch_stats['chunks_processed'] += len(window_results)
+
+        if result_callback:
+            for result in window_results:
+                result_callback(result)
+
+        if builder and window_results:
+            partial_file = await builder.add_batch(
+                batch_results=window_results,
+                batch_idx=batch_idx
+            )
+
+            if self.progress_streamer:
+                await self.progress_streamer.broadcast_batch_exported(
+                    job_id=job.job_id,
+                    batch_idx=batch_idx,
+                    partial_file=str(partial_file)
+                )
+
+            batch_stats['partial_exports'].append(str(partial_file))
+            logger.debug(f"Partial export saved: {partial_file.name}")
+
+        batch_stats['batches_processed'] += 1
+
+        progress = processed / total_chunks if total_chunks else 1.0
         if self.progress_streamer:
-            await self.progress_streamer.broadcast_job_completed(
+            await self.progress_streamer.broadcast_batch_completed(
                 job_id=job.job_id,
-                total_chunks=total_chunks,
-                memory_saved_mb=batch_stats['memory_saved_bytes'] / 1024 / 1024
+                batch_idx=batch_idx + 1,
+                total_batches=(total_chunks + self.batch_size - 1) // self.batch_size,
+                progress=progress,
+                chunks_completed=batch_stats['chunks_processed']
             )
 
-        return all_results, batch_stats
+        if progress_callback:
+            await progress_callback(
+                completed_chunks=batch_stats['chunks_processed'],
+                total_chunks=total_chunks,
+                progress=progress
+            )
 
     async def _translate_batch(
         self,
@@ -274,7 +511,7 @@ class StreamingBatchProcessor:
         from core.parallel import ParallelProcessor
 
         processor = ParallelProcessor(
-            max_concurrency=10,  # Parallel within batch
+            max_concurrency=self.max_concurrency,  # Parallel within batch
             max_retries=5,
             timeout=120.0,
             show_progress=False
@@ -324,6 +561,8 @@ class StreamingBatchProcessor:
         """
         return {
             'batch_size': self.batch_size,
+            'sliding_window': self.sliding_window,
+            'max_concurrency': self.max_concurrency,
             'streaming_enabled': self.enable_streaming,
             'partial_export_enabled': self.enable_partial_export,
             'has_websocket': self.websocket_manager is not None
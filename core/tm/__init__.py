@@ -7,10 +7,12 @@ Key components:
 - TMRepository: Database operations
 - Segmenter: Split text into segments
 - Matcher: Find similar segments
+- TMIndex: N-gram candidate index for fuzzy matching
 """
 
 from .service import TMService, get_tm_service
 from .matcher import TMMatcher
+from .index import TMIndex
 from .segmenter import Segmenter
 from .models import TranslationMemory, TMSegment
 
@@ -18,6 +20,7 @@ __all__ = [
     "TMService",
     "get_tm_service",
     "TMMatcher",
+    "TMIndex",
     "Segmenter",
     "TranslationMemory",
     "TMSegment",
@@ -0,0 +1,386 @@
+"""
+TM Candidate Index
+Character n-gram inverted index for shortlisting fuzzy match candidates.
+
+Scanning every segment with SequenceMatcher is O(N) per query. The index
+keeps, for each TM, a posting list per character trigram so a query only
+scores the few dozen segments that share the most trigrams with it.
+
+The index is resident for the life of the process and holds no ORM
+objects: per segment it keeps only the columns matching needs (ID, hash,
+normalized source, word length, quality). Full TMSegment rows are
+fetched from the database for the winning matches only.
+"""
+import logging
+import threading
+from array import array
+from functools import partial
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .models import TMSegment, normalize_text
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+    # Slot arrays are array("l"), i.e. C long
+    _SLOT_DTYPE = np.dtype("l")
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+
+NGRAM_SIZE = 3
+
+
+def extract_ngrams(normalized: str, n: int = NGRAM_SIZE) -> set:
+    """
+    Get the set of character n-grams of normalized text.
+
+    The text is padded with spaces so short words still produce grams
+    and word boundaries contribute to the overlap.
+    """
+    padded = f" {normalized} "
+    if len(padded) < n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+# segment IDs -> TMSegment rows (missing IDs are left out)
+SegmentFetcher = Callable[[List[str]], Iterable[TMSegment]]
+
+
+class IndexEntry(NamedTuple):
+    """Compact reference to an indexed segment."""
+    id: str
+    quality_score: float
+
+
+class TMIndex:
+    """
+    In-memory candidate index over the segments of one TM.
+
+    Segments occupy integer slots. Deleted or replaced segments leave a
+    dead slot behind which is reclaimed by ``compact()`` once dead slots
+    outnumber live ones.
+
+    ``add()`` accepts anything with ``id``, ``source_text``,
+    ``source_hash`` and ``quality_score`` attributes (ORM segments or
+    plain column rows); only those columns are kept.
+    """
+
+    # Grams present in more than this share of segments carry almost no
+    # signal and are skipped during candidate counting.
+    STOP_GRAM_RATIO = 0.2
+
+    # Below this size every live segment is a candidate.
+    MIN_INDEXED_SEGMENTS = 64
+
+    def __init__(
+        self,
+        tm_id: str,
+        fetch_segments: Optional[SegmentFetcher] = None,
+        n: int = NGRAM_SIZE,
+    ):
+        """
+        Args:
+            tm_id: TM ID
+            fetch_segments: Loads full segments by ID for hydrate()
+            n: N-gram size
+        """
+        self.tm_id = tm_id
+        self.n = n
+        self._fetch_segments = fetch_segments
+
+        # Columns by slot; a dead slot has ID None and word length -1
+        self._ids: List[Optional[str]] = []
+        self._hashes: List[Optional[str]] = []
+        self._normalized: List[str] = []
+        self._quality = array("d")
+        self._word_lengths = array("l")
+        self._gram_counts = array("l")
+        self._postings: Dict[str, array] = {}
+        self._slot_by_id: Dict[str, int] = {}
+        self._slot_by_hash: Dict[str, int] = {}
+        self._dead = 0
+
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    # ==================== MAINTENANCE ====================
+
+    def add(self, segment: TMSegment):
+        """Add or replace a segment."""
+        with self._lock:
+            self._add_columns(
+                segment.id,
+                segment.source_hash,
+                normalize_text(segment.source_text),
+                len(segment.source_text.split()),
+                segment.quality_score if segment.quality_score is not None else 0.8,
+            )
+
+    def _add_columns(
+        self,
+        segment_id: str,
+        source_hash: str,
+        normalized: str,
+        words: int,
+        quality: float,
+    ):
+        if segment_id in self._slot_by_id:
+            self._remove_slot(self._slot_by_id[segment_id])
+
+        grams = extract_ngrams(normalized, self.n)
+        slot = len(self._ids)
+
+        self._ids.append(segment_id)
+        self._hashes.append(source_hash)
+        self._normalized.append(normalized)
+        self._quality.append(quality)
+        self._word_lengths.append(words)
+        self._gram_counts.append(len(grams))
+        self._slot_by_id[segment_id] = slot
+        self._slot_by_hash[source_hash] = slot
+
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("l")
+            postings.append(slot)
+
+    def add_many(self, segments: Iterable[TMSegment]):
+        """Add several segments."""
+        with self._lock:
+            for segment in segments:
+                self.add(segment)
+
+    def remove(self, segment_id: str) -> bool:
+        """Remove a segment by ID."""
+        with self._lock:
+            slot = self._slot_by_id.get(segment_id)
+            if slot is None:
+                return False
+            self._remove_slot(slot)
+            if self._dead > len(self._slot_by_id) and self._dead > self.MIN_INDEXED_SEGMENTS:
+                self.compact()
+            return True
+
+    def _remove_slot(self, slot: int):
+        segment_id = self._ids[slot]
+        if segment_id is None:
+            return
+        source_hash = self._hashes[slot]
+        self._ids[slot] = None
+        self._hashes[slot] = None
+        self._word_lengths[slot] = -1
+        self._slot_by_id.pop(segment_id, None)
+        if self._slot_by_hash.get(source_hash) == slot:
+            del self._slot_by_hash[source_hash]
+        self._dead += 1
+
+    def compact(self):
+        """Rebuild postings without dead slots."""
+        with self._lock:
+            live = [
+                (self._ids[slot], self._hashes[slot], self._normalized[slot],
+                 self._word_lengths[slot], self._quality[slot])
+                for slot in range(len(self._ids))
+                if self._ids[slot] is not None
+            ]
+            self._ids = []
+            self._hashes = []
+            self._normalized = []
+            self._quality = array("d")
+            self._word_lengths = array("l")
+            self._gram_counts = array("l")
+            self._postings = {}
+            self._slot_by_id = {}
+            self._slot_by_hash = {}
+            self._dead = 0
+            for columns in live:
+                self._add_columns(*columns)
+
+    # ==================== LOOKUP ====================
+
+    def _entry(self, slot: int) -> IndexEntry:
+        return IndexEntry(self._ids[slot], self._quality[slot])
+
+    def get_by_hash(self, source_hash: str) -> Optional[IndexEntry]:
+        """Exact lookup by source hash."""
+        with self._lock:
+            slot = self._slot_by_hash.get(source_hash)
+            return self._entry(slot) if slot is not None else None
+
+    def entries(self) -> List[IndexEntry]:
+        """All live segments."""
+        with self._lock:
+            return [self._entry(slot) for slot in self._slot_by_id.values()]
+
+    def hydrate(self, segment_ids: List[str]) -> Dict[str, TMSegment]:
+        """
+        Load full segments for the given IDs in one query.
+
+        IDs deleted since they were matched are missing from the result.
+        """
+        if not segment_ids:
+            return {}
+        if self._fetch_segments is None:
+            raise RuntimeError(f"TM index {self.tm_id} has no segment fetcher")
+        return {seg.id: seg for seg in self._fetch_segments(list(dict.fromkeys(segment_ids)))}
+
+    def candidates(
+        self,
+        source_normalized: str,
+        source_words: int,
+        max_candidates: int = 50,
+    ) -> List[Tuple[IndexEntry, str]]:
+        """
+        Shortlist segments likely to match the source.
+
+        Applies the same word-length filter as the linear scan, then ranks
+        the remaining segments by the Dice coefficient of their n-gram sets.
+
+        Returns:
+            List of (entry, normalized_source) pairs, best first
+        """
+        with self._lock:
+            live = len(self._slot_by_id)
+            if live == 0:
+                return []
+
+            if live <= self.MIN_INDEXED_SEGMENTS:
+                return [
+                    (self._entry(slot), self._normalized[slot])
+                    for slot, segment_id in enumerate(self._ids)
+                    if segment_id is not None
+                    and self._length_ok(self._word_lengths[slot], source_words)
+                ]
+
+            stop_limit = max(self.MIN_INDEXED_SEGMENTS, int(live * self.STOP_GRAM_RATIO))
+            query_grams = extract_ngrams(source_normalized, self.n)
+            postings = [
+                self._postings[g] for g in query_grams if g in self._postings
+            ]
+            informative = [p for p in postings if len(p) <= stop_limit]
+            if not informative:
+                # Query made only of very common grams: fall back to them
+                informative = postings
+
+            if HAS_NUMPY:
+                slots = self._rank_numpy(
+                    informative, len(query_grams), source_words, max_candidates
+                )
+                return [(self._entry(slot), self._normalized[slot]) for slot in slots]
+
+            counts: Dict[int, int] = {}
+            get = counts.get
+            for plist in informative:
+                for slot in plist:
+                    counts[slot] = get(slot, 0) + 1
+
+            ranked = []
+            ids = self._ids
+            lengths = self._word_lengths
+            gram_counts = self._gram_counts
+            query_size = len(query_grams)
+            for slot, shared in counts.items():
+                if ids[slot] is None:
+                    continue
+                if not self._length_ok(lengths[slot], source_words):
+                    continue
+                ranked.append((2.0 * shared / (query_size + gram_counts[slot]), slot))
+
+            ranked.sort(reverse=True)
+            return [
+                (self._entry(slot), self._normalized[slot])
+                for _, slot in ranked[:max_candidates]
+            ]
+
+    def _rank_numpy(
+        self,
+        postings: List[array],
+        query_size: int,
+        source_words: int,
+        max_candidates: int,
+    ) -> List[int]:
+        """Vectorized version of the counting and Dice ranking in candidates()."""
+        slots = np.frombuffer(b"".join(postings), dtype=_SLOT_DTYPE)
+        shared = np.bincount(slots, minlength=len(self._ids))
+        hit = np.flatnonzero(shared)
+
+        # Dead slots have a word length of -1
+        lengths = np.frombuffer(self._word_lengths, dtype=_SLOT_DTYPE)[hit]
+        longest = np.maximum(lengths, source_words)
+        keep = (lengths >= 0) & (
+            np.abs(lengths - source_words) / np.maximum(longest, 1) <= 0.5
+        )
+        hit = hit[keep]
+
+        gram_counts = np.frombuffer(self._gram_counts, dtype=_SLOT_DTYPE)[hit]
+        dice = 2.0 * shared[hit] / (query_size + gram_counts)
+
+        # Same order as sorting (dice, slot) tuples in reverse
+        order = np.lexsort((-hit, -dice))[:max_candidates]
+        return hit[order].tolist()
+
+    @staticmethod
+    def _length_ok(seg_words: int, source_words: int) -> bool:
+        """Mirror of TMMatcher's word-length filter."""
+        longest = max(seg_words, source_words)
+        if longest == 0:
+            return True
+        return abs(seg_words - source_words) / longest <= 0.5
+
+
+class TMIndexRegistry:
+    """
+    Process-wide registry of TM indexes, keyed by TM ID.
+
+    Indexes are built lazily on first lookup and then kept in sync by
+    the repository, so they persist for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[str, TMIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tm_id: str) -> Optional[TMIndex]:
+        """Get index if already built."""
+        return self._indexes.get(tm_id)
+
+    def get_or_build(self, tm_id: str, loader, fetch_segments=None) -> TMIndex:
+        """
+        Get index, building it from ``loader(tm_id)`` on first use.
+
+        Args:
+            tm_id: TM ID
+            loader: Callable returning (or streaming) the index columns
+                of every segment of the TM
+            fetch_segments: Callable ``(tm_id, segment_ids)`` returning
+                full segments, used to hydrate matches
+        """
+        index = self._indexes.get(tm_id)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._indexes.get(tm_id)
+            if index is None:
+                fetch = partial(fetch_segments, tm_id) if fetch_segments else None
+                index = TMIndex(tm_id, fetch_segments=fetch)
+                index.add_many(loader(tm_id))
+                self._indexes[tm_id] = index
+                logger.info(f"Built TM index for {tm_id}: {len(index)} segments")
+        return index
+
+    def invalidate(self, tm_id: Optional[str] = None):
+        """Drop one index, or all of them."""
+        with self._lock:
+            if tm_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(tm_id, None)
+
@@ -4,6 +4,9 @@ Translation Memory Import/Export Module
 Supports:
 - TMX 1.4b (Translation Memory eXchange) - Industry standard
 - CSV (Simple format for spreadsheets)
+
+TMX is read and written incrementally (iter_tmx) so multi-gigabyte
+memories never have to fit in memory as one XML tree.
 """
 
 import csv
@@ -11,12 +14,17 @@ import io
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, BinaryIO, TextIO
+from typing import List, Dict, Iterable, Iterator, Optional, BinaryIO, TextIO, Union
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# File path, or a binary/text file object
+XMLSource = Union[str, Path, BinaryIO, TextIO]
+
 
 @dataclass
 class TMSegmentData:
@@ -55,11 +63,26 @@ class TMExporter:
         Returns:
             TMX XML string
         """
-        # Create TMX root
-        root = ET.Element("tmx", version="1.4")
+        return "".join(TMExporter.iter_tmx(
+            tm_name, segments, source_lang, target_lang, created_by
+        ))
 
-        # Header
-        header = ET.SubElement(root, "header")
+    @staticmethod
+    def iter_tmx(
+        tm_name: str,
+        segments: Iterable[Dict],
+        source_lang: str = "en",
+        target_lang: str = "vi",
+        created_by: str = "AI Publisher Pro"
+    ) -> Iterator[str]:
+        """
+        Export segments to TMX 1.4b, one translation unit at a time.
+
+        Same output as to_tmx(), but ``segments`` is consumed lazily and
+        the document is yielded in pieces, so it can be written to a file
+        or a streaming response as the segments are read.
+        """
+        header = ET.Element("header")
         header.set("creationtool", "AI Publisher Pro")
         header.set("creationtoolversion", "3.0")
         header.set("datatype", "plaintext")
@@ -74,52 +97,74 @@ class TMExporter:
         note = ET.SubElement(header, "note")
         note.text = f"Translation Memory: {tm_name}"
 
-        # Body with translation units
-        body = ET.SubElement(root, "body")
-
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n<tmx version="1.4">'
+        yield ET.tostring(header, encoding="unicode", method="xml")
+        yield "<body>"
         for i, seg in enumerate(segments):
-            tu = ET.SubElement(body, "tu")
-            tu.set("tuid", str(i + 1))
+            tu = TMExporter._build_tu(i, seg, source_lang, target_lang)
+            yield ET.tostring(tu, encoding="unicode", method="xml")
+        yield "</body></tmx>"
 
-            # Add creation date if available
-            if seg.get("created_at"):
-                try:
-                    dt = datetime.fromisoformat(seg["created_at"].replace("Z", "+00:00"))
-                    tu.set("creationdate", dt.strftime("%Y%m%dT%H%M%SZ"))
-                except (ValueError, AttributeError):
-                    # Invalid date format
-                    pass
+    @staticmethod
+    def write_tmx(
+        target: Union[str, Path, BinaryIO],
+        tm_name: str,
+        segments: Iterable[Dict],
+        source_lang: str = "en",
+        target_lang: str = "vi",
+        created_by: str = "AI Publisher Pro"
+    ) -> None:
+        """Write TMX to a path or binary file object as segments are read."""
+        if isinstance(target, (str, Path)):
+            with open(target, "wb") as f:
+                TMExporter.write_tmx(f, tm_name, segments, source_lang, target_lang, created_by)
+            return
+        for piece in TMExporter.iter_tmx(tm_name, segments, source_lang, target_lang, created_by):
+            target.write(piece.encode("utf-8"))
 
-            # Add quality score as prop
-            if seg.get("quality_score"):
-                prop = ET.SubElement(tu, "prop", type="quality")
-                prop.text = str(seg["quality_score"])
-
-            # Add source type as prop
-            if seg.get("source_type"):
-                prop = ET.SubElement(tu, "prop", type="source_type")
-                prop.text = seg["source_type"]
-
-            # Add notes if present
-            if seg.get("notes"):
-                note = ET.SubElement(tu, "note")
-                note.text = seg["notes"]
-
-            # Source segment
-            tuv_source = ET.SubElement(tu, "tuv")
-            tuv_source.set("{http://www.w3.org/XML/1998/namespace}lang", source_lang)
-            seg_source = ET.SubElement(tuv_source, "seg")
-            seg_source.text = seg.get("source_text", "")
-
-            # Target segment
-            tuv_target = ET.SubElement(tu, "tuv")
-            tuv_target.set("{http://www.w3.org/XML/1998/namespace}lang", target_lang)
-            seg_target = ET.SubElement(tuv_target, "seg")
-            seg_target.text = seg.get("target_text", "")
-
-        # Convert to string with proper declaration
-        xml_str = ET.tostring(root, encoding="unicode", method="xml")
-        return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
+    @staticmethod
+    def _build_tu(i: int, seg: Dict, source_lang: str, target_lang: str) -> ET.Element:
+        """Build one <tu> element."""
+        tu = ET.Element("tu")
+        tu.set("tuid", str(i + 1))
+
+        # Add creation date if available
+        if seg.get("created_at"):
+            try:
+                dt = datetime.fromisoformat(seg["created_at"].replace("Z", "+00:00"))
+                tu.set("creationdate", dt.strftime("%Y%m%dT%H%M%SZ"))
+            except (ValueError, AttributeError):
+                # Invalid date format
+                pass
+
+        # Add quality score as prop
+        if seg.get("quality_score"):
+            prop = ET.SubElement(tu, "prop", type="quality")
+            prop.text = str(seg["quality_score"])
+
+        # Add source type as prop
+        if seg.get("source_type"):
+            prop = ET.SubElement(tu, "prop", type="source_type")
+            prop.text = seg["source_type"]
+
+        # Add notes if present
+        if seg.get("notes"):
+            note = ET.SubElement(tu, "note")
+            note.text = seg["notes"]
+
+        # Source segment
+        tuv_source = ET.SubElement(tu, "tuv")
+        tuv_source.set(XML_LANG, source_lang)
+        seg_source = ET.SubElement(tuv_source, "seg")
+        seg_source.text = seg.get("source_text", "")
+
+        # Target segment
+        tuv_target = ET.SubElement(tu, "tuv")
+        tuv_target.set(XML_LANG, target_lang)
+        seg_target = ET.SubElement(tuv_target, "seg")
+        seg_target.text = seg.get("target_text", "")
+
+        return tu
 
     @staticmethod
     def to_csv(
@@ -170,107 +215,144 @@ class TMImporter:
         Returns:
             Tuple of (metadata dict, list of TMSegmentData)
         """
-        segments = []
-        metadata = {
+        metadata: Dict = {}
+        segments = list(TMImporter.iter_tmx(io.StringIO(content), metadata))
+        logger.info(f"Imported {len(segments)} segments from TMX")
+        return metadata, segments
+
+    @staticmethod
+    def iter_tmx(source: XMLSource, metadata: Optional[Dict] = None) -> Iterator[TMSegmentData]:
+        """
+        Stream segments from a TMX file.
+
+        Parses with iterparse and clears every <tu> once it is read, so
+        memory stays flat regardless of file size.
+
+        Args:
+            source: File path or file object (binary or text)
+            metadata: Dict filled with name, source_lang, target_lang and
+                tool as the header and first segment are read
+
+        Yields:
+            TMSegmentData per translation unit with both texts
+
+        Raises:
+            ValueError: If the XML is malformed (possibly after some segments)
+        """
+        if metadata is None:
+            metadata = {}
+        metadata.update({
             "source_lang": "en",
             "target_lang": "vi",
             "name": "Imported TM",
             "tool": None,
-        }
+        })
+        found_target = False
 
         try:
-            root = ET.fromstring(content)
-
-            # Parse header
-            header = root.find("header")
-            if header is not None:
-                metadata["source_lang"] = header.get("srclang", "en")
-                metadata["tool"] = header.get("creationtool")
-
-                # Get TM name from note
-                note = header.find("note")
-                if note is not None and note.text:
-                    if note.text.startswith("Translation Memory: "):
-                        metadata["name"] = note.text[20:]
-                    else:
-                        metadata["name"] = note.text
-
-            # Parse body
-            body = root.find("body")
-            if body is None:
-                return metadata, segments
-
-            for tu in body.findall("tu"):
-                source_text = ""
-                target_text = ""
-                source_lang = metadata["source_lang"]
-                target_lang = metadata.get("target_lang", "vi")
-                quality_score = 0.8
-                source_type = "imported"
-                notes = None
-                created_at = None
-
-                # Parse creation date
-                if tu.get("creationdate"):
-                    try:
-                        created_at = datetime.strptime(
-                            tu.get("creationdate"), "%Y%m%dT%H%M%SZ"
-                        )
-                    except ValueError:
-                        # Invalid date format
-                        pass
-
-                # Parse properties
-                for prop in tu.findall("prop"):
-                    prop_type = prop.get("type")
-                    if prop_type == "quality" and prop.text:
-                        try:
-                            quality_score = float(prop.text)
-                        except ValueError:
-                            # Invalid quality score format
-                            pass
-                    elif prop_type == "source_type" and prop.text:
-                        source_type = prop.text
-
-                # Parse notes
-                note = tu.find("note")
-                if note is not None:
-                    notes = note.text
-
-                # Parse TUVs (translation unit variants)
-                for tuv in tu.findall("tuv"):
-                    lang = tuv.get("{http://www.w3.org/XML/1998/namespace}lang")
-                    seg = tuv.find("seg")
-
-                    if seg is not None and seg.text:
-                        if lang == source_lang or lang == metadata["source_lang"]:
-                            source_text = seg.text
-                        else:
-                            target_text = seg.text
-                            target_lang = lang or target_lang
-
-                if source_text and target_text:
-                    segments.append(TMSegmentData(
-                        source_text=source_text,
-                        target_text=target_text,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        quality_score=quality_score,
-                        source_type=source_type,
-                        notes=notes,
-                        created_at=created_at,
-                    ))
-
-            # Update target_lang if found
-            if segments:
-                metadata["target_lang"] = segments[0].target_lang
+            body = None
+            for event, elem in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == "body":
+                        body = elem
+                    continue
+
+                if elem.tag == "header":
+                    TMImporter._read_header(elem, metadata)
+                    elem.clear()
+                elif elem.tag == "tu":
+                    segment = TMImporter._parse_tu(elem, metadata)
+                    # Drop the parsed unit (and its siblings) from the tree
+                    elem.clear()
+                    if body is not None:
+                        body.clear()
+                    if segment is not None:
+                        if not found_target:
+                            metadata["target_lang"] = segment.target_lang
+                            found_target = True
+                        yield segment
 
         except ET.ParseError as e:
             logger.error(f"TMX parse error: {e}")
             raise ValueError(f"Invalid TMX format: {e}")
 
-        logger.info(f"Imported {len(segments)} segments from TMX")
-        return metadata, segments
+    @staticmethod
+    def _read_header(header: ET.Element, metadata: Dict):
+        metadata["source_lang"] = header.get("srclang", "en")
+        metadata["tool"] = header.get("creationtool")
+
+        # Get TM name from note
+        note = header.find("note")
+        if note is not None and note.text:
+            if note.text.startswith("Translation Memory: "):
+                metadata["name"] = note.text[20:]
+            else:
+                metadata["name"] = note.text
+
+    @staticmethod
+    def _parse_tu(tu: ET.Element, metadata: Dict) -> Optional[TMSegmentData]:
+        """Parse one <tu>; None unless it has both a source and a target text."""
+        source_text = ""
+        target_text = ""
+        source_lang = metadata["source_lang"]
+        target_lang = metadata.get("target_lang", "vi")
+        quality_score = 0.8
+        source_type = "imported"
+        notes = None
+        created_at = None
+
+        # Parse creation date
+        if tu.get("creationdate"):
+            try:
+                created_at = datetime.strptime(
+                    tu.get("creationdate"), "%Y%m%dT%H%M%SZ"
+                )
+            except ValueError:
+                # Invalid date format
+                pass
+
+        # Parse properties
+        for prop in tu.findall("prop"):
+            prop_type = prop.get("type")
+            if prop_type == "quality" and prop.text:
+                try:
+                    quality_score = float(prop.text)
+                except ValueError:
+                    # Invalid quality score format
+                    pass
+            elif prop_type == "source_type" and prop.text:
+                source_type = prop.text
+
+        # Parse notes
+        note = tu.find("note")
+        if note is not None:
+            notes = note.text
+
+        # Parse TUVs (translation unit variants)
+        for tuv in tu.findall("tuv"):
+            lang = tuv.get(XML_LANG)
+            seg = tuv.find("seg")
+
+            if seg is not None and seg.text:
+                if lang == source_lang:
+                    source_text = seg.text
+                else:
+                    target_text = seg.text
+                    target_lang = lang or target_lang
+
+        if not (source_text and target_text):
+            return None
+
+        return TMSegmentData(
+            source_text=source_text,
+            target_text=target_text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            quality_score=quality_score,
+            source_type=source_type,
+            notes=notes,
+            created_at=created_at,
+        )
 
     @staticmethod
     def from_csv(
@@ -5,12 +5,14 @@ Find similar segments using exact and fuzzy matching.
 import logging
 import hashlib
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 
 from .models import TMSegment, compute_hash, normalize_text
 from .schemas import MatchType
+from .index import IndexEntry, TMIndex
+from ..edit_distance import lcs_length
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,13 @@ class MatchResult:
         return f"<Match {self.similarity:.1%} ({self.match_type.value})>"
 
 
+class IndexedMatch(NamedTuple):
+    """A scored index entry, before its segment is loaded."""
+    index: TMIndex
+    entry: IndexEntry
+    similarity: float
+
+
 class TMMatcher:
     """
     Translation Memory Matcher.
@@ -33,8 +42,14 @@ class TMMatcher:
     Finds exact and fuzzy matches for source text.
     Uses hash-based O(1) lookup for exact matches,
     Levenshtein distance for fuzzy matches.
+
+    When a TMIndex is supplied, fuzzy matching only scores the
+    candidates shortlisted by the index instead of every segment.
     """
 
+    # Number of index candidates scored per query
+    MAX_CANDIDATES = 50
+
     # Similarity thresholds
     EXACT_THRESHOLD = 1.0
     NEAR_EXACT_THRESHOLD = 0.95
@@ -119,9 +134,9 @@ class TMMatcher:
 
             # Compute similarity
             seg_norm = self._normalize(segment.source_text)
-            similarity = self._compute_similarity(source_norm, seg_norm)
+            similarity = self._compute_similarity_bounded(source_norm, seg_norm, min_similarity)
 
-            if similarity >= min_similarity:
+            if similarity is not None:
                 match_type = self._get_match_type(similarity)
                 matches.append(MatchResult(
                     segment=segment,
@@ -134,6 +149,96 @@ class TMMatcher:
 
         return matches[:max_results]
 
+    def find_fuzzy_indexed(
+        self,
+        source_text: str,
+        indexes: List[TMIndex],
+        min_similarity: float = None,
+        max_results: int = 5,
+        max_candidates: int = None,
+    ) -> List[MatchResult]:
+        """
+        Find fuzzy matches using candidate indexes.
+
+        Same scoring as find_fuzzy, but only the top candidates of each
+        index (by n-gram overlap) are scored, and only the returned
+        matches are loaded from the database.
+
+        Args:
+            source_text: Text to match
+            indexes: Indexes of the TMs to search
+            min_similarity: Minimum similarity threshold
+            max_results: Maximum matches to return
+            max_candidates: Candidates scored per index
+
+        Returns:
+            List of matches sorted by similarity (descending)
+        """
+        scored = self._score_indexed(
+            source_text, indexes, min_similarity, max_results, max_candidates
+        )
+        return [m for m in self._hydrate(scored) if m is not None]
+
+    def _score_indexed(
+        self,
+        source_text: str,
+        indexes: List[TMIndex],
+        min_similarity: Optional[float],
+        max_results: int,
+        max_candidates: Optional[int],
+    ) -> List[IndexedMatch]:
+        """Best index entries for the source, not yet hydrated."""
+        min_similarity = min_similarity or self.fuzzy_threshold
+        max_candidates = max_candidates or self.MAX_CANDIDATES
+
+        source_norm = self._normalize(source_text)
+        source_words = len(source_text.split())
+
+        matches: List[IndexedMatch] = []
+        # Once max_results matches are found, weaker candidates can be skipped
+        bound = min_similarity
+
+        for index in indexes:
+            for entry, seg_norm in index.candidates(source_norm, source_words, max_candidates):
+                similarity = self._compute_similarity_bounded(source_norm, seg_norm, bound)
+
+                if similarity is not None:
+                    matches.append(IndexedMatch(index, entry, similarity))
+                    if len(matches) >= max_results:
+                        scores = sorted((m.similarity for m in matches), reverse=True)
+                        bound = max(bound, scores[max_results - 1])
+
+        matches.sort(key=lambda m: (m.similarity, m.entry.quality_score), reverse=True)
+
+        return matches[:max_results]
+
+    def _hydrate(self, matches: List[Optional[IndexedMatch]]) -> List[Optional[MatchResult]]:
+        """
+        Turn index matches into MatchResults with one fetch per index.
+
+        Positions are preserved; matches whose segment was deleted in the
+        meantime become None.
+        """
+        wanted: Dict[int, Tuple[TMIndex, List[str]]] = {}
+        for match in matches:
+            if match is not None:
+                wanted.setdefault(id(match.index), (match.index, []))[1].append(match.entry.id)
+
+        loaded = {
+            key: index.hydrate(segment_ids)
+            for key, (index, segment_ids) in wanted.items()
+        }
+
+        results: List[Optional[MatchResult]] = []
+        for match in matches:
+            segment = loaded[id(match.index)].get(match.entry.id) if match else None
+            results.append(MatchResult(
+                segment=segment,
+                similarity=match.similarity,
+                match_type=self._get_match_type(match.similarity),
+            ) if segment is not None else None)
+        return results
+
     def find_best(
         self,
         source_text: str,
@@ -171,44 +276,130 @@ class TMMatcher:
         source_lang: str = "en",
         target_lang: str = "vi",
         min_similarity: float = None,
+        indexes: Optional[List[TMIndex]] = None,
+        max_candidates: int = None,
     ) -> List[Optional[MatchResult]]:
         """
         Find matches for multiple source texts.
 
+        Repeated source texts are matched once.
+
         Args:
             source_texts: List of texts to match
-            segments: Segments to search
+            segments: Segments to search (ignored when indexes are given)
             source_lang: Source language
             target_lang: Target language
             min_similarity: Minimum similarity
+            indexes: Candidate indexes to search instead of scanning segments
+            max_candidates: Candidates scored per index (indexed search only)
 
         Returns:
             List of best matches (None for no match)
         """
+        if indexes is not None:
+            return self._batch_match_indexed(
+                source_texts, source_lang, target_lang, min_similarity, indexes, max_candidates
+            )
+
         # Build hash index for O(1) exact lookup
         hash_index: Dict[str, TMSegment] = {}
         for seg in segments:
             hash_index[seg.source_hash] = seg
 
-        results = []
+        best: Dict[str, Optional[MatchResult]] = {}
 
         for source_text in source_texts:
+            if source_text in best:
+                continue
+
             # Try exact match first
             source_hash = compute_hash(source_text, source_lang, target_lang)
-            if source_hash in hash_index:
-                segment = hash_index[source_hash]
-                results.append(MatchResult(
+            segment = hash_index.get(source_hash)
+            if segment is not None:
+                best[source_text] = MatchResult(
                     segment=segment,
                     similarity=1.0,
                     match_type=MatchType.EXACT,
-                ))
+                )
                 continue
 
             # Fall back to fuzzy
             fuzzy = self.find_fuzzy(source_text, segments, min_similarity, max_results=1)
-            results.append(fuzzy[0] if fuzzy else None)
+            best[source_text] = fuzzy[0] if fuzzy else None
 
-        return results
+        return [best[source_text] for source_text in source_texts]
+
+    def _batch_match_indexed(
+        self,
+        source_texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        min_similarity: Optional[float],
+        indexes: List[TMIndex],
+        max_candidates: Optional[int],
+    ) -> List[Optional[MatchResult]]:
+        """batch_match over indexes: score everything, then hydrate the winners once."""
+        best: Dict[str, Optional[IndexedMatch]] = {}
+
+        for source_text in source_texts:
+            if source_text in best:
+                continue
+
+            source_hash = compute_hash(source_text, source_lang, target_lang)
+            exact = self._get_by_hash(indexes, source_hash)
+            if exact is not None:
+                best[source_text] = exact
+                continue
+
+            fuzzy = self._score_indexed(
+                source_text, indexes, min_similarity,
+                max_results=1, max_candidates=max_candidates,
+            )
+            best[source_text] = fuzzy[0] if fuzzy else None
+
+        unique = list(best)
+        hydrated = dict(zip(unique, self._hydrate([best[text] for text in unique])))
+        return [hydrated[source_text] for source_text in source_texts]
+
+    def batch_exact_match(
+        self,
+        source_texts: List[str],
+        indexes: List[TMIndex],
+    ) -> List[Optional[MatchResult]]:
+        """
+        Find exact matches only for multiple source texts.
+
+        No fuzzy scoring is done. The hash lookup ignores case, so a hit
+        only counts when its source text is identical (up to surrounding
+        whitespace).
+
+        Returns:
+            List of exact matches (None for no match)
+        """
+        best: Dict[str, Optional[IndexedMatch]] = {}
+        for source_text in source_texts:
+            if source_text not in best:
+                # Segments are stored with the default pair hash, see TMRepository
+                best[source_text] = self._get_by_hash(indexes, compute_hash(source_text))
+
+        unique = list(best)
+        hydrated = dict(zip(unique, self._hydrate([best[text] for text in unique])))
+        return [
+            match if match and match.segment.source_text.strip() == source_text.strip() else None
+            for source_text, match in ((text, hydrated[text]) for text in source_texts)
+        ]
+
+    @staticmethod
+    def _get_by_hash(indexes: List[TMIndex], source_hash: str) -> Optional[IndexedMatch]:
+        """Exact lookup across indexes, preferring higher quality."""
+        found = [
+            IndexedMatch(index, entry, 1.0)
+            for index, entry in ((index, index.get_by_hash(source_hash)) for index in indexes)
+            if entry is not None
+        ]
+        if not found:
+            return None
+        return max(found, key=lambda m: m.entry.quality_score)
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison."""
@@ -232,6 +423,38 @@ class TMMatcher:
         """
         return SequenceMatcher(None, text1, text2).ratio()
 
+    def _compute_similarity_bounded(
+        self,
+        text1: str,
+        text2: str,
+        min_similarity: float,
+    ) -> Optional[float]:
+        """
+        Compute similarity, exiting early when it cannot reach min_similarity.
+
+        Checks the cheap upper bounds first (length ratio, then the
+        longest common subsequence) and only runs the full ratio when
+        they pass, so the score is identical to _compute_similarity.
+
+        Returns:
+            Similarity, or None if below min_similarity
+        """
+        len1, len2 = len(text1), len(text2)
+        if len1 + len2 == 0:
+            return 1.0 if min_similarity <= 1.0 else None
+
+        # Best case every char of the shorter text matches
+        if 2.0 * min(len1, len2) / (len1 + len2) < min_similarity:
+            return None
+
+        # Matching blocks are a common subsequence, so the LCS bounds the
+        # ratio (tighter than SequenceMatcher's quick_ratio)
+        if 2.0 * lcs_length(text1, text2) / (len1 + len2) < min_similarity:
+            return None
+
+        similarity = SequenceMatcher(None, text1, text2).ratio()
+        return similarity if similarity >= min_similarity else None
+
     def _get_match_type(self, similarity: float) -> MatchType:
         """Determine match type from similarity score."""
         if similarity >= self.exact_threshold:
@@ -3,14 +3,16 @@ Translation Memory Repository
 Database access layer for TM operations.
 """
 import logging
-from typing import Optional, List, Tuple
+from types import SimpleNamespace
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
-from sqlalchemy import create_engine, func
+from sqlalchemy import create_engine, func, insert, update
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import IntegrityError
 from pathlib import Path
 
-from .models import Base, TranslationMemory, TMSegment, generate_uuid, compute_hash
+from .models import Base, TranslationMemory, TMSegment, generate_uuid, compute_hash, normalize_text
+from .index import TMIndex, TMIndexRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,8 @@ class TMRepository:
     """
     Repository for Translation Memory database operations.
 
-    Handles all CRUD operations for TMs and segments.
+    Handles all CRUD operations for TMs and segments, and keeps the
+    fuzzy-match candidate indexes in sync with segment writes.
     """
 
     def __init__(self, db_path: str = "data/tm.db"):
@@ -27,6 +30,7 @@ class TMRepository:
         self.db_path = db_path
         self._engine = None
         self._session_factory = None
+        self.indexes = TMIndexRegistry()
 
     @property
     def engine(self):
@@ -150,6 +154,7 @@ class TMRepository:
 
             tm.is_active = False
             session.commit()
+            self.indexes.invalidate(tm_id)
             logger.info(f"Deleted TM: {tm_id}")
             return True
 
@@ -213,6 +218,7 @@ class TMRepository:
                 session.commit()
                 session.refresh(segment)
                 self.update_segment_count(tm_id)
+                self._index_segments(tm_id, [segment])
                 return segment
             except IntegrityError:
                 session.rollback()
@@ -222,81 +228,139 @@ class TMRepository:
     def add_segments_bulk(
         self,
         tm_id: str,
-        segments: List[dict],
+        segments: Iterable[dict],
         skip_duplicates: bool = True,
+        batch_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
     ) -> Tuple[int, int, List[dict]]:
         """
         Add multiple segments to TM.
 
+        ``segments`` may be any iterable (e.g. a streaming TMX parser). The
+        TM's existing source hashes are fetched once; new segments are
+        inserted and duplicates updated in executemany batches, all in one
+        transaction.
+
+        Args:
+            tm_id: TM ID
+            segments: Segment dicts with source_text, target_text and
+                optional quality_score, source_type, context and notes
+            skip_duplicates: Skip segments whose source is already in the
+                TM (otherwise their target text is updated)
+            batch_size: Segments per executemany batch
+            progress: Called with the number of segments read after each batch
+
         Returns:
             Tuple of (added_count, skipped_count, errors)
         """
         added = 0
         skipped = 0
         errors = []
+        index = self.indexes.get(tm_id)
 
         with self.get_session() as session:
+            # source hash -> segment ID, for the TM and everything queued so far
+            known = dict(
+                session.query(TMSegment.source_hash, TMSegment.id).filter(
+                    TMSegment.tm_id == tm_id
+                )
+            )
+            inserts: List[dict] = []
+            updates: List[dict] = []
+            # Indexed only once the transaction commits
+            indexed: List[SimpleNamespace] = []
+            read = 0
+
+            def flush():
+                if inserts:
+                    session.execute(insert(TMSegment), inserts)
+                    if index is not None:
+                        indexed.extend(
+                            SimpleNamespace(
+                                id=row["id"],
+                                source_hash=row["source_hash"],
+                                source_text=row["source_text"],
+                                quality_score=row["quality_score"],
+                            )
+                            for row in inserts
+                        )
+                if updates:
+                    session.execute(update(TMSegment), updates)
+                inserts.clear()
+                updates.clear()
+                if progress is not None:
+                    progress(read)
+
             for i, seg_data in enumerate(segments):
-                try:
-                    source = seg_data.get("source_text", "")
-                    target = seg_data.get("target_text", "")
-
-                    if not source or not target:
-                        errors.append({
-                            "index": i,
-                            "source_text": source[:50] if source else "",
-                            "error": "Missing source_text or target_text"
-                        })
-                        continue
-
-                    # Check for existing
-                    source_hash = compute_hash(source)
-                    existing = session.query(TMSegment).filter(
-                        TMSegment.tm_id == tm_id,
-                        TMSegment.source_hash == source_hash
-                    ).first()
-
-                    if existing:
-                        if skip_duplicates:
-                            skipped += 1
-                            continue
-                        else:
-                            # Update existing
-                            existing.target_text = target
-                            existing.updated_at = datetime.utcnow()
-                            added += 1
-                            continue
-
-                    segment = TMSegment(
-                        id=generate_uuid(),
-                        tm_id=tm_id,
-                        source_text=source,
-                        target_text=target,
-                        source_hash=source_hash,
-                        source_normalized=source.lower().strip(),
-                        source_length=len(source.split()),
-                        quality_score=seg_data.get("quality_score", 0.8),
-                        source_type=seg_data.get("source_type", "ai"),
-                        context_before=seg_data.get("context_before"),
-                        context_after=seg_data.get("context_after"),
-                        project_name=seg_data.get("project_name"),
-                        notes=seg_data.get("notes"),
-                    )
-                    session.add(segment)
-                    added += 1
+                read = i + 1
+                source = seg_data.get("source_text", "")
+                target = seg_data.get("target_text", "")
 
-                except Exception as e:
+                if not source or not target:
                     errors.append({
                         "index": i,
-                        "source_text": seg_data.get("source_text", "")[:50],
-                        "error": str(e)
+                        "source_text": source[:50] if source else "",
+                        "error": "Missing source_text or target_text"
                     })
+                    continue
+
+                source_hash = compute_hash(source)
+                existing_id = known.get(source_hash)
+
+                if existing_id is not None:
+                    if skip_duplicates:
+                        skipped += 1
+                    else:
+                        updates.append({
+                            "id": existing_id,
+                            "target_text": target,
+                            "updated_at": datetime.utcnow(),
+                        })
+                        added += 1
+                else:
+                    segment_id = generate_uuid()
+                    known[source_hash] = segment_id
+                    now = datetime.utcnow()
+                    inserts.append({
+                        "id": segment_id,
+                        "tm_id": tm_id,
+                        "source_text": source,
+                        "target_text": target,
+                        "source_hash": source_hash,
+                        "source_normalized": normalize_text(source),
+                        "source_length": len(source.split()),
+                        "quality_score": seg_data.get("quality_score", 0.8),
+                        "source_type": seg_data.get("source_type", "ai"),
+                        "usage_count": 0,
+                        "context_before": seg_data.get("context_before"),
+                        "context_after": seg_data.get("context_after"),
+                        "project_name": seg_data.get("project_name"),
+                        "notes": seg_data.get("notes"),
+                        "created_at": now,
+                        "updated_at": now,
+                    })
+                    added += 1
 
+                if len(inserts) + len(updates) >= batch_size:
+                    flush()
+
+            flush()
             session.commit()
-            self.update_segment_count(tm_id)
 
+        if indexed:
+            index.add_many(indexed)
+
+        self.update_segment_count(tm_id)
         return added, skipped, errors
 
+    def iter_segments(self, tm_id: str, batch_size: int = 1000) -> Iterator[TMSegment]:
+        """Stream every segment of a TM, oldest first, without loading them all."""
+        with self.get_session() as session:
+            query = session.query(TMSegment).filter(
+                TMSegment.tm_id == tm_id
+            ).order_by(TMSegment.created_at)
+            yield from query.yield_per(batch_size)
+
     def get_segment(self, tm_id: str, segment_id: str) -> Optional[TMSegment]:
         """Get a specific segment."""
         with self.get_session() as session:
@@ -367,6 +431,7 @@ class TMRepository:
 
             session.commit()
             session.refresh(segment)
+            self._index_segments(tm_id, [segment])
             return segment
 
     def delete_segment(self, tm_id: str, segment_id: str) -> bool:
@@ -383,6 +448,10 @@ class TMRepository:
             session.delete(segment)
             session.commit()
             self.update_segment_count(tm_id)
+
+            index = self.indexes.get(tm_id)
+            if index is not None:
+                index.remove(segment_id)
             return True
 
     def get_all_segments(self, tm_id: str) -> List[TMSegment]:
@@ -394,6 +463,49 @@ class TMRepository:
                 TMSegment.quality_score.desc()
             ).all()
 
+    def iter_index_rows(self, tm_id: str, batch_size: int = 5000) -> Iterator:
+        """
+        Stream the columns the candidate index needs, without building ORM objects.
+
+        Rows have ``id``, ``source_text``, ``source_hash`` and ``quality_score``.
+        """
+        with self.get_session() as session:
+            query = session.query(
+                TMSegment.id,
+                TMSegment.source_text,
+                TMSegment.source_hash,
+                TMSegment.quality_score,
+            ).filter(
+                TMSegment.tm_id == tm_id
+            ).order_by(
+                TMSegment.quality_score.desc()
+            )
+            yield from query.yield_per(batch_size)
+
+    def get_segments_by_ids(self, tm_id: str, segment_ids: List[str]) -> List[TMSegment]:
+        """Get several segments of a TM (order not preserved)."""
+        segments: List[TMSegment] = []
+        with self.get_session() as session:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(segment_ids), 500):
+                segments.extend(session.query(TMSegment).filter(
+                    TMSegment.tm_id == tm_id,
+                    TMSegment.id.in_(segment_ids[start:start + 500])
+                ).all())
+        return segments
+
+    def get_index(self, tm_id: str) -> TMIndex:
+        """Get the fuzzy-match candidate index for a TM, building it on first use."""
+        return self.indexes.get_or_build(
+            tm_id, self.iter_index_rows, fetch_segments=self.get_segments_by_ids
+        )
+
+    def _index_segments(self, tm_id: str, segments: List[TMSegment]):
+        """Push new or changed segments into the TM's index if it is built."""
+        index = self.indexes.get(tm_id)
+        if index is not None and segments:
+            index.add_many(segments)
+
     def get_segments_by_hash(
         self,
         tm_ids: List[str],
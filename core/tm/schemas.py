@@ -185,6 +185,79 @@ class ProcessResponse(BaseModel):
     estimated_savings: float  # Percentage cost reduction
 
 
+class PretranslateRequest(BaseModel):
+    """Request to pre-translate a whole document from TM."""
+    tm_ids: List[str] = Field(..., min_length=1)
+    source_text: str = Field(..., min_length=1)
+    segment_type: str = Field(default="smart")  # sentence, paragraph, smart
+    min_similarity: float = Field(default=0.75, ge=0.0, le=1.0)
+    include_segments: bool = Field(default=True)
+
+
+class LeverageBand(BaseModel):
+    """Segment and word counts of one leverage band."""
+    segments: int = 0
+    words: int = 0
+
+
+class LeverageStats(BaseModel):
+    """Leverage analysis of a document against TM."""
+    total_segments: int
+    total_words: int
+    exact: LeverageBand
+    near_exact: LeverageBand
+    fuzzy: LeverageBand
+    repetitions: LeverageBand  # Repeats of an earlier unmatched segment
+    new: LeverageBand
+    weighted_words: float  # Words weighted by estimated cost factor
+    leverage_rate: float  # Percentage of words covered by TM or repetitions
+
+
+class PretranslatedSegment(BaseModel):
+    """A document segment after the TM pre-translation pass."""
+    index: int
+    source_text: str
+    target_text: Optional[str] = None  # From TM if matched
+    match_type: MatchType
+    similarity: float
+    word_count: int
+    needs_translation: bool
+    repeat_of: Optional[int] = None  # Index of the first identical segment
+
+
+class PretranslateResponse(BaseModel):
+    """Response from the TM pre-translation pass."""
+    stats: LeverageStats
+    segments: List[PretranslatedSegment]
+    pending_indexes: List[int]  # Segments that still need the translator
+
+    def merge(self, translations: dict) -> List[Optional[str]]:
+        """
+        Combine TM targets with new translations.
+
+        Args:
+            translations: Segment index -> translated text, for pending segments
+
+        Returns:
+            Target text for every segment, in document order
+        """
+        targets: List[Optional[str]] = []
+        for seg in self.segments:
+            if seg.repeat_of is not None:
+                targets.append(targets[seg.repeat_of])
+            elif seg.index in translations:
+                targets.append(translations[seg.index])
+            else:
+                targets.append(seg.target_text)
+        return targets
+
+
+class PretranslatedText(BaseModel):
+    """A text fully covered by TM, rebuilt from its reused segments."""
+    target_text: str
+    segment_ids: List[str]  # Reused TM segments, for usage counting
+
+
 # ==================== IMPORT/EXPORT ====================
 
 class ImportResult(BaseModel):
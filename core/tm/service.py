@@ -2,8 +2,9 @@
 Translation Memory Service
 Business logic layer for TM operations.
 """
+import asyncio
 import logging
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 from datetime import datetime
 
 from .models import TranslationMemory, TMSegment
@@ -12,11 +13,15 @@ from .schemas import (
     SegmentCreate, SegmentUpdate, SegmentResponse, SegmentListResponse,
     BulkSegmentResult, LookupRequest, LookupResponse,
     ProcessRequest, ProcessResponse, ProcessedSegment,
+    PretranslateRequest, PretranslateResponse, PretranslatedSegment, PretranslatedText,
+    LeverageBand, LeverageStats,
     TMMatch, MatchType, SourceType,
 )
 from .repository import TMRepository, get_repository
 from .matcher import TMMatcher, get_matcher, MatchResult
+from .index import TMIndex
 from .segmenter import Segmenter, get_segmenter, SegmentType
+from .io import TMExporter, TMImporter, XMLSource
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,13 @@ class TMService:
     Handles business logic, matching, and processing.
     """
 
+    # Index candidates scored per segment in the bulk pre-translation pass
+    PRETRANSLATE_CANDIDATES = 20
+
+    # Streaming TMX import: segments per insert batch, and how often to log
+    IMPORT_BATCH_SIZE = 1000
+    IMPORT_PROGRESS_EVERY = 50000
+
     def __init__(self):
         """Initialize service."""
         self.repository = get_repository()
@@ -148,6 +160,74 @@ class TMService:
 
         return BulkSegmentResult(added=added, skipped=skipped, errors=errors)
 
+    async def import_tmx(
+        self,
+        tm_id: str,
+        source: XMLSource,
+        skip_duplicates: bool = True,
+    ) -> BulkSegmentResult:
+        """
+        Stream a TMX file into a TM.
+
+        The file is parsed and inserted batch by batch on a worker thread,
+        so neither the XML tree nor the segment list is held in memory.
+        """
+        logged = 0
+
+        def report(count: int):
+            nonlocal logged
+            if count - logged >= self.IMPORT_PROGRESS_EVERY:
+                logged = count
+                logger.info(f"TMX import into {tm_id}: {count} segments read")
+
+        def run():
+            segments = (
+                {
+                    "source_text": seg.source_text,
+                    "target_text": seg.target_text,
+                    "quality_score": seg.quality_score,
+                    "source_type": seg.source_type,
+                    "notes": seg.notes,
+                }
+                for seg in TMImporter.iter_tmx(source)
+            )
+            return self.repository.add_segments_bulk(
+                tm_id=tm_id,
+                segments=segments,
+                skip_duplicates=skip_duplicates,
+                batch_size=self.IMPORT_BATCH_SIZE,
+                progress=report,
+            )
+
+        added, skipped, errors = await asyncio.to_thread(run)
+        logger.info(f"TMX import into {tm_id}: {added} added, {skipped} skipped")
+        return BulkSegmentResult(added=added, skipped=skipped, errors=errors)
+
+    def iter_tmx_export(self, tm_id: str) -> Iterator[bytes]:
+        """
+        TMX export of a whole TM as UTF-8 chunks, read from the database as it is written.
+
+        Raises:
+            ValueError: If the TM does not exist
+        """
+        tm = self.repository.get_tm(tm_id)
+        if not tm:
+            raise ValueError("Translation Memory not found")
+
+        segments = (
+            {
+                "source_text": s.source_text,
+                "target_text": s.target_text,
+                "quality_score": s.quality_score,
+                "source_type": s.source_type,
+                "notes": s.notes,
+                "created_at": s.created_at.isoformat() if s.created_at else None,
+            }
+            for s in self.repository.iter_segments(tm_id)
+        )
+        pieces = TMExporter.iter_tmx(tm.name, segments, tm.source_language, tm.target_language)
+        return (piece.encode("utf-8") for piece in pieces)
+
     async def list_segments(
         self,
         tm_id: str,
@@ -223,24 +303,16 @@ class TMService:
 
         Returns matching segments sorted by similarity.
         """
-        # Get all segments from specified TMs
-        all_segments = []
-        tm_names = {}
-
-        for tm_id in request.tm_ids:
-            tm = self.repository.get_tm(tm_id)
-            if tm:
-                tm_names[tm_id] = tm.name
-                segments = self.repository.get_all_segments(tm_id)
-                all_segments.extend(segments)
+        # Get candidate indexes of specified TMs
+        indexes, tm_names = self._get_indexes(request.tm_ids)
 
-        if not all_segments:
+        if not any(len(index) for index in indexes):
             return LookupResponse(matches=[], best_match=None, match_count=0)
 
         # Find matches
-        matches = self.matcher.find_fuzzy(
+        matches = self.matcher.find_fuzzy_indexed(
             request.source_text,
-            all_segments,
+            indexes,
             min_similarity=request.min_similarity,
             max_results=request.max_results,
         )
@@ -262,6 +334,51 @@ class TMService:
             match_count=len(tm_matches),
         )
 
+    async def suggest(
+        self,
+        tm_ids: List[str],
+        source_texts: List[str],
+        min_similarity: float = 0.75,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+    ) -> List[Optional[TMMatch]]:
+        """
+        Best match for each of many source texts in one batch_match pass.
+
+        Used to prefetch suggestions for a window of editor segments.
+        When source_lang/target_lang are given, TMs of another language
+        pair are skipped. Usage counts are not touched: showing a
+        suggestion is not using it.
+        """
+        return await asyncio.to_thread(
+            self._suggest_sync, tm_ids, source_texts, min_similarity, source_lang, target_lang
+        )
+
+    def _suggest_sync(
+        self,
+        tm_ids: List[str],
+        source_texts: List[str],
+        min_similarity: float,
+        source_lang: Optional[str],
+        target_lang: Optional[str],
+    ) -> List[Optional[TMMatch]]:
+        """Blocking body of suggest."""
+        indexes, tm_names = self._get_indexes(tm_ids, source_lang, target_lang)
+        if not source_texts or not any(len(index) for index in indexes):
+            return [None] * len(source_texts)
+
+        best_matches = self.matcher.batch_match(
+            source_texts,
+            [],
+            min_similarity=min_similarity,
+            indexes=indexes,
+        )
+        return [
+            self._match_to_response(m, tm_names.get(m.segment.tm_id, "Unknown"))
+            if m and m.match_type != MatchType.NO_MATCH else None
+            for m in best_matches
+        ]
+
     async def process(self, request: ProcessRequest) -> ProcessResponse:
         """
         Process text through TM for translation.
@@ -275,29 +392,22 @@ class TMService:
         # Segment the text
         text_segments = segmenter.segment(request.source_text)
 
-        # Get all TM segments
-        all_tm_segments = []
-        tm_names = {}
+        # Get candidate indexes of specified TMs
+        indexes, tm_names = self._get_indexes(request.tm_ids)
 
-        for tm_id in request.tm_ids:
-            tm = self.repository.get_tm(tm_id)
-            if tm:
-                tm_names[tm_id] = tm.name
-                segments = self.repository.get_all_segments(tm_id)
-                all_tm_segments.extend(segments)
+        # Match all segments in one pass over the indexes
+        best_matches = self.matcher.batch_match(
+            [seg.text for seg in text_segments],
+            [],
+            min_similarity=request.min_similarity,
+            indexes=indexes,
+        )
 
-        # Match each segment
         processed = []
         matched_count = 0
         total_cost_factor = 0.0
 
-        for seg in text_segments:
-            match = self.matcher.find_best(
-                seg.text,
-                all_tm_segments,
-                min_similarity=request.min_similarity,
-            )
-
+        for seg, match in zip(text_segments, best_matches):
             cost_factor = self.matcher.estimate_cost_factor(match)
             total_cost_factor += cost_factor
 
@@ -331,6 +441,218 @@ class TMService:
             estimated_savings=estimated_savings,
         )
 
+    async def pretranslate(self, request: PretranslateRequest) -> PretranslateResponse:
+        """
+        Pre-translate a whole document from TM before it is sent to the LLM.
+
+        The document is segmented once and every segment is matched in a
+        single batch_match pass. Exact and near-exact matches are reused,
+        repeated segments are translated once, and only the remaining
+        segments are listed in pending_indexes. The leverage statistics
+        can be used to skip or reprice a job before it starts.
+
+        This is an estimate only, so TM usage counts are left untouched.
+        Matching is CPU-bound and runs off the event loop.
+        """
+        return await asyncio.to_thread(self._pretranslate_sync, request)
+
+    def _pretranslate_sync(self, request: PretranslateRequest) -> PretranslateResponse:
+        """Blocking body of pretranslate."""
+        segmenter = get_segmenter(SegmentType(request.segment_type))
+        text_segments = segmenter.segment(request.source_text)
+
+        indexes, _ = self._get_indexes(request.tm_ids)
+
+        if any(len(index) for index in indexes):
+            best_matches = self.matcher.batch_match(
+                [seg.text for seg in text_segments],
+                [],
+                min_similarity=request.min_similarity,
+                indexes=indexes,
+                max_candidates=self.PRETRANSLATE_CANDIDATES,
+            )
+        else:
+            best_matches = [None] * len(text_segments)
+
+        bands = {
+            "exact": LeverageBand(),
+            "near_exact": LeverageBand(),
+            "fuzzy": LeverageBand(),
+            "repetitions": LeverageBand(),
+            "new": LeverageBand(),
+        }
+        segments = []
+        pending_indexes = []
+        first_pending = {}
+        weighted_words = 0.0
+
+        for i, (seg, match) in enumerate(zip(text_segments, best_matches)):
+            match_type = match.match_type if match else MatchType.NO_MATCH
+            reusable = match_type in (MatchType.EXACT, MatchType.NEAR_EXACT)
+            repeat_of = None
+
+            if reusable:
+                band = match_type.value
+                cost_factor = self.matcher.estimate_cost_factor(match)
+            elif seg.text in first_pending:
+                band = "repetitions"
+                cost_factor = 0.0
+                repeat_of = first_pending[seg.text]
+            else:
+                band = "fuzzy" if match_type == MatchType.FUZZY else "new"
+                cost_factor = self.matcher.estimate_cost_factor(match)
+                first_pending[seg.text] = i
+                pending_indexes.append(i)
+
+            bands[band].segments += 1
+            bands[band].words += seg.word_count
+            weighted_words += cost_factor * seg.word_count
+
+            if request.include_segments:
+                segments.append(PretranslatedSegment(
+                    index=i,
+                    source_text=seg.text,
+                    target_text=match.segment.target_text if match else None,
+                    match_type=match_type,
+                    similarity=match.similarity if match else 0.0,
+                    word_count=seg.word_count,
+                    needs_translation=not reusable,
+                    repeat_of=repeat_of,
+                ))
+
+        total_words = sum(seg.word_count for seg in text_segments)
+        leveraged_words = total_words - bands["new"].words
+        stats = LeverageStats(
+            total_segments=len(text_segments),
+            total_words=total_words,
+            weighted_words=weighted_words,
+            leverage_rate=leveraged_words / total_words * 100 if total_words else 0.0,
+            **bands,
+        )
+
+        logger.info(
+            f"Pre-translated {stats.total_segments} segments: "
+            f"{bands['exact'].segments} exact, {bands['near_exact'].segments} near-exact, "
+            f"{bands['fuzzy'].segments} fuzzy, {bands['repetitions'].segments} repetitions, "
+            f"{bands['new'].segments} new"
+        )
+
+        return PretranslateResponse(
+            stats=stats,
+            segments=segments,
+            pending_indexes=pending_indexes,
+        )
+
+    async def pretranslate_texts(
+        self,
+        tm_ids: List[str],
+        source_texts: List[str],
+        source_lang: str = "en",
+        target_lang: str = "vi",
+        segment_type: str = "smart",
+    ) -> List[Optional[PretranslatedText]]:
+        """
+        Translations of whole texts (e.g. job chunks) that TM fully covers.
+
+        Only TMs of the source_lang/target_lang pair are used. Every text
+        is segmented and all segments are looked up in one exact-match
+        pass. A text is returned only when each of its segments matches a
+        TM source exactly (case included), since nobody reviews the reused
+        target; it keeps the text between segments and swaps each segment
+        for the TM target.
+        Usage counts are not touched here: the caller records the
+        segment_ids once the translation is used.
+        """
+        return await asyncio.to_thread(
+            self._pretranslate_texts_sync, tm_ids, source_texts, source_lang, target_lang, segment_type
+        )
+
+    def _pretranslate_texts_sync(
+        self,
+        tm_ids: List[str],
+        source_texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        segment_type: str,
+    ) -> List[Optional[PretranslatedText]]:
+        """Blocking body of pretranslate_texts."""
+        indexes, _ = self._get_indexes(tm_ids, source_lang, target_lang)
+        if not source_texts or not any(len(index) for index in indexes):
+            return [None] * len(source_texts)
+
+        segmenter = get_segmenter(SegmentType(segment_type))
+        text_segments = [segmenter.segment(text) for text in source_texts]
+        exact_matches = self.matcher.batch_exact_match(
+            [seg.text for segments in text_segments for seg in segments],
+            indexes,
+        )
+
+        results = []
+        offset = 0
+        for text, segments in zip(source_texts, text_segments):
+            matches = exact_matches[offset:offset + len(segments)]
+            offset += len(segments)
+            results.append(self._rebuild_text(text, segments, matches))
+        return results
+
+    @staticmethod
+    def _rebuild_text(text, segments, matches) -> Optional[PretranslatedText]:
+        """Swap every segment of text for its TM target, or None if one is not reusable."""
+        if not segments:
+            return None
+
+        parts = []
+        pos = 0
+        for seg, match in zip(segments, matches):
+            if not match:
+                return None
+            # Segments are stripped and merged, so locate them in the text
+            start = text.find(seg.text, pos)
+            if start < 0:
+                return None
+            parts.append(text[pos:start])
+            parts.append(match.segment.target_text)
+            pos = start + len(seg.text)
+        parts.append(text[pos:])
+
+        return PretranslatedText(
+            target_text="".join(parts),
+            segment_ids=[match.segment.id for match in matches],
+        )
+
+    async def record_usage(self, segment_ids: List[str]):
+        """Count reuse of TM segments that a job actually consumed."""
+        if segment_ids:
+            await asyncio.to_thread(self.repository.increment_usage_count, list(segment_ids))
+
+    def _get_indexes(
+        self,
+        tm_ids: List[str],
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+    ) -> Tuple[List[TMIndex], dict]:
+        """
+        Get candidate indexes and names for active TMs.
+
+        When source_lang/target_lang are given, TMs of another language
+        pair are skipped.
+        """
+        indexes = []
+        tm_names = {}
+
+        for tm_id in tm_ids:
+            tm = self.repository.get_tm(tm_id)
+            if not tm:
+                continue
+            if source_lang and tm.source_language != source_lang:
+                continue
+            if target_lang and tm.target_language != target_lang:
+                continue
+            tm_names[tm_id] = tm.name
+            indexes.append(self.repository.get_index(tm_id))
+
+        return indexes, tm_names
+
     def _match_to_response(self, match: MatchResult, tm_name: str) -> TMMatch:
         """Convert MatchResult to TMMatch schema."""
         return TMMatch(
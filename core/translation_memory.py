@@ -12,8 +12,11 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+import math
 import re
 
+from .edit_distance import levenshtein_many
+
 
 @dataclass
 class TMSegment:
@@ -306,6 +309,63 @@ class TranslationMemory:
 
         return None
 
+    def get_exact_matches(
+        self,
+        sources: List[str],
+        source_lang: str = "en",
+        target_lang: str = "vi"
+    ) -> Dict[str, TMMatch]:
+        """
+        Get exact matches for many sources in one query
+
+        Args:
+            sources: Source texts
+            source_lang: Source language
+            target_lang: Target language
+
+        Returns:
+            Dict mapping source text to its TMMatch (misses are omitted)
+        """
+        hash_to_source: Dict[str, str] = {}
+        for source in sources:
+            content = f"{source_lang}:{target_lang}:{source}"
+            hash_to_source[hashlib.sha256(content.encode()).hexdigest()] = source
+
+        if not hash_to_source:
+            return {}
+
+        cursor = self.conn.cursor()
+        matches: Dict[str, TMMatch] = {}
+        hashes = list(hash_to_source)
+
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(hashes), 500):
+            batch = hashes[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"""
+                SELECT * FROM segments
+                WHERE source_hash IN ({placeholders})
+                AND source_lang = ?
+                AND target_lang = ?
+            """, (*batch, source_lang, target_lang))
+
+            for row in cursor.fetchall():
+                segment = self._row_to_segment(row)
+                matches[hash_to_source[row['source_hash']]] = TMMatch(
+                    segment=segment,
+                    similarity=1.0,
+                    match_type="exact"
+                )
+
+        if matches:
+            cursor.executemany(
+                "UPDATE segments SET use_count = use_count + 1 WHERE id = ?",
+                [(match.segment.id,) for match in matches.values()]
+            )
+            self.conn.commit()
+
+        return matches
+
     def get_fuzzy_matches(
         self,
         source: str,
@@ -360,13 +420,15 @@ class TranslationMemory:
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
-        # Calculate similarity for each candidate
-        matches = []
-        for row in rows:
-            segment = self._row_to_segment(row)
-            similarity = self._calculate_similarity(source, segment.source)
+        # Calculate similarity for all candidates in one batch
+        segments = [self._row_to_segment(row) for row in rows]
+        similarities = self._calculate_similarities(
+            source, [segment.source for segment in segments], threshold
+        )
 
-            if similarity >= threshold:
+        matches = []
+        for segment, similarity in zip(segments, similarities):
+            if similarity is not None:
                 matches.append(TMMatch(
                     segment=segment,
                     similarity=similarity,
@@ -416,14 +478,83 @@ class TranslationMemory:
         # 3. Word overlap (30% weight)
         word_similarity = self._word_overlap_similarity(s1, s2)
 
-        # Weighted average
-        similarity = (
+        return self._combine_similarity(lev_similarity, char_similarity, word_similarity)
+
+    def _combine_similarity(
+        self,
+        lev_similarity: float,
+        char_similarity: float,
+        word_similarity: float
+    ) -> float:
+        """Weighted average of the similarity components"""
+        return (
             lev_similarity * 0.4 +
             char_similarity * 0.3 +
             word_similarity * 0.3
         )
 
-        return similarity
+    def _calculate_similarities(
+        self,
+        source: str,
+        candidates: List[str],
+        threshold: float
+    ) -> List[Optional[float]]:
+        """
+        Calculate similarity of source against many candidates
+
+        Returns the same scores as _calculate_similarity, but only for
+        candidates that reach threshold (None otherwise). The cheap bigram
+        and word scores bound how large the edit distance may be, so
+        candidates that cannot reach threshold skip the Levenshtein step
+        and the rest are computed together (NumPy bit-parallel when
+        available, banded DP otherwise).
+        """
+        results: List[Optional[float]] = [None] * len(candidates)
+        s1 = source.lower().strip()
+
+        pending = []  # (index, s2, char_similarity, word_similarity, max_distance)
+        for i, candidate in enumerate(candidates):
+            if source == candidate:
+                results[i] = 1.0 if threshold <= 1.0 else None
+                continue
+
+            s2 = candidate.lower().strip()
+            if not s1 or not s2:
+                results[i] = 0.0 if threshold <= 0.0 else None
+                continue
+
+            char_similarity = self._bigram_similarity(s1, s2)
+            word_similarity = self._word_overlap_similarity(s1, s2)
+
+            # Smallest Levenshtein similarity that can still reach threshold
+            needed = (threshold - char_similarity * 0.3 - word_similarity * 0.3) / 0.4
+            longest = max(len(s1), len(s2))
+            max_distance = math.floor((1.0 - needed) * longest + 1e-9)
+
+            if max_distance < abs(len(s1) - len(s2)):
+                continue
+
+            pending.append((i, s2, char_similarity, word_similarity, min(max_distance, longest)))
+
+        if not pending:
+            return results
+
+        distances = levenshtein_many(
+            s1,
+            [item[1] for item in pending],
+            [item[4] for item in pending]
+        )
+
+        for (i, s2, char_similarity, word_similarity, max_distance), distance in zip(pending, distances):
+            if distance > max_distance:
+                continue
+
+            lev_similarity = 1.0 - (distance / max(len(s1), len(s2)))
+            similarity = self._combine_similarity(lev_similarity, char_similarity, word_similarity)
+            if similarity >= threshold:
+                results[i] = similarity
+
+        return results
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance (edit distance)"""
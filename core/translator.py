@@ -43,12 +43,15 @@ from collections.abc import Callable
 import httpx
 
 from .chunker import TranslationChunk
+from .chunk_packer import ChunkPacker
+from .http_pool import pooled_client
 from .validator import TranslationResult, QualityValidator
 from .glossary_legacy import GlossaryManager
 from .cache import TranslationCache
 from .parallel import ParallelProcessor, BatchProcessor, ProcessingStats
 from .translation_memory import TranslationMemory, TMSegment
 from .language import LanguagePair, get_language_pair, get_language_name, LanguageValidator
+from .async_lookup import LookupExecutor, get_lookup_executor
 
 from config.logging_config import get_logger
 logger = get_logger(__name__)
@@ -109,7 +112,9 @@ class TranslatorEngine:
         retry_delay: int = 3,
         chunk_cache=None,
         mode: str = "simple",
-        domain: Optional[str] = None
+        domain: Optional[str] = None,
+        lookup_executor: Optional[LookupExecutor] = None,
+        packer: Optional[ChunkPacker] = None
     ):
         """
         Initialize TranslatorEngine.
@@ -130,6 +135,10 @@ class TranslatorEngine:
             chunk_cache: Optional ChunkCache for persistent caching.
             mode: Pipeline mode for cache key differentiation.
             domain: Domain for cache key (e.g., 'stem', 'book').
+            lookup_executor: Thread pool for blocking TM/cache I/O
+                (defaults to the shared executor).
+            packer: Optional ChunkPacker; when set, small chunks are
+                translated several per request by pretranslate_packed.
 
         Raises:
             ValueError: If provider is not supported.
@@ -161,6 +170,22 @@ class TranslatorEngine:
         self.tm_fuzzy_matches = 0
         self.tm_no_matches = 0
 
+        # Blocking TM/cache I/O runs here instead of on the event loop
+        self.lookup_executor = lookup_executor or get_lookup_executor()
+        # (chunk.id, chunk.text) -> prefetched result, None = known miss
+        self._prefetched: dict = {}
+        # (chunk.id, chunk.text) -> TM segment ids of a seeded pre-translation
+        self._pretranslated_ids: dict = {}
+        # TM segments reused by translate_chunk, for usage counting
+        self.tm_segments_used: List[str] = []
+
+        # Request packing of small chunks
+        self.packer = packer
+        self.packed_requests = 0
+        self.packed_chunks = 0
+        # (chunk.id, chunk.text) -> packed group planned by plan_packed
+        self._packed_groups: dict = {}
+
     def build_prompt(self, chunk: TranslationChunk) -> str:
         """
         Build translation prompt for LLM with context and glossary.
@@ -230,6 +255,246 @@ class TranslatorEngine:
 
         return "\n".join(prompt_parts)
 
+    def _overlap_count(self, chunk: TranslationChunk) -> int:
+        """FIX-002: overlap_char_count carried from chunk to result."""
+        return getattr(chunk, 'overlap_char_count', 0)
+
+    def _chunk_cache_key(self, chunk: TranslationChunk) -> str:
+        """Phase 5.1 chunk cache key for a chunk."""
+        from .cache.chunk_cache import compute_chunk_key
+        return compute_chunk_key(
+            source_text=chunk.text,
+            source_lang=self.source_lang,
+            target_lang=self.target_lang,
+            mode=self.mode,
+            domain=self.domain
+        )
+
+    def _tm_exact_result(self, chunk: TranslationChunk, match) -> TranslationResult:
+        """Build result from an exact TM match."""
+        self.tm_exact_matches += 1
+        result = TranslationResult(
+            chunk_id=chunk.id,
+            source=chunk.text,
+            translated=match.segment.target,
+            quality_score=match.segment.quality_score,
+            overlap_char_count=self._overlap_count(chunk)
+        )
+        result.warnings.append(f"✓ TM exact match (100%)")
+        return result
+
+    def _tm_fuzzy_lookup(self, chunk: TranslationChunk) -> Optional[TranslationResult]:
+        """Look up a fuzzy TM match (blocking)."""
+        fuzzy_matches = self.tm.get_fuzzy_matches(
+            chunk.text,
+            self.source_lang,
+            self.target_lang,
+            threshold=self.tm_fuzzy_threshold,
+            max_results=1
+        )
+        if fuzzy_matches and fuzzy_matches[0].similarity >= self.tm_fuzzy_threshold:
+            self.tm_fuzzy_matches += 1
+            match = fuzzy_matches[0]
+            result = TranslationResult(
+                chunk_id=chunk.id,
+                source=chunk.text,
+                translated=match.segment.target,
+                quality_score=match.segment.quality_score * match.similarity,
+                overlap_char_count=self._overlap_count(chunk)
+            )
+            result.warnings.append(f"✓ TM fuzzy match ({match.similarity:.1%})")
+            return result
+
+        self.tm_no_matches += 1
+        return None
+
+    def _cached_result(self, chunk: TranslationChunk, translated: str) -> TranslationResult:
+        """Build result from a cache hit (cached results assumed high quality)."""
+        return TranslationResult(
+            chunk_id=chunk.id,
+            source=chunk.text,
+            translated=translated,
+            quality_score=1.0,
+            overlap_char_count=self._overlap_count(chunk)
+        )
+
+    def seed_pretranslation(
+        self,
+        chunk: TranslationChunk,
+        translated: str,
+        segment_ids: List[str]
+    ) -> None:
+        """
+        Queue a translation resolved before the job (TM pre-translation pass).
+
+        translate_chunk returns it without lookups or an LLM call, and only
+        then adds segment_ids to tm_segments_used.
+        """
+        key = (chunk.id, chunk.text)
+        result = self._cached_result(chunk, translated)
+        result.warnings.append("✓ TM pre-translation")
+        self._prefetched[key] = result
+        self._pretranslated_ids[key] = segment_ids
+
+    def _lookup_sync(self, chunk: TranslationChunk) -> Optional[TranslationResult]:
+        """
+        Resolve a chunk from TM or caches (blocking, runs on the lookup pool).
+
+        Order: TM exact, TM fuzzy, chunk cache, legacy cache.
+        """
+        # 1. Check Translation Memory first (exact, then fuzzy)
+        if self.tm:
+            exact_match = self.tm.get_exact_match(
+                chunk.text,
+                self.source_lang,
+                self.target_lang
+            )
+            if exact_match:
+                return self._tm_exact_result(chunk, exact_match)
+
+            result = self._tm_fuzzy_lookup(chunk)
+            if result:
+                return result
+
+        # 2. Phase 5.1: Check new chunk cache (hash-based, persistent)
+        if self.chunk_cache:
+            cached_translation = self.chunk_cache.get(self._chunk_cache_key(chunk))
+            if cached_translation:
+                return self._cached_result(chunk, cached_translation)
+
+        # 3. Fallback to legacy cache
+        if self.cache:
+            cached = self.cache.get(chunk.text, self.model)
+            if cached:
+                return self._cached_result(chunk, cached)
+
+        return None
+
+    def _store_sync(
+        self,
+        chunk: TranslationChunk,
+        translated: str,
+        quality_score: float,
+        domain: str
+    ):
+        """Save a good translation to caches and TM (blocking)."""
+        self._store_many_sync([(chunk, translated, quality_score, domain)])
+
+    def _store_many_sync(self, items: List[tuple]):
+        """
+        Save good translations to caches and TM (blocking).
+
+        Args:
+            items: (chunk, translated, quality_score, domain) tuples; chunk
+                cache rows are written in one transaction
+        """
+        # Phase 5.1: Cache successful translations in new chunk cache
+        if self.chunk_cache:
+            self.chunk_cache.set_many(
+                [(self._chunk_cache_key(chunk), translated) for chunk, translated, _, _ in items],
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                mode=self.mode
+            )
+
+        for chunk, translated, quality_score, domain in items:
+            # Legacy cache (fallback)
+            if self.cache:
+                self.cache.set(chunk.text, translated, self.model, quality_score)
+
+            # Save to Translation Memory
+            if self.tm:
+                tm_segment = TMSegment(
+                    source=chunk.text,
+                    target=translated,
+                    source_lang=self.source_lang,
+                    target_lang=self.target_lang,
+                    domain=domain,
+                    quality_score=quality_score,
+                    context_before=chunk.context_before,
+                    context_after=chunk.context_after,
+                    created_by=f"{self.provider}/{self.model}"
+                )
+                self.tm.add_segment(tm_segment)
+
+    def _prefetch_sync(self, chunks: List[TranslationChunk]) -> int:
+        """
+        Resolve TM and cache hits for many chunks with bulk queries (blocking).
+
+        Exact TM matches and chunk cache hits are each fetched in one query;
+        fuzzy TM matching runs for the remaining chunks in the same pass.
+        Chunks still unresolved are recorded as misses so translate_chunk
+        goes straight to the LLM.
+
+        Returns:
+            Number of chunks resolved without an LLM call
+        """
+        pending = [c for c in chunks if (c.id, c.text) not in self._prefetched]
+        resolved: dict = {}
+
+        if self.tm and pending:
+            exact = self.tm.get_exact_matches(
+                [c.text for c in pending],
+                self.source_lang,
+                self.target_lang
+            )
+            remaining = []
+            for chunk in pending:
+                match = exact.get(chunk.text)
+                result = self._tm_exact_result(chunk, match) if match else self._tm_fuzzy_lookup(chunk)
+                if result:
+                    resolved[(chunk.id, chunk.text)] = result
+                else:
+                    remaining.append(chunk)
+            pending = remaining
+
+        if self.chunk_cache and pending:
+            keys = [self._chunk_cache_key(c) for c in pending]
+            found = self.chunk_cache.get_many(keys)
+            remaining = []
+            for chunk, key in zip(pending, keys):
+                if key in found:
+                    resolved[(chunk.id, chunk.text)] = self._cached_result(chunk, found[key])
+                else:
+                    remaining.append(chunk)
+            pending = remaining
+
+        if self.cache and pending:
+            remaining = []
+            for chunk in pending:
+                cached = self.cache.get(chunk.text, self.model)
+                if cached:
+                    resolved[(chunk.id, chunk.text)] = self._cached_result(chunk, cached)
+                else:
+                    remaining.append(chunk)
+            pending = remaining
+
+        for chunk in pending:
+            resolved[(chunk.id, chunk.text)] = None
+
+        self._prefetched.update(resolved)
+        return sum(1 for r in resolved.values() if r is not None)
+
+    async def prefetch_lookups(self, chunks: List[TranslationChunk]) -> int:
+        """
+        Resolve TM/cache hits for all chunks before any LLM call is scheduled.
+
+        Results are kept on the engine and consumed by translate_chunk, so
+        callers can keep passing every chunk through translate_chunk.
+
+        Args:
+            chunks: Chunks about to be translated.
+
+        Returns:
+            Number of chunks resolved from TM or cache.
+        """
+        if not chunks or not (self.tm or self.chunk_cache or self.cache):
+            return 0
+
+        hits = await self.lookup_executor.run(self._prefetch_sync, chunks)
+        logger.info(f" Prefetch: {hits}/{len(chunks)} chunks resolved from TM/cache")
+        return hits
+
     async def translate_chunk(
         self,
         client: httpx.AsyncClient,
@@ -240,6 +505,7 @@ class TranslatorEngine:
 
         Translation flow:
         1. Check Translation Memory for exact/fuzzy matches
+           (prefetched by prefetch_lookups, or looked up off the event loop)
         2. Check chunk cache for cached translation
         3. Check legacy cache
         4. If not cached, call LLM API with retry logic
@@ -261,122 +527,36 @@ class TranslatorEngine:
             Low quality translations (score < 0.5) trigger automatic retry.
             Failed translations return fallback text with quality_score=0.
         """
-        # 1. Check Translation Memory first (exact match)
-        if self.tm:
-            exact_match = self.tm.get_exact_match(
-                chunk.text,
-                self.source_lang,
-                self.target_lang
-            )
-            if exact_match:
+        # Planned packed group: the first member to get here sends the shared
+        # request, the others wait for it instead of calling the LLM
+        prefetch_key = (chunk.id, chunk.text)
+        if prefetch_key in self._packed_groups:
+            await self._run_packed_group(client, self._packed_groups[prefetch_key])
+
+        # 1-3. TM and cache lookups: use prefetched results when available,
+        # otherwise run them on the lookup thread pool (sqlite I/O)
+        if prefetch_key in self._prefetched:
+            result = self._prefetched.pop(prefetch_key)
+            if prefetch_key in self._pretranslated_ids:
                 self.tm_exact_matches += 1
-                # FIX-002: Copy overlap_char_count
-                overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                result = TranslationResult(
-                    chunk_id=chunk.id,
-                    source=chunk.text,
-                    translated=exact_match.segment.target,
-                    quality_score=exact_match.segment.quality_score,
-                    overlap_char_count=overlap_count
-                )
-                result.warnings.append(f"✓ TM exact match (100%)")
-                return result
-
-            # Check fuzzy matches
-            fuzzy_matches = self.tm.get_fuzzy_matches(
-                chunk.text,
-                self.source_lang,
-                self.target_lang,
-                threshold=self.tm_fuzzy_threshold,
-                max_results=1
-            )
-            if fuzzy_matches and fuzzy_matches[0].similarity >= self.tm_fuzzy_threshold:
-                self.tm_fuzzy_matches += 1
-                match = fuzzy_matches[0]
-                # FIX-002: Copy overlap_char_count
-                overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                result = TranslationResult(
-                    chunk_id=chunk.id,
-                    source=chunk.text,
-                    translated=match.segment.target,
-                    quality_score=match.segment.quality_score * match.similarity,
-                    overlap_char_count=overlap_count
-                )
-                result.warnings.append(f"✓ TM fuzzy match ({match.similarity:.1%})")
-                return result
-
-            self.tm_no_matches += 1
-
-        # 2. Phase 5.1: Check new chunk cache (hash-based, persistent)
-        if self.chunk_cache:
-            from .cache.chunk_cache import compute_chunk_key
-            cache_key = compute_chunk_key(
-                source_text=chunk.text,
-                source_lang=self.source_lang,
-                target_lang=self.target_lang,
-                mode=self.mode,
-                domain=self.domain
-            )
-            cached_translation = self.chunk_cache.get(cache_key)
-            if cached_translation:
-                # FIX-002: Copy overlap_char_count
-                overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                return TranslationResult(
-                    chunk_id=chunk.id,
-                    source=chunk.text,
-                    translated=cached_translation,
-                    quality_score=1.0,  # Cached results assumed high quality
-                    overlap_char_count=overlap_count
-                )
-
-        # Fallback to legacy cache
-        if self.cache:
-            cached = self.cache.get(chunk.text, self.model)
-            if cached:
-                # FIX-002: Copy overlap_char_count
-                overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                return TranslationResult(
-                    chunk_id=chunk.id,
-                    source=chunk.text,
-                    translated=cached,
-                    quality_score=1.0,
-                    overlap_char_count=overlap_count
-                )
+                self.tm_segments_used.extend(self._pretranslated_ids.pop(prefetch_key))
+        else:
+            result = await self.lookup_executor.run(self._lookup_sync, chunk)
+        if result is not None:
+            return result
 
         prompt = self.build_prompt(chunk)
 
         for attempt in range(1, self.max_retries + 1):
             try:
                 # Call API
-                if self.provider == "openai":
-                    translated = await self._call_openai(client, prompt, chunk.text)
-                elif self.provider == "anthropic":
-                    translated = await self._call_anthropic(client, prompt, chunk.text)
-                else:
-                    raise ValueError(f"Unsupported provider: {self.provider}")
+                translated = await self._call_llm(client, prompt, chunk.text)
 
                 if not translated.strip():
                     raise ValueError("Empty translation")
 
                 # Validate
-                # FIX-002: Copy overlap_char_count từ chunk sang result
-                overlap_count = getattr(chunk, 'overlap_char_count', 0)
-                result = TranslationResult(
-                    chunk_id=chunk.id,
-                    source=chunk.text,
-                    translated=translated,
-                    overlap_char_count=overlap_count
-                )
-
-                domain = self.glossary_mgr.domain if self.glossary_mgr else 'default'
-                validation = self.validator.validate(
-                    chunk.text, translated, self.glossary_mgr,
-                    domain=domain,
-                    source_lang=self.source_lang,
-                    target_lang=self.target_lang
-                )
-                result.quality_score = validation.quality_score
-                result.warnings = validation.warnings
+                result, domain = self._validated_result(chunk, translated)
 
                 # Retry if quality too low
                 if result.quality_score < 0.5 and attempt < self.max_retries:
@@ -384,42 +564,11 @@ class TranslatorEngine:
                     await asyncio.sleep(self.retry_delay)
                     continue
 
-                # Phase 5.1: Cache successful translation in new chunk cache
-                if self.chunk_cache and result.quality_score >= 0.7:
-                    from .cache.chunk_cache import compute_chunk_key
-                    cache_key = compute_chunk_key(
-                        source_text=chunk.text,
-                        source_lang=self.source_lang,
-                        target_lang=self.target_lang,
-                        mode=self.mode,
-                        domain=self.domain
-                    )
-                    self.chunk_cache.set(
-                        key=cache_key,
-                        value=translated,
-                        source_lang=self.source_lang,
-                        target_lang=self.target_lang,
-                        mode=self.mode
-                    )
-
-                # Legacy cache (fallback)
-                if self.cache and result.quality_score >= 0.7:
-                    self.cache.set(chunk.text, translated, self.model, result.quality_score)
-
-                # Save to Translation Memory
-                if self.tm and result.quality_score >= 0.7:
-                    tm_segment = TMSegment(
-                        source=chunk.text,
-                        target=translated,
-                        source_lang=self.source_lang,
-                        target_lang=self.target_lang,
-                        domain=domain,
-                        quality_score=result.quality_score,
-                        context_before=chunk.context_before,
-                        context_after=chunk.context_after,
-                        created_by=f"{self.provider}/{self.model}"
+                # Cache and save to TM off the event loop
+                if result.quality_score >= 0.7:
+                    await self.lookup_executor.run(
+                        self._store_sync, chunk, translated, result.quality_score, domain
                     )
-                    self.tm.add_segment(tm_segment)
 
                 return result
 
@@ -439,6 +588,179 @@ class TranslatorEngine:
                         overlap_char_count=overlap_count
                     )
 
+    def _validated_result(self, chunk: TranslationChunk, translated: str) -> tuple[TranslationResult, str]:
+        """Build a result for an LLM translation and score it with the validator."""
+        # FIX-002: Copy overlap_char_count từ chunk sang result
+        result = TranslationResult(
+            chunk_id=chunk.id,
+            source=chunk.text,
+            translated=translated,
+            overlap_char_count=self._overlap_count(chunk)
+        )
+
+        domain = self.glossary_mgr.domain if self.glossary_mgr else 'default'
+        validation = self.validator.validate(
+            chunk.text, translated, self.glossary_mgr,
+            domain=domain,
+            source_lang=self.source_lang,
+            target_lang=self.target_lang
+        )
+        result.quality_score = validation.quality_score
+        result.warnings = validation.warnings
+        return result, domain
+
+    def build_packed_prompt(self, group: List[TranslationChunk]) -> str:
+        """
+        Build the prompt for a packed group of small chunks.
+
+        The group is framed like one chunk (context from the first and
+        last member) with extra instructions to keep the segment markers.
+        """
+        packed = TranslationChunk(
+            id=group[0].id,
+            text=self.packer.build_text(group),
+            context_before=group[0].context_before,
+            context_after=group[-1].context_after
+        )
+        return "\n".join([self.build_prompt(packed), "", self.packer.instructions(len(group))])
+
+    async def translate_packed(
+        self,
+        client: httpx.AsyncClient,
+        group: List[TranslationChunk]
+    ) -> List[Optional[TranslationResult]]:
+        """
+        Translate a group of small chunks with one LLM request.
+
+        Args:
+            client: httpx.AsyncClient for API calls.
+            group: Chunks produced by ChunkPacker.pack.
+
+        Returns:
+            One entry per chunk. None marks chunks that still need a
+            normal translate_chunk call: every chunk when the request
+            fails or the markers cannot be split back, otherwise only
+            chunks whose packed translation scored below 0.5.
+        """
+        try:
+            translated = await self._call_llm(
+                client, self.build_packed_prompt(group), self.packer.build_text(group)
+            )
+        except Exception as e:
+            logger.warning(f" Packed request for {len(group)} chunks failed: {e}")
+            return [None] * len(group)
+
+        parts = self.packer.split(translated, group)
+        if parts is None:
+            logger.warning(f" Packed response for {len(group)} chunks could not be split, falling back")
+            return [None] * len(group)
+
+        self.packed_requests += 1
+        results: List[Optional[TranslationResult]] = []
+        to_store = []
+        for chunk, text in zip(group, parts):
+            result, domain = self._validated_result(chunk, text)
+            if result.quality_score < 0.5:
+                results.append(None)
+                continue
+            if result.quality_score >= 0.7:
+                to_store.append((chunk, text, result.quality_score, domain))
+            self.packed_chunks += 1
+            results.append(result)
+        if to_store:
+            await self.lookup_executor.run(self._store_many_sync, to_store)
+        return results
+
+    async def pretranslate_packed(
+        self,
+        client: httpx.AsyncClient,
+        chunks: List[TranslationChunk],
+        max_concurrency: int = 5
+    ) -> int:
+        """
+        Translate small chunks in packed requests before the per-chunk pass.
+
+        Like prefetch_lookups, results are kept on the engine and consumed
+        by translate_chunk, so callers keep passing every chunk through
+        translate_chunk. Chunks already resolved from TM/cache are skipped;
+        chunks the packed requests could not translate are left for
+        translate_chunk to send individually.
+
+        Args:
+            client: httpx.AsyncClient for API calls.
+            chunks: Chunks about to be translated.
+            max_concurrency: Packed requests in flight at once.
+
+        Returns:
+            Number of chunks translated by packed requests.
+        """
+        if not self.packer or not chunks:
+            return 0
+
+        pending = [c for c in chunks if self._prefetched.get((c.id, c.text)) is None]
+        groups = self.packer.pack(pending)
+        if not groups:
+            return 0
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(group):
+            async with semaphore:
+                return group, await self.translate_packed(client, group)
+
+        translated = 0
+        for group, results in await asyncio.gather(*(run(g) for g in groups)):
+            for chunk, result in zip(group, results):
+                if result is not None:
+                    self._prefetched[(chunk.id, chunk.text)] = result
+                    translated += 1
+
+        logger.info(
+            f" Packed: {translated}/{sum(len(g) for g in groups)} small chunks "
+            f"translated in {len(groups)} requests"
+        )
+        return translated
+
+    def plan_packed(self, chunks: List[TranslationChunk]) -> int:
+        """
+        Group small chunks for packed requests without sending them yet.
+
+        Unlike pretranslate_packed this makes no LLM call: the request for
+        a group is sent by translate_chunk for whichever member is
+        translated first, so it runs inside the caller's concurrency limit
+        (e.g. a streaming window slot) instead of ahead of it.
+
+        Returns:
+            Number of chunks placed in packed groups.
+        """
+        if not self.packer or not chunks:
+            return 0
+
+        pending = [
+            c for c in chunks
+            if self._prefetched.get((c.id, c.text)) is None
+            and (c.id, c.text) not in self._packed_groups
+        ]
+        planned = 0
+        for group in self.packer.pack(pending):
+            state = {"chunks": group, "task": None}
+            for chunk in group:
+                self._packed_groups[(chunk.id, chunk.text)] = state
+            planned += len(group)
+        return planned
+
+    async def _run_packed_group(self, client: httpx.AsyncClient, state: dict) -> None:
+        """Send a planned group's packed request once and queue its results."""
+        if state["task"] is None:
+            state["task"] = asyncio.ensure_future(self.translate_packed(client, state["chunks"]))
+        # Shielded so a member's timeout or retry does not cancel the shared request
+        results = await asyncio.shield(state["task"])
+
+        for chunk, result in zip(state["chunks"], results):
+            key = (chunk.id, chunk.text)
+            if self._packed_groups.pop(key, None) is not None and result is not None:
+                self._prefetched[key] = result
+
     async def translate_parallel(
         self,
         chunks: List[TranslationChunk],
@@ -484,11 +806,19 @@ class TranslatorEngine:
             cancellation_token=cancellation_token
         )
 
-        # Use self.translate_chunk as the processing function
-        results, stats = await processor.process_all(
-            chunks,
-            self.translate_chunk
-        )
+        # Resolve TM/cache hits in bulk before scheduling LLM calls
+        await self.prefetch_lookups(chunks)
+
+        async with pooled_client(self.provider) as client:
+            # Pack small chunks into shared requests, then translate the rest
+            await self.pretranslate_packed(client, chunks, max_concurrency)
+
+            # Use self.translate_chunk as the processing function
+            results, stats = await processor.process_all(
+                chunks,
+                self.translate_chunk,
+                http_client=client
+            )
 
         # Update cache stats if available
         if self.cache:
@@ -534,10 +864,18 @@ class TranslatorEngine:
             max_concurrency=max_concurrency
         )
 
-        results, stats = await batch_processor.process_in_batches(
-            chunks,
-            self.translate_chunk
-        )
+        # Resolve TM/cache hits in bulk before scheduling LLM calls
+        await self.prefetch_lookups(chunks)
+
+        async with pooled_client(self.provider) as client:
+            # Pack small chunks into shared requests, then translate the rest
+            await self.pretranslate_packed(client, chunks, max_concurrency)
+
+            results, stats = await batch_processor.process_in_batches(
+                chunks,
+                self.translate_chunk,
+                http_client=client
+            )
 
         # Update cache stats
         if self.cache:
@@ -546,6 +884,14 @@ class TranslatorEngine:
 
         return results, stats
 
+    async def _call_llm(self, client: httpx.AsyncClient, prompt: str, text: str) -> str:
+        """Dispatch a translation request to the configured provider."""
+        if self.provider == "openai":
+            return await self._call_openai(client, prompt, text)
+        elif self.provider == "anthropic":
+            return await self._call_anthropic(client, prompt, text)
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
     async def _call_openai(self, client: httpx.AsyncClient, prompt: str, text: str) -> str:
         """
         Call OpenAI Chat Completions API.
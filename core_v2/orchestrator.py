@@ -284,8 +284,12 @@ class UniversalPublisher:
         self.converter = OutputConverter()
         self.verifier = QualityVerifier(llm_client) if enable_verification else None
 
-        # NEW: Vision reader for PDF/images
-        self.vision_reader = VisionReader(llm_client)
+        # NEW: Vision reader for PDF/images (pages cached so re-runs resume)
+        self.vision_reader = VisionReader(
+            llm_client,
+            concurrency=concurrency,
+            cache_dir=self.output_dir / ".vision_cache",
+        )
 
         # Semaphore for concurrency control
         self._semaphore = asyncio.Semaphore(concurrency)
@@ -8,10 +8,14 @@ Properly handles LaTeX formulas:
 """
 
 import asyncio
+import hashlib
+import os
 import subprocess
 import tempfile
 import shutil
 import logging
+import uuid
+import weakref
 from pathlib import Path
 from typing import Optional, List, Dict, Union
 from enum import Enum
@@ -24,6 +28,36 @@ from core.pdf_engine import PdfRenderer, create_pdf_template
 
 logger = logging.getLogger(__name__)
 
+# Concurrent LaTeX compiler processes across all converters (per event loop)
+MAX_CONCURRENT_COMPILES = max(1, (os.cpu_count() or 2) // 2)
+MAX_LATEX_RUNS = 3
+# Disk budget of the compiled PDF cache; least recently used PDFs go first
+PDF_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_compile_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _compile_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _compile_slots.get(loop)
+    if sem is None:
+        sem = _compile_slots[loop] = asyncio.Semaphore(MAX_CONCURRENT_COMPILES)
+    return sem
+
+
+def _latex_needs_rerun(aux_before: Optional[bytes], aux_after: Optional[bytes], log: str) -> bool:
+    """Rerun only if the compiler asks for it or cross-reference data in .aux changed."""
+    if "Rerun to get" in log or "Label(s) may have changed" in log:
+        return True
+    if aux_after is None or aux_after == aux_before:
+        return False
+    return any(
+        marker in aux_after
+        for marker in (b"\\newlabel", b"\\@writefile", b"\\bibcite", b"\\bibdata")
+    )
+
 
 class OutputFormat(Enum):
     DOCX = "docx"
@@ -41,11 +75,23 @@ class OutputConverter:
     FIXED: Proper formula rendering for STEM documents.
     """
 
-    def __init__(self, temp_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        temp_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        cache_max_bytes: int = PDF_CACHE_MAX_BYTES,
+    ):
         self.temp_dir = temp_dir or Path(tempfile.gettempdir()) / "aps_converter"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # Compiled PDFs keyed by content hash (created on first use)
+        self.cache_dir = cache_dir or self.temp_dir / "pdf_cache"
+        self.cache_max_bytes = cache_max_bytes
         self._check_dependencies()
 
+    def _temp_file(self, name: str) -> Path:
+        """Unique temp file path so concurrent jobs never share inputs."""
+        return self.temp_dir / f"{uuid.uuid4().hex}_{name}"
+
     def _check_dependencies(self):
         """Check if required tools are installed"""
         self.has_pandoc = shutil.which("pandoc") is not None
@@ -168,7 +214,7 @@ class OutputConverter:
 
         # Use pandoc to convert markdown to latex
         if self.has_pandoc:
-            temp_input = self.temp_dir / "temp_input.md"
+            temp_input = self._temp_file("temp_input.md")
             temp_input.write_text(content, encoding='utf-8')
 
             try:
@@ -285,6 +331,11 @@ class OutputConverter:
         Convert LaTeX to PDF using pdflatex or xelatex.
 
         This gives the best formula rendering quality.
+
+        Each compile runs in its own workspace under ``temp_dir``, at most
+        ``MAX_CONCURRENT_COMPILES`` at a time, and is only rerun while
+        cross-references are still settling. Results are cached by
+        content hash, so recompiling unchanged content is a file copy.
         """
 
         # Prefer xelatex for better Unicode support
@@ -295,45 +346,93 @@ class OutputConverter:
             logger.warning("No LaTeX compiler, using pandoc for PDF")
             return await self._pandoc_latex_to_pdf(content, output_path)
 
-        temp_tex = self.temp_dir / "document.tex"
+        digest = hashlib.sha256(f"{latex_cmd}\0{content}".encode("utf-8")).hexdigest()
+        cached = self.cache_dir / f"{digest}.pdf"
+        if cached.exists():
+            shutil.copy(cached, output_path)
+            try:
+                os.utime(cached)  # mtime = last use, for LRU eviction
+            except OSError:
+                pass
+            logger.info(f"PDF served from cache: {output_path}")
+            return True
+
+        workspace = Path(tempfile.mkdtemp(prefix="latex_", dir=self.temp_dir))
+        temp_tex = workspace / "document.tex"
+        aux_file = workspace / "document.aux"
+        log_file = workspace / "document.log"
         temp_tex.write_text(content, encoding='utf-8')
 
         try:
-            # Run LaTeX compiler (twice for references)
-            for i in range(2):
-                proc = await asyncio.create_subprocess_exec(
-                    latex_cmd,
-                    "-interaction=nonstopmode",
-                    "-output-directory", str(self.temp_dir),
-                    str(temp_tex),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(self.temp_dir),
-                )
-                stdout, stderr = await proc.communicate()
-
-                if proc.returncode != 0 and i == 1:
-                    logger.warning(f"LaTeX warning: {stderr.decode()[:500]}")
+            async with _compile_semaphore():
+                for run in range(1, MAX_LATEX_RUNS + 1):
+                    aux_before = aux_file.read_bytes() if aux_file.exists() else None
+
+                    proc = await asyncio.create_subprocess_exec(
+                        latex_cmd,
+                        "-interaction=nonstopmode",
+                        "-output-directory", str(workspace),
+                        str(temp_tex),
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        cwd=str(workspace),
+                    )
+                    stdout, stderr = await proc.communicate()
+
+                    aux_after = aux_file.read_bytes() if aux_file.exists() else None
+                    log = log_file.read_text(encoding="utf-8", errors="ignore") if log_file.exists() else ""
+                    if run == MAX_LATEX_RUNS or not _latex_needs_rerun(aux_before, aux_after, log):
+                        if proc.returncode != 0:
+                            logger.warning(f"LaTeX warning: {stderr.decode()[:500]}")
+                        break
 
             # Check for PDF output
-            pdf_file = self.temp_dir / "document.pdf"
+            pdf_file = workspace / "document.pdf"
             if pdf_file.exists():
                 shutil.copy(pdf_file, output_path)
-                logger.info(f"PDF created: {output_path}")
+                # A PDF from a run with errors may be incomplete: never reuse it
+                if proc.returncode == 0:
+                    try:
+                        self.cache_dir.mkdir(parents=True, exist_ok=True)
+                        partial = self.cache_dir / f"{digest}.{uuid.uuid4().hex}.part"
+                        shutil.copy(pdf_file, partial)
+                        os.replace(partial, cached)
+                        self._prune_pdf_cache(keep=cached)
+                    except OSError as e:
+                        logger.debug(f"Could not cache compiled PDF: {e}")
+                logger.info(f"PDF created: {output_path} ({run} LaTeX run(s))")
                 return True
             else:
                 logger.error(f"LaTeX failed, no PDF produced")
                 # Try pandoc fallback
                 return await self._pandoc_latex_to_pdf(content, output_path)
         finally:
-            # Cleanup temp files
-            for ext in ['.tex', '.aux', '.log', '.out', '.toc']:
-                (self.temp_dir / f"document{ext}").unlink(missing_ok=True)
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    def _prune_pdf_cache(self, keep: Path):
+        """Delete least recently used cached PDFs until the cache fits its budget."""
+        entries = []
+        for path in self.cache_dir.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by another converter
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted cached PDF {path.name}")
 
     async def _pandoc_latex_to_pdf(self, content: str, output_path: Path) -> bool:
         """Fallback: Use pandoc for LaTeX to PDF"""
 
-        temp_input = self.temp_dir / "temp_latex.tex"
+        temp_input = self._temp_file("temp_latex.tex")
         temp_input.write_text(content, encoding='utf-8')
 
         # Use xelatex for better Unicode support
@@ -369,7 +468,7 @@ class OutputConverter:
             logger.error("pandoc required for DOCX conversion")
             return False
 
-        temp_input = self.temp_dir / "temp_latex.tex"
+        temp_input = self._temp_file("temp_latex.tex")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -402,7 +501,7 @@ class OutputConverter:
             logger.error("pandoc required for HTML conversion")
             return False
 
-        temp_input = self.temp_dir / "temp_latex.tex"
+        temp_input = self._temp_file("temp_latex.tex")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -433,7 +532,7 @@ class OutputConverter:
             logger.error("pandoc required for EPUB conversion")
             return False
 
-        temp_input = self.temp_dir / "temp_latex.tex"
+        temp_input = self._temp_file("temp_latex.tex")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -479,7 +578,7 @@ class OutputConverter:
             return False
 
         # Create temp file WITHOUT YAML frontmatter (avoids --- parsing issues)
-        temp_input = self.temp_dir / "temp_markdown.md"
+        temp_input = self._temp_file("temp_markdown.md")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -527,7 +626,7 @@ class OutputConverter:
             logger.error("pandoc required for HTML conversion")
             return False
 
-        temp_input = self.temp_dir / "temp_markdown.md"
+        temp_input = self._temp_file("temp_markdown.md")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -575,7 +674,7 @@ class OutputConverter:
             logger.error("pandoc required for EPUB conversion")
             return False
 
-        temp_input = self.temp_dir / "temp_markdown.md"
+        temp_input = self._temp_file("temp_markdown.md")
         temp_input.write_text(content, encoding='utf-8')
 
         try:
@@ -652,7 +751,7 @@ class OutputConverter:
             return False
 
         # Create temp markdown WITHOUT frontmatter (avoids --- parsing issues)
-        temp_md = self.temp_dir / "temp_simple.md"
+        temp_md = self._temp_file("temp_simple.md")
         temp_md.write_text(content, encoding='utf-8')
 
         try:
@@ -999,11 +1098,16 @@ class OutputConverter:
         return result_path
 
     def cleanup(self):
-        """Clean up temp files."""
+        """Clean up temp files and workspaces (the compiled PDF cache is kept)."""
         if self.temp_dir.exists():
             for f in self.temp_dir.iterdir():
+                if f == self.cache_dir:
+                    continue
                 try:
-                    f.unlink()
+                    if f.is_dir():
+                        shutil.rmtree(f)
+                    else:
+                        f.unlink()
                 except OSError:
                     # File may be in use or already deleted
                     pass
@@ -11,11 +11,18 @@ Philosophy: "Let Claude BE the solution, not use tools FOR Claude"
 
 import asyncio
 import base64
+import hashlib
+import json
 import logging
 import io
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable
-from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,195 @@ class VisionDocument:
         return any(page.has_formulas for page in self.pages)
 
 
+# =============================================================================
+# PACING, RENDERING AND PAGE CACHE
+# =============================================================================
+
+# Header names carrying "requests left" / "seconds until the window resets"
+_REMAINING_HEADERS = (
+    "anthropic-ratelimit-requests-remaining",
+    "x-ratelimit-remaining-requests",
+)
+_RESET_HEADERS = (
+    "anthropic-ratelimit-requests-reset",
+    "x-ratelimit-reset-requests",
+)
+
+
+_DURATION = re.compile(
+    r"^(?:(?P<h>[\d.]+)h)?(?:(?P<m>[\d.]+)m(?!s))?(?:(?P<s>[\d.]+)s)?(?:(?P<ms>[\d.]+)ms)?$"
+)
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Seconds until reset from '12', '1m30s', '250ms' or an RFC 3339/1123 date."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    match = _DURATION.match(value)
+    if match and any(match.groupdict().values()):
+        parts = {k: float(v) for k, v in match.groupdict().items() if v}
+        return (
+            parts.get("h", 0) * 3600 + parts.get("m", 0) * 60
+            + parts.get("s", 0) + parts.get("ms", 0) / 1000
+        )
+
+    for parse in (lambda v: datetime.fromisoformat(v.replace("Z", "+00:00")), parsedate_to_datetime):
+        try:
+            reset_at = parse(value)
+        except (TypeError, ValueError):
+            continue
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    return None
+
+
+class RequestPacer:
+    """
+    Token bucket for Vision requests.
+
+    Starts at ``requests_per_minute`` and re-tunes itself from provider
+    rate-limit headers (remaining requests / reset window), pausing all
+    callers on ``retry-after``.
+    """
+
+    def __init__(self, requests_per_minute: float = 60.0, burst: int = 1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for a request slot."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hold every caller for ``seconds`` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def update_from_headers(self, headers: Any):
+        """Re-tune the rate from response or error headers, if present."""
+        if not headers:
+            return
+        get = headers.get
+        retry_after = get("retry-after")
+        if retry_after:
+            wait = _parse_reset(str(retry_after))
+            if wait is not None:
+                self.pause(wait)
+                return
+
+        remaining = next((get(h) for h in _REMAINING_HEADERS if get(h) is not None), None)
+        reset = next((get(h) for h in _RESET_HEADERS if get(h) is not None), None)
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+        except (TypeError, ValueError):
+            return
+        window = _parse_reset(str(reset))
+        if window is None:
+            return
+        if remaining <= 0:
+            self.pause(window)
+        elif window > 0:
+            self.rate = remaining / window
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    text = str(error).lower()
+    return (
+        getattr(error, "status_code", None) == 429
+        or "429" in text
+        or "rate_limit" in text
+        or "rate limit" in text
+    )
+
+
+def _error_headers(error: Exception) -> Any:
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
+def _pdf_page_count(pdf_path: Path) -> int:
+    import fitz
+    with fitz.open(str(pdf_path)) as doc:
+        return len(doc)
+
+
+def _render_pdf_page(pdf_path: Path, page_index: int, dpi: int) -> bytes:
+    """Render one page to PNG (own document handle, safe to run in a worker thread)."""
+    import fitz
+    with fitz.open(str(pdf_path)) as doc:
+        mat = fitz.Matrix(dpi / 72, dpi / 72)
+        return doc[page_index].get_pixmap(matrix=mat).tobytes("png")
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PageCache:
+    """
+    Per-document cache of pages already read, keyed by page image hash.
+
+    One append-only JSON-lines file per source document, so an
+    interrupted read resumes without paying for finished pages again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._entries[record["key"]] = record["page"]
+                    except (json.JSONDecodeError, KeyError):
+                        continue  # Torn last line after a crash
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, page_number: int) -> Optional[PageContent]:
+        page = self._entries.get(key)
+        if page is None:
+            return None
+        return PageContent(**{**page, "page_number": page_number})
+
+    def put(self, key: str, page: PageContent):
+        self._entries[key] = asdict(page)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "page": asdict(page)}, ensure_ascii=False) + "\n")
+
+
 # =============================================================================
 # VISION PROMPTS - CLAUDE READS LIKE A HUMAN
 # =============================================================================
@@ -173,23 +369,45 @@ class VisionReader:
     TRUE Claude-native: Claude SEES the document, no extraction tools.
     """
 
-    def __init__(self, llm_client):
+    def __init__(
+        self,
+        llm_client,
+        concurrency: int = 1,
+        requests_per_minute: float = 60.0,
+        render_workers: int = 4,
+        cache_dir: Optional[Path] = None,
+        max_retries: int = 3,
+    ):
         """
         Initialize Vision Reader
 
         Args:
             llm_client: LLM client with async chat method (supports vision)
+            concurrency: Pages in flight at once in read_pdf (1 = one at a time)
+            requests_per_minute: Initial request pacing, re-tuned from rate-limit headers
+            render_workers: Threads used to render PDF pages off the event loop
+            cache_dir: Directory for per-document page caches (None = no resume)
+            max_retries: Retries for a page after a rate-limit error
         """
         self.llm_client = llm_client
         self.max_tokens = 8192
         self._current_prompt = None  # Override prompt for specialized reading
 
+        self.concurrency = max(1, concurrency)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_retries = max_retries
+        self.pacer = RequestPacer(requests_per_minute, burst=self.concurrency)
+        self._render_pool = ThreadPoolExecutor(
+            max_workers=max(1, render_workers), thread_name_prefix="vision-render"
+        )
+
     async def read_pdf(
         self,
         pdf_path: Path,
         dpi: int = 150,
         max_pages: Optional[int] = None,
         progress_callback: Optional[Callable] = None,
+        concurrency: Optional[int] = None,
     ) -> VisionDocument:
         """
         Read PDF using Claude Vision
@@ -197,11 +415,17 @@ class VisionReader:
         Claude sees each page as an image and extracts content
         with perfect formula reconstruction.
 
+        Pages are rendered in a thread pool and read up to
+        ``concurrency`` at a time, paced by the request token bucket.
+        Results are always returned in page order. With ``cache_dir``
+        set, pages already read (same image, same prompt) are reused.
+
         Args:
             pdf_path: Path to PDF file
             dpi: Resolution for rendering (higher = better formula clarity)
             max_pages: Limit pages to process (None = all)
-            progress_callback: Called with (current_page, total_pages)
+            progress_callback: Called with (pages_done, total_pages)
+            concurrency: Override the reader's in-flight page limit
 
         Returns:
             VisionDocument with all content as Markdown+LaTeX
@@ -214,48 +438,58 @@ class VisionReader:
         pdf_path = Path(pdf_path)
         logger.info(f"[Vision] Reading PDF: {pdf_path.name}")
 
-        # Open PDF
-        doc = fitz.open(str(pdf_path))
-        total_pages = len(doc)
+        loop = asyncio.get_running_loop()
+        total_pages = await loop.run_in_executor(self._render_pool, _pdf_page_count, pdf_path)
 
         if max_pages:
             total_pages = min(total_pages, max_pages)
 
-        logger.info(f"[Vision] Processing {total_pages} pages at {dpi} DPI")
-
-        # Process each page with Vision
-        pages = []
-        for page_num in range(total_pages):
+        limit = max(1, concurrency or self.concurrency)
+        logger.info(f"[Vision] Processing {total_pages} pages at {dpi} DPI (x{limit})")
+
+        cache = None
+        if self.cache_dir:
+            doc_hash = await loop.run_in_executor(self._render_pool, _file_digest, pdf_path)
+            cache = PageCache(self.cache_dir / f"{doc_hash}.jsonl")
+            if len(cache):
+                logger.info(f"[Vision] Page cache has {len(cache)} pages for {pdf_path.name}")
+
+        prompt_id = hashlib.sha256(
+            (self._current_prompt or PAGE_READING_PROMPT).encode("utf-8")
+        ).hexdigest()[:16]
+        sem = asyncio.Semaphore(limit)
+        done = 0
+
+        async def read_one(page_index: int) -> PageContent:
+            nonlocal done
+            page_num = page_index + 1
+            async with sem:
+                img_bytes = await loop.run_in_executor(
+                    self._render_pool, _render_pdf_page, pdf_path, page_index, dpi
+                )
+                key = f"{hashlib.sha256(img_bytes).hexdigest()}:{prompt_id}"
+
+                page_content = cache.get(key, page_num) if cache is not None else None
+                if page_content is None:
+                    page_content = await self._read_page_image(img_bytes, page_num, total_pages)
+                    if cache is not None and not page_content.content.startswith("[VISION ERROR"):
+                        cache.put(key, page_content)
+                    logger.info(
+                        f"[Vision] Page {page_num}/{total_pages} complete "
+                        f"({len(page_content.content)} chars)"
+                    )
+
+            done += 1
             if progress_callback:
-                progress_callback(page_num + 1, total_pages)
-
-            page = doc[page_num]
+                progress_callback(done, total_pages)
+            return page_content
 
-            # Render page to image
-            mat = fitz.Matrix(dpi / 72, dpi / 72)  # Scale matrix
-            pix = page.get_pixmap(matrix=mat)
-            img_bytes = pix.tobytes("png")
-
-            # Claude reads the page
-            page_content = await self._read_page_image(
-                img_bytes,
-                page_num + 1,
-                total_pages
-            )
-
-            pages.append(page_content)
-            logger.info(f"[Vision] Page {page_num + 1}/{total_pages} complete ({len(page_content.content)} chars)")
-
-            # Small delay to avoid rate limits
-            if page_num < total_pages - 1:
-                await asyncio.sleep(1)
-
-        doc.close()
+        pages = await asyncio.gather(*[read_one(i) for i in range(total_pages)])
 
         return VisionDocument(
             source_file=pdf_path.name,
             total_pages=total_pages,
-            pages=pages,
+            pages=list(pages),
         )
 
     async def read_image(
@@ -315,10 +549,6 @@ class VisionReader:
             page_content.page_number = i + 1
             pages.append(page_content)
 
-            # Small delay to avoid rate limits
-            if i < total - 1:
-                await asyncio.sleep(1)
-
         return VisionDocument(
             source_file=image_paths[0].name if image_paths else "images",
             total_pages=total,
@@ -417,34 +647,47 @@ class VisionReader:
         if total_pages > 1:
             prompt += f"\n\nThis is page {page_num} of {total_pages}."
 
-        # Call Claude Vision
-        try:
-            response = await self.llm_client.chat(
-                messages=[{
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": img_base64,
+        # Call Claude Vision (paced; retried after rate-limit errors)
+        content = f"[VISION ERROR: Page {page_num}]"
+        for attempt in range(self.max_retries + 1):
+            await self.pacer.acquire()
+            try:
+                response = await self.llm_client.chat(
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": media_type,
+                                    "data": img_base64,
+                                }
+                            },
+                            {
+                                "type": "text",
+                                "text": prompt,
                             }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt,
-                        }
-                    ]
-                }],
-                max_tokens=self.max_tokens,
-            )
-
-            content = response.content.strip()
-
-        except Exception as e:
-            logger.error(f"[Vision] Page {page_num} failed: {e}")
-            content = f"[VISION ERROR: Page {page_num}]"
+                        ]
+                    }],
+                    max_tokens=self.max_tokens,
+                )
+
+                self.pacer.update_from_headers(getattr(response, "headers", None))
+                content = response.content.strip()
+                break
+
+            except Exception as e:
+                if _is_rate_limit_error(e) and attempt < self.max_retries:
+                    headers = _error_headers(e)
+                    if headers and headers.get("retry-after"):
+                        self.pacer.update_from_headers(headers)
+                    else:
+                        self.pacer.pause(2 ** attempt)
+                    logger.warning(f"[Vision] Page {page_num} rate limited, retrying ({attempt + 1})")
+                    continue
+                logger.error(f"[Vision] Page {page_num} failed: {e}")
+                break
 
         # Detect content features
         has_formulas = '$' in content or '\\' in content
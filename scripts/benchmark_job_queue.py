@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: JobQueue operations, per-call vs pooled SQLite connections
+
+Runs the same mix of JobQueue operations against:
+- SQLiteBackend(pooled=False): one connection opened per call
+- SQLiteBackend(pooled=True): persistent connections, PRAGMAs applied once,
+  prepared statements reused
+
+Usage:
+    python scripts/benchmark_job_queue.py [num_jobs]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database.sqlite_backend import SQLiteBackend
+from core.job_queue import JobQueue
+
+
+def run(num_jobs: int, pooled: bool) -> dict:
+    """Time create/get/update/next/stats on a fresh queue."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "jobs.db"
+        queue = JobQueue(db_path=db_path)
+        queue._backend = SQLiteBackend(db_path, pooled=pooled)
+
+        timings = {}
+
+        start = time.perf_counter()
+        jobs = [
+            queue.create_job(f"job {i}", f"in_{i}.txt", f"out_{i}.txt")
+            for i in range(num_jobs)
+        ]
+        timings["create_job"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for job in jobs:
+            queue.get_job(job.job_id)
+        timings["get_job"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for job in jobs:
+            job.update_progress(1, 2)
+            queue.update_job(job)
+        timings["update_job"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(num_jobs):
+            queue.get_next_job()
+        timings["get_next_job"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(num_jobs):
+            queue.get_queue_stats()
+        timings["get_queue_stats"] = time.perf_counter() - start
+
+        queue._backend.close()
+        return {op: num_jobs / elapsed for op, elapsed in timings.items()}
+
+
+def main():
+    num_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"JobQueue benchmark: {num_jobs} jobs\n")
+    before = run(num_jobs, pooled=False)
+    after = run(num_jobs, pooled=True)
+
+    print(f"{'operation':<18}{'per-call ops/s':>16}{'pooled ops/s':>16}{'speedup':>10}")
+    for op in before:
+        print(f"{op:<18}{before[op]:>16.0f}{after[op]:>16.0f}{after[op] / before[op]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
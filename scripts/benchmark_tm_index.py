@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: TM fuzzy matching, linear scan vs n-gram candidate index
+
+Compares latency and recall of:
+- TMMatcher.find_fuzzy over every segment (linear scan)
+- TMMatcher.find_fuzzy_indexed over a TMIndex (shortlisted candidates)
+
+Recall is the share of queries whose best indexed match has the same
+similarity as the best linear-scan match.
+
+Usage:
+    python scripts/benchmark_tm_index.py [num_segments] [num_queries]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.tm.index import TMIndex
+from core.tm.matcher import TMMatcher
+from core.tm.models import TMSegment, compute_hash, normalize_text
+
+
+WORDS = (
+    "patient hospital treatment doctor medicine blood heart lung kidney "
+    "disease chronic acute therapy dose tablet daily risk study result "
+    "clinical trial group control effect side analysis data sample test "
+    "the a of in on with for and was were is are to by from after before"
+).split()
+
+
+def make_sentence(rng: random.Random) -> str:
+    """Generate a random sentence of 6-20 words."""
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 20))).capitalize() + "."
+
+
+def mutate(sentence: str, rng: random.Random) -> str:
+    """Change one or two words to produce a fuzzy query."""
+    words = sentence.rstrip(".").split()
+    for _ in range(rng.randint(1, 2)):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words) + "."
+
+
+def generate_segments(num_segments: int, rng: random.Random):
+    """Generate synthetic TM segments."""
+    segments = []
+    for i in range(num_segments):
+        source = make_sentence(rng)
+        segments.append(TMSegment(
+            id=f"seg_{i}",
+            tm_id="bench",
+            source_text=source,
+            target_text=source,
+            source_hash=compute_hash(source),
+            source_normalized=normalize_text(source),
+            source_length=len(source.split()),
+            quality_score=0.8,
+        ))
+    return segments
+
+
+def benchmark(num_segments: int = 20000, num_queries: int = 100):
+    """Run linear vs indexed comparison."""
+    rng = random.Random(42)
+    segments = generate_segments(num_segments, rng)
+    queries = [mutate(rng.choice(segments).source_text, rng) for _ in range(num_queries)]
+
+    print("\n" + "=" * 60)
+    print("TM FUZZY MATCHING: LINEAR SCAN vs INDEX")
+    print("=" * 60)
+    print(f"Segments: {num_segments:,}")
+    print(f"Queries:  {num_queries:,}")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    by_id = {seg.id: seg for seg in segments}
+    index = TMIndex("bench", fetch_segments=lambda ids: [by_id[i] for i in ids])
+    index.add_many(segments)
+    build_time = time.perf_counter() - start
+    print(f"Index build:        {build_time:.2f}s")
+
+    matcher = TMMatcher()
+
+    start = time.perf_counter()
+    linear = [matcher.find_fuzzy(q, segments, max_results=1) for q in queries]
+    linear_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [matcher.find_fuzzy_indexed(q, [index], max_results=1) for q in queries]
+    indexed_time = time.perf_counter() - start
+
+    expected = [m for m in linear if m]
+    hits = sum(
+        1 for lin, idx in zip(linear, indexed)
+        if lin and idx and abs(lin[0].similarity - idx[0].similarity) < 1e-9
+    )
+    recall = hits / len(expected) if expected else 1.0
+
+    print(f"Linear scan:        {linear_time / num_queries * 1000:.1f} ms/query")
+    print(f"Indexed:            {indexed_time / num_queries * 1000:.1f} ms/query")
+    print(f"Speedup:            {linear_time / max(indexed_time, 1e-9):.1f}x")
+    print(f"Recall@1:           {recall:.1%} ({hits}/{len(expected)} queries with a match)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    n_segments = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    benchmark(n_segments, n_queries)
@@ -4,6 +4,7 @@ Start batch processor for port 9000
 Phase 2.0.4 - OMML testing
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -15,31 +16,41 @@ sys.path.insert(0, str(project_root))
 from core.batch_processor import run_batch_processor
 from core.job_queue import JobQueue
 
-async def main():
-    """Start batch processor for Phase 2.0.4"""
+async def main(args):
+    """Start batch processor for Phase 2.0.4
+
+    Several processes can be started against the same queue; each one
+    claims jobs under its own worker lease.
+    """
 
     # Create queue (uses default database)
-    queue = JobQueue()
+    queue = JobQueue(worker_id=args.worker_id)
 
     print("=" * 70)
     print("🚀 Starting Batch Processor for Phase 2.0.4 Testing")
     print("=" * 70)
     print(f"   Database: {queue.db_path}")
-    print(f"   Max concurrent jobs: 1")
-    print(f"   Scheduler: Enabled")
+    print(f"   Worker: {queue.worker_id}")
+    print(f"   Max concurrent jobs: {args.max_jobs}")
+    print(f"   Scheduler: {'Disabled' if args.no_scheduler else 'Enabled'}")
     print("=" * 70)
     print()
 
     # Run processor
     await run_batch_processor(
         queue=queue,
-        max_concurrent_jobs=1,
-        enable_scheduler=True
+        max_concurrent_jobs=args.max_jobs,
+        enable_scheduler=not args.no_scheduler,
+        worker_id=queue.worker_id
     )
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start a batch processor worker")
+    parser.add_argument("--max-jobs", type=int, default=1, help="Concurrent jobs in this process")
+    parser.add_argument("--worker-id", default=None, help="Worker lease name (default: host:pid)")
+    parser.add_argument("--no-scheduler", action="store_true", help="Do not run the job scheduler")
     try:
-        asyncio.run(main())
+        asyncio.run(main(parser.parse_args()))
     except KeyboardInterrupt:
         print("\n\n🛑 Batch processor stopped by user")
         sys.exit(0)
@@ -476,3 +476,205 @@ class TestCheckpointEdgeCases:
         assert checkpoint.results_data["chunk_1"]["translated"] == "Tiếng Việt có dấu: àáảãạ ơớợờỡ"
         assert checkpoint.results_data["chunk_2"]["translated"] == "中文字符测试"
         assert checkpoint.results_data["chunk_3"]["translated"] == "العربية اختبار"
+
+
+class TestIncrementalCheckpoints:
+    """Test row-per-chunk storage and legacy migration"""
+
+    @pytest.fixture
+    def temp_checkpoint_manager(self, tmp_path):
+        return CheckpointManager(tmp_path / "checkpoints.db")
+
+    def _start(self, manager, job_id="job_inc", total=10):
+        manager.save_checkpoint(
+            job_id=job_id,
+            input_file="/input.pdf",
+            output_file="/output.docx",
+            total_chunks=total,
+            completed_chunk_ids=[],
+            results_data={}
+        )
+
+    def test_save_chunk_results_appends(self, temp_checkpoint_manager):
+        """Chunks saved in separate calls accumulate, in save order"""
+        self._start(temp_checkpoint_manager)
+
+        temp_checkpoint_manager.save_chunk_results("job_inc", {1: {"translated": "A"}, 2: {"translated": "B"}})
+        temp_checkpoint_manager.save_chunk_result("job_inc", 3, {"translated": "C"})
+
+        checkpoint = temp_checkpoint_manager.load_checkpoint("job_inc")
+        assert checkpoint.completed_chunk_ids == [1, 2, 3]
+        assert checkpoint.results_data[3] == {"translated": "C"}
+        assert temp_checkpoint_manager.completed_count("job_inc") == 3
+        assert temp_checkpoint_manager.get_resume_info("job_inc")["remaining_chunks"] == 7
+
+    def test_save_chunk_results_requires_checkpoint(self, temp_checkpoint_manager):
+        """Appending to a missing checkpoint is a no-op"""
+        assert temp_checkpoint_manager.save_chunk_results("missing", {1: {}}) is False
+        assert temp_checkpoint_manager.completed_count("missing") == 0
+
+    def test_results_are_loaded_lazily(self, temp_checkpoint_manager):
+        """load_checkpoint does not decode results until they are used"""
+        self._start(temp_checkpoint_manager)
+        temp_checkpoint_manager.save_chunk_result("job_inc", 1, {"translated": "A"})
+
+        checkpoint = temp_checkpoint_manager.load_checkpoint("job_inc")
+        assert checkpoint.results_data.loaded is False
+        assert checkpoint.completion_percentage() == 0.1
+        assert checkpoint.results_data.loaded is False
+
+        assert dict(checkpoint.results_data) == {1: {"translated": "A"}}
+        assert checkpoint.results_data.loaded is True
+
+    def test_get_results_pagination(self, temp_checkpoint_manager):
+        """get_results returns a window of results in save order"""
+        self._start(temp_checkpoint_manager)
+        temp_checkpoint_manager.save_chunk_results(
+            "job_inc", {i: {"translated": str(i)} for i in range(1, 6)}
+        )
+
+        page = temp_checkpoint_manager.get_results("job_inc", offset=2, limit=2)
+        assert list(page) == [3, 4]
+
+    def test_full_save_updates_and_removes_chunks(self, temp_checkpoint_manager):
+        """save_checkpoint still replaces the whole state"""
+        self._start(temp_checkpoint_manager)
+        temp_checkpoint_manager.save_chunk_results("job_inc", {1: {"translated": "A"}, 2: {"translated": "B"}})
+
+        checkpoint = temp_checkpoint_manager.load_checkpoint("job_inc")
+        checkpoint.results_data[1]["translated"] = "A (edited)"
+        del checkpoint.results_data[2]
+        temp_checkpoint_manager.save_checkpoint(
+            job_id=checkpoint.job_id,
+            input_file=checkpoint.input_file,
+            output_file=checkpoint.output_file,
+            total_chunks=checkpoint.total_chunks,
+            completed_chunk_ids=[1],
+            results_data=checkpoint.results_data,
+            job_metadata=checkpoint.job_metadata
+        )
+
+        reloaded = temp_checkpoint_manager.load_checkpoint("job_inc")
+        assert reloaded.completed_chunk_ids == [1]
+        assert dict(reloaded.results_data) == {1: {"translated": "A (edited)"}}
+
+    def test_delete_removes_chunk_rows(self, temp_checkpoint_manager):
+        self._start(temp_checkpoint_manager)
+        temp_checkpoint_manager.save_chunk_result("job_inc", 1, {"translated": "A"})
+
+        temp_checkpoint_manager.delete_checkpoint("job_inc")
+
+        assert temp_checkpoint_manager.get_results("job_inc") == {}
+
+    def test_legacy_blob_checkpoint_is_migrated(self, tmp_path):
+        """Databases in the old single-row JSON format migrate on open"""
+        import json
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE checkpoints (
+                    job_id TEXT PRIMARY KEY,
+                    input_file TEXT NOT NULL,
+                    output_file TEXT NOT NULL,
+                    total_chunks INTEGER NOT NULL,
+                    completed_chunk_ids TEXT NOT NULL,
+                    results_data TEXT NOT NULL,
+                    job_metadata TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX idx_updated_at ON checkpoints(updated_at)")
+            conn.execute(
+                "INSERT INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ("old_job", "/in.pdf", "/out.docx", 4, json.dumps([1, 2]),
+                 json.dumps({"1": {"translated": "A"}, "2": {"translated": "B"}}),
+                 json.dumps({"domain": "stem"}), 100.0, 200.0)
+            )
+
+        manager = CheckpointManager(db_path)
+        checkpoint = manager.load_checkpoint("old_job")
+
+        assert checkpoint.completed_chunk_ids == [1, 2]
+        assert dict(checkpoint.results_data) == {1: {"translated": "A"}, 2: {"translated": "B"}}
+        assert checkpoint.job_metadata == {"domain": "stem"}
+        assert checkpoint.created_at == 100.0
+        assert manager.completed_count("old_job") == 2
+
+        # Re-opening the migrated database is a no-op
+        assert CheckpointManager(db_path).completed_count("old_job") == 2
+
+        # The updated_at index now belongs to the new table
+        with sqlite3.connect(db_path) as conn:
+            indexed = conn.execute(
+                "SELECT tbl_name FROM sqlite_master WHERE type = 'index' AND name = 'idx_updated_at'"
+            ).fetchall()
+        assert indexed == [("checkpoints",)]
+
+
+class TestChunkWindowsAndVersions:
+    """Test windowed reads and versioned single-chunk updates"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = CheckpointManager(tmp_path / "checkpoints.db")
+        manager.save_checkpoint(
+            job_id="job_win",
+            input_file="/input.pdf",
+            output_file="/output.docx",
+            total_chunks=12,
+            completed_chunk_ids=[],
+            results_data={}
+        )
+        # Saved out of order, as parallel workers finish them
+        for i in [3, 1, 10, 2, 11, 12, 4, 5, 6, 7, 8, 9]:
+            manager.save_chunk_result("job_win", i, {"source": f"S{i}", "translated": f"T{i}"})
+        return manager
+
+    def test_window_is_in_document_order(self, manager):
+        window = manager.get_chunk_window("job_win", offset=8, limit=3)
+
+        assert [r.chunk_id for r in window] == [9, 10, 11]
+        assert [r.index for r in window] == [8, 9, 10]
+        assert window[0].result["translated"] == "T9"
+        assert manager.count_results("job_win") == 12
+
+    def test_get_chunk_reports_position(self, manager):
+        record = manager.get_chunk("job_win", "10")
+
+        assert record.chunk_id == 10
+        assert record.index == 9
+        assert record.version == 0
+        assert manager.get_chunk("job_win", 99) is None
+
+    def test_update_bumps_version_and_keeps_other_fields(self, manager):
+        assert manager.update_chunk_result("job_win", 2, {"translated": "edited"}, expected_version=0) == 1
+
+        record = manager.get_chunk("job_win", 2)
+        assert record.result == {"source": "S2", "translated": "edited"}
+        assert record.version == 1
+        assert manager.get_chunk("job_win", 3).version == 0
+
+    def test_stale_version_is_rejected(self, manager):
+        from core.cache.checkpoint_manager import VersionConflictError
+
+        manager.update_chunk_result("job_win", 2, {"translated": "first"})
+
+        with pytest.raises(VersionConflictError) as exc:
+            manager.update_chunk_result("job_win", 2, {"translated": "second"}, expected_version=0)
+
+        assert exc.value.current_version == 1
+        assert manager.get_chunk("job_win", 2).result["translated"] == "first"
+
+    def test_retranslation_bumps_version(self, manager):
+        manager.save_chunk_result("job_win", 4, {"source": "S4", "translated": "again"})
+        manager.save_chunk_result("job_win", 5, {"source": "S5", "translated": "T5"})
+
+        assert manager.get_chunk("job_win", 4).version == 1
+        assert manager.get_chunk("job_win", 5).version == 0
+
+    def test_update_missing_chunk(self, manager):
+        assert manager.update_chunk_result("job_win", 99, {"translated": "x"}) is None
+        assert manager.update_chunk_result("missing", 1, {"translated": "x"}) is None
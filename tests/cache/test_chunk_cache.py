@@ -10,11 +10,14 @@ Tests cover:
 - Statistics tracking
 - Database persistence
 - Thread safety
+- Write-behind buffering
 """
 
 import pytest
 import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 from core.cache.chunk_cache import ChunkCache, compute_chunk_key
@@ -158,6 +161,22 @@ class TestChunkCache:
         stats = temp_cache.stats()
         assert stats['total_entries'] == 0, "Entry count must be 0 after clear"
 
+    def test_get_many(self, temp_cache):
+        """Test bulk lookup returns only hits and tracks stats"""
+        temp_cache.set("k1", "một")
+        temp_cache.set("k2", "hai")
+
+        found = temp_cache.get_many(["k1", "k2", "k3", "k1"])
+
+        assert found == {"k1": "một", "k2": "hai"}
+        stats = temp_cache.stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+
+    def test_get_many_empty(self, temp_cache):
+        """Test bulk lookup with no keys"""
+        assert temp_cache.get_many([]) == {}
+
     def test_cache_persistence(self):
         """Test that cache survives restart"""
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
@@ -180,6 +199,98 @@ class TestChunkCache:
             os.unlink(temp_path)
 
 
+class TestWriteBehind:
+    """Test buffered write-behind mode"""
+
+    @pytest.fixture
+    def wb_cache(self, tmp_path):
+        """Write-behind cache that only flushes when asked"""
+        cache = ChunkCache(tmp_path / "chunks.db", write_behind=True, flush_interval=3600)
+        yield cache
+        cache.close()
+
+    @staticmethod
+    def stored(cache, key):
+        row = cache._get_connection().execute(
+            'SELECT value, access_count FROM chunk_cache WHERE key = ?', (key,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def test_buffered_value_visible_before_flush(self, wb_cache):
+        wb_cache.set("k1", "một")
+
+        assert wb_cache.get("k1") == "một"
+        assert wb_cache.get_many(["k1", "k2"]) == {"k1": "một"}
+        assert self.stored(wb_cache, "k1") is None
+
+    def test_flush_writes_sets_and_access_stats(self, wb_cache):
+        wb_cache.set_many([("k1", "một"), ("k2", "hai")])
+        assert wb_cache.flush() == 2
+
+        wb_cache.get("k1")
+        wb_cache.get_many(["k1", "k2"])
+        assert self.stored(wb_cache, "k1") == ("một", 1)
+
+        wb_cache.flush()
+        assert self.stored(wb_cache, "k1") == ("một", 3)
+        assert self.stored(wb_cache, "k2") == ("hai", 2)
+
+    def test_value_visible_while_flush_commits(self, wb_cache, monkeypatch):
+        wb_cache.set("k1", "một")
+        seen = []
+        write_rows = wb_cache._write_rows
+
+        def write_and_read(rows, access):
+            # Another reader, between the buffer swap and the commit
+            reader = threading.Thread(target=lambda: seen.append(wb_cache.get("k1")))
+            reader.start()
+            reader.join()
+            write_rows(rows, access)
+
+        monkeypatch.setattr(wb_cache, "_write_rows", write_and_read)
+        wb_cache.flush()
+
+        assert seen == ["một"]
+        assert wb_cache._flushing_sets == {}
+
+    def test_size_threshold_triggers_flush(self, tmp_path):
+        cache = ChunkCache(tmp_path / "chunks.db", write_behind=True,
+                           flush_interval=3600, flush_size=3)
+        try:
+            cache.set_many([(f"k{i}", f"v{i}") for i in range(3)])
+            deadline = time.time() + 5
+            while self.stored(cache, "k2") is None and time.time() < deadline:
+                time.sleep(0.01)
+            assert self.stored(cache, "k2") == ("v2", 1)
+        finally:
+            cache.close()
+
+    def test_close_flushes(self, tmp_path):
+        path = tmp_path / "chunks.db"
+        cache = ChunkCache(path, write_behind=True, flush_interval=3600)
+        cache.set("k1", "một")
+        cache.close()
+
+        reopened = ChunkCache(path)
+        assert reopened.get("k1") == "một"
+        reopened.close()
+
+    def test_clear_drops_buffers(self, wb_cache):
+        wb_cache.set("k1", "một")
+        wb_cache.clear()
+
+        assert wb_cache.get("k1") is None
+        assert wb_cache.stats()['total_entries'] == 0
+
+    def test_set_many_without_write_behind(self, tmp_path):
+        cache = ChunkCache(tmp_path / "chunks.db")
+        cache.set_many([("k1", "một"), ("k2", "hai")], "en", "vi", "simple")
+
+        assert self.stored(cache, "k1") == ("một", 1)
+        assert cache.stats()['total_entries'] == 2
+        cache.close()
+
+
 class TestCacheStatistics:
     """Test cache statistics tracking"""
 
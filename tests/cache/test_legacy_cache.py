@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit Tests for the legacy TranslationCache (append-only log store)
+
+Tests cover:
+- Cache operations (set, get, overwrite)
+- Persistence and lazy index build
+- Compaction of overwritten records
+- One-time migration from translation_cache.json
+- Recovery from a torn final record
+- Several writers on one log
+"""
+
+import json
+
+import pytest
+
+from core.cache.legacy_cache import TranslationCache, get_translation_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+class TestTranslationCache:
+    """Test basic cache operations"""
+
+    def test_set_get_roundtrip(self, cache):
+        cache.set("Hello", "Xin chào", "gpt-4o", 0.9)
+        assert cache.get("Hello", "gpt-4o") == "Xin chào"
+        assert cache.get("Hello", "other-model") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_overwrite_returns_latest(self, cache):
+        cache.set("Hello", "Một", "m")
+        cache.set("Hello", "Hai", "m")
+        assert cache.get("Hello", "m") == "Hai"
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        first = TranslationCache(tmp_path)
+        first.set("Hello", "Xin chào", "m")
+        first.close()
+
+        second = TranslationCache(tmp_path)
+        assert second._index is None  # Index is built lazily
+        assert second.get("Hello", "m") == "Xin chào"
+        second.close()
+
+    def test_disabled(self, tmp_path):
+        disabled = TranslationCache(tmp_path, enabled=False)
+        disabled.set("Hello", "Xin chào", "m")
+        assert disabled.get("Hello", "m") is None
+        assert not (tmp_path / TranslationCache.LOG_NAME).exists()
+
+
+class TestCompaction:
+    """Test removal of overwritten records"""
+
+    def test_compact_drops_stale_records(self, cache):
+        for i in range(5):
+            cache.set("Hello", f"v{i}", "m")
+        cache.set("World", "Thế giới", "m")
+        size_before = cache.log_file.stat().st_size
+
+        cache.compact()
+
+        assert cache.log_file.stat().st_size < size_before
+        assert cache.get("Hello", "m") == "v4"
+        assert cache.get("World", "m") == "Thế giới"
+        assert len(cache.log_file.read_bytes().splitlines()) == 2
+
+    def test_automatic_compaction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(TranslationCache, "COMPACT_MIN_DEAD", 3)
+        cache = TranslationCache(tmp_path)
+        for i in range(10):
+            cache.set("Hello", f"v{i}", "m")
+
+        assert cache._dead <= 3
+        assert cache.get("Hello", "m") == "v9"
+        cache.close()
+
+
+class TestMigration:
+    """Test one-time import of the JSON cache"""
+
+    def test_migrates_json_file(self, tmp_path):
+        legacy = TranslationCache(tmp_path, enabled=False)
+        hash_key = legacy.get_hash("Hello", "m")
+        (tmp_path / "translation_cache.json").write_text(json.dumps({
+            hash_key: {"translation": "Xin chào", "model": "m",
+                       "quality_score": 0.9, "timestamp": "2025-01-01T00:00:00"}
+        }), encoding="utf-8")
+
+        cache = TranslationCache(tmp_path)
+
+        assert cache.get("Hello", "m") == "Xin chào"
+        assert not (tmp_path / "translation_cache.json").exists()
+        assert (tmp_path / "translation_cache.json.migrated").exists()
+        cache.close()
+
+
+class TestRecovery:
+    """Test handling of a crash during append"""
+
+    def test_torn_record_is_dropped(self, tmp_path):
+        cache = TranslationCache(tmp_path)
+        cache.set("Hello", "Xin chào", "m")
+        cache.close()
+
+        with open(cache.log_file, "ab") as f:
+            f.write(b'abc123\t{"translation": "cut')
+
+        reopened = TranslationCache(tmp_path)
+        assert reopened.get("Hello", "m") == "Xin chào"
+        reopened.set("World", "Thế giới", "m")
+        assert reopened.get("World", "m") == "Thế giới"
+        reopened.close()
+
+
+class TestSharedLog:
+    """Test several instances appending to the same log"""
+
+    def test_interleaved_writers_keep_offsets(self, tmp_path):
+        a = TranslationCache(tmp_path)
+        b = TranslationCache(tmp_path)
+
+        a.set("x", "X", "m")
+        b.set("y", "Y", "m")
+        a.set("z", "Z", "m")
+
+        assert a.get("z", "m") == "Z"
+        assert b.get("y", "m") == "Y"
+        a.close()
+        b.close()
+
+    def test_stale_offset_is_a_miss(self, tmp_path):
+        a = TranslationCache(tmp_path)
+        b = TranslationCache(tmp_path)
+        a.set("x", "X", "m")
+        assert b.get("x", "m") == "X"
+
+        # Point b's index at a's next record
+        b._index[b.get_hash("x", "m")] = a._append(a.get_hash("y", "m"), {"translation": "Y"})
+
+        assert b.get("x", "m") is None
+        a.close()
+        b.close()
+
+    def test_compaction_by_other_writer(self, tmp_path):
+        a = TranslationCache(tmp_path)
+        b = TranslationCache(tmp_path)
+        for i in range(3):
+            a.set("Hello", f"v{i}", "m")
+        b.set("World", "Thế giới", "m")
+        assert b.get("World", "m") == "Thế giới"
+
+        a.compact()
+        b.set("Again", "Lần nữa", "m")
+
+        assert b.get("Again", "m") == "Lần nữa"
+        assert b.get("Hello", "m") == "v2"
+        assert a.get("Again", "m") == "Lần nữa"
+        a.close()
+        b.close()
+
+    def test_shared_instance_per_directory(self, tmp_path):
+        cache = get_translation_cache(tmp_path)
+
+        assert get_translation_cache(tmp_path / ".") is cache
+        assert get_translation_cache(tmp_path, enabled=False) is not cache
+
+    def test_compaction_keeps_other_writers_records(self, tmp_path):
+        a = TranslationCache(tmp_path)
+        b = TranslationCache(tmp_path)
+        a.set("Hello", "v0", "m")
+        a.set("Hello", "v1", "m")
+        b.set("World", "Thế giới", "m")
+
+        a.compact()
+
+        assert TranslationCache(tmp_path).get("World", "m") == "Thế giới"
+        a.close()
+        b.close()
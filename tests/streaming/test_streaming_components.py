@@ -15,7 +15,7 @@ import pytest
 import asyncio
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, MagicMock
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 
 from core.streaming import (
     StreamingBatchProcessor,
@@ -606,5 +606,153 @@ class TestStreamingBatchProcessorBatching:
         assert len(batches[2]) == 50   # Third batch: partial
 
 
+class FakeTranslator:
+    """Translator whose chunk latency is configurable per chunk id"""
+
+    def __init__(self, delays=None, fail_ids=()):
+        self.delays = delays or {}
+        self.fail_ids = set(fail_ids)
+        self.active = 0
+        self.peak = 0
+        self.started = []
+
+    async def translate_chunk(self, client, chunk):
+        self.started.append(chunk.id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(chunk.id, 0.001))
+            if chunk.id in self.fail_ids:
+                raise ValueError("provider error")
+            return TranslationResult(
+                chunk_id=chunk.id,
+                source=chunk.text,
+                translated=f"T{chunk.id}",
+                quality_score=0.9
+            )
+        finally:
+            self.active -= 1
+
+
+def make_chunks(count):
+    return [TranslationChunk(id=i, text=f"Source {i}") for i in range(1, count + 1)]
+
+
+class TestSlidingWindow:
+    """Test continuous sliding-window execution"""
+
+    @pytest.fixture
+    def job(self):
+        return TranslationJob(job_id="job", job_name="job", input_file="in.txt",
+                              output_file="out.txt", output_format="txt")
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_and_exported(self, job, tmp_path):
+        translator = FakeTranslator(delays={1: 0.05, 4: 0.03})
+        processor = StreamingBatchProcessor(batch_size=3, sliding_window=True, max_concurrency=4)
+
+        results, stats = await processor.process_streaming(
+            job=job, chunks=make_chunks(10), translator=translator,
+            http_client=None, output_path=tmp_path / "out.txt"
+        )
+
+        assert [r.chunk_id for r in results] == list(range(1, 11))
+        assert stats['mode'] == 'sliding_window'
+        assert stats['chunks_processed'] == 10
+        text = (tmp_path / "out.txt").read_text(encoding="utf-8")
+        positions = [text.index(f"T{i}\n") for i in range(1, 11)]
+        assert positions == sorted(positions)
+
+    @pytest.mark.asyncio
+    async def test_slow_chunk_does_not_idle_slots(self, job, tmp_path):
+        # Chunk 1 is slow; with batch barriers, chunks 4+ would wait for it
+        translator = FakeTranslator(delays={1: 0.2})
+        processor = StreamingBatchProcessor(
+            batch_size=3, sliding_window=True, max_concurrency=3, enable_partial_export=False
+        )
+
+        await processor.process_streaming(
+            job=job, chunks=make_chunks(12), translator=translator,
+            http_client=None, output_path=tmp_path / "out.txt"
+        )
+
+        assert translator.peak == 3
+        # All other chunks started while chunk 1 was still running
+        assert set(translator.started[:12]) == set(range(1, 13))
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_read_ahead(self, job, tmp_path):
+        translator = FakeTranslator(delays={1: 0.1})
+        processor = StreamingBatchProcessor(
+            batch_size=2, sliding_window=True, max_concurrency=2,
+            window_size=4, enable_partial_export=False
+        )
+
+        task = asyncio.create_task(processor.process_streaming(
+            job=job, chunks=make_chunks(20), translator=translator,
+            http_client=None, output_path=tmp_path / "out.txt"
+        ))
+        await asyncio.sleep(0.05)
+        # Only chunks inside the window may start while chunk 1 is pending
+        assert max(translator.started) <= 4
+        await task
+
+    @pytest.mark.asyncio
+    async def test_callbacks_without_keeping_results(self, job, tmp_path):
+        seen = []
+        progress_values = []
+
+        async def on_progress(completed_chunks, total_chunks, progress):
+            progress_values.append(progress)
+
+        processor = StreamingBatchProcessor(
+            batch_size=4, sliding_window=True, max_concurrency=3, enable_partial_export=False
+        )
+        translator = FakeTranslator(fail_ids={10})
+        # Skip retry backoff for the failing chunk
+        with patch("core.parallel.asyncio.sleep", new=AsyncMock()):
+            results, stats = await processor.process_streaming(
+                job=job, chunks=make_chunks(10), translator=translator,
+                http_client=None, output_path=tmp_path / "out.txt",
+                progress_callback=on_progress,
+                result_callback=lambda r: seen.append(r.chunk_id),
+                keep_results=False
+            )
+
+        assert results == []
+        assert seen == list(range(1, 10))
+        assert stats['chunks_processed'] == 9
+        assert progress_values[-1] == 1.0
+
+
+class TestPrepareBatch:
+    """Test the per-batch prepare hook (bulk prefetch before dispatch)"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sliding_window", [True, False])
+    async def test_runs_per_batch_before_dispatch(self, sliding_window, tmp_path):
+        job = TranslationJob(job_id="job", job_name="job", input_file="in.txt",
+                             output_file="out.txt", output_format="txt")
+        translator = FakeTranslator()
+        prepared = []
+
+        async def prepare_batch(batch_chunks):
+            # None of these chunks may have been dispatched yet
+            assert not {c.id for c in batch_chunks} & set(translator.started)
+            prepared.append([c.id for c in batch_chunks])
+
+        processor = StreamingBatchProcessor(
+            batch_size=4, sliding_window=sliding_window, max_concurrency=3,
+            enable_partial_export=False
+        )
+        await processor.process_streaming(
+            job=job, chunks=make_chunks(10), translator=translator,
+            http_client=None, output_path=tmp_path / "out.txt",
+            prepare_batch=prepare_batch
+        )
+
+        assert prepared == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -118,6 +118,44 @@ def test_image_block():
     assert "image_data_base64" in d_with_data
 
 
+def test_image_store(tmp_path):
+    """Test content-addressed ImageStore"""
+    from core.image_embedding import ImageStore
+
+    store = ImageStore(tmp_path / "images")
+    first = store.put(b"same bytes", "png")
+    second = store.put(b"same bytes", "png")
+
+    # Identical content is stored once
+    assert first == second
+    assert len([p for p in store.root.rglob("*") if p.is_file()]) == 1
+    assert first.read() == b"same bytes"
+    assert first.size == len(b"same bytes")
+
+    assert store.get(first.digest, "png") == first
+    assert store.get("0" * 64, "png") is None
+
+    store.clear()
+    assert store.get(first.digest, "png") is None
+
+
+def test_image_block_spilled_to_store(tmp_path):
+    """Test ImageBlock reading its data lazily from the store"""
+    from core.image_embedding import ImageBlock, ImageStore
+
+    stored = ImageStore(tmp_path).put(b"\x89PNG fake", "png")
+    block = ImageBlock(stored=stored, width_px=10, height_px=10)
+
+    assert block.image_data == b""
+    assert block.size_bytes == len(b"\x89PNG fake")
+    assert block.read_data() == b"\x89PNG fake"
+    assert block.image_source() == str(stored.path)
+    assert block.to_dict(include_data=True)["image_data_base64"] == block.to_base64()
+
+    # In-memory blocks hand embedders a stream
+    assert ImageBlock(image_data=b"abc").image_source().read() == b"abc"
+
+
 def test_extraction_config():
     """Test ExtractionConfig defaults"""
     from core.image_embedding import ExtractionConfig, ImageFormat
@@ -127,6 +165,8 @@ def test_extraction_config():
     assert config.min_height == 50
     assert config.output_format == ImageFormat.PNG
     assert config.skip_duplicates is True
+    assert config.workers == 1
+    assert config.store_dir is None
 
 
 def test_pipeline_config():
@@ -2,6 +2,8 @@
 Unit tests for api/deps.py — shared state singletons and ConnectionManager.
 """
 import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -13,6 +15,14 @@ from core.job_queue import JobQueue
 from core.cache.chunk_cache import ChunkCache
 
 
+async def wait_until(condition, timeout=2.0):
+    """Yield to the sender tasks until condition() holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0)
+
+
 class TestSingletons:
     """Test module-level singleton instances."""
 
@@ -72,30 +82,151 @@ class TestConnectionManager:
         assert ws in cm.active_connections
         ws.accept.assert_awaited_once()
 
-    def test_disconnect(self):
+    @pytest.mark.asyncio
+    async def test_disconnect(self):
         cm = ConnectionManager()
-        ws = MagicMock()
-        cm.active_connections.append(ws)
+        ws = AsyncMock()
+        await cm.connect(ws)
         cm.disconnect(ws)
         assert ws not in cm.active_connections
+        cm.disconnect(ws)  # Unknown sockets are ignored
 
     @pytest.mark.asyncio
     async def test_broadcast_sends_to_all(self):
         cm = ConnectionManager()
         ws1 = AsyncMock()
         ws2 = AsyncMock()
-        cm.active_connections = [ws1, ws2]
+        await cm.connect(ws1)
+        await cm.connect(ws2)
         msg = {"event": "test"}
         await cm.broadcast(msg)
-        ws1.send_json.assert_awaited_once_with(msg)
-        ws2.send_json.assert_awaited_once_with(msg)
+        assert await cm.drain()
+        ws1.send_text.assert_awaited_once_with(json.dumps(msg))
+        ws2.send_text.assert_awaited_once_with(json.dumps(msg))
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_failed_connection(self):
         cm = ConnectionManager()
         ws_good = AsyncMock()
         ws_bad = AsyncMock()
-        ws_bad.send_json.side_effect = Exception("disconnected")
-        cm.active_connections = [ws_bad, ws_good]
+        ws_bad.send_text.side_effect = Exception("disconnected")
+        await cm.connect(ws_bad)
+        await cm.connect(ws_good)
+        await cm.broadcast({"event": "test"})
+        assert await cm.drain()
+        ws_good.send_text.assert_awaited_once()
+        assert cm.active_connections == [ws_good]
+
+
+class TestConnectionManagerFanOut:
+    """Test per-client queues, coalescing and job subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self):
+        cm = ConnectionManager()
+        release = asyncio.Event()
+
+        async def wait_for_release(text):
+            await release.wait()
+
+        slow = AsyncMock()
+        slow.send_text.side_effect = wait_for_release
+        fast = AsyncMock()
+        await cm.connect(slow)
+        await cm.connect(fast)
+
+        for i in range(5):
+            await cm.broadcast({"event": "chunk_translated", "job_id": "j", "n": i})
+        await wait_until(lambda: fast.send_text.await_count == 5 and slow.send_text.await_count == 1)
+
+        assert fast.send_text.await_count == 5
+        assert cm.get_metrics()["queued"] == 4  # First message is in flight
+        release.set()
+        assert await cm.drain()
+        assert slow.send_text.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_progress_events_coalesce_to_latest(self):
+        cm = ConnectionManager()
+        release = asyncio.Event()
+
+        async def wait_for_release(text):
+            await release.wait()
+
+        ws = AsyncMock()
+        ws.send_text.side_effect = wait_for_release
+        await cm.connect(ws)
+        await cm.broadcast({"event": "job_started", "job_id": "j"})
+        await wait_until(lambda: ws.send_text.await_count == 1)
+
+        for progress in (10, 20, 30):
+            await cm.broadcast({"event": "job_progress", "job_id": "j", "progress": progress})
+        await cm.broadcast({"event": "job_progress", "job_id": "other", "progress": 5})
+        release.set()
+        assert await cm.drain()
+
+        sent = [json.loads(c.args[0]) for c in ws.send_text.await_args_list]
+        assert [m.get("progress") for m in sent] == [None, 30, 5]
+        assert cm.get_metrics()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        cm = ConnectionManager(max_queue=2)
+        release = asyncio.Event()
+
+        async def wait_for_release(text):
+            await release.wait()
+
+        ws = AsyncMock()
+        ws.send_text.side_effect = wait_for_release
+        await cm.connect(ws)
+        await cm.broadcast({"event": "chunk_translated", "n": 0})
+        await wait_until(lambda: ws.send_text.await_count == 1)
+
+        for i in range(1, 5):
+            await cm.broadcast({"event": "chunk_translated", "n": i})
+        release.set()
+        assert await cm.drain()
+
+        sent = [json.loads(c.args[0])["n"] for c in ws.send_text.await_args_list]
+        assert sent == [0, 3, 4]
+        assert cm.get_metrics()["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_filter_job_events(self):
+        cm = ConnectionManager()
+        watcher = AsyncMock()
+        dashboard = AsyncMock()
+        await cm.connect(watcher)
+        await cm.connect(dashboard)
+        cm.subscribe(watcher, "job-a")
+
+        await cm.broadcast({"event": "job_completed", "job_id": "job-a"})
+        await cm.broadcast({"event": "job_completed", "job_id": "job-b"})
+        await cm.broadcast({"event": "stats_update", "stats": {}})
+        assert await cm.drain()
+
+        watcher_events = [json.loads(c.args[0]) for c in watcher.send_text.await_args_list]
+        assert [m.get("job_id") for m in watcher_events] == ["job-a", None]
+        assert dashboard.send_text.await_count == 3
+
+        cm.unsubscribe(watcher)
+        await cm.broadcast({"event": "job_completed", "job_id": "job-b"})
+        assert await cm.drain()
+        assert watcher.send_text.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_send_lag(self):
+        cm = ConnectionManager()
+        ws = AsyncMock()
+        await cm.connect(ws)
         await cm.broadcast({"event": "test"})
-        ws_good.send_json.assert_awaited_once()
+        assert await cm.drain()
+
+        metrics = cm.get_metrics()
+        assert metrics["clients"] == 1
+        assert metrics["sent"] == 1
+        assert metrics["messages_broadcast"] == 1
+        assert metrics["lag_max_ms"] >= 0.0
+        assert metrics["per_client"][0]["sent"] == 1
+        cm.disconnect(ws)
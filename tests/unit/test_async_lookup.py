@@ -0,0 +1,101 @@
+"""
+Unit tests for core/async_lookup.py and TranslatorEngine TM/cache prefetching.
+"""
+
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.async_lookup import LookupExecutor
+from core.cache.chunk_cache import ChunkCache
+from core.chunker import TranslationChunk
+from core.translation_memory import TranslationMemory, TMSegment
+from core.translator import TranslatorEngine
+
+
+@pytest.fixture
+def executor():
+    ex = LookupExecutor(thread_name_prefix="test-lookup")
+    yield ex
+    ex.shutdown()
+
+
+@pytest.fixture
+def engine(tmp_path, executor):
+    tm = TranslationMemory(tmp_path / "tm.db")
+    chunk_cache = ChunkCache(tmp_path / "chunks.db")
+    eng = TranslatorEngine(
+        provider="openai",
+        model="test-model",
+        api_key="sk-test",
+        tm=tm,
+        chunk_cache=chunk_cache,
+        lookup_executor=executor,
+    )
+    eng._call_openai = AsyncMock(return_value="Bản dịch mới")
+    yield eng
+    tm.close()
+    chunk_cache.close()
+
+
+class TestLookupExecutor:
+    async def test_runs_off_event_loop_thread(self, executor):
+        name = await executor.run(lambda: threading.current_thread().name)
+        assert name.startswith("test-lookup")
+        assert name != threading.current_thread().name
+
+    async def test_propagates_exceptions(self, executor):
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run(boom)
+
+
+class TestPrefetchLookups:
+    async def test_prefetch_resolves_tm_and_cache_hits(self, engine):
+        engine.tm.add_segment(TMSegment(source="Hello world", target="Xin chào thế giới"))
+        cached_chunk = TranslationChunk(id=2, text="Cached paragraph")
+        engine.chunk_cache.set(engine._chunk_cache_key(cached_chunk), "Đoạn đã lưu")
+
+        chunks = [
+            TranslationChunk(id=1, text="Hello world"),
+            cached_chunk,
+            TranslationChunk(id=3, text="Something brand new here"),
+        ]
+
+        hits = await engine.prefetch_lookups(chunks)
+
+        assert hits == 2
+        assert engine.tm_exact_matches == 1
+        assert engine._prefetched[(3, "Something brand new here")] is None
+
+    async def test_translate_chunk_uses_prefetched_results(self, engine):
+        engine.tm.add_segment(TMSegment(source="Hello world", target="Xin chào thế giới"))
+        chunks = [
+            TranslationChunk(id=1, text="Hello world"),
+            TranslationChunk(id=2, text="Something brand new here"),
+        ]
+        await engine.prefetch_lookups(chunks)
+
+        first = await engine.translate_chunk(None, chunks[0])
+        second = await engine.translate_chunk(None, chunks[1])
+
+        assert first.translated == "Xin chào thế giới"
+        assert second.translated == "Bản dịch mới"
+        assert engine._call_openai.await_count == 1
+        assert engine._prefetched == {}
+
+    async def test_translate_chunk_without_prefetch(self, engine):
+        chunk = TranslationChunk(id=1, text="Hello world")
+        engine.tm.add_segment(TMSegment(source="Hello world", target="Xin chào thế giới"))
+
+        result = await engine.translate_chunk(None, chunk)
+
+        assert result.translated == "Xin chào thế giới"
+        engine._call_openai.assert_not_awaited()
+
+    async def test_prefetch_without_lookups_configured(self, executor):
+        eng = TranslatorEngine(provider="openai", model="m", api_key="k", lookup_executor=executor)
+        assert await eng.prefetch_lookups([TranslationChunk(id=1, text="x")]) == 0
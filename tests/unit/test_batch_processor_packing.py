@@ -0,0 +1,160 @@
+"""
+Tests for request packing, bulk prefetch and TM pre-translation in
+BatchProcessor's streaming path.
+
+Jobs of streaming_batch_size chunks or more go through
+StreamingBatchProcessor, so packing has to happen per streaming batch.
+"""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from core.batch_processor import BatchProcessor
+from core.job_queue import JobQueue, JobStatus
+from core.cache import CheckpointManager
+from core.tm import service as tm_service
+from core.tm.repository import TMRepository
+from core.tm.service import TMService
+from core.translator import TranslatorEngine
+from core.validator import QualityValidator
+
+
+SENTENCES = 150
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    # The processor keeps its legacy cache and TM under relative data/ paths
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "checkpoint_dir", tmp_path / "checkpoints")
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(settings, "chunk_cache_enabled", False)
+    monkeypatch.setattr(settings, "streaming_batch_size", 100)
+    monkeypatch.setattr(settings, "pack_small_chunks", True)
+    return tmp_path
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def fake_call_llm(self, client, prompt, text):
+        calls.append(text)
+        # Keep packed segment markers, "translate" every other line
+        return "\n".join(
+            line if line.startswith("[[#") else f"VI {line}"
+            for line in text.splitlines()
+        )
+
+    monkeypatch.setattr(TranslatorEngine, "_call_llm", fake_call_llm)
+    monkeypatch.setattr(QualityValidator, "validate", lambda *a, **kw: type(
+        "Validation", (), {"quality_score": 0.9, "warnings": []}
+    )())
+    return calls
+
+
+def create_job(workspace, **metadata):
+    input_path = workspace / "subtitles.txt"
+    input_path.write_text(
+        "\n\n".join(f"Subtitle line number {i}." for i in range(SENTENCES)),
+        encoding="utf-8"
+    )
+
+    queue = JobQueue(db_path=workspace / "jobs.db")
+    job = queue.create_job(
+        "subtitles", str(input_path), str(workspace / "out.txt"),
+        output_format="txt",
+        chunk_size=40,
+        metadata={"api_key": "sk-test-key-0123456789", "enable_adn_extraction": False, **metadata},
+    )
+    return queue, job
+
+
+@pytest.mark.parametrize("sliding_window", [True, False])
+async def test_streaming_job_packs_small_chunks(workspace, llm_calls, monkeypatch, sliding_window):
+    monkeypatch.setattr(settings, "streaming_sliding_window", sliding_window)
+    queue, job = create_job(workspace)
+    processor = BatchProcessor(queue=queue)
+
+    assert await processor.process_single_job(job.job_id)
+
+    job = queue.get_job(job.job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert job.total_chunks >= settings.streaming_batch_size
+    # Several chunks share each request
+    assert 0 < len(llm_calls) < job.total_chunks / 4
+    assert "VI Subtitle line number 149." in (workspace / "out.txt").read_text(encoding="utf-8")
+
+
+async def test_packed_requests_stay_within_window(workspace, llm_calls, monkeypatch):
+    monkeypatch.setattr(settings, "streaming_sliding_window", True)
+    in_flight = peak = 0
+    translate = TranslatorEngine._call_llm
+
+    async def slow_call_llm(self, client, prompt, text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await translate(self, client, prompt, text)
+
+    monkeypatch.setattr(TranslatorEngine, "_call_llm", slow_call_llm)
+    queue, job = create_job(workspace)
+
+    assert await BatchProcessor(queue=queue).process_single_job(job.job_id)
+
+    assert queue.get_job(job.job_id).status == JobStatus.COMPLETED
+    assert 0 < peak <= job.concurrency
+
+
+@pytest.mark.parametrize("sliding_window", [True, False])
+async def test_streaming_results_go_to_checkpoint(workspace, llm_calls, monkeypatch, sliding_window):
+    monkeypatch.setattr(settings, "streaming_sliding_window", sliding_window)
+    monkeypatch.setattr(settings, "pack_small_chunks", False)
+    saves = []
+    save_chunk_results = CheckpointManager.save_chunk_results
+
+    def record_save(self, job_id, results):
+        saves.append(len(results))
+        return save_chunk_results(self, job_id, results)
+
+    monkeypatch.setattr(CheckpointManager, "save_chunk_results", record_save)
+    queue, job = create_job(workspace)
+
+    assert await BatchProcessor(queue=queue).process_single_job(job.job_id)
+
+    job = queue.get_job(job.job_id)
+    assert job.status == JobStatus.COMPLETED
+    # Written a few at a time as they complete, every chunk exactly once
+    assert max(saves) <= settings.checkpoint_interval
+    assert sum(saves) == job.total_chunks
+    output = (workspace / "out.txt").read_text(encoding="utf-8")
+    assert "VI Subtitle line number 0." in output
+    assert "VI Subtitle line number 149." in output
+
+
+async def test_streaming_job_reuses_tm_pretranslation(workspace, llm_calls, monkeypatch):
+    repository = TMRepository(db_path=str(workspace / "tm.db"))
+    tm = repository.create_tm(name="Subtitles")
+    for i in range(50):
+        repository.add_segment(tm.id, f"Subtitle line number {i}.", f"Phụ đề dòng số {i}.")
+    svc = TMService()
+    svc.repository = repository
+    monkeypatch.setattr(tm_service, "_service", svc)
+
+    queue, job = create_job(workspace, tm_ids=[tm.id])
+    processor = BatchProcessor(queue=queue)
+
+    assert await processor.process_single_job(job.job_id)
+
+    assert queue.get_job(job.job_id).status == JobStatus.COMPLETED
+    sent = "\n".join(llm_calls)
+    assert "Subtitle line number 0." not in sent
+    assert "Subtitle line number 50." in sent
+    output = (workspace / "out.txt").read_text(encoding="utf-8")
+    assert "Phụ đề dòng số 49." in output
+    # Usage is counted once the job has used the matches
+    assert all(seg.usage_count == 1 for seg in repository.iter_segments(tm.id))
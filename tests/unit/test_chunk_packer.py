@@ -0,0 +1,163 @@
+"""
+Unit tests for core/chunk_packer.py and TranslatorEngine packed requests.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.async_lookup import LookupExecutor
+from core.chunk_packer import ChunkPacker
+from core.chunker import TranslationChunk
+from core.translator import TranslatorEngine
+
+
+def make_chunks(*texts):
+    return [TranslationChunk(id=i, text=t) for i, t in enumerate(texts, 1)]
+
+
+def fake_packed_translation(client, prompt, text):
+    """Echo the packed text with every segment 'translated'."""
+    lines = []
+    for line in text.splitlines():
+        lines.append(line if line.startswith("[[#") else f"VI {line}")
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def executor():
+    ex = LookupExecutor(thread_name_prefix="test-pack")
+    yield ex
+    ex.shutdown()
+
+
+@pytest.fixture
+def engine(executor):
+    eng = TranslatorEngine(
+        provider="openai",
+        model="test-model",
+        api_key="sk-test",
+        lookup_executor=executor,
+        packer=ChunkPacker(max_tokens=100, small_chunk_tokens=20),
+        retry_delay=0,
+    )
+    eng.validator.validate = lambda *a, **kw: type(
+        "Validation", (), {"quality_score": 0.9, "warnings": []}
+    )()
+    return eng
+
+
+class TestChunkPacker:
+    def test_pack_respects_budget_and_large_chunks(self):
+        packer = ChunkPacker(max_tokens=30, small_chunk_tokens=20)
+        chunks = make_chunks("a" * 40, "b" * 40, "c" * 40, "d" * 400, "e" * 40, "f" * 40)
+
+        groups = packer.pack(chunks)
+
+        # 10 tokens + 4 marker tokens each: two per group under a 30 budget
+        assert [[c.id for c in g] for g in groups] == [[1, 2], [5, 6]]
+
+    def test_single_chunk_groups_are_dropped(self):
+        packer = ChunkPacker(small_chunk_tokens=20)
+        chunks = make_chunks("short", "x" * 400, "also short")
+        assert packer.pack(chunks) == []
+
+    def test_split_round_trip(self):
+        packer = ChunkPacker()
+        group = make_chunks("Hello", "Line one\nLine two", "Bye")
+
+        packed = packer.build_text(group)
+        parts = packer.split(fake_packed_translation(None, "", packed), group)
+
+        assert parts == ["VI Hello", "VI Line one\nVI Line two", "VI Bye"]
+
+    @pytest.mark.parametrize("response", [
+        "[[#1]]\nXin chào\n[[#3]]\nTạm biệt",
+        "[[#2]]\nXin chào\n[[#1]]\nTạm biệt",
+        "[[#1]]\n\n[[#2]]\nTạm biệt",
+        "Here is the translation:\n[[#1]]\nXin chào\n[[#2]]\nTạm biệt",
+    ])
+    def test_split_rejects_damaged_markers(self, response):
+        packer = ChunkPacker()
+        assert packer.split(response, make_chunks("Hello", "Bye")) is None
+
+
+class TestPackedTranslation:
+    async def test_pretranslate_packs_small_chunks(self, engine):
+        engine._call_openai = AsyncMock(side_effect=fake_packed_translation)
+        chunks = make_chunks("One", "Two", "Three")
+
+        packed = await engine.pretranslate_packed(None, chunks)
+        results = [await engine.translate_chunk(None, c) for c in chunks]
+
+        assert packed == 3
+        assert engine._call_openai.await_count == 1
+        assert [r.translated for r in results] == ["VI One", "VI Two", "VI Three"]
+        assert [r.chunk_id for r in results] == [1, 2, 3]
+
+    async def test_split_failure_falls_back_per_chunk(self, engine):
+        engine._call_openai = AsyncMock(return_value="merged translation without markers")
+        chunks = make_chunks("One", "Two")
+
+        assert await engine.pretranslate_packed(None, chunks) == 0
+
+        engine._call_openai = AsyncMock(return_value="Một")
+        result = await engine.translate_chunk(None, chunks[0])
+
+        assert result.translated == "Một"
+        engine._call_openai.assert_awaited_once()
+
+    async def test_low_quality_segment_is_left_for_single_request(self, engine):
+        engine._call_openai = AsyncMock(side_effect=fake_packed_translation)
+        scores = iter([0.9, 0.2])
+        engine.validator.validate = lambda *a, **kw: type(
+            "Validation", (), {"quality_score": next(scores), "warnings": []}
+        )()
+
+        results = await engine.translate_packed(None, make_chunks("One", "Two"))
+
+        assert results[0].translated == "VI One"
+        assert results[1] is None
+
+    async def test_good_segments_cached_in_one_write(self, engine):
+        engine._call_openai = AsyncMock(side_effect=fake_packed_translation)
+        engine.chunk_cache = MagicMock()
+
+        await engine.translate_packed(None, make_chunks("One", "Two"))
+
+        engine.chunk_cache.set_many.assert_called_once()
+        items = engine.chunk_cache.set_many.call_args.args[0]
+        assert [value for _, value in items] == ["VI One", "VI Two"]
+
+    async def test_without_packer_nothing_is_packed(self, engine):
+        engine.packer = None
+        engine._call_openai = AsyncMock()
+
+        assert await engine.pretranslate_packed(None, make_chunks("One", "Two")) == 0
+        engine._call_openai.assert_not_awaited()
+
+    async def test_planned_group_is_sent_by_first_member(self, engine):
+        engine._call_openai = AsyncMock(side_effect=fake_packed_translation)
+        chunks = make_chunks("One", "Two", "Three")
+
+        assert engine.plan_packed(chunks) == 3
+        engine._call_openai.assert_not_awaited()
+
+        results = await asyncio.gather(*(engine.translate_chunk(None, c) for c in chunks))
+
+        assert engine._call_openai.await_count == 1
+        assert [r.translated for r in results] == ["VI One", "VI Two", "VI Three"]
+        assert engine._packed_groups == {}
+
+    async def test_planned_group_failure_falls_back_per_chunk(self, engine):
+        engine._call_openai = AsyncMock(side_effect=[
+            "merged translation without markers", "Một", "Hai"
+        ])
+        chunks = make_chunks("One", "Two")
+        engine.plan_packed(chunks)
+
+        results = [await engine.translate_chunk(None, c) for c in chunks]
+
+        assert [r.translated for r in results] == ["Một", "Hai"]
+        assert engine._call_openai.await_count == 3
@@ -0,0 +1,110 @@
+"""Tests for api/services/conversion_cache.py — dedup, caching, LRU eviction."""
+
+import asyncio
+
+import pytest
+
+from api.services.conversion_cache import ConversionCache
+
+
+def make_converter(calls, delay=0.0, size=10):
+    """Async converter writing ``size`` bytes and counting invocations."""
+    async def convert(src, fmt, outdir, base):
+        calls.append((src.name, fmt))
+        await asyncio.sleep(delay)
+        target = outdir / f"{base}.{fmt}"
+        target.write_bytes(b"x" * size)
+        return target
+    return convert
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "output.docx"
+    path.write_bytes(b"translated document")
+    return path
+
+
+class TestConversionCache:
+    """Content-addressed conversion cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_conversion(self, tmp_path, source):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=1024)
+        calls = []
+        convert = make_converter(calls, delay=0.05)
+
+        results = await asyncio.gather(*[cache.get(source, "pdf", convert) for _ in range(5)])
+
+        assert calls == [("output.docx", "pdf")]
+        assert len({r.path for r in results}) == 1
+        assert results[0].path.read_bytes() == b"x" * 10
+
+        again = await cache.get(source, "pdf", convert)
+        assert again.cached is True
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_content_hits_cache(self, tmp_path, source):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=1024)
+        calls = []
+        copy = tmp_path / "copy.docx"
+        copy.write_bytes(source.read_bytes())
+
+        await cache.get(source, "md", make_converter(calls))
+        result = await cache.get(copy, "md", make_converter(calls))
+
+        assert result.cached is True
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_leaves_conversion_running(self, tmp_path, source):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=1024)
+        calls = []
+        convert = make_converter(calls, delay=0.2)
+
+        pending = await cache.get(source, "pdf", convert, wait=0.01)
+        assert pending.ready is False
+        assert cache.is_converting(source, "pdf")
+
+        done = await cache.get(source, "pdf", convert)
+        assert done.ready is True
+        assert len(calls) == 1
+        assert not cache.is_converting(source, "pdf")
+
+    @pytest.mark.asyncio
+    async def test_failed_conversion_is_not_cached(self, tmp_path, source):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=1024)
+
+        async def broken(src, fmt, outdir, base):
+            return None
+
+        with pytest.raises(ValueError):
+            await cache.get(source, "pdf", broken)
+        assert cache.total_bytes == 0
+        assert not cache.is_converting(source, "pdf")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_under_budget(self, tmp_path, source):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+        calls = []
+        convert = make_converter(calls, size=10)
+
+        first = await cache.get(source, "pdf", convert)
+        second = await cache.get(source, "md", convert)
+        await cache.get(source, "pdf", convert)  # Touch pdf, md becomes LRU
+        third = await cache.get(source, "txt", convert)
+
+        assert first.path.exists()
+        assert not second.path.exists()
+        assert third.path.exists()
+        assert cache.total_bytes == 20
+
+    def test_existing_artifacts_count_towards_budget(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "abc.pdf").write_bytes(b"x" * 7)
+
+        cache = ConversionCache(cache_dir, max_bytes=1024)
+
+        assert cache.total_bytes == 7
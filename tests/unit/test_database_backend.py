@@ -103,3 +103,91 @@ class TestSQLiteBackend:
         with tmp_db.connection() as conn:
             rows = conn.execute("SELECT COUNT(*) FROM t").fetchone()
             assert rows[0] == 5
+
+
+@pytest.fixture
+def pooled_db(tmp_path):
+    """Create a pooled SQLiteBackend."""
+    backend = SQLiteBackend(tmp_path / "pooled.db", pooled=True, pool_size=2)
+    yield backend
+    backend.close()
+
+
+class TestSQLiteBackendPooled:
+    """Pooled connection mode."""
+
+    def test_implements_protocol(self, pooled_db):
+        assert isinstance(pooled_db, DatabaseBackend)
+
+    def test_reuses_connection(self, pooled_db):
+        with pooled_db.connection() as conn:
+            first = conn._conn
+        with pooled_db.connection() as conn:
+            assert conn._conn is first
+
+    def test_pragmas_applied(self, tmp_path):
+        backend = SQLiteBackend(
+            tmp_path / "p.db", pooled=True, synchronous="NORMAL",
+            mmap_size=1024 * 1024, busy_timeout_ms=1234,
+        )
+        with backend.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        backend.close()
+
+    def test_invalid_synchronous(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteBackend(tmp_path / "p.db", pooled=True, synchronous="FAST; DROP")
+
+    def test_rollback_on_error(self, pooled_db):
+        with pooled_db.connection() as conn:
+            conn.execute("CREATE TABLE t (val TEXT)")
+
+        with pytest.raises(RuntimeError):
+            with pooled_db.connection() as conn:
+                conn.execute("INSERT INTO t (val) VALUES (?)", ("x",))
+                raise RuntimeError("force rollback")
+
+        with pooled_db.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_nested_connections_do_not_share(self, pooled_db):
+        with pooled_db.connection() as outer:
+            with pooled_db.connection() as inner:
+                assert inner._conn is not outer._conn
+
+    def test_pool_size_bounds_idle_connections(self, pooled_db):
+        with pooled_db.connection():
+            with pooled_db.connection():
+                with pooled_db.connection():
+                    pass
+        assert pooled_db._idle.qsize() == 2
+
+    def test_close_closes_idle(self, pooled_db):
+        with pooled_db.connection() as conn:
+            raw = conn._conn
+        pooled_db.close()
+        assert pooled_db._idle.qsize() == 0
+        with pytest.raises(Exception):
+            raw.execute("SELECT 1")
+
+    def test_concurrent_threads(self, pooled_db):
+        import threading
+
+        with pooled_db.connection() as conn:
+            conn.execute("CREATE TABLE t (val INTEGER)")
+
+        def worker(n):
+            for i in range(20):
+                with pooled_db.connection() as conn:
+                    conn.execute("INSERT INTO t (val) VALUES (?)", (n * 100 + i,))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with pooled_db.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 80
@@ -0,0 +1,136 @@
+"""
+Unit tests for core/edit_distance.py — banded and bit-parallel Levenshtein, LCS.
+"""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from core.edit_distance import lcs_length, levenshtein_bounded, levenshtein_many
+
+
+def reference_distance(s1: str, s2: str) -> int:
+    """Classic full-matrix Levenshtein."""
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current = [i + 1]
+        for j, c2 in enumerate(s2):
+            current.append(min(previous[j + 1] + 1, current[j] + 1, previous[j] + (c1 != c2)))
+        previous = current
+    return previous[-1]
+
+
+def reference_lcs(s1: str, s2: str) -> int:
+    """Classic full-matrix LCS."""
+    previous = [0] * (len(s2) + 1)
+    for c1 in s1:
+        current = [0]
+        for j, c2 in enumerate(s2):
+            current.append(previous[j] + 1 if c1 == c2 else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def random_pairs(count: int, max_len: int, seed: int = 7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        a = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, max_len)))
+        b = "".join(rng.choice("abcde") for _ in range(rng.randint(0, max_len)))
+        yield a, b
+
+
+# ---------------------------------------------------------------------------
+# levenshtein_bounded
+# ---------------------------------------------------------------------------
+
+class TestLevenshteinBounded:
+    @pytest.mark.parametrize("s1,s2,expected", [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("kitten", "sitting", 3),
+        ("test", "text", 1),
+        ("flaw", "lawn", 2),
+    ])
+    def test_known_distances(self, s1, s2, expected):
+        assert levenshtein_bounded(s1, s2) == expected
+
+    def test_matches_reference(self):
+        for a, b in random_pairs(500, 40):
+            assert levenshtein_bounded(a, b) == reference_distance(a, b)
+
+    def test_bound_exceeded_returns_bound_plus_one(self):
+        for a, b in random_pairs(500, 40, seed=11):
+            expected = reference_distance(a, b)
+            for k in (0, 3, 10):
+                result = levenshtein_bounded(a, b, k)
+                assert result == (expected if expected <= k else k + 1)
+
+    def test_length_difference_short_circuit(self):
+        assert levenshtein_bounded("a" * 100, "a", 5) == 6
+
+
+# ---------------------------------------------------------------------------
+# levenshtein_batch (NumPy)
+# ---------------------------------------------------------------------------
+
+class TestLevenshteinBatch:
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_matches_reference_multiword_patterns(self):
+        from core.edit_distance import levenshtein_batch
+
+        rng = random.Random(3)
+        for _ in range(30):
+            pattern = "".join(rng.choice("abcd ") for _ in range(rng.randint(1, 200)))
+            texts = [
+                "".join(rng.choice("abcxd") for _ in range(rng.randint(0, 200)))
+                for _ in range(5)
+            ]
+            assert levenshtein_batch(pattern, texts) == [
+                reference_distance(pattern, t) for t in texts
+            ]
+
+    def test_empty_inputs(self):
+        from core.edit_distance import levenshtein_batch
+
+        assert levenshtein_batch("abc", []) == []
+        assert levenshtein_batch("", ["ab", ""]) == [2, 0]
+        assert levenshtein_batch("abc", ["", "abc"]) == [3, 0]
+
+
+# ---------------------------------------------------------------------------
+# levenshtein_many
+# ---------------------------------------------------------------------------
+
+class TestLevenshteinMany:
+    def test_small_batch_uses_bounds(self):
+        assert levenshtein_many("kitten", ["sitting", "kitten"], [1, 1]) == [2, 0]
+
+    def test_large_batch_is_exact(self):
+        rng = random.Random(5)
+        pattern = "".join(rng.choice("ab ") for _ in range(300))
+        texts = ["".join(rng.choice("abc") for _ in range(300)) for _ in range(4)]
+        assert levenshtein_many(pattern, texts) == [reference_distance(pattern, t) for t in texts]
+
+
+# ---------------------------------------------------------------------------
+# lcs_length
+# ---------------------------------------------------------------------------
+
+class TestLcsLength:
+    def test_matches_reference(self):
+        for a, b in random_pairs(300, 90):
+            assert lcs_length(a, b) == reference_lcs(a, b)
+
+    def test_empty(self):
+        assert lcs_length("", "abc") == 0
+        assert lcs_length("abc", "") == 0
+
+    def test_bounds_sequence_matcher_ratio(self):
+        for a, b in random_pairs(200, 60, seed=11):
+            if a or b:
+                bound = 2.0 * lcs_length(a, b) / (len(a) + len(b))
+                assert SequenceMatcher(None, a, b).ratio() <= bound + 1e-12
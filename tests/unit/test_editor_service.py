@@ -0,0 +1,116 @@
+"""
+Unit tests for core/editor/service.py and api/editor_router.py — windowed, versioned segments.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from config.settings import settings
+from core.editor.service import EditorService, get_editor_service
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "checkpoint_dir", tmp_path)
+    svc = EditorService()
+    svc.checkpoint_manager.save_checkpoint(
+        job_id="job1",
+        input_file="/in.txt",
+        output_file="/out.txt",
+        total_chunks=20,
+        completed_chunk_ids=[],
+        results_data={}
+    )
+    svc.checkpoint_manager.save_chunk_results(
+        "job1", {i: {"source": f"Source {i}", "translated": f"Dich {i}", "quality_score": 0.9} for i in range(1, 21)}
+    )
+    return svc
+
+
+@pytest.fixture
+def client(service):
+    app.dependency_overrides[get_editor_service] = lambda: service
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_editor_service, None)
+
+
+class TestEditorService:
+    def test_window(self, service):
+        response = service.get_job_segments("job1", offset=5, limit=3)
+
+        assert [s.chunk_id for s in response.segments] == ["6", "7", "8"]
+        assert [s.index for s in response.segments] == [5, 6, 7]
+        assert response.offset == 5
+        assert response.total_segments == 20
+        assert response.can_export is True
+
+    def test_window_around_cursor(self, service):
+        response = service.get_job_segments("job1", limit=4, around="10")
+
+        assert response.offset == 7
+        assert [s.chunk_id for s in response.segments] == ["8", "9", "10", "11"]
+
+    def test_limit_is_capped(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "editor_max_page_size", 5)
+        assert len(service.get_job_segments("job1", limit=1000).segments) == 5
+
+    def test_unknown_job_or_cursor(self, service):
+        assert service.get_job_segments("missing") is None
+        assert service.get_job_segments("job1", around="99") is None
+
+    def test_update_segment_marks_edit(self, service):
+        assert service.update_segment("job1", "3", "Sua 3", expected_version=0) == 1
+
+        segment = service.get_job_segments("job1", offset=2, limit=1).segments[0]
+        assert segment.translated == "Sua 3"
+        assert segment.is_edited is True
+        assert segment.version == 1
+        assert segment.source == "Source 3"
+
+    async def test_tm_suggestions_use_one_batched_lookup(self, service):
+        tm_service = MagicMock()
+        tm_service.suggest = AsyncMock(return_value=[None, None, None])
+        response = service.get_job_segments("job1", limit=3)
+
+        with patch("core.tm.service.get_tm_service", return_value=tm_service):
+            await service.add_tm_suggestions(response, ["tm1"])
+
+        tm_service.suggest.assert_awaited_once_with(
+            ["tm1"], ["Source 1", "Source 2", "Source 3"], min_similarity=0.75,
+            source_lang=None, target_lang=None
+        )
+
+
+class TestEditorRoutes:
+    def test_get_segments_window(self, client):
+        resp = client.get("/editor/jobs/job1/segments", params={"offset": 18, "limit": 5})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [s["chunk_id"] for s in data["segments"]] == ["19", "20"]
+        assert data["total_segments"] == 20
+
+    def test_update_returns_new_version(self, client):
+        resp = client.patch(
+            "/editor/jobs/job1/segments/4",
+            json={"translated_text": "Sua", "expected_version": 0}
+        )
+
+        assert resp.status_code == 200
+        assert resp.json()["version"] == 1
+
+    def test_stale_update_conflicts(self, client):
+        client.patch("/editor/jobs/job1/segments/4", json={"translated_text": "A"})
+        resp = client.patch(
+            "/editor/jobs/job1/segments/4",
+            json={"translated_text": "B", "expected_version": 0}
+        )
+
+        assert resp.status_code == 409
+        assert resp.json()["detail"]["current_version"] == 1
+
+    def test_update_unknown_segment(self, client):
+        resp = client.patch("/editor/jobs/job1/segments/99", json={"translated_text": "A"})
+        assert resp.status_code == 404
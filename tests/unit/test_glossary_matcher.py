@@ -0,0 +1,116 @@
+"""
+Unit tests for core/glossary/matcher.py and automaton.py — single-pass term matching.
+"""
+
+import pytest
+
+from core.glossary.automaton import TermAutomaton, tokenize
+from core.glossary.matcher import TermMatcher
+from core.glossary.models import GlossaryTerm
+
+
+def make_term(term_id: str, source: str, target: str, priority: int = 5, case_sensitive: bool = False):
+    return GlossaryTerm(
+        id=term_id,
+        glossary_id="g1",
+        source_term=source,
+        target_term=target,
+        priority=priority,
+        case_sensitive=case_sensitive,
+    )
+
+
+@pytest.fixture
+def matcher():
+    m = TermMatcher()
+    m._term_cache["g1"] = [
+        make_term("t1", "heart", "tim"),
+        make_term("t2", "heart attack", "nhồi máu cơ tim"),
+        make_term("t3", "attack", "cơn"),
+        make_term("t4", "DNA", "ADN", case_sensitive=True),
+        make_term("t5", "C++", "C++"),
+    ]
+    m._term_cache["g2"] = [
+        make_term("t6", "heart", "trái tim", priority=9),
+    ]
+    return m
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer / automaton
+# ---------------------------------------------------------------------------
+
+class TestAutomaton:
+    def test_tokenize_offsets(self):
+        assert tokenize("a, bc") == [(0, 1, "a"), (1, 2, ","), (2, 3, " "), (3, 5, "bc")]
+
+    def test_scan_reports_overlapping_occurrences(self):
+        terms = [(make_term("a", "heart attack", "x"), "g"), (make_term("b", "attack", "y"), "g")]
+        spans = {(c.start, c.end) for c in TermAutomaton(terms).scan("heart attack")}
+        assert spans == {(0, 12), (6, 12)}
+
+    def test_requires_word_boundaries(self):
+        automaton = TermAutomaton([(make_term("a", "heart", "x"), "g")])
+        assert automaton.scan("hearty sweetheart") == []
+
+
+# ---------------------------------------------------------------------------
+# TermMatcher.find_matches
+# ---------------------------------------------------------------------------
+
+class TestFindMatches:
+    def test_longest_match_wins(self, matcher):
+        matches = matcher.find_matches("A heart attack is serious.", ["g1"])
+        assert [m.source_term for m in matches] == ["heart attack"]
+        assert (matches[0].start, matches[0].end) == (2, 14)
+
+    def test_case_insensitive_default(self, matcher):
+        matches = matcher.find_matches("HEART and Heart", ["g1"])
+        assert [m.start for m in matches] == [0, 10]
+
+    def test_case_sensitive_term(self, matcher):
+        assert matcher.find_matches("dna sample", ["g1"]) == []
+        assert [m.target_term for m in matcher.find_matches("DNA sample", ["g1"])] == ["ADN"]
+
+    def test_case_insensitive_disabled(self, matcher):
+        assert matcher.find_matches("Heart", ["g1"], case_insensitive=False) == []
+
+    def test_priority_breaks_ties(self, matcher):
+        matches = matcher.find_matches("my heart", ["g1", "g2"])
+        assert len(matches) == 1
+        assert matches[0].target_term == "trái tim"
+        assert matches[0].glossary_id == "g2"
+
+    def test_regex_boundary_semantics_for_symbols(self, matcher):
+        # Same as re.search(r"\bC\+\+\b"): needs a word char after "+"
+        assert matcher.find_matches("I like C++ code", ["g1"]) == []
+
+    def test_sorted_by_position(self, matcher):
+        matches = matcher.find_matches("attack of the heart", ["g1"])
+        assert [m.source_term for m in matches] == ["attack", "heart"]
+
+    def test_empty_inputs(self, matcher):
+        assert matcher.find_matches("", ["g1"]) == []
+        assert matcher.find_matches("heart", []) == []
+
+
+# ---------------------------------------------------------------------------
+# Automaton cache
+# ---------------------------------------------------------------------------
+
+class TestAutomatonCache:
+    def test_automaton_reused(self, matcher):
+        first = matcher.get_automaton(["g1"])
+        assert matcher.get_automaton(["g1"]) is first
+
+    def test_clear_cache_invalidates_automaton(self, matcher):
+        first = matcher.get_automaton(["g1", "g2"])
+        terms = matcher._term_cache["g2"]
+        matcher.clear_cache("g2")
+        matcher._term_cache["g2"] = terms
+        assert matcher.get_automaton(["g1", "g2"]) is not first
+
+    def test_clear_all(self, matcher):
+        matcher.get_automaton(["g1"])
+        matcher.clear_cache()
+        assert matcher._automaton_cache == {}
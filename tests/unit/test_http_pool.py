@@ -0,0 +1,71 @@
+"""
+Unit tests for core/http_pool.py — shared per-provider HTTP clients.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import core.http_pool as http_pool
+from core.http_pool import HTTPPool, pooled_client
+
+
+def echo_transport(status=200):
+    return httpx.MockTransport(lambda request: httpx.Response(status, json={"ok": True}))
+
+
+@pytest.fixture
+def pool():
+    return HTTPPool(max_connections=10, max_keepalive_connections=5, http2=False)
+
+
+class TestHTTPPool:
+    async def test_same_client_per_provider(self, pool):
+        openai_a = pool.get_client("openai")
+        openai_b = pool.get_client("openai")
+        anthropic = pool.get_client("anthropic")
+
+        assert openai_a is openai_b
+        assert anthropic is not openai_a
+        await pool.close()
+
+    async def test_close_closes_clients_and_recreates_on_demand(self, pool):
+        client = pool.get_client("openai")
+        await pool.close()
+
+        assert client.is_closed
+        assert pool.get_client("openai") is not client
+        await pool.close()
+
+    async def test_metrics_count_requests(self, pool):
+        client = pool.get_client("openai")
+        client._transport.inner = echo_transport()
+
+        await asyncio.gather(*[client.get("https://example.test/") for _ in range(3)])
+        client._transport.inner = echo_transport(status=429)
+        await client.get("https://example.test/")
+
+        metrics = pool.get_metrics()["openai"]
+        assert metrics["requests"] == 4
+        assert metrics["in_flight"] == 0
+        assert metrics["errors"] == 1
+        assert metrics["clients"] == 1
+        assert metrics["max_connections"] == 10
+        await pool.close()
+
+    async def test_pooled_client_context_leaves_client_open(self, pool, monkeypatch):
+        monkeypatch.setattr(http_pool, "_pool", pool)
+
+        async with pooled_client("openai") as client:
+            pass
+
+        assert not client.is_closed
+        assert client is pool.get_client("openai")
+        await http_pool.close_http_pool()
+        assert client.is_closed
+        assert http_pool._pool is None
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "_h2_available", lambda: False)
+        assert HTTPPool(http2=True).http2 is False
@@ -0,0 +1,176 @@
+"""Tests for JobQueue atomic claiming and worker leases."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from core.job_queue import JobQueue, JobStatus, JobPriority
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(db_path=tmp_path / "jobs.db", worker_id="test-worker")
+
+
+def _fill(queue, count, **kwargs):
+    return [queue.create_job(f"job {i}", f"in_{i}.txt", f"out_{i}.txt", **kwargs) for i in range(count)]
+
+
+class TestClaimJobs:
+
+    def test_claims_by_priority(self, queue):
+        queue.create_job("low", "a", "b", priority=JobPriority.LOW)
+        queue.create_job("urgent", "a", "b", priority=JobPriority.URGENT)
+        queue.create_job("normal", "a", "b", priority=JobPriority.NORMAL)
+
+        jobs = queue.claim_jobs("w1", 2)
+
+        assert [job.job_name for job in jobs] == ["urgent", "normal"]
+        assert all(job.status == JobStatus.QUEUED for job in jobs)
+        assert all(job.worker_id == "w1" for job in jobs)
+        assert all(job.lease_expires_at > time.time() for job in jobs)
+
+    def test_claimed_jobs_not_claimed_again(self, queue):
+        _fill(queue, 3)
+        first = queue.claim_jobs("w1", 2)
+        second = queue.claim_jobs("w2", 5)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert not {j.job_id for j in first} & {j.job_id for j in second}
+        assert queue.claim_jobs("w3", 1) == []
+
+    def test_skips_future_scheduled_jobs(self, queue):
+        queue.create_job("later", "a", "b", scheduled_at=time.time() + 3600)
+        assert queue.claim_jobs("w1", 1) == []
+
+    def test_get_next_job_uses_queue_worker(self, queue):
+        _fill(queue, 1)
+        job = queue.get_next_job()
+        assert job.worker_id == "test-worker"
+        assert queue.get_next_job() is None
+
+    def test_concurrent_workers_never_share_jobs(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        _fill(JobQueue(db_path=db_path), 60)
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(name):
+            # Each worker has its own queue/backend, like a separate process
+            worker_queue = JobQueue(db_path=db_path)
+            while True:
+                jobs = worker_queue.claim_jobs(name, 3)
+                if not jobs:
+                    return
+                with lock:
+                    claimed.extend(job.job_id for job in jobs)
+
+        threads = [threading.Thread(target=worker, args=(f"w{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(claimed) == 60
+        assert len(set(claimed)) == 60
+
+
+class TestLeases:
+
+    def test_update_job_keeps_lease(self, queue):
+        _fill(queue, 1)
+        job = queue.claim_jobs("w1", 1)[0]
+        job.mark_started()
+        queue.update_job(job)
+
+        stored = queue.get_job(job.job_id)
+        assert stored.status == JobStatus.RUNNING
+        assert stored.worker_id == "w1"
+        assert stored.lease_expires_at == job.lease_expires_at
+
+    def test_heartbeat_extends_lease(self, queue):
+        _fill(queue, 2)
+        jobs = queue.claim_jobs("w1", 2, lease_seconds=10)
+
+        held = queue.heartbeat("w1", lease_seconds=1000)
+
+        assert sorted(held) == sorted(job.job_id for job in jobs)
+        assert queue.get_job(jobs[0].job_id).lease_expires_at > time.time() + 500
+        assert queue.heartbeat("other") == []
+
+    def test_finished_job_not_heartbeated(self, queue):
+        _fill(queue, 1)
+        job = queue.claim_jobs("w1", 1)[0]
+        job.mark_completed()
+        queue.update_job(job)
+        assert queue.heartbeat("w1") == []
+
+    def test_expired_lease_is_requeued(self, queue):
+        _fill(queue, 1)
+        job = queue.claim_jobs("crashed", 1, lease_seconds=0.01)[0]
+        time.sleep(0.05)
+
+        reclaimed = queue.claim_jobs("w2", 1)
+
+        assert [j.job_id for j in reclaimed] == [job.job_id]
+        assert reclaimed[0].worker_id == "w2"
+        assert reclaimed[0].retry_count == 1
+        assert "lease expired" in reclaimed[0].error_message
+
+    def test_expired_lease_fails_after_max_retries(self, queue):
+        _fill(queue, 1, max_retries=0)
+        job = queue.claim_jobs("crashed", 1, lease_seconds=0.01)[0]
+        time.sleep(0.05)
+
+        assert queue.requeue_expired_leases() == 1
+        stored = queue.get_job(job.job_id)
+        assert stored.status == JobStatus.FAILED
+        assert stored.completed_at is not None
+
+    def test_migrates_old_schema(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, job_name TEXT NOT NULL, "
+                     "status TEXT NOT NULL, priority INTEGER NOT NULL DEFAULT 5, "
+                     "input_file TEXT NOT NULL, output_file TEXT NOT NULL, "
+                     "created_at REAL NOT NULL, updated_at REAL NOT NULL)")
+        conn.close()
+
+        queue = JobQueue(db_path=db_path)
+        with queue._backend.connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()}
+        assert {"worker_id", "lease_expires_at"} <= columns
+
+
+class TestLostLease:
+    async def test_job_stops_without_writing(self, queue, tmp_path, monkeypatch):
+        import asyncio
+
+        from config.settings import settings
+        from core.batch_processor import BatchProcessor
+
+        monkeypatch.setattr(settings, "checkpoint_dir", tmp_path / "checkpoints")
+        _fill(queue, 1)
+        # Leased to another worker, so this processor's heartbeat never holds it
+        job = queue.claim_jobs("other", 1, lease_seconds=1000)[0]
+
+        processor = BatchProcessor(queue=queue, worker_id="w1")
+        processor.heartbeat_interval = 0.01
+
+        async def run_forever(job):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(processor, "_process_job_impl", run_forever)
+        processor._start_heartbeat()
+        try:
+            await asyncio.wait_for(processor._process_job(job), timeout=5)
+        finally:
+            processor._stop_heartbeat()
+
+        stored = queue.get_job(job.job_id)
+        assert stored.status == JobStatus.QUEUED
+        assert stored.worker_id == "other"
+        assert processor.current_jobs == []
@@ -0,0 +1,96 @@
+"""Tests for OcrPipeline sequential and process-pool modes."""
+
+import pickle
+
+import fitz
+import pytest
+
+from core.ocr.base import OcrError
+from core.ocr.pipeline import OcrPipeline
+
+
+class ImageSizeOcrClient:
+    """Deterministic fake OCR: reports the rendered image size."""
+
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        return {
+            "text": f"{mode}:{len(image_bytes)}",
+            "confidence": 0.9,
+            "blocks": [],
+            "metadata": {"language": language},
+        }
+
+
+class FailingOcrClient(ImageSizeOcrClient):
+    """Fails on every image (OcrError is recovered per page)."""
+
+    def extract_structured(self, image_bytes, mode="document", language=None):
+        raise OcrError("engine down")
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    for i in range(7):
+        page = doc.new_page()
+        page.insert_text((72, 72), "Page text " * (i + 1))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestSequential:
+
+    def test_process_pdf(self, pdf_path):
+        pages = OcrPipeline(ImageSizeOcrClient(), dpi=36).process_pdf(pdf_path)
+        assert [p.page_num for p in pages] == list(range(7))
+        assert all(p.text.startswith("document:") for p in pages)
+
+    def test_page_range(self, pdf_path):
+        pages = OcrPipeline(ImageSizeOcrClient(), dpi=36).process_pdf(pdf_path, page_range=(2, 4))
+        assert [p.page_num for p in pages] == [2, 3]
+
+    def test_ocr_error_gives_empty_page(self, pdf_path):
+        pages = OcrPipeline(FailingOcrClient(), dpi=36).process_pdf(pdf_path, page_range=(0, 2))
+        assert [p.text for p in pages] == ["", ""]
+        assert pages[0].metadata == {"error": "engine down"}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            OcrPipeline(ImageSizeOcrClient()).process_pdf(tmp_path / "missing.pdf")
+
+
+class TestProcessPool:
+
+    def test_matches_sequential_in_page_order(self, pdf_path):
+        sequential = OcrPipeline(ImageSizeOcrClient(), dpi=36, language="en").process_pdf(pdf_path)
+        pooled = OcrPipeline(
+            ImageSizeOcrClient(), dpi=36, language="en", workers=2, max_in_flight=3
+        ).process_pdf(pdf_path, mode="document")
+
+        assert pooled == sequential
+
+    def test_iter_pdf_streams_and_closes_early(self, pdf_path):
+        pipeline = OcrPipeline(ImageSizeOcrClient(), dpi=36, workers=2)
+        pages = pipeline.iter_pdf(pdf_path, mode="handwriting")
+
+        first = next(pages)
+        pages.close()  # Cancels queued pages and shuts the pool down
+
+        assert first.page_num == 0
+        assert first.text.startswith("handwriting:")
+
+    def test_ocr_error_in_worker(self, pdf_path):
+        pages = OcrPipeline(FailingOcrClient(), dpi=36, workers=2).process_pdf(pdf_path)
+        assert len(pages) == 7
+        assert all(p.confidence == 0.0 for p in pages)
+
+
+def test_mathpix_client_is_picklable():
+    from core.ocr.mathpix_client import MathPixOcrClient
+
+    client = MathPixOcrClient(app_id="id", app_key="key")
+    restored = pickle.loads(pickle.dumps(client))
+    assert restored.app_id == "id"
+    assert restored.httpx is client.httpx
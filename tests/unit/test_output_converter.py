@@ -300,3 +300,152 @@ class TestCleanup:
     def test_cleanup_handles_empty_dir(self, tmp_path):
         converter = OutputConverter(temp_dir=tmp_path / "empty_temp")
         converter.cleanup()  # Should not raise
+
+
+# ==================== LaTeX Compilation ====================
+
+
+def fake_latex(aux_runs=None, delay=0.0, tracker=None, returncode=0):
+    """Stand-in for xelatex: writes .aux/.log/.pdf into the output directory."""
+    import asyncio
+    calls = []
+    runs = aux_runs or {}
+
+    async def create_subprocess_exec(*args, **kwargs):
+        workdir = Path(args[args.index("-output-directory") + 1])
+        calls.append(workdir)
+        run = calls.count(workdir)
+        aux = runs.get(run, runs.get("default", "\\relax\n"))
+
+        async def communicate():
+            if tracker is not None:
+                tracker["now"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["now"])
+            await asyncio.sleep(delay)
+            (workdir / "document.aux").write_text(aux)
+            (workdir / "document.log").write_text("Output written on document.pdf")
+            (workdir / "document.pdf").write_bytes(b"%PDF " + (workdir / "document.tex").read_bytes())
+            if tracker is not None:
+                tracker["now"] -= 1
+            return b"", b""
+
+        proc = MagicMock(returncode=returncode)
+        proc.communicate = communicate
+        return proc
+
+    return create_subprocess_exec, calls
+
+
+class TestLatexToPdf:
+    """Isolated, bounded, cached LaTeX compilation."""
+
+    LATEX = "\\documentclass{article}\n\\begin{document}\nHello\n\\end{document}"
+
+    def make_converter(self, tmp_path):
+        converter = OutputConverter(temp_dir=tmp_path / "temp")
+        converter.has_xelatex = True
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_single_run_without_cross_references(self, tmp_path):
+        converter = self.make_converter(tmp_path)
+        exec_fn, calls = fake_latex()
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            assert await converter._latex_to_pdf(self.LATEX, tmp_path / "out.pdf")
+
+        assert len(calls) == 1
+        assert (tmp_path / "out.pdf").read_bytes().startswith(b"%PDF")
+        # Workspace removed, only the cache remains
+        assert [p.name for p in (tmp_path / "temp").iterdir()] == ["pdf_cache"]
+
+    @pytest.mark.asyncio
+    async def test_reruns_until_aux_is_stable(self, tmp_path):
+        converter = self.make_converter(tmp_path)
+        exec_fn, calls = fake_latex(aux_runs={
+            1: "\\newlabel{eq:1}{{1}{1}}\n",
+            "default": "\\newlabel{eq:1}{{1}{1}}\n",
+        })
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            assert await converter._latex_to_pdf(self.LATEX, tmp_path / "out.pdf")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_served_from_cache(self, tmp_path):
+        converter = self.make_converter(tmp_path)
+        exec_fn, calls = fake_latex()
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            await converter._latex_to_pdf(self.LATEX, tmp_path / "a.pdf")
+            await converter._latex_to_pdf(self.LATEX, tmp_path / "b.pdf")
+            await converter._latex_to_pdf(self.LATEX.replace("Hello", "Bye"), tmp_path / "c.pdf")
+
+        assert len(calls) == 2
+        assert (tmp_path / "a.pdf").read_bytes() == (tmp_path / "b.pdf").read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_failed_compile_is_not_cached(self, tmp_path):
+        converter = self.make_converter(tmp_path)
+        exec_fn, calls = fake_latex(returncode=1)
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            assert await converter._latex_to_pdf(self.LATEX, tmp_path / "a.pdf")
+            assert await converter._latex_to_pdf(self.LATEX, tmp_path / "b.pdf")
+
+        assert len(calls) == 2
+        assert not list(converter.cache_dir.glob("*.pdf"))
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, tmp_path):
+        import os
+
+        converter = self.make_converter(tmp_path)
+        docs = [self.LATEX.replace("Hello", f"Doc {i}") for i in range(3)]
+        exec_fn, calls = fake_latex()
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            for i, doc in enumerate(docs[:2]):
+                await converter._latex_to_pdf(doc, tmp_path / f"{i}.pdf")
+            first, second = sorted(converter.cache_dir.glob("*.pdf"), key=lambda p: p.stat().st_mtime)
+            os.utime(first, (1, 1))
+            os.utime(second, (2, 2))
+            # Reusing doc 0 makes doc 1 the least recently used
+            await converter._latex_to_pdf(docs[0], tmp_path / "again.pdf")
+
+            converter.cache_max_bytes = 2 * first.stat().st_size + 10
+            await converter._latex_to_pdf(docs[2], tmp_path / "2.pdf")
+            await converter._latex_to_pdf(docs[1], tmp_path / "1b.pdf")
+
+        # doc 1 was evicted and compiled again, doc 0 was kept
+        assert len(calls) == 4
+        assert len(list(converter.cache_dir.glob("*.pdf"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_are_isolated_and_bounded(self, tmp_path, monkeypatch):
+        import asyncio
+        import core_v2.output_converter as output_converter
+
+        monkeypatch.setattr(output_converter, "MAX_CONCURRENT_COMPILES", 2)
+        converter = self.make_converter(tmp_path)
+        tracker = {"now": 0, "peak": 0}
+        exec_fn, calls = fake_latex(delay=0.02, tracker=tracker)
+        docs = [self.LATEX.replace("Hello", f"Job {i}") for i in range(5)]
+
+        with patch("asyncio.create_subprocess_exec", exec_fn):
+            results = await asyncio.gather(*[
+                converter._latex_to_pdf(doc, tmp_path / f"job{i}.pdf")
+                for i, doc in enumerate(docs)
+            ])
+
+        assert all(results)
+        assert tracker["peak"] == 2
+        assert len(set(calls)) == 5
+        for i in range(5):
+            assert f"Job {i}".encode() in (tmp_path / f"job{i}.pdf").read_bytes()
+
+    def test_cleanup_keeps_pdf_cache(self, tmp_path):
+        converter = OutputConverter(temp_dir=tmp_path / "temp")
+        converter.cache_dir.mkdir()
+        (converter.cache_dir / "abc.pdf").write_bytes(b"%PDF")
+        (converter.temp_dir / "latex_x").mkdir()
+
+        converter.cleanup()
+
+        assert [p.name for p in converter.temp_dir.iterdir()] == ["pdf_cache"]
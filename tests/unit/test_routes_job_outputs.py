@@ -10,6 +10,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 from api.main import app
+from api.services.conversion_cache import ConversionCache
 from core.job_queue import JobStatus
 
 
@@ -20,6 +21,12 @@ class TestDownloadJobOutput:
     def client(self):
         return TestClient(app)
 
+    @pytest.fixture(autouse=True)
+    def conversion_cache(self, tmp_path):
+        cache = ConversionCache(tmp_path / "conversions", max_bytes=10 * 1024 * 1024)
+        with patch("api.routes.job_outputs.get_conversion_cache", return_value=cache):
+            yield cache
+
     def test_invalid_format(self, client):
         resp = client.get("/api/jobs/abc/download/exe")
         assert resp.status_code == 400
@@ -172,6 +179,34 @@ class TestDownloadJobOutput:
         assert resp.status_code == 500
         assert "converter boom" in resp.json()["detail"]
 
+    def test_download_slow_conversion_returns_202(self, client, tmp_path):
+        """Conversion outlasting the wait budget → 202 with poll URL."""
+        out_docx = tmp_path / "output.docx"
+        out_docx.write_bytes(b"fake docx")
+
+        mock_job = MagicMock()
+        mock_job.status = JobStatus.COMPLETED
+        mock_job.output_file = str(out_docx)
+        mock_job.output_format = "docx"
+
+        async def fake_convert(src, fmt, outdir, base):
+            import asyncio
+            await asyncio.sleep(0.3)
+            target = outdir / f"{base}.{fmt}"
+            target.write_text("converted")
+            return target
+
+        with patch("api.routes.job_outputs.queue") as mock_queue, \
+             patch("api.routes.job_outputs.settings") as mock_settings, \
+             patch("api.routes.job_outputs.convert_document_format", side_effect=fake_convert):
+            mock_queue.get_job.return_value = mock_job
+            mock_settings.conversion_wait_seconds = 0.01
+            resp = client.get("/api/jobs/abc/download/md")
+
+        assert resp.status_code == 202
+        assert resp.json()["poll_url"] == "/api/jobs/abc/download/md"
+        assert resp.headers["Retry-After"] == "1"
+
     def test_download_cancelled_message(self, client):
         mock_job = MagicMock()
         mock_job.status = JobStatus.CANCELLED
@@ -151,6 +151,40 @@ class TestCacheStats:
         assert resp.status_code == 500
 
 
+class TestWebSocketMetrics:
+    """Test GET /api/ws/metrics."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_ws_metrics_response(self, client):
+        resp = client.get("/api/ws/metrics")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["success"] is True
+        for key in ("clients", "queued", "dropped", "coalesced", "lag_avg_ms", "lag_max_ms"):
+            assert key in data["metrics"]
+
+
+class TestHttpPoolMetrics:
+    """Test GET /api/http-pool/metrics."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_http_pool_metrics_response(self, client):
+        pool = MagicMock()
+        pool.get_metrics.return_value = {"openai": {"requests": 3, "connections_open": 1}}
+        with patch("core.http_pool.get_http_pool", return_value=pool):
+            resp = client.get("/api/http-pool/metrics")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["success"] is True
+        assert data["metrics"]["openai"]["requests"] == 3
+
+
 class TestClearCache:
     """Test POST /api/cache/clear."""
 
@@ -61,6 +61,39 @@ class TestUploadFile:
             assert "too large" in resp.json()["detail"]
 
 
+class TestUploadDeduplication:
+    """Test streamed uploads are deduplicated and reuse analysis."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        from api.services.upload_store import UploadStore
+        store = UploadStore(tmp_path / "uploads", db_dir=tmp_path)
+        with patch("api.routes.uploads.get_upload_store", return_value=store):
+            yield TestClient(app)
+
+    def test_reupload_gets_own_file(self, client):
+        content = b"The same book, uploaded twice."
+        first = client.post("/api/upload", files={"file": ("book.txt", io.BytesIO(content), "text/plain")}).json()
+        second = client.post("/api/upload", files={"file": ("copy.txt", io.BytesIO(content), "text/plain")}).json()
+
+        assert first["deduplicated"] is False
+        assert second["deduplicated"] is True
+        assert second["server_path"] != first["server_path"]
+        assert second["sha256"] == first["sha256"]
+
+    def test_reupload_skips_analysis(self, client):
+        content = b"The quick brown fox jumps over the lazy dog."
+        path = client.post("/api/upload", files={"file": ("a.txt", io.BytesIO(content), "text/plain")}).json()["server_path"]
+
+        with patch("api.routes.uploads.read_document", return_value=content.decode()) as read:
+            first = client.post("/api/analyze", json={"file_path": path})
+            again = client.post("/api/upload", files={"file": ("b.txt", io.BytesIO(content), "text/plain")}).json()
+            second = client.post("/api/analyze", json={"file_path": again["server_path"]})
+
+        assert first.json() == second.json()
+        assert read.call_count == 1
+
+
 class TestAnalyzeFile:
     """Test POST /api/analyze."""
 
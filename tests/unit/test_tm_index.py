@@ -0,0 +1,271 @@
+"""
+Unit tests for core/tm/index.py — n-gram candidate index for fuzzy TM matching.
+"""
+
+import pytest
+
+from core.tm.index import TMIndex, TMIndexRegistry, extract_ngrams
+from core.tm.matcher import TMMatcher
+from core.tm.models import TMSegment, compute_hash, normalize_text
+from core.tm.schemas import MatchType
+from core.tm.repository import TMRepository
+
+
+def make_segment(seg_id: str, source: str, target: str = "t", quality: float = 0.8) -> TMSegment:
+    return TMSegment(
+        id=seg_id,
+        tm_id="tm1",
+        source_text=source,
+        target_text=target,
+        source_hash=compute_hash(source),
+        source_normalized=normalize_text(source),
+        source_length=len(source.split()),
+        quality_score=quality,
+    )
+
+
+def build_index(segments, tm_id: str = "tm1") -> TMIndex:
+    """Index whose fetcher serves segments from memory, recording each fetch."""
+    by_id = {seg.id: seg for seg in segments}
+    fetches = []
+
+    def fetch(segment_ids):
+        fetches.append(list(segment_ids))
+        return [by_id[i] for i in segment_ids if i in by_id]
+
+    idx = TMIndex(tm_id, fetch_segments=fetch)
+    idx.add_many(segments)
+    idx.fetches = fetches
+    idx.by_id = by_id
+    return idx
+
+
+def filler_segments(count: int):
+    return [
+        make_segment(f"f{i}", f"unrelated filler sentence number {i} about topic {i % 7}")
+        for i in range(count)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def index():
+    return build_index(
+        filler_segments(200)
+        + [make_segment("target", "The patient was admitted to the hospital yesterday.")]
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = TMRepository(db_path=str(tmp_path / "tm.db"))
+    tm = repository.create_tm(name="Test TM")
+    return repository, tm.id
+
+
+# ---------------------------------------------------------------------------
+# extract_ngrams
+# ---------------------------------------------------------------------------
+
+class TestExtractNgrams:
+    def test_trigrams_with_padding(self):
+        assert extract_ngrams("ab") == {" ab", "ab "}
+
+    def test_empty(self):
+        assert extract_ngrams("") == {"  "}
+
+
+# ---------------------------------------------------------------------------
+# TMIndex
+# ---------------------------------------------------------------------------
+
+class TestTMIndex:
+    def test_len(self, index):
+        assert len(index) == 201
+
+    def test_candidates_ranks_similar_first(self, index):
+        source = normalize_text("The patient was admitted to hospital yesterday.")
+        candidates = index.candidates(source, 7, max_candidates=5)
+        assert candidates[0][0].id == "target"
+        assert len(candidates) <= 5
+
+    def test_get_by_hash(self, index):
+        entry = index.get_by_hash(compute_hash("The patient was admitted to the hospital yesterday."))
+        assert entry.id == "target"
+        assert entry.quality_score == pytest.approx(0.8)
+        assert index.get_by_hash("missing") is None
+
+    def test_remove(self, index):
+        assert index.remove("target") is True
+        assert index.remove("target") is False
+        assert len(index) == 200
+        source = normalize_text("The patient was admitted to the hospital yesterday.")
+        assert all(seg.id != "target" for seg, _ in index.candidates(source, 8))
+
+    def test_replace_keeps_single_entry(self, index):
+        index.add(make_segment("target", "The patient was discharged today."))
+        assert len(index) == 201
+        assert index.get_by_hash(compute_hash("The patient was admitted to the hospital yesterday.")) is None
+
+    def test_compact_preserves_segments(self, index):
+        for i in range(150):
+            index.remove(f"f{i}")
+        index.compact()
+        assert len(index) == 51
+        assert len(index.entries()) == 51
+        source = normalize_text("The patient was admitted to the hospital yesterday.")
+        assert "target" in {entry.id for entry, _ in index.candidates(source, 7)}
+
+    def test_small_index_returns_all_length_compatible(self):
+        idx = build_index([
+            make_segment("a", "hello world"),
+            make_segment("b", "one two three four five six seven eight"),
+        ])
+        ids = [seg.id for seg, _ in idx.candidates("hello there", 2)]
+        assert ids == ["a"]
+
+
+    def test_numpy_ranking_matches_python(self, index, monkeypatch):
+        from core.tm import index as index_module
+        if not index_module.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        for i in range(0, 200, 3):
+            index.remove(f"f{i}")
+        queries = [
+            "The patient was admitted to hospital yesterday.",
+            "unrelated filler sentence number 42 about topic 3",
+        ]
+
+        def ranked():
+            return [
+                [seg.id for seg, _ in index.candidates(normalize_text(q), len(q.split()), 20)]
+                for q in queries
+            ]
+
+        with_numpy = ranked()
+        monkeypatch.setattr(index_module, "HAS_NUMPY", False)
+        assert ranked() == with_numpy
+
+
+# ---------------------------------------------------------------------------
+# TMMatcher with indexes
+# ---------------------------------------------------------------------------
+
+class TestIndexedMatching:
+    def test_indexed_matches_linear_scan(self, index):
+        matcher = TMMatcher()
+        source = "The patient was admitted to the hospital today."
+        linear = matcher.find_fuzzy(source, list(index.by_id.values()), max_results=1)
+        indexed = matcher.find_fuzzy_indexed(source, [index], max_results=1)
+        assert indexed[0].segment.id == linear[0].segment.id
+        assert indexed[0].segment.target_text == "t"
+        assert indexed[0].similarity == pytest.approx(linear[0].similarity)
+
+    def test_only_winners_are_hydrated(self, index):
+        matcher = TMMatcher()
+        matcher.find_fuzzy_indexed("unrelated filler sentence number 12 about topic 5", [index], max_results=3)
+        assert len(index.fetches) == 1
+        assert len(index.fetches[0]) == 3
+
+    def test_deleted_winner_is_dropped(self, index):
+        del index.by_id["target"]
+        matcher = TMMatcher()
+        results = matcher.find_fuzzy_indexed(
+            "The patient was admitted to the hospital today.", [index], max_results=1
+        )
+        assert results == []
+
+    def test_bounded_similarity_equals_ratio(self):
+        matcher = TMMatcher()
+        a, b = "the quick brown fox", "the quick brown cat"
+        assert matcher._compute_similarity_bounded(a, b, 0.5) == matcher._compute_similarity(a, b)
+        assert matcher._compute_similarity_bounded(a, "zzz", 0.5) is None
+
+    def test_batch_match_with_indexes(self, index):
+        matcher = TMMatcher()
+        results = matcher.batch_match(
+            [
+                "The patient was admitted to the hospital yesterday.",
+                "The patient was admitted to the hospital today.",
+                "completely different words here",
+            ],
+            [],
+            indexes=[index],
+        )
+        assert results[0].similarity == 1.0
+        assert results[0].match_type == MatchType.EXACT
+        assert results[1].segment.id == "target"
+        assert results[2] is None
+        # Every winner of the batch is loaded in a single fetch
+        assert index.fetches == [["target"]]
+
+
+# ---------------------------------------------------------------------------
+# Registry and repository sync
+# ---------------------------------------------------------------------------
+
+class TestIndexSync:
+    def test_registry_builds_once(self):
+        registry = TMIndexRegistry()
+        calls = []
+
+        def loader(tm_id):
+            calls.append(tm_id)
+            return [make_segment("a", "hello world")]
+
+        first = registry.get_or_build("tm1", loader)
+        second = registry.get_or_build("tm1", loader)
+        assert first is second
+        assert calls == ["tm1"]
+
+        registry.invalidate("tm1")
+        assert registry.get("tm1") is None
+
+    def test_add_segment_updates_built_index(self, repo):
+        repository, tm_id = repo
+        repository.add_segment(tm_id, "First sentence here.", "Câu đầu.")
+        index = repository.get_index(tm_id)
+        assert len(index) == 1
+
+        repository.add_segment(tm_id, "Second sentence here.", "Câu hai.")
+        assert len(index) == 2
+
+    def test_bulk_and_delete_update_index(self, repo):
+        repository, tm_id = repo
+        index = repository.get_index(tm_id)
+        added, skipped, _ = repository.add_segments_bulk(tm_id, [
+            {"source_text": "Alpha beta gamma.", "target_text": "A"},
+            {"source_text": "Delta epsilon zeta.", "target_text": "D"},
+            {"source_text": "Alpha beta gamma.", "target_text": "dup"},
+        ])
+        assert (added, skipped) == (2, 1)
+        assert len(index) == 2
+
+        entry = index.get_by_hash(compute_hash("Alpha beta gamma."))
+        assert index.hydrate([entry.id])[entry.id].target_text == "A"
+        assert repository.delete_segment(tm_id, entry.id) is True
+        assert len(index) == 1
+
+    def test_update_segment_refreshes_index(self, repo):
+        repository, tm_id = repo
+        segment = repository.add_segment(tm_id, "Old source text.", "Cũ.")
+        index = repository.get_index(tm_id)
+
+        repository.update_segment(tm_id, segment.id, source_text="New source text.")
+
+        assert index.get_by_hash(compute_hash("Old source text.")) is None
+        assert index.get_by_hash(compute_hash("New source text.")).id == segment.id
+
+    def test_lookup_hydrates_from_repository(self, repo):
+        repository, tm_id = repo
+        repository.add_segment(tm_id, "The patient was admitted yesterday.", "Bệnh nhân nhập viện hôm qua.")
+        matcher = TMMatcher()
+
+        results = matcher.find_fuzzy_indexed(
+            "The patient was admitted today.", [repository.get_index(tm_id)], min_similarity=0.5
+        )
+
+        assert results[0].segment.target_text == "Bệnh nhân nhập viện hôm qua."
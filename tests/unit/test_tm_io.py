@@ -0,0 +1,170 @@
+"""
+Unit tests for streaming TMX/TBX import and export (core/tm/io.py, core/glossary/io.py).
+"""
+
+import io
+
+import pytest
+
+from core.glossary.io import GlossaryExporter, GlossaryImporter
+from core.tm.io import TMExporter, TMImporter
+from core.tm.repository import TMRepository
+from core.tm.service import TMService
+
+
+SEGMENTS = [
+    {"source_text": "The heart pumps blood.", "target_text": "Tim bơm máu.", "quality_score": 0.9},
+    {"source_text": "Take two tablets daily.", "target_text": "Uống hai viên mỗi ngày.", "notes": "dose"},
+    {"source_text": "Rest & <recover>.", "target_text": "Nghỉ ngơi & <hồi phục>."},
+]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = TMRepository(db_path=str(tmp_path / "tm.db"))
+    tm = repository.create_tm(name="Medical TM")
+    return repository, tm.id
+
+
+@pytest.fixture
+def service(repo):
+    svc = TMService()
+    svc.repository = repo[0]
+    return svc, repo[1]
+
+
+# ---------------------------------------------------------------------------
+# TMX
+# ---------------------------------------------------------------------------
+
+class TestTMX:
+    def test_iter_matches_to_tmx(self):
+        pieces = list(TMExporter.iter_tmx("TM", iter(SEGMENTS), "en", "vi"))
+        assert len(pieces) == len(SEGMENTS) + 4
+        # Only the creation timestamp can differ between the two calls
+        assert len("".join(pieces)) == len(TMExporter.to_tmx("TM", SEGMENTS, "en", "vi"))
+
+    def test_write_and_stream_back(self, tmp_path):
+        path = tmp_path / "out.tmx"
+        TMExporter.write_tmx(path, "TM", iter(SEGMENTS), "en", "vi")
+
+        metadata = {}
+        with open(path, "rb") as f:
+            segments = list(TMImporter.iter_tmx(f, metadata))
+
+        assert metadata["source_lang"] == "en"
+        assert metadata["target_lang"] == "vi"
+        assert [s.source_text for s in segments] == [s["source_text"] for s in SEGMENTS]
+        assert segments[2].target_text == "Nghỉ ngơi & <hồi phục>."
+        assert segments[0].quality_score == pytest.approx(0.9)
+
+    def test_from_tmx_uses_stream(self):
+        metadata, segments = TMImporter.from_tmx(TMExporter.to_tmx("TM", SEGMENTS))
+        assert len(segments) == 3
+        assert metadata["source_lang"] == "en"
+
+    def test_malformed_raises_value_error(self):
+        with pytest.raises(ValueError):
+            TMImporter.from_tmx("<tmx><body><tu>")
+
+
+# ---------------------------------------------------------------------------
+# Bulk insert from a stream
+# ---------------------------------------------------------------------------
+
+class TestBulkImport:
+    def test_dedupes_in_stream_and_against_existing(self, repo):
+        repository, tm_id = repo
+        repository.add_segment(tm_id, "The heart pumps blood.", "Cũ.")
+        reported = []
+
+        added, skipped, errors = repository.add_segments_bulk(
+            tm_id, iter(SEGMENTS + SEGMENTS[1:2]), batch_size=2, progress=reported.append
+        )
+
+        assert (added, skipped, errors) == (2, 2, [])
+        # Reported after each batch of 2 pending rows, then at the end
+        assert reported[-1] == 4
+        assert reported == sorted(reported)
+        assert repository.get_tm(tm_id).segment_count == 3
+
+    def test_update_mode_overwrites_target(self, repo):
+        repository, tm_id = repo
+        repository.add_segment(tm_id, "The heart pumps blood.", "Cũ.")
+
+        added, skipped, _ = repository.add_segments_bulk(
+            tm_id, SEGMENTS[:1], skip_duplicates=False
+        )
+
+        # Updated duplicates count as added, as with add_segment
+        assert (added, skipped) == (1, 0)
+        segment = next(repository.iter_segments(tm_id))
+        assert segment.target_text == "Tim bơm máu."
+
+    def test_index_untouched_when_commit_fails(self, repo, monkeypatch):
+        repository, tm_id = repo
+        repository.add_segment(tm_id, "The heart pumps blood.", "Tim bơm máu.")
+        index = repository.get_index(tm_id)
+        get_session = repository.get_session
+
+        def fail():
+            raise RuntimeError("disk full")
+
+        def failing_session():
+            session = get_session()
+            monkeypatch.setattr(session, "commit", fail)
+            return session
+
+        monkeypatch.setattr(repository, "get_session", failing_session)
+        with pytest.raises(RuntimeError):
+            repository.add_segments_bulk(tm_id, SEGMENTS[1:])
+
+        assert len(index) == 1
+
+    async def test_service_round_trip(self, service):
+        svc, tm_id = service
+        result = await svc.import_tmx(tm_id, io.BytesIO(TMExporter.to_tmx("TM", SEGMENTS).encode()))
+        assert result.added == 3
+
+        exported = b"".join(svc.iter_tmx_export(tm_id)).decode("utf-8")
+        _, segments = TMImporter.from_tmx(exported)
+        assert sorted(s.source_text for s in segments) == sorted(s["source_text"] for s in SEGMENTS)
+
+    def test_export_unknown_tm(self, service):
+        svc, _ = service
+        with pytest.raises(ValueError):
+            svc.iter_tmx_export("missing")
+
+
+# ---------------------------------------------------------------------------
+# TBX
+# ---------------------------------------------------------------------------
+
+TERMS = [
+    {"source_term": "heart", "target_term": "tim", "context": "anatomy", "part_of_speech": "noun"},
+    {"source_term": "pump", "target_term": "bơm"},
+]
+
+
+class TestTBX:
+    def test_round_trip(self):
+        content = "".join(GlossaryExporter.iter_tbx("Medical", iter(TERMS), "en", "vi"))
+        metadata = {}
+        terms = list(GlossaryImporter.iter_tbx(io.BytesIO(content.encode()), metadata))
+
+        assert metadata == {"name": "Medical", "source_lang": "en", "target_lang": "vi"}
+        assert [(t.source_term, t.target_term) for t in terms] == [("heart", "tim"), ("pump", "bơm")]
+        assert terms[0].context == "anatomy"
+        assert terms[0].part_of_speech == "noun"
+
+    def test_plain_tags_without_namespace(self):
+        content = (
+            '<tbx><text><body><conceptEntry id="c1">'
+            '<langSec xml:lang="fr"><termSec><term>coeur</term></termSec></langSec>'
+            '<langSec xml:lang="vi"><termSec><term>tim</term></termSec></langSec>'
+            '</conceptEntry></body></text></tbx>'
+        )
+        metadata, terms = GlossaryImporter.from_tbx(content)
+
+        assert metadata["source_lang"] == "fr"
+        assert terms[0].source_term == "coeur"
@@ -0,0 +1,158 @@
+"""
+Unit tests for TMService.pretranslate — document-level TM pre-translation pass.
+"""
+
+import pytest
+
+from core.tm.repository import TMRepository
+from core.tm.schemas import MatchType, PretranslateRequest
+from core.tm.service import TMService
+
+
+EXACT = "The patient was admitted to the hospital yesterday."
+FUZZY_SOURCE = "Blood pressure should be measured every morning before breakfast."
+FUZZY_DOC = "Blood pressure should be checked every evening before breakfast."
+NEW = "Completely unrelated words appear in this sentence here."
+
+
+@pytest.fixture
+def service(tmp_path):
+    repository = TMRepository(db_path=str(tmp_path / "tm.db"))
+    tm = repository.create_tm(name="Test TM")
+    repository.add_segment(tm.id, EXACT, "Bệnh nhân nhập viện hôm qua.")
+    repository.add_segment(tm.id, FUZZY_SOURCE, "Huyết áp nên được đo mỗi sáng.")
+
+    svc = TMService()
+    svc.repository = repository
+    return svc, tm.id
+
+
+async def run(service, text, **kwargs):
+    svc, tm_id = service
+    request = PretranslateRequest(tm_ids=[tm_id], source_text=text, segment_type="sentence", **kwargs)
+    return await svc.pretranslate(request)
+
+
+class TestPretranslate:
+    async def test_classifies_segments(self, service):
+        result = await run(service, " ".join([EXACT, FUZZY_DOC, NEW]))
+
+        types = [seg.match_type for seg in result.segments]
+        assert types == [MatchType.EXACT, MatchType.FUZZY, MatchType.NO_MATCH]
+        assert result.segments[0].target_text == "Bệnh nhân nhập viện hôm qua."
+        assert result.pending_indexes == [1, 2]
+
+    async def test_leverage_stats(self, service):
+        result = await run(service, " ".join([EXACT, FUZZY_DOC, NEW, NEW]))
+        stats = result.stats
+
+        assert stats.total_segments == 4
+        assert stats.exact.segments == 1
+        assert stats.exact.words == len(EXACT.split())
+        assert stats.fuzzy.segments == 1
+        assert stats.new.segments == 1
+        assert stats.repetitions.segments == 1
+        assert stats.total_words == sum(
+            band.words for band in
+            (stats.exact, stats.near_exact, stats.fuzzy, stats.repetitions, stats.new)
+        )
+        assert 0 < stats.leverage_rate < 100
+        assert stats.weighted_words < stats.total_words
+
+    async def test_repetitions_translated_once(self, service):
+        result = await run(service, " ".join([NEW, EXACT, NEW]))
+
+        assert result.pending_indexes == [0]
+        assert result.segments[2].repeat_of == 0
+
+        targets = result.merge({0: "Bản dịch mới."})
+        assert targets == ["Bản dịch mới.", "Bệnh nhân nhập viện hôm qua.", "Bản dịch mới."]
+
+    async def test_without_segments(self, service):
+        result = await run(service, " ".join([EXACT, NEW]), include_segments=False)
+
+        assert result.segments == []
+        assert result.pending_indexes == [1]
+        assert result.stats.total_segments == 2
+
+    async def test_estimate_leaves_usage_counts(self, service):
+        svc, tm_id = service
+
+        await run(service, " ".join([EXACT, NEW]))
+
+        assert all(seg.usage_count == 0 for seg in svc.repository.iter_segments(tm_id))
+
+    async def test_empty_tm(self, tmp_path):
+        repository = TMRepository(db_path=str(tmp_path / "empty.db"))
+        tm = repository.create_tm(name="Empty")
+        svc = TMService()
+        svc.repository = repository
+
+        result = await run((svc, tm.id), " ".join([EXACT, NEW]))
+
+        assert result.stats.new.segments == 2
+        assert result.stats.leverage_rate == 0.0
+
+
+class TestSuggest:
+    async def test_best_match_per_source(self, service):
+        svc, tm_id = service
+
+        suggestions = await svc.suggest([tm_id], [EXACT, NEW, FUZZY_DOC])
+
+        assert suggestions[0].match_type == MatchType.EXACT
+        assert suggestions[0].target_text == "Bệnh nhân nhập viện hôm qua."
+        assert suggestions[1] is None
+        assert suggestions[2].match_type == MatchType.FUZZY
+        assert suggestions[2].tm_name == "Test TM"
+
+    async def test_other_language_pair_is_skipped(self, service):
+        svc, tm_id = service
+
+        suggestions = await svc.suggest([tm_id], [EXACT], source_lang="en", target_lang="fr")
+
+        assert suggestions == [None]
+
+
+class TestPretranslateTexts:
+    async def test_only_fully_covered_texts(self, service):
+        svc, tm_id = service
+
+        covered = await svc.pretranslate_texts(
+            [tm_id], [f"{EXACT}\n\n{EXACT}", f"{EXACT} {NEW}", ""], segment_type="sentence"
+        )
+
+        assert covered[0].target_text == "Bệnh nhân nhập viện hôm qua.\n\nBệnh nhân nhập viện hôm qua."
+        assert len(covered[0].segment_ids) == 2
+        assert covered[1] is None
+        assert covered[2] is None
+
+    async def test_case_must_match(self, service):
+        svc, tm_id = service
+
+        covered = await svc.pretranslate_texts([tm_id], [EXACT.upper()], segment_type="sentence")
+
+        assert covered == [None]
+
+    async def test_other_language_pair_is_skipped(self, service):
+        svc, tm_id = service
+
+        covered = await svc.pretranslate_texts([tm_id], [EXACT], "en", "fr", segment_type="sentence")
+
+        assert covered == [None]
+
+    async def test_near_exact_is_not_reused(self, service):
+        svc, tm_id = service
+
+        covered = await svc.pretranslate_texts([tm_id], [EXACT.rstrip(".")], segment_type="sentence")
+
+        assert covered == [None]
+
+    async def test_record_usage(self, service):
+        svc, tm_id = service
+        covered = await svc.pretranslate_texts([tm_id], [EXACT])
+
+        await svc.record_usage(covered[0].segment_ids)
+
+        counts = {seg.source_text: seg.usage_count for seg in svc.repository.iter_segments(tm_id)}
+        assert counts == {EXACT: 1, FUZZY_SOURCE: 0}
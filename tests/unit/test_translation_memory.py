@@ -244,6 +244,18 @@ class TestTranslationMemory:
     # Test: get_fuzzy_matches
     # ========================================================================
 
+    def test_get_exact_matches_bulk(self, tm):
+        """Test bulk exact lookup returns hits keyed by source."""
+        tm.add_segment(TMSegment(source="Hello", target="Xin chào"))
+        tm.add_segment(TMSegment(source="Goodbye", target="Tạm biệt"))
+
+        matches = tm.get_exact_matches(["Hello", "Goodbye", "Missing"])
+
+        assert set(matches) == {"Hello", "Goodbye"}
+        assert matches["Hello"].segment.target == "Xin chào"
+        assert matches["Hello"].match_type == "exact"
+        assert tm.get_exact_match("Hello").segment.use_count == 1
+
     def test_get_fuzzy_matches_similar_text(self, tm):
         """Test getting fuzzy matches for similar text."""
         # Add segments
@@ -357,6 +369,27 @@ class TestTranslationMemory:
         distance = tm._levenshtein_distance("hello", "world")
         assert distance > 0
 
+    def test_calculate_similarities_matches_single(self, tm):
+        """Test batched similarity returns the same scores as the scalar path."""
+        source = "The patient was admitted to the hospital"
+        candidates = [
+            "The patient was admitted to the hospital",
+            "The patient was admitted to a hospital",
+            "A completely unrelated sentence",
+            "",
+        ]
+        results = tm._calculate_similarities(source, candidates, threshold=0.0)
+        for candidate, result in zip(candidates, results):
+            assert result == tm._calculate_similarity(source, candidate)
+
+    def test_calculate_similarities_threshold(self, tm):
+        """Test candidates below threshold are reported as None."""
+        results = tm._calculate_similarities(
+            "Hello world", ["Hello world!", "Goodbye moon"], threshold=0.7
+        )
+        assert results[0] == tm._calculate_similarity("Hello world", "Hello world!")
+        assert results[1] is None
+
     def test_bigram_similarity(self, tm):
         """Test bigram similarity calculation."""
         # Identical
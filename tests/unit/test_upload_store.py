@@ -0,0 +1,99 @@
+"""Tests for api/services/upload_store.py — streaming upload storage."""
+
+import io
+
+import pytest
+
+from api.services import upload_store as upload_store_module
+from api.services.upload_store import UploadStore, UploadTooLargeError
+
+
+class AsyncReader:
+    """Minimal async reader mimicking UploadFile.read(size)."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.read_sizes = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self._buffer.read(size)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadStore(tmp_path / "uploads", db_dir=tmp_path / "db")
+
+
+class TestSave:
+
+    async def test_streams_in_chunks(self, store, monkeypatch):
+        monkeypatch.setattr(upload_store_module, "UPLOAD_CHUNK_SIZE", 4)
+        reader = AsyncReader(b"0123456789")
+
+        stored = await store.save(reader, "book.txt", max_bytes=100)
+
+        assert stored.path.read_bytes() == b"0123456789"
+        assert stored.size == 10
+        assert stored.path.name.endswith("_book.txt")
+        assert set(reader.read_sizes) == {4}
+
+    async def test_too_large_aborts_and_cleans_up(self, store, monkeypatch):
+        monkeypatch.setattr(upload_store_module, "UPLOAD_CHUNK_SIZE", 4)
+        reader = AsyncReader(b"x" * 100)
+
+        with pytest.raises(UploadTooLargeError):
+            await store.save(reader, "big.txt", max_bytes=10)
+
+        # Stopped reading right after the limit, no partial file left
+        assert len(reader.read_sizes) == 3
+        assert list(store.upload_dir.iterdir()) == []
+
+    async def test_identical_upload_is_deduplicated(self, store):
+        first = await store.save(AsyncReader(b"same book"), "a.pdf", max_bytes=100)
+        second = await store.save(AsyncReader(b"same book"), "b.pdf", max_bytes=100)
+        other = await store.save(AsyncReader(b"other book"), "c.pdf", max_bytes=100)
+
+        assert not first.deduplicated
+        assert second.deduplicated
+        assert second.sha256 == first.sha256
+        assert not other.deduplicated
+
+    async def test_identical_uploads_get_their_own_files(self, store):
+        first = await store.save(AsyncReader(b"same book"), "a.pdf", max_bytes=100)
+        second = await store.save(AsyncReader(b"same book"), "a.pdf", max_bytes=100)
+
+        # Never hand one client a path to another client's upload
+        assert second.path != first.path
+        assert second.path.name.endswith("_a.pdf")
+        first.path.unlink()
+        assert second.path.read_bytes() == b"same book"
+
+
+class TestAnalysisCache:
+
+    async def test_roundtrip(self, store):
+        stored = await store.save(AsyncReader(b"text"), "a.txt", max_bytes=100)
+        assert store.get_analysis(stored.path) is None
+
+        store.set_analysis(stored.path, {"word_count": 1})
+
+        assert store.get_analysis(stored.path) == {"word_count": 1}
+
+    async def test_modified_file_invalidates(self, store):
+        stored = await store.save(AsyncReader(b"text"), "a.txt", max_bytes=100)
+        store.set_analysis(stored.path, {"word_count": 1})
+        stored.path.write_bytes(b"different length")
+
+        assert store.get_analysis(stored.path) is None
+
+    async def test_identical_upload_reuses_analysis(self, store):
+        stored = await store.save(AsyncReader(b"text"), "a.txt", max_bytes=100)
+        store.set_analysis(stored.path, {"word_count": 1})
+        stored.path.unlink()
+
+        again = await store.save(AsyncReader(b"text"), "b.txt", max_bytes=100)
+        other = await store.save(AsyncReader(b"other"), "c.txt", max_bytes=100)
+
+        assert store.get_analysis(again.path) == {"word_count": 1}
+        assert store.get_analysis(other.path) is None
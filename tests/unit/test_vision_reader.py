@@ -0,0 +1,181 @@
+"""Tests for core_v2/vision_reader.py — concurrent read_pdf, RequestPacer, PageCache."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import core_v2.vision_reader as vision_reader
+from core_v2.vision_reader import (
+    PageCache,
+    PageContent,
+    RequestPacer,
+    VisionReader,
+    _parse_reset,
+)
+
+
+@pytest.fixture
+def fake_pdf(tmp_path, monkeypatch):
+    """A 6-page 'PDF' whose pages render to distinct bytes."""
+    pdf = tmp_path / "book.pdf"
+    pdf.write_bytes(b"%PDF-fake")
+    monkeypatch.setitem(sys.modules, "fitz", MagicMock())
+    monkeypatch.setattr(vision_reader, "_pdf_page_count", lambda path: 6)
+    monkeypatch.setattr(
+        vision_reader, "_render_pdf_page",
+        lambda path, index, dpi: f"page-{index}".encode(),
+    )
+    return pdf
+
+
+def make_client(delays=None):
+    """LLM client echoing the page number, with optional per-page latency."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def chat(messages, max_tokens):
+        text = messages[0]["content"][1]["text"]
+        page = int(text.rsplit("page ", 1)[1].split(" ")[0])
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep((delays or {}).get(page, 0.01))
+        in_flight["now"] -= 1
+        return MagicMock(content=f"Content of page {page}", headers=None)
+
+    client = MagicMock()
+    client.chat = AsyncMock(side_effect=chat)
+    return client, in_flight
+
+
+# ==================== read_pdf ====================
+
+
+class TestReadPdf:
+    """Concurrent, ordered page reading."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_return_in_order(self, fake_pdf):
+        client, in_flight = make_client(delays={1: 0.1})
+        reader = VisionReader(client, concurrency=3, requests_per_minute=60000)
+        progress = []
+
+        doc = await reader.read_pdf(fake_pdf, progress_callback=lambda d, t: progress.append(d))
+
+        assert [p.page_number for p in doc.pages] == [1, 2, 3, 4, 5, 6]
+        assert doc.pages[0].content == "Content of page 1"
+        assert in_flight["peak"] == 3
+        assert progress == [1, 2, 3, 4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_max_pages(self, fake_pdf):
+        client, _ = make_client()
+        reader = VisionReader(client, requests_per_minute=60000)
+
+        doc = await reader.read_pdf(fake_pdf, max_pages=2)
+
+        assert doc.total_pages == 2
+        assert client.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_from_page_cache(self, fake_pdf, tmp_path):
+        client, _ = make_client()
+        reader = VisionReader(
+            client, concurrency=2, requests_per_minute=60000, cache_dir=tmp_path / "cache"
+        )
+        await reader.read_pdf(fake_pdf, max_pages=4)
+        assert client.chat.await_count == 4
+
+        client.chat.reset_mock()
+        resumed = VisionReader(
+            client, concurrency=2, requests_per_minute=60000, cache_dir=tmp_path / "cache"
+        )
+        doc = await resumed.read_pdf(fake_pdf)
+
+        assert client.chat.await_count == 2  # Only pages 5 and 6
+        assert doc.pages[3].content == "Content of page 4"
+        assert doc.pages[5].content == "Content of page 6"
+
+    @pytest.mark.asyncio
+    async def test_error_pages_are_not_cached(self, fake_pdf, tmp_path):
+        client = MagicMock()
+        client.chat = AsyncMock(side_effect=RuntimeError("boom"))
+        reader = VisionReader(client, requests_per_minute=60000, cache_dir=tmp_path / "cache")
+
+        doc = await reader.read_pdf(fake_pdf, max_pages=1)
+
+        assert doc.pages[0].content == "[VISION ERROR: Page 1]"
+        assert list((tmp_path / "cache").glob("*.jsonl")) == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_is_retried(self, fake_pdf):
+        error = RuntimeError("429 rate_limit_error")
+        error.response = MagicMock(headers={"retry-after": "0"})
+        client = MagicMock()
+        client.chat = AsyncMock(side_effect=[error, MagicMock(content="ok", headers=None)])
+        reader = VisionReader(client, requests_per_minute=60000)
+
+        doc = await reader.read_pdf(fake_pdf, max_pages=1)
+
+        assert doc.pages[0].content == "ok"
+        assert client.chat.await_count == 2
+
+
+# ==================== RequestPacer ====================
+
+
+class TestRequestPacer:
+    """Token bucket pacing driven by rate-limit headers."""
+
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self):
+        pacer = RequestPacer(requests_per_minute=1200, burst=2)  # 20/s
+        start = time.monotonic()
+        for _ in range(4):
+            await pacer.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_headers_retune_rate(self):
+        pacer = RequestPacer(requests_per_minute=60)
+        pacer.update_from_headers({
+            "x-ratelimit-remaining-requests": "100",
+            "x-ratelimit-reset-requests": "10s",
+        })
+        assert pacer.rate == pytest.approx(10.0)
+
+    def test_exhausted_window_pauses(self):
+        pacer = RequestPacer(requests_per_minute=60)
+        pacer.update_from_headers({
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": "5",
+        })
+        assert pacer._paused_until - time.monotonic() > 4
+
+    def test_parse_reset_formats(self):
+        assert _parse_reset("12") == 12.0
+        assert _parse_reset("1m30s") == 90.0
+        assert _parse_reset("250ms") == 0.25
+        assert _parse_reset("2030-01-01T00:00:00Z") > 0
+        assert _parse_reset("not a time") is None
+
+
+# ==================== PageCache ====================
+
+
+class TestPageCache:
+    """Append-only per-document page cache."""
+
+    def test_round_trip_and_torn_line(self, tmp_path):
+        path = tmp_path / "doc.jsonl"
+        cache = PageCache(path)
+        cache.put("abc", PageContent(page_number=3, content="x", has_tables=True))
+        with open(path, "a") as f:
+            f.write('{"key": "torn"')
+
+        reloaded = PageCache(path)
+        page = reloaded.get("abc", page_number=7)
+        assert len(reloaded) == 1
+        assert page.page_number == 7
+        assert page.has_tables is True
+        assert reloaded.get("missing", 1) is None
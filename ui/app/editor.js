@@ -5,6 +5,10 @@
 
 const Editor = {
     currentJobId: null,
+    nextOffset: 0,
+    totalSegments: 0,
+    loadingPage: false,
+    versions: {},
 
     init() {
         // Find elements
@@ -40,29 +44,65 @@ const Editor = {
             this.overlay.classList.add('hidden');
             this.container.innerHTML = ''; // Clear memory
             this.currentJobId = null;
+            this.versions = {};
+            if (this.pageObserver) this.pageObserver.disconnect();
         }, 300);
     },
 
     async loadSegments(jobId) {
         this.container.innerHTML = '<div class="loading-spinner"></div>';
+        this.nextOffset = 0;
+        this.totalSegments = 0;
+        this.versions = {};
 
         try {
-            const response = await fetch(`/api/editor/jobs/${jobId}/segments`);
+            await this.loadNextPage(jobId);
+        } catch (error) {
+            console.error('Editor load error:', error);
+            this.container.innerHTML = `<div class="error-message">Could not load editor: ${error.message}</div>`;
+        }
+    },
+
+    // Segments are served in windows; the next one loads when the end of the list scrolls into view
+    async loadNextPage(jobId) {
+        if (this.loadingPage) return;
+        this.loadingPage = true;
+
+        try {
+            const response = await fetch(`/api/editor/jobs/${jobId}/segments?offset=${this.nextOffset}`);
             if (!response.ok) throw new Error('Failed to load segments');
 
             const data = await response.json();
-            this.renderSegments(data.segments);
+            if (jobId !== this.currentJobId) return;
 
-        } catch (error) {
-            console.error('Editor load error:', error);
-            this.container.innerHTML = `<div class="error-message">Could not load editor: ${error.message}</div>`;
+            if (this.nextOffset === 0) this.container.innerHTML = '';
+            this.totalSegments = data.total_segments;
+            this.nextOffset = data.offset + data.segments.length;
+            this.renderSegments(data.segments);
+            this.observeEnd(jobId);
+        } finally {
+            this.loadingPage = false;
         }
     },
 
-    renderSegments(segments) {
-        this.container.innerHTML = '';
+    observeEnd(jobId) {
+        if (this.pageObserver) this.pageObserver.disconnect();
+        const last = this.container.lastElementChild;
+        if (!last || this.nextOffset >= this.totalSegments) return;
+
+        this.pageObserver = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                this.pageObserver.disconnect();
+                this.loadNextPage(jobId).catch(error => console.error('Editor page error:', error));
+            }
+        });
+        this.pageObserver.observe(last);
+    },
 
+    renderSegments(segments) {
         segments.forEach(seg => {
+            this.versions[seg.chunk_id] = seg.version;
+
             const card = document.createElement('div');
             card.className = 'segment-card';
             card.dataset.id = seg.chunk_id;
@@ -119,11 +159,18 @@ const Editor = {
             const response = await fetch(`/api/editor/jobs/${this.currentJobId}/segments/${chunkId}`, {
                 method: 'PATCH',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ translated_text: newText })
+                body: JSON.stringify({
+                    translated_text: newText,
+                    expected_version: this.versions[chunkId]
+                })
             });
 
             if (response.ok) {
+                const data = await response.json();
+                this.versions[chunkId] = data.version;
                 indicator.classList.add('saved');
+            } else if (response.status === 409) {
+                console.error(`Segment ${chunkId} was changed elsewhere; reload to see the latest text`);
             } else {
                 console.error('Save failed');
             }